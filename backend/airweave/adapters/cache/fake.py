@@ -1,5 +1,6 @@
 """In-memory fake context cache for testing."""
 
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -35,7 +36,9 @@ class FakeContextCache(ContextCache):
     async def set_user(self, user: schemas.User) -> None:
         self._users[user.email] = user
 
-    async def set_api_key_org_id(self, api_key: str, org_id: UUID) -> None:
+    async def set_api_key_org_id(
+        self, api_key: str, org_id: UUID, expires_at: Optional[datetime] = None
+    ) -> None:
         self._api_keys[api_key] = org_id
 
     # --- Invalidation ---
@@ -52,6 +55,14 @@ class FakeContextCache(ContextCache):
         self._api_keys.pop(api_key, None)
         self._invalidations.append(("api_key", api_key))
 
+    # --- Lifecycle ---
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
     # --- Test helpers ---
 
     def assert_invalidated(self, entity_type: str, key: str) -> None:
@@ -7,10 +7,12 @@ removing the dependency on the credentials module.
 import hashlib
 import json
 import logging
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from airweave import schemas
+from airweave.core.datetime_utils import utc_now_naive
 from airweave.core.protocols.cache import ContextCache
 
 logger = logging.getLogger(__name__)
@@ -69,7 +71,7 @@ class RedisContextCache(ContextCache):
             key_hash = self._hash_api_key(api_key)
             data = await self._redis.get(f"{API_KEY_PREFIX}:{key_hash}")
             if data:
-                return UUID(data.decode("utf-8"))
+                return UUID(data.decode("utf-8") if isinstance(data, bytes) else data)
             return None
         except Exception as e:
             logger.debug("Cache read error (api_key): %s", e)
@@ -93,11 +95,18 @@ class RedisContextCache(ContextCache):
         except Exception as e:
             logger.debug("Cache write error (user %s): %s", user.email, e)
 
-    async def set_api_key_org_id(self, api_key: str, org_id: UUID) -> None:
-        """Cache an API key → org ID mapping with TTL."""
+    async def set_api_key_org_id(
+        self, api_key: str, org_id: UUID, expires_at: Optional[datetime] = None
+    ) -> None:
+        """Cache an API key → org ID mapping with TTL, never past the key's expiry."""
+        ttl = API_KEY_TTL
+        if expires_at is not None:
+            ttl = min(ttl, int((expires_at - utc_now_naive()).total_seconds()))
+            if ttl <= 0:
+                return
         try:
             key_hash = self._hash_api_key(api_key)
-            await self._redis.setex(f"{API_KEY_PREFIX}:{key_hash}", API_KEY_TTL, str(org_id))
+            await self._redis.setex(f"{API_KEY_PREFIX}:{key_hash}", ttl, str(org_id))
         except Exception as e:
             logger.debug("Cache write error (api_key): %s", e)
 
@@ -124,3 +133,11 @@ class RedisContextCache(ContextCache):
             await self._redis.delete(f"{API_KEY_PREFIX}:{key_hash}")
         except Exception as e:
             logger.debug("Cache invalidation error (api_key): %s", e)
+
+    # --- Lifecycle ---
+
+    async def start(self) -> None:
+        """No-op: the Redis client is shared and connects on demand."""
+
+    async def close(self) -> None:
+        """No-op: the shared Redis client is closed with the app."""
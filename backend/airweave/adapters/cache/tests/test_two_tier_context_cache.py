@@ -0,0 +1,299 @@
+"""Tests for TwoTierContextCache — local tier, TTL/LRU bounds, cross-pod invalidation."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from airweave import schemas
+from airweave.adapters.cache.fake import FakeContextCache
+from airweave.adapters.cache.two_tier import (
+    INVALIDATION_CHANNEL,
+    INVALIDATION_NAMESPACE,
+    TwoTierContextCache,
+)
+from airweave.adapters.pubsub.fake import FakePubSub
+from airweave.core.datetime_utils import utc_now_naive
+
+
+def _make_org(org_id=None):
+    now = datetime.now(timezone.utc)
+    return schemas.Organization(
+        id=org_id or uuid4(),
+        name="Test Org",
+        created_at=now,
+        modified_at=now,
+    )
+
+
+class _CountingCache(FakeContextCache):
+    """FakeContextCache that counts reads, standing in for Redis."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    async def get_organization(self, org_id):
+        self.reads += 1
+        return await super().get_organization(org_id)
+
+    async def get_api_key_org_id(self, api_key):
+        self.reads += 1
+        return await super().get_api_key_org_id(api_key)
+
+
+class _Subscription:
+    def __init__(self, bus: "_LoopbackPubSub") -> None:
+        self._bus = bus
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def listen(self):
+        while True:
+            message = await self.queue.get()
+            if message is None:
+                return
+            yield message
+
+    async def close(self) -> None:
+        self._bus.subscribers.discard(self)
+
+
+class _LoopbackPubSub(FakePubSub):
+    """Delivers published messages to every subscriber, like Redis across pods."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.subscribers: set = set()
+
+    async def publish(self, namespace, id_value, data):
+        await super().publish(namespace, id_value, data)
+        message = {"type": "message", "data": json.dumps(data)}
+        for subscription in tuple(self.subscribers):
+            subscription.queue.put_nowait(message)
+        return len(self.subscribers)
+
+    async def subscribe(self, namespace, id_value):
+        self.subscriptions.append((namespace, str(id_value)))
+        subscription = _Subscription(self)
+        self.subscribers.add(subscription)
+        return subscription
+
+    def drop_connection(self) -> None:
+        for subscription in tuple(self.subscribers):
+            subscription.queue.put_nowait(None)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _started(remote, pubsub, **kwargs) -> TwoTierContextCache:
+    cache = TwoTierContextCache(remote, pubsub, resubscribe_delay=0.01, **kwargs)
+    await cache.start()
+    await _settle()
+    return cache
+
+
+@pytest.fixture
+def remote():
+    return _CountingCache()
+
+
+@pytest.fixture
+def pubsub():
+    return _LoopbackPubSub()
+
+
+class TestLocalTier:
+    @pytest.mark.asyncio
+    async def test_repeated_reads_are_served_locally(self, remote, pubsub):
+        org = _make_org()
+        await remote.set_organization(org)
+        cache = await _started(remote, pubsub)
+
+        for _ in range(5):
+            assert await cache.get_organization(org.id) == org
+
+        assert remote.reads == 1
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_not_used_before_start(self, remote, pubsub):
+        org = _make_org()
+        cache = TwoTierContextCache(remote, pubsub)
+        await cache.set_organization(org)
+
+        await cache.get_organization(org.id)
+        await cache.get_organization(org.id)
+
+        assert not cache.local_active
+        assert remote.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_with_zero_ttl(self, remote, pubsub):
+        cache = await _started(remote, pubsub, ttl_seconds=0)
+
+        assert not cache.local_active
+        assert pubsub.subscriptions == []
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self, remote, pubsub):
+        org = _make_org()
+        await remote.set_organization(org)
+        clock = _Clock()
+        cache = await _started(remote, pubsub, ttl_seconds=5, clock=clock)
+
+        await cache.get_organization(org.id)
+        clock.now = 4.9
+        await cache.get_organization(org.id)
+        assert remote.reads == 1
+
+        clock.now = 5.0
+        await cache.get_organization(org.id)
+        assert remote.reads == 2
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, remote, pubsub):
+        orgs = [_make_org() for _ in range(3)]
+        for org in orgs:
+            await remote.set_organization(org)
+        cache = await _started(remote, pubsub, max_entries=2)
+
+        await cache.get_organization(orgs[0].id)
+        await cache.get_organization(orgs[1].id)
+        await cache.get_organization(orgs[0].id)  # orgs[1] is now least recently used
+        await cache.get_organization(orgs[2].id)
+        assert remote.reads == 3
+
+        await cache.get_organization(orgs[0].id)
+        assert remote.reads == 3
+        await cache.get_organization(orgs[1].id)
+        assert remote.reads == 4
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_misses_are_not_cached(self, remote, pubsub):
+        cache = await _started(remote, pubsub)
+        org_id = uuid4()
+
+        assert await cache.get_organization(org_id) is None
+        assert await cache.get_organization(org_id) is None
+
+        assert remote.reads == 2
+        await cache.close()
+
+
+class TestApiKeys:
+    @pytest.mark.asyncio
+    async def test_expired_key_is_not_cached(self, remote, pubsub):
+        cache = await _started(remote, pubsub)
+        expired = utc_now_naive() - timedelta(seconds=1)
+
+        await cache.set_api_key_org_id("ak_expired", uuid4(), expires_at=expired)
+        await cache.get_api_key_org_id("ak_expired")
+
+        assert remote.reads == 1
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_message_carries_only_the_key_hash(self, remote, pubsub):
+        cache = await _started(remote, pubsub)
+
+        await cache.invalidate_api_key("ak_secret")
+
+        [message] = pubsub.published[(INVALIDATION_NAMESPACE, INVALIDATION_CHANNEL)]
+        assert "ak_secret" not in json.dumps(message)
+        remote.assert_invalidated("api_key", "ak_secret")
+        await cache.close()
+
+
+class TestInvalidation:
+    @pytest.mark.asyncio
+    async def test_invalidation_on_one_pod_reaches_the_others(self, remote, pubsub):
+        org = _make_org()
+        await remote.set_organization(org)
+        pod_a = await _started(remote, pubsub)
+        pod_b = await _started(remote, pubsub)
+        assert await pod_a.get_organization(org.id) == org
+        assert await pod_b.get_organization(org.id) == org
+
+        await pod_a.invalidate_organization(org.id)
+        await _settle()
+
+        assert await pod_a.get_organization(org.id) is None
+        assert await pod_b.get_organization(org.id) is None
+        await pod_a.close()
+        await pod_b.close()
+
+    @pytest.mark.asyncio
+    async def test_read_racing_an_invalidation_is_not_kept(self, remote, pubsub):
+        org = _make_org()
+        await remote.set_organization(org)
+        cache = await _started(remote, pubsub)
+        fetched = asyncio.Event()
+        release = asyncio.Event()
+        get_organization = remote.get_organization
+
+        async def slow_get(org_id):
+            value = await get_organization(org_id)
+            fetched.set()
+            await release.wait()
+            return value
+
+        remote.get_organization = slow_get
+        read = asyncio.create_task(cache.get_organization(org.id))
+        await fetched.wait()
+        await cache.invalidate_organization(org.id)
+        release.set()
+        assert await read == org  # read before the invalidation, served as is
+
+        remote.get_organization = get_organization
+        assert await cache.get_organization(org.id) is None
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_lost_subscription_disables_and_clears_local_tier(self, remote, pubsub):
+        org = _make_org()
+        await remote.set_organization(org)
+        cache = await _started(remote, pubsub)
+        await cache.get_organization(org.id)
+
+        pubsub.drop_connection()
+        await _settle()
+
+        assert not cache.local_active
+        await cache.get_organization(org.id)
+        assert remote.reads == 2
+
+        await asyncio.sleep(0.05)  # resubscribed
+        assert cache.local_active
+        assert len(pubsub.subscriptions) == 2
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_malformed_messages_are_ignored(self, remote, pubsub):
+        org = _make_org()
+        await remote.set_organization(org)
+        cache = await _started(remote, pubsub)
+        await cache.get_organization(org.id)
+
+        for subscription in pubsub.subscribers:
+            subscription.queue.put_nowait({"type": "message", "data": "not json"})
+        await _settle()
+
+        assert cache.local_active
+        await cache.get_organization(org.id)
+        assert remote.reads == 1
+        await cache.close()
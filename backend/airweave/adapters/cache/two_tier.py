@@ -0,0 +1,270 @@
+"""Two-tier context cache: an in-process L1 in front of another ContextCache.
+
+Every authenticated request reads its organization and its user or API key
+from the context cache. A busy API pod sees the same few keys over and over,
+so ``TwoTierContextCache`` answers repeated reads from a bounded in-process
+LRU with a short TTL and only goes to the wrapped cache (Redis) once per key
+and TTL.
+
+Invalidations remove the entry from the wrapped cache, drop it locally and
+are published over pub/sub, so every other pod drops its copy as well. The
+local tier is only used while this pod is subscribed to those messages:
+before ``start()``, and whenever the subscription is down, reads and writes
+go straight to the wrapped cache and the local tier is empty.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Hashable, Optional
+from uuid import UUID
+
+from airweave import schemas
+from airweave.core.datetime_utils import utc_now_naive
+from airweave.core.protocols.cache import ContextCache
+from airweave.core.protocols.pubsub import PubSub
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_NAMESPACE = "context_cache"
+INVALIDATION_CHANNEL = "invalidate"
+
+DEFAULT_TTL_SECONDS = 5.0
+DEFAULT_MAX_ENTRIES = 10_000
+RESUBSCRIBE_DELAY_SECONDS = 5.0
+
+_ORG = "org"
+_USER = "user"
+_API_KEY = "apikey"
+
+
+class _LocalTier:
+    """Bounded LRU whose entries expire after a TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float]) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self._ttl if ttl_seconds is None else min(self._ttl, ttl_seconds)
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TwoTierContextCache(ContextCache):
+    """In-process LRU (L1) in front of a shared context cache (L2).
+
+    Cached objects are shared between the requests a pod serves until they
+    expire, so callers must treat them as read-only.
+
+    Args:
+        remote: The shared cache (normally ``RedisContextCache``).
+        pubsub: Transport for invalidation messages between pods.
+        ttl_seconds: Lifetime of a local entry; caps staleness if an
+            invalidation message is lost.
+        max_entries: Local entries kept before the least recently used is evicted.
+        resubscribe_delay: Wait before resubscribing after the subscription failed.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        remote: ContextCache,
+        pubsub: PubSub,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        resubscribe_delay: float = RESUBSCRIBE_DELAY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize with an empty local tier and no subscription."""
+        self._remote = remote
+        self._pubsub = pubsub
+        self._local = _LocalTier(max_entries, ttl_seconds, clock)
+        self._enabled = ttl_seconds > 0 and max_entries > 0
+        self._resubscribe_delay = resubscribe_delay
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = False
+        # Bumped on every local invalidation; a read that started before one
+        # must not put what it fetched into the local tier.
+        self._generation = 0
+
+    @staticmethod
+    def _hash_api_key(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    @property
+    def local_active(self) -> bool:
+        """Whether reads are currently answered from the local tier."""
+        return self._enabled and self._subscribed
+
+    # --- Lifecycle ---
+
+    async def start(self) -> None:
+        """Subscribe to invalidations from other pods and enable the local tier."""
+        if self._enabled and self._listener is None:
+            self._listener = asyncio.create_task(self._listen(), name="context_cache:invalidations")
+
+    async def close(self) -> None:
+        """Stop listening for invalidations and drop the local tier."""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        self._subscribed = False
+        self._local.clear()
+        await self._remote.close()
+
+    # --- Read ---
+
+    async def get_organization(self, org_id: UUID) -> Optional[schemas.Organization]:
+        """Return the organization from the local tier, else from the shared cache."""
+        return await self._get((_ORG, str(org_id)), lambda: self._remote.get_organization(org_id))
+
+    async def get_user(self, user_email: str) -> Optional[schemas.User]:
+        """Return the user from the local tier, else from the shared cache."""
+        return await self._get((_USER, user_email), lambda: self._remote.get_user(user_email))
+
+    async def get_api_key_org_id(self, api_key: str) -> Optional[UUID]:
+        """Return the API key's org ID from the local tier, else from the shared cache."""
+        key = (_API_KEY, self._hash_api_key(api_key))
+        return await self._get(key, lambda: self._remote.get_api_key_org_id(api_key))
+
+    # --- Write ---
+
+    async def set_organization(self, organization: schemas.Organization) -> None:
+        """Cache an organization in both tiers."""
+        await self._remote.set_organization(organization)
+        self._set((_ORG, str(organization.id)), organization)
+
+    async def set_user(self, user: schemas.User) -> None:
+        """Cache a user in both tiers."""
+        await self._remote.set_user(user)
+        self._set((_USER, user.email), user)
+
+    async def set_api_key_org_id(
+        self, api_key: str, org_id: UUID, expires_at: Optional[datetime] = None
+    ) -> None:
+        """Cache an API key → org ID mapping in both tiers, never past ``expires_at``."""
+        await self._remote.set_api_key_org_id(api_key, org_id, expires_at)
+        ttl = (expires_at - utc_now_naive()).total_seconds() if expires_at else None
+        self._set((_API_KEY, self._hash_api_key(api_key)), org_id, ttl)
+
+    # --- Invalidation ---
+
+    async def invalidate_organization(self, org_id: UUID) -> None:
+        """Remove the organization from the shared cache and every pod's local tier."""
+        await self._remote.invalidate_organization(org_id)
+        await self._invalidate(_ORG, str(org_id))
+
+    async def invalidate_user(self, user_email: str) -> None:
+        """Remove the user from the shared cache and every pod's local tier."""
+        await self._remote.invalidate_user(user_email)
+        await self._invalidate(_USER, user_email)
+
+    async def invalidate_api_key(self, api_key: str) -> None:
+        """Remove the API key from the shared cache and every pod's local tier."""
+        await self._remote.invalidate_api_key(api_key)
+        # Only the hash leaves the process
+        await self._invalidate(_API_KEY, self._hash_api_key(api_key))
+
+    # --- Internals ---
+
+    async def _get(self, key: tuple[str, str], fetch: Callable[[], Any]) -> Any:
+        if not self.local_active:
+            return await fetch()
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        generation = self._generation
+        value = await fetch()
+        if value is not None and generation == self._generation and self.local_active:
+            self._local.set(key, value)
+        return value
+
+    def _set(self, key: tuple[str, str], value: Any, ttl_seconds: Optional[float] = None) -> None:
+        if self.local_active:
+            self._local.set(key, value, ttl_seconds)
+
+    async def _invalidate(self, kind: str, key: str) -> None:
+        self._drop(kind, key)
+        try:
+            await self._pubsub.publish(
+                INVALIDATION_NAMESPACE, INVALIDATION_CHANNEL, {"kind": kind, "key": key}
+            )
+        except Exception as e:
+            logger.warning("Context cache invalidation not published (%s %s): %s", kind, key, e)
+
+    def _drop(self, kind: str, key: str) -> None:
+        self._generation += 1
+        self._local.discard((kind, key))
+
+    def _apply(self, data: Any) -> None:
+        """Apply one invalidation message from another pod (or this one)."""
+        try:
+            message = json.loads(data)
+            self._drop(message["kind"], message["key"])
+        except (TypeError, ValueError, KeyError) as e:
+            logger.warning("Ignoring malformed context cache invalidation %r: %s", data, e)
+
+    async def _listen(self) -> None:
+        """Keep a subscription to invalidations; the local tier is off while it is down."""
+        while True:
+            try:
+                subscription = await self._pubsub.subscribe(
+                    INVALIDATION_NAMESPACE, INVALIDATION_CHANNEL
+                )
+            except Exception as e:
+                logger.warning("Context cache invalidation subscribe failed: %s", e)
+                await asyncio.sleep(self._resubscribe_delay)
+                continue
+
+            self._subscribed = True
+            try:
+                async for message in subscription.listen():
+                    if message.get("type") == "message":
+                        self._apply(message["data"])
+                logger.warning("Context cache invalidation subscription ended")
+            except Exception as e:
+                logger.warning("Context cache invalidation subscription failed: %s", e)
+            finally:
+                # Invalidations may have been missed; start over from the shared cache
+                self._subscribed = False
+                self._generation += 1
+                self._local.clear()
+                try:
+                    await subscription.close()
+                except Exception:
+                    pass
+            await asyncio.sleep(self._resubscribe_delay)
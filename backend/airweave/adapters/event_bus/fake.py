@@ -36,7 +36,9 @@ class FakeEventBus:
         self._subscribers: list[tuple[str, "EventHandler"]] = []
         self._call_subscribers = call_subscribers
 
-    def subscribe(self, event_pattern: str, handler: "EventHandler") -> None:
+    def subscribe(
+        self, event_pattern: str, handler: "EventHandler", *, lossless: bool = False
+    ) -> None:
         """Register a handler (only called if call_subscribers=True)."""
         self._subscribers.append((event_pattern, handler))
 
@@ -51,6 +53,13 @@ class FakeEventBus:
                 if fnmatch.fnmatch(event.event_type, pattern):
                     await handler(event)
 
+    async def close(self) -> None:
+        """Nothing is queued; delivery is synchronous."""
+
+    def snapshot(self) -> list:
+        """No delivery queues to report."""
+        return []
+
     # Test helpers
 
     def has_event(self, event_type: str) -> bool:
@@ -1,13 +1,38 @@
 """In-memory event bus implementation.
 
-Simple event bus that fans out events to subscribers in-process.
+Event bus that fans out events to subscribers in-process.
 Can be replaced with a distributed bus (Redis Streams, Kafka, etc.) later.
+
+``publish`` never waits for subscribers. It looks up the subscribers for the
+event type (pattern matching is done once per event type, not per event),
+appends the event to each subscriber's bounded queue and returns. One
+background task per subscriber drains its queue in order, so a slow webhook
+or analytics call delays only that subscriber, never the sync pipeline that
+published the event.
+
+High-rate events can coalesce: when an event defines ``coalesce_key`` and the
+last event still waiting in a subscriber's queue has the same key, the two are
+merged (e.g. consecutive ``entity.batch_processed`` deltas for one sync job
+are summed). A subscriber that keeps up never sees merged events.
+
+If a queue is full, the new event is dropped for that subscriber and counted.
+That is fine for best-effort consumers (analytics, progress relays), but not
+for ones whose state must add up, like usage billing. Those subscribe with
+``lossless=True``: ``publish`` then waits for room in their queue instead of
+dropping, so a stalled lossless subscriber slows publishers down rather than
+losing events. ``snapshot()`` reports queue depth, lag, drops and coalesced
+events per subscriber.
 """
 
 import asyncio
 import fnmatch
 import logging
-from typing import TYPE_CHECKING
+import re
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Pattern, Tuple
+
+from airweave.core.protocols.event_bus import EventSubscriberSnapshot
 
 if TYPE_CHECKING:
     from airweave.core.protocols.event_bus import DomainEvent, EventHandler
@@ -15,66 +40,283 @@ if TYPE_CHECKING:
 # Use standard logging to avoid circular import with airweave.core.logging
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+_DROP_LOG_INTERVAL_SECONDS = 10.0
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+class _Queued:
+    __slots__ = ("event", "enqueued_at")
+
+    def __init__(self, event: "DomainEvent", enqueued_at: float) -> None:
+        self.event = event
+        self.enqueued_at = enqueued_at
+
+
+class _LoopState:
+    """Events bound to the event loop a subscriber's delivery task runs on."""
+
+    __slots__ = ("loop", "wakeup", "idle", "space")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.wakeup = asyncio.Event()
+        self.idle = asyncio.Event()
+        self.space = asyncio.Event()
+
+
+class _Subscriber:
+    """One handler with its own bounded queue and delivery task."""
+
+    def __init__(self, handler: "EventHandler", max_queue_size: int) -> None:
+        self.handler = handler
+        self.name = _handler_name(handler)
+        self.max_queue_size = max_queue_size
+        self.lossless = False
+        self.queue: Deque[_Queued] = deque()
+        self.delivered = 0
+        self.failed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self._delivering = False
+        self._last_drop_log = 0.0
+        self._state: Optional[_LoopState] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # -- producer side (called from publish; only lossless subscribers await) --
+
+    @property
+    def full(self) -> bool:
+        return len(self.queue) >= self.max_queue_size
+
+    async def wait_for_space(self) -> None:
+        """Wait until the queue has room (backpressure for lossless subscribers)."""
+        while self.full:
+            state = self._ensure_running()
+            state.space.clear()
+            await state.space.wait()
+
+    def enqueue(self, event: "DomainEvent", now: float) -> None:
+        key = event.coalesce_key()
+        if key is not None and self.queue:
+            tail = self.queue[-1]
+            if tail.event.coalesce_key() == key:
+                tail.event = tail.event.coalesce(event)
+                self.coalesced += 1
+                return
+
+        if len(self.queue) >= self.max_queue_size:
+            self.dropped += 1
+            if now - self._last_drop_log >= _DROP_LOG_INTERVAL_SECONDS:
+                self._last_drop_log = now
+                logger.warning(
+                    f"EventBus: queue for {self.name} is full ({self.max_queue_size}); "
+                    f"dropped {self.dropped} events so far"
+                )
+            return
+
+        self.queue.append(_Queued(event, now))
+        state = self._ensure_running()
+        state.idle.clear()
+        state.wakeup.set()
+
+    # -- delivery --
+
+    def _ensure_running(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._state
+        if state is None or state.loop is not loop:
+            # First use, or the previous loop is gone (tests, worker restarts)
+            state = self._state = _LoopState(loop)
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(state), name=f"event-bus:{self.name}")
+        return state
+
+    async def _run(self, state: _LoopState) -> None:
+        while True:
+            while not self.queue:
+                state.idle.set()
+                state.wakeup.clear()
+                await state.wakeup.wait()
+
+            item = self.queue.popleft()
+            state.space.set()
+            self.lag = time.monotonic() - item.enqueued_at
+            self.max_lag = max(self.max_lag, self.lag)
+            self._delivering = True
+            try:
+                await self.handler(item.event)
+            except Exception as e:
+                self.failed += 1
+                # Log (but don't raise - other subscribers and later events are unaffected)
+                logger.error(
+                    f"EventBus: subscriber {self.name} failed for '{_event_type(item.event)}': {e}",
+                    exc_info=e,
+                )
+            finally:
+                self._delivering = False
+                self.delivered += 1
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.queue) or self._delivering
+
+    async def wait_idle(self) -> None:
+        state = self._state
+        if state is None or state.loop is not asyncio.get_running_loop():
+            return
+        while self.busy and self._task is not None and not self._task.done():
+            await state.idle.wait()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        if task.get_loop() is not asyncio.get_running_loop():
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        # Release publishers blocked on a full lossless queue
+        if self._state is not None:
+            self._state.space.set()
+
+    def snapshot(self) -> EventSubscriberSnapshot:
+        return EventSubscriberSnapshot(
+            subscriber=self.name,
+            queue_depth=len(self.queue),
+            delivered=self.delivered,
+            failed=self.failed,
+            dropped=self.dropped,
+            coalesced=self.coalesced,
+            lag_ms=round(self.lag * 1000, 2),
+            max_lag_ms=round(self.max_lag * 1000, 2),
+        )
+
+
+class _PatternIndex:
+    """Subscriptions indexed by exact event type, prefix (``sync.*``) and glob."""
+
+    def __init__(self) -> None:
+        self.exact: Dict[str, List[_Subscriber]] = {}
+        self.prefix: List[Tuple[str, _Subscriber]] = []
+        self.glob: List[Tuple[Pattern[str], _Subscriber]] = []
+
+    def add(self, pattern: str, subscriber: _Subscriber) -> None:
+        if not _GLOB_CHARS.search(pattern):
+            self.exact.setdefault(pattern, []).append(subscriber)
+        elif pattern.endswith("*") and not _GLOB_CHARS.search(pattern[:-1]):
+            self.prefix.append((pattern[:-1], subscriber))
+        else:
+            self.glob.append((re.compile(fnmatch.translate(pattern)), subscriber))
+
+    def match(self, event_type: str) -> Tuple[_Subscriber, ...]:
+        matched: List[_Subscriber] = list(self.exact.get(event_type, ()))
+        matched.extend(sub for prefix, sub in self.prefix if event_type.startswith(prefix))
+        matched.extend(sub for regex, sub in self.glob if regex.match(event_type))
+        # A handler subscribed under several matching patterns gets the event once
+        return tuple(dict.fromkeys(matched))
+
 
 class InMemoryEventBus:
     """In-memory event bus with pattern-based subscriptions.
 
-    Implements the EventBus protocol. Events are delivered to all
-    matching subscribers asynchronously.
+    Implements the EventBus protocol. Events are queued per subscriber and
+    delivered in publish order by background tasks.
 
     Usage:
         bus = InMemoryEventBus()
         bus.subscribe("sync.*", webhook_handler)
         bus.subscribe("sync.completed", analytics_handler)
         await bus.publish(SyncLifecycleEvent(...))
+
+    Args:
+        max_queue_size: Events buffered per subscriber before new ones are dropped
+            (or, for lossless subscribers, before ``publish`` waits).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE) -> None:
         """Initialize the event bus."""
-        self._subscribers: list[tuple[str, "EventHandler"]] = []
+        self._max_queue_size = max_queue_size
+        self._subscribers: Dict["EventHandler", _Subscriber] = {}
+        self._index = _PatternIndex()
+        # event_type -> matching subscribers, filled on first publish of each type
+        self._routes: Dict[str, Tuple[_Subscriber, ...]] = {}
 
-    def subscribe(self, event_pattern: str, handler: "EventHandler") -> None:
+    def subscribe(
+        self, event_pattern: str, handler: "EventHandler", *, lossless: bool = False
+    ) -> None:
         """Register a handler for events matching the pattern.
 
         Args:
             event_pattern: Glob pattern (e.g., 'sync.*', 'sync.completed').
             handler: Async function to call when matching events are published.
+            lossless: Never drop events for this handler; ``publish`` waits for
+                room in its queue instead. A handler is lossless if any of its
+                subscriptions is.
         """
-        self._subscribers.append((event_pattern, handler))
-        logger.debug(f"EventBus: subscribed handler to '{event_pattern}'")
+        subscriber = self._subscribers.get(handler)
+        if subscriber is None:
+            subscriber = _Subscriber(handler, self._max_queue_size)
+            self._subscribers[handler] = subscriber
+        subscriber.lossless = subscriber.lossless or lossless
+        self._index.add(event_pattern, subscriber)
+        self._routes.clear()
+        logger.debug(f"EventBus: subscribed {subscriber.name} to '{event_pattern}'")
 
     async def publish(self, event: "DomainEvent") -> None:
-        """Publish an event to all matching subscribers.
+        """Queue an event for all matching subscribers.
 
-        Subscribers are called concurrently. Failures in one subscriber
-        don't affect others.
+        Returns immediately unless a lossless subscriber's queue is full, in
+        which case it waits for room. Failures in one subscriber don't affect
+        others.
 
         Args:
             event: The domain event to publish.
         """
-        event_type = event.event_type
-        matching_handlers = [
-            handler
-            for pattern, handler in self._subscribers
-            if fnmatch.fnmatch(event_type, pattern)
-        ]
-
-        if not matching_handlers:
-            logger.warning(f"EventBus: no subscribers for '{event_type}'")
-            return
+        event_type = _event_type(event)
+        subscribers = self._routes.get(event_type)
+        if subscribers is None:
+            subscribers = self._index.match(event_type)
+            self._routes[event_type] = subscribers
+            if not subscribers:
+                logger.warning(f"EventBus: no subscribers for '{event_type}'")
 
-        logger.debug(f"EventBus: publishing '{event_type}' to {len(matching_handlers)} subscribers")
+        for subscriber in subscribers:
+            if subscriber.lossless and subscriber.full:
+                await subscriber.wait_for_space()
+            subscriber.enqueue(event, time.monotonic())
 
-        # Fan out to all matching handlers concurrently
-        results = await asyncio.gather(
-            *[handler(event) for handler in matching_handlers],
-            return_exceptions=True,
-        )
+    async def flush(self) -> None:
+        """Wait until every event published so far has been delivered."""
+        for subscriber in list(self._subscribers.values()):
+            await subscriber.wait_idle()
 
-        # Log any failures (but don't raise - other subscribers succeeded)
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(
-                    f"EventBus: subscriber failed for '{event_type}': {result}",
-                    exc_info=result,
-                )
+    async def close(self, timeout: float = 10.0) -> None:
+        """Deliver what is queued (up to ``timeout`` seconds), then stop delivery tasks."""
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            pending = sum(len(s.queue) for s in self._subscribers.values())
+            logger.warning(f"EventBus: closing with {pending} undelivered events")
+        for subscriber in self._subscribers.values():
+            await subscriber.stop()
+
+    def snapshot(self) -> List[EventSubscriberSnapshot]:
+        """Per-subscriber queue depth, lag, drop and coalescing counters."""
+        return [subscriber.snapshot() for subscriber in self._subscribers.values()]
+
+
+def _event_type(event: "DomainEvent") -> str:
+    event_type = event.event_type
+    # str-valued enums hash by member name, so key routes by the plain value
+    return getattr(event_type, "value", event_type)
+
+
+def _handler_name(handler: "EventHandler") -> str:
+    owner = getattr(handler, "__self__", None)
+    if owner is not None:
+        return type(owner).__name__
+    return getattr(handler, "__qualname__", repr(handler))
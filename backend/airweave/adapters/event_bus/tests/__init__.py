@@ -0,0 +1 @@
+"""Tests for event bus adapters."""
@@ -0,0 +1,258 @@
+"""Tests for InMemoryEventBus — routing, background delivery, coalescing, limits."""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from airweave.adapters.event_bus.in_memory import InMemoryEventBus
+from airweave.core.events.collection import CollectionLifecycleEvent
+from airweave.core.events.sync import EntityBatchProcessedEvent, TypeActionCounts
+from airweave.domains.usage.fakes.ledger import FakeUsageLedger
+from airweave.domains.usage.subscribers.billing_listener import UsageBillingListener
+from airweave.domains.usage.types import ActionType
+
+ORG_ID = uuid4()
+SYNC_ID = uuid4()
+COLLECTION_ID = uuid4()
+SOURCE_CONNECTION_ID = uuid4()
+
+
+def _batch(job_id, seq, inserted=1, entity_type="SlackMessageEntity", billable=True):
+    return EntityBatchProcessedEvent(
+        organization_id=ORG_ID,
+        sync_id=SYNC_ID,
+        sync_job_id=job_id,
+        collection_id=COLLECTION_ID,
+        source_connection_id=SOURCE_CONNECTION_ID,
+        inserted=inserted,
+        type_breakdown={entity_type: TypeActionCounts(inserted=inserted)},
+        batch_seq=seq,
+        batch_duration_ms=10,
+        billable=billable,
+    )
+
+
+def _collection_event(name="Docs"):
+    return CollectionLifecycleEvent.created(
+        organization_id=ORG_ID,
+        collection_id=COLLECTION_ID,
+        collection_name=name,
+        collection_readable_id="docs-abc",
+    )
+
+
+class _Recorder:
+    """Subscriber that records events, optionally blocking until released."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.events = []
+        self.delay = delay
+        self.fail = fail
+        self.gate: asyncio.Event | None = None
+
+    async def handle(self, event) -> None:
+        if self.gate is not None:
+            await self.gate.wait()
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        self.events.append(event)
+
+
+class TestRouting:
+    @pytest.mark.asyncio
+    async def test_exact_prefix_and_glob_patterns(self):
+        bus = InMemoryEventBus()
+        exact, prefix, wildcard, glob = _Recorder(), _Recorder(), _Recorder(), _Recorder()
+        bus.subscribe("collection.created", exact.handle)
+        bus.subscribe("collection.*", prefix.handle)
+        bus.subscribe("*", wildcard.handle)
+        bus.subscribe("*.crea?ed", glob.handle)
+        bus.subscribe("sync.*", _Recorder().handle)
+
+        await bus.publish(_collection_event())
+        await bus.flush()
+
+        assert [len(r.events) for r in (exact, prefix, wildcard, glob)] == [1, 1, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_overlapping_patterns_deliver_once_per_handler(self):
+        bus = InMemoryEventBus()
+        recorder = _Recorder()
+        bus.subscribe("collection.*", recorder.handle)
+        bus.subscribe("collection.created", recorder.handle)
+
+        await bus.publish(_collection_event())
+        await bus.flush()
+
+        assert len(recorder.events) == 1
+
+    @pytest.mark.asyncio
+    async def test_late_subscription_is_routed(self):
+        bus = InMemoryEventBus()
+        await bus.publish(_collection_event())
+
+        recorder = _Recorder()
+        bus.subscribe("collection.*", recorder.handle)
+        await bus.publish(_collection_event())
+        await bus.flush()
+
+        assert len(recorder.events) == 1
+
+
+class TestDelivery:
+    @pytest.mark.asyncio
+    async def test_publish_does_not_wait_for_slow_subscribers(self):
+        bus = InMemoryEventBus()
+        slow = _Recorder(delay=0.2)
+        bus.subscribe("collection.*", slow.handle)
+
+        start = time.monotonic()
+        for i in range(20):
+            await bus.publish(_collection_event(name=f"c{i}"))
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.05
+        assert slow.events == []
+        await bus.close(timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_each_subscriber_receives_events_in_order(self):
+        bus = InMemoryEventBus()
+        fast, slow = _Recorder(), _Recorder(delay=0.005)
+        bus.subscribe("collection.*", fast.handle)
+        bus.subscribe("collection.*", slow.handle)
+
+        for i in range(10):
+            await bus.publish(_collection_event(name=f"c{i}"))
+        await bus.flush()
+
+        expected = [f"c{i}" for i in range(10)]
+        assert [e.collection_name for e in fast.events] == expected
+        assert [e.collection_name for e in slow.events] == expected
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_does_not_affect_others(self):
+        bus = InMemoryEventBus()
+        failing, healthy = _Recorder(fail=True), _Recorder()
+        bus.subscribe("collection.*", failing.handle)
+        bus.subscribe("collection.*", healthy.handle)
+
+        await bus.publish(_collection_event())
+        await bus.publish(_collection_event())
+        await bus.flush()
+
+        assert len(healthy.events) == 2
+        assert sorted(s.failed for s in bus.snapshot()) == [0, 2]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self):
+        bus = InMemoryEventBus(max_queue_size=3)
+        recorder = _Recorder()
+        recorder.gate = asyncio.Event()
+        bus.subscribe("collection.*", recorder.handle)
+
+        for i in range(6):
+            await bus.publish(_collection_event(name=f"c{i}"))
+        await asyncio.sleep(0)  # first event is picked up and blocks on the gate
+        await bus.publish(_collection_event(name="late"))
+
+        (stats,) = bus.snapshot()
+        assert stats.dropped == 3
+        assert stats.queue_depth == 3
+
+        recorder.gate.set()
+        await bus.flush()
+        assert [e.collection_name for e in recorder.events] == ["c0", "c1", "c2", "late"]
+
+    @pytest.mark.asyncio
+    async def test_saturated_billing_subscriber_loses_nothing(self):
+        class _SlowLedger(FakeUsageLedger):
+            async def record(self, organization_id, action_type, amount=1):
+                await asyncio.sleep(0.001)
+                await super().record(organization_id, action_type, amount)
+
+        bus = InMemoryEventBus(max_queue_size=3)
+        ledger = _SlowLedger()
+        billing = UsageBillingListener(ledger=ledger)
+        best_effort = _Recorder(delay=0.01)
+        bus.subscribe("entity.*", billing.handle, lossless=True)
+        bus.subscribe("entity.*", best_effort.handle)
+
+        # One job per event, so nothing coalesces and the queues saturate
+        for seq in range(50):
+            await bus.publish(_batch(uuid4(), seq, inserted=2))
+        await bus.flush()
+
+        assert ledger.recorded[(ORG_ID, ActionType.ENTITIES)] == 100
+        stats = {s.subscriber: s for s in bus.snapshot()}
+        assert stats["UsageBillingListener"].dropped == 0
+        assert stats["_Recorder"].dropped > 0
+
+    @pytest.mark.asyncio
+    async def test_close_releases_publishers_blocked_on_a_lossless_queue(self):
+        bus = InMemoryEventBus(max_queue_size=1)
+        recorder = _Recorder()
+        recorder.gate = asyncio.Event()
+        bus.subscribe("collection.*", recorder.handle, lossless=True)
+
+        await bus.publish(_collection_event(name="c0"))
+        await asyncio.sleep(0)  # c0 is picked up and blocks on the gate
+        await bus.publish(_collection_event(name="c1"))
+        blocked = asyncio.create_task(bus.publish(_collection_event(name="c2")))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        await bus.close(timeout=0.01)
+        await asyncio.wait_for(blocked, 1.0)
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_queued_entity_batches_are_summed(self):
+        bus = InMemoryEventBus()
+        recorder = _Recorder()
+        recorder.gate = asyncio.Event()
+        bus.subscribe("entity.*", recorder.handle)
+        job_id = uuid4()
+
+        await bus.publish(_batch(job_id, seq=1))
+        await asyncio.sleep(0)  # batch 1 is in delivery
+        for seq in range(2, 6):
+            await bus.publish(_batch(job_id, seq=seq, inserted=2, entity_type=f"T{seq % 2}"))
+        recorder.gate.set()
+        await bus.flush()
+
+        first, merged = recorder.events
+        assert first.batch_seq == 1
+        assert merged.inserted == 8
+        assert merged.batch_seq == 5
+        assert merged.batch_duration_ms == 40
+        assert merged.type_breakdown == {
+            "T0": TypeActionCounts(inserted=4),
+            "T1": TypeActionCounts(inserted=4),
+        }
+        assert bus.snapshot()[0].coalesced == 3
+
+    @pytest.mark.asyncio
+    async def test_coalescing_keeps_jobs_billing_modes_and_order_apart(self):
+        bus = InMemoryEventBus()
+        recorder = _Recorder()
+        recorder.gate = asyncio.Event()
+        bus.subscribe("*", recorder.handle)
+        job_a, job_b = uuid4(), uuid4()
+
+        await bus.publish(_collection_event(name="blocker"))
+        await asyncio.sleep(0)
+        await bus.publish(_batch(job_a, seq=1))
+        await bus.publish(_batch(job_b, seq=1))
+        await bus.publish(_batch(job_b, seq=2, billable=False))
+        await bus.publish(_collection_event(name="between"))
+        await bus.publish(_batch(job_b, seq=3, billable=False))
+        recorder.gate.set()
+        await bus.flush()
+
+        assert len(recorder.events) == 6
+        assert sum(e.inserted for e in recorder.events if hasattr(e, "inserted")) == 4
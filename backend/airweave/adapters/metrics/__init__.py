@@ -16,21 +16,44 @@ from airweave.adapters.metrics.http import (
     RequestRecord,
     ResponseSizeRecord,
 )
+from airweave.adapters.metrics.pubsub import FakePubSubMetrics, PrometheusPubSubMetrics
 from airweave.adapters.metrics.renderer import FakeMetricsRenderer, PrometheusMetricsRenderer
+from airweave.adapters.metrics.sync_pipeline import (
+    BatchRecord,
+    BatchShapeRecord,
+    FakeSyncPipelineMetrics,
+    PrometheusSyncPipelineMetrics,
+    StageRecord,
+)
+from airweave.adapters.metrics.usage import (
+    FakeUsageLedgerMetrics,
+    FlushRecord,
+    PrometheusUsageLedgerMetrics,
+)
 from airweave.adapters.metrics.worker import FakeWorkerMetrics, PrometheusWorkerMetrics
 
 __all__ = [
+    "BatchRecord",
+    "BatchShapeRecord",
     "FakeAgenticSearchMetrics",
     "FakeDbPoolMetrics",
     "FakeHttpMetrics",
     "FakeMetricsRenderer",
+    "FakePubSubMetrics",
+    "FakeSyncPipelineMetrics",
+    "FakeUsageLedgerMetrics",
     "FakeWorkerMetrics",
+    "FlushRecord",
     "PrometheusAgenticSearchMetrics",
     "PrometheusDbPoolMetrics",
     "PrometheusHttpMetrics",
     "PrometheusMetricsRenderer",
+    "PrometheusPubSubMetrics",
+    "PrometheusSyncPipelineMetrics",
+    "PrometheusUsageLedgerMetrics",
     "PrometheusWorkerMetrics",
     "RequestRecord",
     "ResponseSizeRecord",
+    "StageRecord",
     "StepDurationRecord",
 ]
@@ -0,0 +1,83 @@
+"""PubSub multiplexer metrics adapters (Prometheus + Fake).
+
+Prometheus implementation exposes per-namespace gauges for shared Redis
+pub/sub connections and local SSE subscribers, plus a slow-consumer counter.
+"""
+
+from prometheus_client import CollectorRegistry, Counter, Gauge
+
+from airweave.core.protocols.metrics import PubSubMetrics
+
+
+class PrometheusPubSubMetrics(PubSubMetrics):
+    """Prometheus-backed pub/sub multiplexer metrics."""
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        """Initialize the gauges and counter on the given registry."""
+        self._registry = registry or CollectorRegistry()
+
+        self._connections = Gauge(
+            "airweave_pubsub_redis_connections",
+            "Open Redis pub/sub connections per namespace",
+            ["namespace"],
+            registry=self._registry,
+        )
+
+        self._subscribers = Gauge(
+            "airweave_pubsub_subscribers",
+            "Local subscribers fed by the shared connection per namespace",
+            ["namespace"],
+            registry=self._registry,
+        )
+
+        self._slow_consumer_disconnects = Counter(
+            "airweave_pubsub_slow_consumer_disconnects_total",
+            "Subscribers disconnected for falling behind",
+            ["namespace"],
+            registry=self._registry,
+        )
+
+    # -- PubSubMetrics protocol methods --
+
+    def update(self, *, namespace: str, connections: int, subscribers: int) -> None:
+        """Set the connection and subscriber gauges of a namespace."""
+        self._connections.labels(namespace=namespace).set(connections)
+        self._subscribers.labels(namespace=namespace).set(subscribers)
+
+    def inc_slow_consumer_disconnects(self, namespace: str) -> None:
+        """Count a subscriber disconnected for falling behind."""
+        self._slow_consumer_disconnects.labels(namespace=namespace).inc()
+
+
+# ---------------------------------------------------------------------------
+# Fake
+# ---------------------------------------------------------------------------
+
+
+class FakePubSubMetrics(PubSubMetrics):
+    """In-memory spy implementing the PubSubMetrics protocol."""
+
+    def __init__(self) -> None:
+        """Initialize empty per-namespace state."""
+        self.connections: dict[str, int] = {}
+        self.subscribers: dict[str, int] = {}
+        self.slow_consumer_disconnects: dict[str, int] = {}
+
+    def update(self, *, namespace: str, connections: int, subscribers: int) -> None:
+        """Record the connection and subscriber counts of a namespace."""
+        self.connections[namespace] = connections
+        self.subscribers[namespace] = subscribers
+
+    def inc_slow_consumer_disconnects(self, namespace: str) -> None:
+        """Count a slow-consumer disconnect for a namespace."""
+        self.slow_consumer_disconnects[namespace] = (
+            self.slow_consumer_disconnects.get(namespace, 0) + 1
+        )
+
+    # -- test helpers --
+
+    def clear(self) -> None:
+        """Reset all recorded state."""
+        self.connections.clear()
+        self.subscribers.clear()
+        self.slow_consumer_disconnects.clear()
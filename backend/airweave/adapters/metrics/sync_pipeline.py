@@ -0,0 +1,139 @@
+"""Sync pipeline metrics adapters (Prometheus + Fake).
+
+Prometheus implementation exposes per-stage and per-batch latency
+histograms labelled by source, and the estimated payload of each batch
+labelled by why it was closed, registered on the worker's registry.
+"""
+
+from dataclasses import dataclass
+
+from prometheus_client import CollectorRegistry, Histogram
+
+from airweave.core.protocols.metrics import SyncPipelineMetrics
+
+# Stages range from sub-millisecond hashing to multi-second embedding calls
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+BATCH_SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+# A few chat messages up to a batch of large files
+PAYLOAD_BUCKETS = tuple(2**n for n in range(12, 28, 2))  # 4 KiB .. 64 MiB
+
+
+class PrometheusSyncPipelineMetrics(SyncPipelineMetrics):
+    """Prometheus-backed sync pipeline stage histograms."""
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        """Initialize the stage, batch and batch-shape histograms on the given registry."""
+        self._registry = registry or CollectorRegistry()
+
+        self._stage_duration = Histogram(
+            "airweave_sync_stage_duration_seconds",
+            "Time a batch spent in each sync pipeline stage",
+            ["stage", "source"],
+            buckets=STAGE_BUCKETS,
+            registry=self._registry,
+        )
+
+        self._batch_duration = Histogram(
+            "airweave_sync_batch_duration_seconds",
+            "End-to-end processing time per entity batch",
+            ["source"],
+            buckets=STAGE_BUCKETS,
+            registry=self._registry,
+        )
+
+        self._batch_entities = Histogram(
+            "airweave_sync_batch_entities",
+            "Entities per processed batch",
+            ["source"],
+            buckets=BATCH_SIZE_BUCKETS,
+            registry=self._registry,
+        )
+
+        self._batch_payload = Histogram(
+            "airweave_sync_batch_payload_bytes",
+            "Estimated payload per entity batch when it is closed",
+            ["source", "reason"],
+            buckets=PAYLOAD_BUCKETS,
+            registry=self._registry,
+        )
+
+    # -- SyncPipelineMetrics protocol methods --
+
+    def observe_stage(self, stage: str, source: str, duration: float) -> None:
+        """Record how long one pipeline stage took for a batch."""
+        self._stage_duration.labels(stage=stage, source=source).observe(duration)
+
+    def observe_batch(self, source: str, duration: float, entity_count: int) -> None:
+        """Record the duration and entity count of one processed batch."""
+        self._batch_duration.labels(source=source).observe(duration)
+        self._batch_entities.labels(source=source).observe(entity_count)
+
+    def observe_batch_shape(self, source: str, payload_bytes: int, reason: str) -> None:
+        """Record the payload size and flush reason of one emitted batch."""
+        self._batch_payload.labels(source=source, reason=reason).observe(payload_bytes)
+
+
+# ---------------------------------------------------------------------------
+# Fake
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class StageRecord:
+    """Single recorded stage observation."""
+
+    stage: str
+    source: str
+    duration: float
+
+
+@dataclass(frozen=True)
+class BatchRecord:
+    """Single recorded batch observation."""
+
+    source: str
+    duration: float
+    entity_count: int
+
+
+@dataclass(frozen=True)
+class BatchShapeRecord:
+    """Single recorded batch shape observation."""
+
+    source: str
+    payload_bytes: int
+    reason: str
+
+
+class FakeSyncPipelineMetrics(SyncPipelineMetrics):
+    """In-memory spy implementing the SyncPipelineMetrics protocol."""
+
+    def __init__(self) -> None:
+        """Initialize empty observation lists."""
+        self.stages: list[StageRecord] = []
+        self.batches: list[BatchRecord] = []
+        self.shapes: list[BatchShapeRecord] = []
+
+    def observe_stage(self, stage: str, source: str, duration: float) -> None:
+        """Record a stage observation."""
+        self.stages.append(StageRecord(stage=stage, source=source, duration=duration))
+
+    def observe_batch(self, source: str, duration: float, entity_count: int) -> None:
+        """Record a batch observation."""
+        self.batches.append(
+            BatchRecord(source=source, duration=duration, entity_count=entity_count)
+        )
+
+    def observe_batch_shape(self, source: str, payload_bytes: int, reason: str) -> None:
+        """Record a batch shape observation."""
+        self.shapes.append(
+            BatchShapeRecord(source=source, payload_bytes=payload_bytes, reason=reason)
+        )
+
+    # -- test helpers --
+
+    def clear(self) -> None:
+        """Reset all recorded state."""
+        self.stages.clear()
+        self.batches.clear()
+        self.shapes.clear()
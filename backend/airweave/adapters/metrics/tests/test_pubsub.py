@@ -0,0 +1,38 @@
+"""Unit tests for pub/sub multiplexer metrics adapters."""
+
+from prometheus_client import CollectorRegistry, generate_latest
+
+from airweave.adapters.metrics import FakePubSubMetrics, PrometheusPubSubMetrics
+
+
+class TestFakePubSubMetrics:
+    """Tests for the FakePubSubMetrics test helper."""
+
+    def test_records_per_namespace(self):
+        fake = FakePubSubMetrics()
+        fake.update(namespace="sync_job", connections=1, subscribers=12)
+        fake.inc_slow_consumer_disconnects("sync_job")
+        fake.inc_slow_consumer_disconnects("sync_job")
+
+        assert fake.connections == {"sync_job": 1}
+        assert fake.subscribers == {"sync_job": 12}
+        assert fake.slow_consumer_disconnects == {"sync_job": 2}
+
+        fake.clear()
+        assert fake.subscribers == {}
+
+
+class TestPrometheusPubSubMetrics:
+    """Tests for the Prometheus adapter."""
+
+    def test_update_sets_labelled_gauges(self):
+        registry = CollectorRegistry()
+        adapter = PrometheusPubSubMetrics(registry=registry)
+
+        adapter.update(namespace="sync_job", connections=1, subscribers=300)
+        adapter.inc_slow_consumer_disconnects("sync_job")
+        output = generate_latest(registry).decode()
+
+        assert 'airweave_pubsub_redis_connections{namespace="sync_job"} 1.0' in output
+        assert 'airweave_pubsub_subscribers{namespace="sync_job"} 300.0' in output
+        assert 'airweave_pubsub_slow_consumer_disconnects_total{namespace="sync_job"} 1.0' in output
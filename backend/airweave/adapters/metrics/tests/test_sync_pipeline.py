@@ -0,0 +1,46 @@
+"""Unit tests for sync pipeline metrics adapters."""
+
+from prometheus_client import CollectorRegistry, generate_latest
+
+from airweave.adapters.metrics import FakeSyncPipelineMetrics, PrometheusSyncPipelineMetrics
+
+
+class TestFakeSyncPipelineMetrics:
+    """Tests for the FakeSyncPipelineMetrics test helper."""
+
+    def test_records_and_clears(self):
+        fake = FakeSyncPipelineMetrics()
+        fake.observe_stage("embed", "slack", 0.5)
+        fake.observe_batch("slack", 1.2, 64)
+        fake.observe_batch_shape("slack", 4096, "entities")
+
+        assert fake.stages[0].stage == "embed"
+        assert fake.batches[0].entity_count == 64
+        assert fake.shapes[0].reason == "entities"
+
+        fake.clear()
+        assert fake.stages == []
+        assert fake.batches == []
+        assert fake.shapes == []
+
+
+class TestPrometheusSyncPipelineMetrics:
+    """Tests for the Prometheus adapter."""
+
+    def test_observations_land_in_labelled_histograms(self):
+        registry = CollectorRegistry()
+        adapter = PrometheusSyncPipelineMetrics(registry=registry)
+
+        adapter.observe_stage("embed", "slack", 0.3)
+        adapter.observe_batch("slack", 1.0, 64)
+        adapter.observe_batch_shape("slack", 4096, "bytes")
+        output = generate_latest(registry).decode()
+
+        assert (
+            'airweave_sync_stage_duration_seconds_count{source="slack",stage="embed"} 1.0' in output
+        )
+        assert 'airweave_sync_batch_duration_seconds_sum{source="slack"} 1.0' in output
+        assert 'airweave_sync_batch_entities_sum{source="slack"} 64.0' in output
+        assert (
+            'airweave_sync_batch_payload_bytes_sum{reason="bytes",source="slack"} 4096.0' in output
+        )
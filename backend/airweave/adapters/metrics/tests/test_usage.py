@@ -0,0 +1,42 @@
+"""Unit tests for usage ledger metrics adapters."""
+
+from prometheus_client import CollectorRegistry, generate_latest
+
+from airweave.adapters.metrics import (
+    FakeUsageLedgerMetrics,
+    FlushRecord,
+    PrometheusUsageLedgerMetrics,
+)
+
+
+class TestFakeUsageLedgerMetrics:
+    """Tests for the FakeUsageLedgerMetrics test helper."""
+
+    def test_records_pending_and_flushes(self):
+        fake = FakeUsageLedgerMetrics()
+        fake.set_pending("entities", 40)
+        fake.set_pending("entities", 0)
+        fake.observe_flush(0.02, success=True)
+
+        assert fake.pending == {"entities": 0}
+        assert fake.flushes == [FlushRecord(duration=0.02, success=True)]
+
+        fake.clear()
+        assert fake.flushes == []
+
+
+class TestPrometheusUsageLedgerMetrics:
+    """Tests for the Prometheus adapter."""
+
+    def test_pending_gauge_and_flush_histogram(self):
+        registry = CollectorRegistry()
+        adapter = PrometheusUsageLedgerMetrics(registry=registry)
+
+        adapter.set_pending("entities", 250)
+        adapter.observe_flush(0.03, success=True)
+        adapter.observe_flush(1.5, success=False)
+        output = generate_latest(registry).decode()
+
+        assert 'airweave_usage_pending{action_type="entities"} 250.0' in output
+        assert 'airweave_usage_flush_duration_seconds_count{outcome="success"} 1.0' in output
+        assert 'airweave_usage_flush_duration_seconds_count{outcome="error"} 1.0' in output
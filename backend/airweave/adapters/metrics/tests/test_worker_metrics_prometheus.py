@@ -247,3 +247,84 @@ def test_fractional_uptime_precision():
     text = _render(registry)
     assert "airweave_worker_uptime_seconds" in text
     assert "3600.12" in text or "3600.123" in text
+
+
+def test_source_concurrency_gauges():
+    adapter, registry = _make_adapter()
+    adapter.update(
+        _make_snapshot(
+            connector_metrics={
+                "gmail": ConnectorSnapshot(
+                    active_syncs=1,
+                    active_and_pending_workers=30,
+                    concurrency_limit=12,
+                    requests_in_flight=7,
+                    throttle_events=3,
+                ),
+            }
+        )
+    )
+    adapter.update(_make_snapshot(connector_metrics={}))
+
+    text = _render(registry)
+    assert (
+        'airweave_worker_source_concurrency_limit{connector_type="gmail",worker_id="0"} 0.0'
+        in text
+    )
+    assert "airweave_worker_source_requests_in_flight" in text
+    assert "airweave_worker_source_throttle_events" in text
+
+
+def test_source_stream_gauges():
+    adapter, registry = _make_adapter()
+    adapter.update(
+        _make_snapshot(
+            stream_max_queue_bytes=2**28,
+            connector_metrics={
+                "slack": ConnectorSnapshot(
+                    active_syncs=1,
+                    active_and_pending_workers=5,
+                    stream_queue_depth=120,
+                    stream_queued_bytes=3 * 2**20,
+                ),
+            },
+        )
+    )
+
+    text = _render(registry)
+    labels = 'connector_type="slack",worker_id="0"'
+    assert f"airweave_worker_source_stream_queue_depth{{{labels}}} 120.0" in text
+    assert f"airweave_worker_source_stream_queued_bytes{{{labels}}} 3.145728e+06" in text
+    assert 'airweave_worker_stream_max_queue_bytes_config{worker_id="0"} 2.68435456e+08' in text
+
+    adapter.update(_make_snapshot(connector_metrics={}))
+    assert f"airweave_worker_source_stream_queued_bytes{{{labels}}} 0.0" in _render(registry)
+
+
+def test_event_bus_gauges():
+    from airweave.core.protocols.event_bus import EventSubscriberSnapshot
+
+    adapter, registry = _make_adapter()
+    adapter.update(
+        _make_snapshot(
+            event_subscribers=(
+                EventSubscriberSnapshot(
+                    subscriber="WebhookEventSubscriber",
+                    queue_depth=12,
+                    delivered=100,
+                    failed=0,
+                    dropped=2,
+                    coalesced=40,
+                    lag_ms=250.0,
+                    max_lag_ms=900.0,
+                ),
+            )
+        )
+    )
+
+    text = _render(registry)
+    labels = 'subscriber="WebhookEventSubscriber",worker_id="0"'
+    assert f"airweave_worker_event_queue_depth{{{labels}}} 12.0" in text
+    assert f"airweave_worker_event_lag_seconds{{{labels}}} 0.25" in text
+    assert f"airweave_worker_events_dropped{{{labels}}} 2.0" in text
+    assert f"airweave_worker_events_coalesced{{{labels}}} 40.0" in text
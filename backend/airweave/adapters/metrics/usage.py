@@ -0,0 +1,86 @@
+"""Usage ledger metrics adapters (Prometheus + Fake).
+
+Prometheus implementation exposes the usage recorded but not yet written to
+the database per action type, and a histogram of per-organization flush
+latency labelled by outcome.
+"""
+
+from dataclasses import dataclass
+
+from prometheus_client import CollectorRegistry, Gauge, Histogram
+
+from airweave.core.protocols.metrics import UsageLedgerMetrics
+
+# One usage upsert per organization; slow flushes mean DB pressure
+FLUSH_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class PrometheusUsageLedgerMetrics(UsageLedgerMetrics):
+    """Prometheus-backed usage ledger metrics."""
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        """Initialize the pending gauge and flush histogram on the given registry."""
+        self._registry = registry or CollectorRegistry()
+
+        self._pending = Gauge(
+            "airweave_usage_pending",
+            "Usage recorded in memory and not yet written to the database",
+            ["action_type"],
+            registry=self._registry,
+        )
+
+        self._flush_duration = Histogram(
+            "airweave_usage_flush_duration_seconds",
+            "Time to write one organization's pending usage",
+            ["outcome"],
+            buckets=FLUSH_BUCKETS,
+            registry=self._registry,
+        )
+
+    # -- UsageLedgerMetrics protocol methods --
+
+    def set_pending(self, action_type: str, amount: int) -> None:
+        """Set the usage of an action type still waiting to be written."""
+        self._pending.labels(action_type=action_type).set(amount)
+
+    def observe_flush(self, duration: float, success: bool) -> None:
+        """Record how long one organization's flush took and whether it succeeded."""
+        outcome = "success" if success else "error"
+        self._flush_duration.labels(outcome=outcome).observe(duration)
+
+
+# ---------------------------------------------------------------------------
+# Fake
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class FlushRecord:
+    """Single recorded flush observation."""
+
+    duration: float
+    success: bool
+
+
+class FakeUsageLedgerMetrics(UsageLedgerMetrics):
+    """In-memory spy implementing the UsageLedgerMetrics protocol."""
+
+    def __init__(self) -> None:
+        """Initialize empty pending state and flush list."""
+        self.pending: dict[str, int] = {}
+        self.flushes: list[FlushRecord] = []
+
+    def set_pending(self, action_type: str, amount: int) -> None:
+        """Record the pending usage of an action type."""
+        self.pending[action_type] = amount
+
+    def observe_flush(self, duration: float, success: bool) -> None:
+        """Record a flush observation."""
+        self.flushes.append(FlushRecord(duration=duration, success=success))
+
+    # -- test helpers --
+
+    def clear(self) -> None:
+        """Reset all recorded state."""
+        self.pending.clear()
+        self.flushes.clear()
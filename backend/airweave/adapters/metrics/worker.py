@@ -1,6 +1,6 @@
 """Worker metrics adapters (Prometheus + Fake).
 
-Prometheus implementation owns all 11 gauges, the Info metric, and the
+Prometheus implementation owns all 17 gauges, the Info metric, and the
 ProcessCollector for Temporal worker instrumentation.
 """
 
@@ -84,6 +84,72 @@ class PrometheusWorkerMetrics(WorkerMetrics):
             registry=registry,
         )
 
+        # Per-connector adaptive concurrency (summed over live source connections)
+        self._source_concurrency_limit = Gauge(
+            "airweave_worker_source_concurrency_limit",
+            "Current adaptive (AIMD) concurrency limit by connector type",
+            ["worker_id", "connector_type"],
+            registry=registry,
+        )
+
+        self._source_requests_in_flight = Gauge(
+            "airweave_worker_source_requests_in_flight",
+            "Upstream requests currently in flight by connector type",
+            ["worker_id", "connector_type"],
+            registry=registry,
+        )
+
+        self._source_throttle_events = Gauge(
+            "airweave_worker_source_throttle_events",
+            "429/503/timeout responses seen by live source connections, by connector type",
+            ["worker_id", "connector_type"],
+            registry=registry,
+        )
+
+        # Source stream queues: entities fetched but not yet processed
+        self._stream_queue_depth = Gauge(
+            "airweave_worker_source_stream_queue_depth",
+            "Entities waiting in sync source stream queues by connector type",
+            ["worker_id", "connector_type"],
+            registry=registry,
+        )
+
+        self._stream_queued_bytes = Gauge(
+            "airweave_worker_source_stream_queued_bytes",
+            "Estimated payload of entities waiting in sync source stream queues by connector type",
+            ["worker_id", "connector_type"],
+            registry=registry,
+        )
+
+        # Event bus delivery (per subscriber: webhooks, analytics, billing, progress relay)
+        self._event_queue_depth = Gauge(
+            "airweave_worker_event_queue_depth",
+            "Domain events waiting for delivery, by subscriber",
+            ["worker_id", "subscriber"],
+            registry=registry,
+        )
+
+        self._event_lag_seconds = Gauge(
+            "airweave_worker_event_lag_seconds",
+            "Time the last delivered event spent queued, by subscriber",
+            ["worker_id", "subscriber"],
+            registry=registry,
+        )
+
+        self._events_dropped = Gauge(
+            "airweave_worker_events_dropped",
+            "Events dropped because the subscriber's queue was full",
+            ["worker_id", "subscriber"],
+            registry=registry,
+        )
+
+        self._events_coalesced = Gauge(
+            "airweave_worker_events_coalesced",
+            "Events merged into an earlier queued event (e.g. entity batches)",
+            ["worker_id", "subscriber"],
+            registry=registry,
+        )
+
         # Config value gauges
         self._sync_max_workers_config = Gauge(
             "airweave_worker_sync_max_workers_config",
@@ -92,6 +158,13 @@ class PrometheusWorkerMetrics(WorkerMetrics):
             registry=registry,
         )
 
+        self._stream_max_queue_bytes_config = Gauge(
+            "airweave_worker_stream_max_queue_bytes_config",
+            "Configured source stream byte budget per sync (SYNC_STREAM_MAX_QUEUE_BYTES)",
+            ["worker_id"],
+            registry=registry,
+        )
+
         self._thread_pool_size_config = Gauge(
             "airweave_worker_thread_pool_size_config",
             "Configured thread pool size per worker pod (SYNC_THREAD_POOL_SIZE)",
@@ -147,6 +220,26 @@ class PrometheusWorkerMetrics(WorkerMetrics):
                 worker_id=wid, connector_type=connector_type
             ).set(cs.active_syncs)
 
+            self._source_concurrency_limit.labels(worker_id=wid, connector_type=connector_type).set(
+                cs.concurrency_limit
+            )
+
+            self._source_requests_in_flight.labels(
+                worker_id=wid, connector_type=connector_type
+            ).set(cs.requests_in_flight)
+
+            self._source_throttle_events.labels(worker_id=wid, connector_type=connector_type).set(
+                cs.throttle_events
+            )
+
+            self._stream_queue_depth.labels(worker_id=wid, connector_type=connector_type).set(
+                cs.stream_queue_depth
+            )
+
+            self._stream_queued_bytes.labels(worker_id=wid, connector_type=connector_type).set(
+                cs.stream_queued_bytes
+            )
+
         # Zero out connectors that finished since last scrape
         previous = self._previous_connector_labels.get(wid, set())
         for connector_type in previous - current_connector_labels:
@@ -156,11 +249,31 @@ class PrometheusWorkerMetrics(WorkerMetrics):
             self._active_syncs_by_connector.labels(
                 worker_id=wid, connector_type=connector_type
             ).set(0)
+            self._source_concurrency_limit.labels(worker_id=wid, connector_type=connector_type).set(
+                0
+            )
+            self._source_requests_in_flight.labels(
+                worker_id=wid, connector_type=connector_type
+            ).set(0)
+            self._source_throttle_events.labels(worker_id=wid, connector_type=connector_type).set(0)
+            self._stream_queue_depth.labels(worker_id=wid, connector_type=connector_type).set(0)
+            self._stream_queued_bytes.labels(worker_id=wid, connector_type=connector_type).set(0)
 
         self._previous_connector_labels[wid] = current_connector_labels
 
+        # Event bus gauges (subscribers are fixed at startup, no zeroing needed)
+        for sub in snapshot.event_subscribers:
+            labels = {"worker_id": wid, "subscriber": sub.subscriber}
+            self._event_queue_depth.labels(**labels).set(sub.queue_depth)
+            self._event_lag_seconds.labels(**labels).set(sub.lag_ms / 1000)
+            self._events_dropped.labels(**labels).set(sub.dropped)
+            self._events_coalesced.labels(**labels).set(sub.coalesced)
+
         # Config gauges
         self._sync_max_workers_config.labels(worker_id=wid).set(snapshot.sync_max_workers)
+        self._stream_max_queue_bytes_config.labels(worker_id=wid).set(
+            snapshot.stream_max_queue_bytes
+        )
         self._thread_pool_size_config.labels(worker_id=wid).set(snapshot.thread_pool_size)
 
         # Thread pool active
@@ -75,6 +75,9 @@ class FakePubSub:
             close_error=self.close_error,
         )
 
+    async def close(self) -> None:
+        """No-op: there are no connections to release."""
+
     async def store_snapshot(self, key: str, data: str, ttl_seconds: int) -> None:
         """Record a snapshot with its TTL."""
         self.snapshots[key] = (data, ttl_seconds)
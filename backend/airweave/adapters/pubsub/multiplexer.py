@@ -0,0 +1,283 @@
+"""Pod-level multiplexing of pub/sub subscriptions.
+
+Every SSE client used to open its own Redis connection for a single channel,
+so a dashboard with hundreds of sync-progress tabs held hundreds of Redis
+connections per API pod. ``PubSubMultiplexer`` instead opens one connection
+per namespace, pattern-subscribes to ``<namespace>:*`` and fans messages out
+to in-process queues, one per local subscriber.
+
+- A namespace connection is opened by its first subscriber and closed once it
+  has had no subscribers for ``idle_close_seconds``.
+- Each subscriber has a bounded queue. A subscriber that falls more than
+  ``max_queue_size`` messages behind is disconnected with
+  ``SlowConsumerError`` so it cannot hold memory or delay others; SSE
+  clients reconnect.
+- If a namespace connection fails, its subscribers are disconnected with the
+  error and the next subscribe opens a fresh connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+from airweave.core.protocols.metrics import PubSubMetrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_IDLE_CLOSE_SECONDS = 30.0
+
+_CLOSED = object()
+
+
+class SlowConsumerError(Exception):
+    """Raised from ``listen()`` when a subscriber fell too far behind."""
+
+
+class MultiplexedSubscription:
+    """One local subscriber to a channel; satisfies ``PubSubSubscription``."""
+
+    def __init__(
+        self, multiplexer: PubSubMultiplexer, namespace: str, channel: str, max_queue_size: int
+    ) -> None:
+        """Initialize an open subscription with an empty queue."""
+        self.namespace = namespace
+        self.channel = channel
+        self._multiplexer = multiplexer
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    def deliver(self, message: dict[str, Any]) -> None:
+        """Queue a message without blocking the namespace reader."""
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(
+                f"PubSub: disconnecting slow subscriber on {self.channel} "
+                f"({self._queue.maxsize} messages behind)"
+            )
+            self._multiplexer._count_slow_consumer(self.namespace)
+            self.disconnect(SlowConsumerError(f"Subscriber on {self.channel} fell behind"))
+
+    def disconnect(self, error: Optional[BaseException] = None) -> None:
+        """End the subscription; ``listen()`` raises ``error`` if one is given."""
+        if self._closed:
+            return
+        self._closed = True
+        self._error = error
+        self._multiplexer._detach(self)
+        # Pending messages are discarded; the consumer is going away
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield a subscribe confirmation, then messages for the channel."""
+        yield {"type": "subscribe", "channel": self.channel, "data": 1}
+        while True:
+            message = await self._queue.get()
+            if message is _CLOSED:
+                if self._error is not None:
+                    raise self._error
+                return
+            yield message
+
+    async def close(self) -> None:
+        """Stop receiving messages."""
+        self.disconnect()
+
+
+class _Namespace:
+    """One pattern subscription and the local subscribers it feeds."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.pattern = f"{name}:*"
+        self.client: Any = None
+        self.pubsub: Any = None
+        self.reader: Optional[asyncio.Task] = None
+        self.idle_closer: Optional[asyncio.Task] = None
+        self.channels: Dict[str, Set[MultiplexedSubscription]] = {}
+        self.subscriber_count = 0
+        self.failed = False
+
+
+class PubSubMultiplexer:
+    """Shares one pattern subscription per namespace between local subscribers.
+
+    Args:
+        connect: Opens a new Redis client for a namespace connection.
+        max_queue_size: Messages buffered per subscriber before it is disconnected.
+        idle_close_seconds: How long an unused namespace connection stays open.
+        metrics: Optional connection and subscriber gauges.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        *,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        idle_close_seconds: float = DEFAULT_IDLE_CLOSE_SECONDS,
+        metrics: Optional[PubSubMetrics] = None,
+    ) -> None:
+        """Initialize with no namespace connections open."""
+        self._connect = connect
+        self._max_queue_size = max_queue_size
+        self._idle_close_seconds = idle_close_seconds
+        self._metrics = metrics
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def subscribe(self, namespace: str, channel: str) -> MultiplexedSubscription:
+        """Register a local subscriber, opening the namespace connection if needed."""
+        async with self._lock(namespace):
+            ns = self._namespaces.get(namespace)
+            if ns is None or ns.failed:
+                ns = await self._open(namespace)
+            if ns.idle_closer is not None:
+                ns.idle_closer.cancel()
+                ns.idle_closer = None
+            subscription = MultiplexedSubscription(self, namespace, channel, self._max_queue_size)
+            ns.channels.setdefault(channel, set()).add(subscription)
+            ns.subscriber_count += 1
+            self._report(ns)
+            return subscription
+
+    async def close(self) -> None:
+        """Disconnect every subscriber and close all namespace connections."""
+        namespaces = list(self._namespaces.values())
+        self._namespaces.clear()
+        for ns in namespaces:
+            self._disconnect_all(ns)
+            await self._shutdown(ns)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Open connections and local subscribers per namespace."""
+        return {
+            name: {
+                "connections": 0 if ns.failed else 1,
+                "subscribers": ns.subscriber_count,
+                "channels": len(ns.channels),
+            }
+            for name, ns in self._namespaces.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Namespace connections
+    # ------------------------------------------------------------------
+
+    def _lock(self, namespace: str) -> asyncio.Lock:
+        lock = self._locks.get(namespace)
+        if lock is None:
+            lock = self._locks[namespace] = asyncio.Lock()
+        return lock
+
+    async def _open(self, namespace: str) -> _Namespace:
+        ns = _Namespace(namespace)
+        ns.client = await self._connect()
+        ns.pubsub = ns.client.pubsub()
+        try:
+            await ns.pubsub.psubscribe(ns.pattern)
+        except Exception:
+            await self._close_connection(ns)
+            raise
+        ns.reader = asyncio.create_task(self._read(ns), name=f"pubsub:{namespace}")
+        self._namespaces[namespace] = ns
+        logger.info(f"PubSub: opened shared subscription {ns.pattern}")
+        return ns
+
+    async def _read(self, ns: _Namespace) -> None:
+        try:
+            async for message in ns.pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                subscribers = ns.channels.get(message["channel"])
+                if not subscribers:
+                    continue
+                out = {"type": "message", "channel": message["channel"], "data": message["data"]}
+                for subscription in tuple(subscribers):
+                    subscription.deliver(out)
+            raise ConnectionError(f"Subscription {ns.pattern} ended")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"PubSub: shared subscription {ns.pattern} failed: {e}")
+            ns.failed = True
+            if self._namespaces.get(ns.name) is ns:
+                del self._namespaces[ns.name]
+            self._disconnect_all(ns, e)
+            await self._close_connection(ns)
+            self._report(ns)
+
+    @staticmethod
+    def _disconnect_all(ns: _Namespace, error: Optional[BaseException] = None) -> None:
+        subscriptions = [s for subs in ns.channels.values() for s in subs]
+        ns.channels.clear()
+        ns.subscriber_count = 0
+        for subscription in subscriptions:
+            subscription.disconnect(error)
+
+    def _detach(self, subscription: MultiplexedSubscription) -> None:
+        ns = self._namespaces.get(subscription.namespace)
+        if ns is None:
+            return
+        subscribers = ns.channels.get(subscription.channel)
+        if subscribers is None or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del ns.channels[subscription.channel]
+        ns.subscriber_count -= 1
+        self._report(ns)
+        if ns.subscriber_count == 0 and ns.idle_closer is None:
+            ns.idle_closer = asyncio.create_task(self._close_when_idle(ns))
+
+    async def _close_when_idle(self, ns: _Namespace) -> None:
+        await asyncio.sleep(self._idle_close_seconds)
+        async with self._lock(ns.name):
+            if ns.subscriber_count or self._namespaces.get(ns.name) is not ns:
+                return
+            ns.idle_closer = None
+            del self._namespaces[ns.name]
+            await self._shutdown(ns)
+            logger.info(f"PubSub: closed idle shared subscription {ns.pattern}")
+
+    async def _shutdown(self, ns: _Namespace) -> None:
+        ns.failed = True
+        for task in (ns.idle_closer, ns.reader):
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        await self._close_connection(ns)
+        self._report(ns)
+
+    @staticmethod
+    async def _close_connection(ns: _Namespace) -> None:
+        try:
+            if ns.pubsub is not None:
+                await ns.pubsub.close()
+            if ns.client is not None:
+                await ns.client.close()
+        except Exception as e:
+            logger.debug(f"PubSub: error closing {ns.pattern}: {e}")
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def _report(self, ns: _Namespace) -> None:
+        if self._metrics is not None:
+            self._metrics.update(
+                namespace=ns.name,
+                connections=0 if ns.failed else 1,
+                subscribers=ns.subscriber_count,
+            )
+
+    def _count_slow_consumer(self, namespace: str) -> None:
+        if self._metrics is not None:
+            self._metrics.inc_slow_consumer_disconnects(namespace)
@@ -10,7 +10,8 @@ Usage patterns:
 
 Notes:
 - Publishes accept either strings (already JSON) or dicts which will be JSON-encoded
-- Subscriptions create a dedicated Redis connection suited for long-lived SSE streams
+- Subscriptions share one dedicated Redis connection per namespace and pod
+  (see ``PubSubMultiplexer``), so open SSE streams do not each hold a connection
 """
 
 from __future__ import annotations
@@ -21,13 +22,34 @@ from typing import Any
 
 import redis.asyncio as redis
 
+from airweave.adapters.pubsub.multiplexer import (
+    DEFAULT_MAX_QUEUE_SIZE,
+    MultiplexedSubscription,
+    PubSubMultiplexer,
+)
 from airweave.core.config import settings
+from airweave.core.protocols.metrics import PubSubMetrics
 from airweave.core.redis_client import redis_client
 
 
 class RedisPubSub:
     """Redis-backed implementation of the PubSub protocol."""
 
+    def __init__(
+        self,
+        metrics: PubSubMetrics | None = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    ) -> None:
+        """Initialize the adapter.
+
+        Args:
+            metrics: Optional connection and subscriber gauges.
+            max_queue_size: Messages buffered per subscriber before it is disconnected.
+        """
+        self._multiplexer = PubSubMultiplexer(
+            self._connect, max_queue_size=max_queue_size, metrics=metrics
+        )
+
     @staticmethod
     def make_channel(namespace: str, id_str: str) -> str:
         """Build a Redis channel name as ``<namespace>:<id>``."""
@@ -52,21 +74,30 @@ class RedisPubSub:
         """Store a snapshot in Redis with a TTL (for stall detection)."""
         await redis_client.client.setex(key, ttl_seconds, data)
 
-    async def subscribe(self, namespace: str, id_value: Any) -> redis.client.PubSub:
-        """Create a dedicated pubsub connection and subscribe to a channel.
-
-        A separate client is created for pubsub to avoid connection pool
-        interference with regular Redis usage.
+    async def subscribe(self, namespace: str, id_value: Any) -> MultiplexedSubscription:
+        """Subscribe to a channel through the namespace's shared connection.
 
         Args:
             namespace: The channel namespace
             id_value: Identifier used to build the channel name
 
         Returns:
-            A Redis ``PubSub`` instance subscribed to the channel
+            A subscription yielding the channel's messages
         """
         channel = self.make_channel(namespace, str(id_value))
+        return await self._multiplexer.subscribe(namespace, channel)
 
+    async def close(self) -> None:
+        """End all subscriptions and close the shared connections."""
+        await self._multiplexer.close()
+
+    @staticmethod
+    async def _connect() -> redis.Redis:
+        """Create a dedicated client for a shared pubsub connection.
+
+        A separate client is created for pubsub to avoid connection pool
+        interference with regular Redis usage.
+        """
         if settings.REDIS_PASSWORD:
             from urllib.parse import quote
 
@@ -92,14 +123,10 @@ class RedisPubSub:
             else:
                 socket_keepalive_options = {}
 
-        pubsub_redis = await redis.from_url(
+        return await redis.from_url(
             redis_url,
             decode_responses=True,
             socket_keepalive=True,
             socket_connect_timeout=5,
             socket_keepalive_options=socket_keepalive_options,
         )
-
-        pubsub = pubsub_redis.pubsub()
-        await pubsub.subscribe(channel)
-        return pubsub
@@ -0,0 +1 @@
+"""Tests for PubSub adapters."""
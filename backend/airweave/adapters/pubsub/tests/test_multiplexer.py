@@ -0,0 +1,200 @@
+"""Unit tests for PubSubMultiplexer."""
+
+import asyncio
+import fnmatch
+
+import pytest
+
+from airweave.adapters.metrics import FakePubSubMetrics
+from airweave.adapters.pubsub.multiplexer import PubSubMultiplexer, SlowConsumerError
+
+
+class _FakeRedisPubSub:
+    def __init__(self, broker: "_FakeBroker") -> None:
+        self._broker = broker
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self.patterns: list[str] = []
+
+    async def psubscribe(self, pattern: str) -> None:
+        self.patterns.append(pattern)
+        self._broker.connections.append(self)
+
+    async def listen(self):
+        while True:
+            message = await self._queue.get()
+            if isinstance(message, BaseException):
+                raise message
+            yield message
+
+    async def close(self) -> None:
+        if self in self._broker.connections:
+            self._broker.connections.remove(self)
+
+
+class _FakeBroker:
+    """Routes published messages to pattern subscriptions like Redis does."""
+
+    def __init__(self) -> None:
+        self.connections: list[_FakeRedisPubSub] = []
+        self.clients_opened = 0
+
+    async def connect(self):
+        self.clients_opened += 1
+        broker = self
+
+        class _Client:
+            def pubsub(self):
+                return _FakeRedisPubSub(broker)
+
+            async def close(self):
+                pass
+
+        return _Client()
+
+    def publish(self, channel: str, data: str) -> None:
+        for conn in self.connections:
+            for pattern in conn.patterns:
+                if fnmatch.fnmatchcase(channel, pattern):
+                    conn._queue.put_nowait(
+                        {"type": "pmessage", "pattern": pattern, "channel": channel, "data": data}
+                    )
+
+    def fail(self, error: Exception) -> None:
+        for conn in self.connections:
+            conn._queue.put_nowait(error)
+
+
+async def _next_message(subscription, timeout: float = 1.0):
+    async def _read():
+        async for message in subscription.listen():
+            if message["type"] == "message":
+                return message["data"]
+
+    return await asyncio.wait_for(_read(), timeout)
+
+
+@pytest.fixture
+def broker():
+    return _FakeBroker()
+
+
+@pytest.mark.asyncio
+async def test_subscribers_in_a_namespace_share_one_connection(broker):
+    metrics = FakePubSubMetrics()
+    mux = PubSubMultiplexer(broker.connect, metrics=metrics)
+
+    subs = [await mux.subscribe("sync_job", f"sync_job:{i}") for i in range(50)]
+    await mux.subscribe("search", "search:req-1")
+
+    assert broker.clients_opened == 2
+    assert metrics.connections == {"sync_job": 1, "search": 1}
+    assert metrics.subscribers["sync_job"] == 50
+    assert [c.patterns for c in broker.connections] == [["sync_job:*"], ["search:*"]]
+    await subs[0].close()
+    assert metrics.subscribers["sync_job"] == 49
+    await mux.close()
+
+
+@pytest.mark.asyncio
+async def test_messages_reach_only_subscribers_of_the_channel(broker):
+    mux = PubSubMultiplexer(broker.connect)
+    a1 = await mux.subscribe("sync_job", "sync_job:a")
+    a2 = await mux.subscribe("sync_job", "sync_job:a")
+    b = await mux.subscribe("sync_job", "sync_job:b")
+
+    broker.publish("sync_job:a", "for-a")
+    broker.publish("sync_job:b", "for-b")
+    broker.publish("sync_job_state:a", "other-namespace")
+
+    assert await _next_message(a1) == "for-a"
+    assert await _next_message(a2) == "for-a"
+    assert await _next_message(b) == "for-b"
+    await mux.close()
+
+
+@pytest.mark.asyncio
+async def test_listen_starts_with_subscribe_confirmation(broker):
+    mux = PubSubMultiplexer(broker.connect)
+    sub = await mux.subscribe("search", "search:r")
+
+    first = await sub.listen().__anext__()
+
+    assert first["type"] == "subscribe"
+    await mux.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_disconnected_without_affecting_others(broker):
+    metrics = FakePubSubMetrics()
+    mux = PubSubMultiplexer(broker.connect, max_queue_size=3, metrics=metrics)
+    slow = await mux.subscribe("sync_job", "sync_job:a")
+    fast = await mux.subscribe("sync_job", "sync_job:a")
+    fast_stream = fast.listen()
+    await fast_stream.__anext__()
+
+    received = []
+    for i in range(5):
+        broker.publish("sync_job:a", str(i))
+        received.append((await asyncio.wait_for(fast_stream.__anext__(), 1.0))["data"])
+
+    assert received == ["0", "1", "2", "3", "4"]
+    assert metrics.slow_consumer_disconnects == {"sync_job": 1}
+    assert metrics.subscribers["sync_job"] == 1
+    with pytest.raises(SlowConsumerError):
+        await _next_message(slow)
+    await mux.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_failure_disconnects_subscribers_and_reconnects(broker):
+    mux = PubSubMultiplexer(broker.connect)
+    sub = await mux.subscribe("sync_job", "sync_job:a")
+
+    broker.fail(ConnectionError("connection reset"))
+
+    with pytest.raises(ConnectionError):
+        await _next_message(sub)
+    resubscribed = await mux.subscribe("sync_job", "sync_job:a")
+    broker.publish("sync_job:a", "after")
+
+    assert broker.clients_opened == 2
+    assert await _next_message(resubscribed) == "after"
+    await mux.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_namespace_connection_is_closed(broker):
+    metrics = FakePubSubMetrics()
+    mux = PubSubMultiplexer(broker.connect, idle_close_seconds=0.01, metrics=metrics)
+    sub = await mux.subscribe("sync_job", "sync_job:a")
+
+    await sub.close()
+    await asyncio.sleep(0.05)
+
+    assert broker.connections == []
+    assert metrics.connections == {"sync_job": 0}
+    assert mux.stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_resubscribing_within_grace_period_keeps_connection(broker):
+    mux = PubSubMultiplexer(broker.connect, idle_close_seconds=0.05)
+    await (await mux.subscribe("sync_job", "sync_job:a")).close()
+
+    await mux.subscribe("sync_job", "sync_job:b")
+    await asyncio.sleep(0.1)
+
+    assert broker.clients_opened == 1
+    assert len(broker.connections) == 1
+    await mux.close()
+
+
+@pytest.mark.asyncio
+async def test_close_ends_open_streams(broker):
+    mux = PubSubMultiplexer(broker.connect)
+    sub = await mux.subscribe("search", "search:r")
+
+    await mux.close()
+
+    assert await _next_message(sub) is None
+    assert broker.connections == []
@@ -90,7 +90,7 @@ class ContextResolver:
         organization_id = self._resolve_organization_id(x_organization_id, auth)
         organization = await self._get_or_fetch_organization(db, organization_id)
 
-        await self._validate_organization_access(db, organization_id, auth, x_api_key)
+        self._validate_organization_access(organization_id, auth)
 
         ctx = self._build_context(request, request_id, auth, organization)
 
@@ -183,7 +183,9 @@ class ContextResolver:
                 f"endpoint={request.url.path} created_by={api_key_obj.created_by_email}"
             )
 
-            await self._cache.set_api_key_org_id(api_key, org_id)
+            await self._cache.set_api_key_org_id(
+                api_key, org_id, expires_at=api_key_obj.expiration_date
+            )
 
             return AuthResult(
                 method=AuthMethod.API_KEY,
@@ -225,7 +227,10 @@ class ContextResolver:
 
         user_update = schemas.UserUpdate(last_active_at=datetime.utcnow())
         user = await self._users.update_user_no_auth(db, id=user.id, obj_in=user_update)
-        return schemas.User.model_validate(user)
+        user_schema = schemas.User.model_validate(user)
+        # The resolver's session is closed before the endpoint runs
+        await db.commit()
+        return user_schema
 
     # ------------------------------------------------------------------
     # Organization resolution
@@ -270,13 +275,7 @@ class ContextResolver:
     # Access validation
     # ------------------------------------------------------------------
 
-    async def _validate_organization_access(
-        self,
-        db: AsyncSession,
-        organization_id: str,
-        auth: AuthResult,
-        x_api_key: Optional[str],
-    ) -> None:
+    def _validate_organization_access(self, organization_id: str, auth: AuthResult) -> None:
         if auth.method in (AuthMethod.AUTH0, AuthMethod.SYSTEM):
             if not auth.user:
                 raise HTTPException(
@@ -290,9 +289,10 @@ class ContextResolver:
                     detail=f"User does not have access to organization {organization_id}",
                 )
 
-        elif auth.method == AuthMethod.API_KEY and x_api_key:
-            api_key_obj = await self._api_keys.get_by_key(db, key=x_api_key)
-            if str(api_key_obj.organization_id) != organization_id:
+        elif auth.method == AuthMethod.API_KEY and auth.api_key_org_id:
+            # Set from the validated key, or from the cache, which drops keys
+            # when they are deleted and never keeps them past their expiry
+            if auth.api_key_org_id != organization_id:
                 raise HTTPException(
                     status_code=403,
                     detail=f"API key does not have access to organization {organization_id}",
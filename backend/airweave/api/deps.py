@@ -23,7 +23,7 @@ from airweave.core.logging import ContextualLogger
 from airweave.core.protocols.cache import ContextCache
 from airweave.core.protocols.rate_limiter import RateLimiter
 from airweave.core.shared_models import AuthMethod
-from airweave.db.session import get_db
+from airweave.db.session import get_db, get_db_context  # noqa: F401 — get_db re-exported
 from airweave.domains.organizations.repository import ApiKeyRepository, OrganizationRepository
 from airweave.domains.users.repository import UserRepository
 
@@ -88,14 +88,20 @@ def require_org_role(
 
 async def get_context(
     request: Request,
-    db: AsyncSession = Depends(get_db),
     x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
     x_organization_id: Optional[str] = Header(None, alias="X-Organization-ID"),
     auth0_user: Optional[Auth0User] = Depends(auth0.get_user),
     cache: ContextCache = Inject(ContextCache),
     rate_limiter: RateLimiter = Inject(RateLimiter),
 ) -> ApiContext:
-    """Create unified API context for the request."""
+    """Create unified API context for the request.
+
+    The resolver gets its own session rather than the endpoint's ``get_db``
+    one: a session only takes a pooled connection when it first queries, so
+    requests served from the context cache never touch the pool, and a
+    connection taken on a cache miss goes back to the pool before the
+    endpoint runs instead of being held until the response is sent.
+    """
     resolver = ContextResolver(
         cache=cache,
         rate_limiter=rate_limiter,
@@ -103,7 +109,8 @@ async def get_context(
         api_key_repo=_api_key_repo,
         org_repo=_org_repo,
     )
-    return await resolver.resolve(request, db, auth0_user, x_api_key, x_organization_id)
+    async with get_db_context() as db:
+        return await resolver.resolve(request, db, auth0_user, x_api_key, x_organization_id)
 
 
 async def get_logger(
@@ -114,7 +121,6 @@ async def get_logger(
 
 
 async def get_user(
-    db: AsyncSession = Depends(get_db),
     auth0_user: Optional[Auth0User] = Depends(auth0.get_user),
     cache: ContextCache = Inject(ContextCache),
     rate_limiter: RateLimiter = Inject(RateLimiter),
@@ -127,7 +133,8 @@ async def get_user(
         api_key_repo=_api_key_repo,
         org_repo=_org_repo,
     )
-    return await resolver.authenticate_user_only(db, auth0_user)
+    async with get_db_context() as db:
+        return await resolver.authenticate_user_only(db, auth0_user)
 
 
 async def get_user_from_token(token: str, db: AsyncSession) -> Optional[schemas.User]:
@@ -1,19 +1,20 @@
 """Middleware for the FastAPI application.
 
-This module contains middleware that process requests and responses.
+This module contains the ASGI middleware that process requests and responses,
+and the exception handlers registered on the app.
 """
 
 import asyncio
 import time
 import traceback
 import uuid
-from collections.abc import AsyncIterator, Awaitable, Callable
 
 from fastapi import Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from airweave.analytics.service import analytics
 from airweave.api.context import ApiContext
@@ -32,212 +33,319 @@ from airweave.core.exceptions import (
 from airweave.core.logging import logger
 from airweave.core.protocols import HttpMetrics
 
-
-async def add_request_id(request: Request, call_next: callable) -> Response:
-    """Middleware to generate and add a request ID to the request for tracing.
-
-    Args:
-    ----
-        request (Request): The incoming request.
-        call_next (callable): The next middleware in the chain.
-
-    Returns:
-    -------
-        Response: The response to the incoming request.
-
-    """
-    request.state.request_id = str(uuid.uuid4())
-    return await call_next(request)
-
-
-async def log_requests(request: Request, call_next: callable) -> Response:
-    """Middleware to log incoming requests.
-
-    Args:
-    ----
-        request (Request): The incoming request.
-        call_next (callable): The next middleware in the chain.
-
-    Returns:
-    -------
-        Response: The response to the incoming request.
-
-    """
-    start_time = time.time()
-    response = await call_next(request)
-    duration = time.time() - start_time
-    logger.info(
-        (
-            f"Handled request {request.method} {request.url} in {duration:.2f} seconds."
-            f"Response code: {response.status_code}"
-        )
-    )
-    return response
-
-
-async def exception_logging_middleware(request: Request, call_next: callable) -> Response:
-    """Middleware to log unhandled exceptions.
-
-    Args:
-    ----
-        request (Request): The incoming request.
-        call_next (callable): The next middleware in the chain.
-
-    Returns:
-    -------
-        Response: The response to the incoming request.
-
-    """
-    try:
-        response = await call_next(request)
-        return response
-    except Exception as exc:
-        # Always log the full exception details
-        logger.error(f"Unhandled exception: {exc}\n{traceback.format_exc()}")
-
-        # Create error message with actual exception details
-        error_message = f"Internal Server Error: {exc.__class__.__name__}: {str(exc)}"
-
-        # Build response content
-        response_content = {"detail": error_message}
-
-        # Include stack trace only in development mode
-        if settings.LOCAL_CURSOR_DEVELOPMENT or settings.DEBUG:
-            response_content["trace"] = traceback.format_exc()
-
-        return JSONResponse(status_code=500, content=response_content)
-
-
 # Paths that are exempt from the request timeout (long-running operations)
 TIMEOUT_EXEMPT_PATHS = [
     "/search/agentic",  # Agentic search (streaming and non-streaming)
 ]
 
+_METRICS_SKIP_PREFIXES = (
+    "/health",
+    "/metrics",
+    "/docs",
+    "/openapi.json",
+    "/favicon.ico",
+    "/redoc",
+)
+_METRICS_SKIP_EXACT = frozenset(_METRICS_SKIP_PREFIXES)
+_METRICS_SKIP_SLASH = tuple(p + "/" for p in _METRICS_SKIP_PREFIXES)
 
-async def request_timeout_middleware(request: Request, call_next: callable) -> Response:
-    """Middleware to enforce request timeout.
 
-    Wraps request processing in asyncio.wait_for() to prevent long-running requests
-    from tying up resources. Some paths are exempt from timeout (e.g., agentic search).
+class ApiMiddleware:
+    """Per-request handling for every HTTP request, as one pure-ASGI middleware.
 
-    Args:
-    ----
-        request (Request): The incoming request.
-        call_next (callable): The next middleware in the chain.
+    Assigns ``request.state.request_id`` for tracing, then applies, from the
+    outermost concern to the innermost:
 
-    Returns:
-    -------
-        Response: The response to the incoming request or 504 on timeout.
+    1. unhandled exceptions are logged and answered with a 500;
+    2. API calls are tracked in analytics;
+    3. requests are logged with their status and duration;
+    4. ``RateLimit-*`` headers are added from ``request.state.rate_limit_result``;
+    5. the request timeout is enforced until the response starts (504);
+    6. the ``Content-Length`` of the request body is checked (413);
+    7. HTTP metrics (counts, latency, in-flight, response size) are recorded.
 
+    A single ASGI layer avoids the task, memory stream and response wrapping
+    that ``BaseHTTPMiddleware`` adds per layer; streaming responses are passed
+    through message by message.
     """
-    # Check if this path is exempt from timeout
-    path = request.url.path
-    for exempt_path in TIMEOUT_EXEMPT_PATHS:
-        if exempt_path in path:
-            return await call_next(request)
 
-    try:
-        response = await asyncio.wait_for(
-            call_next(request), timeout=settings.API_REQUEST_TIMEOUT_SECONDS
-        )
-        return response
-    except asyncio.TimeoutError:
-        logger.warning(
-            f"Request timeout after {settings.API_REQUEST_TIMEOUT_SECONDS}s: "
-            f"{request.method} {request.url}"
-        )
-        return JSONResponse(
-            status_code=504,
-            content={
-                "detail": f"Request timeout after {settings.API_REQUEST_TIMEOUT_SECONDS} seconds"
-            },
-        )
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
 
+        Args:
+            app: The ASGI application to wrap
+        """
+        self.app = app
 
-async def request_body_size_middleware(request: Request, call_next: callable) -> Response:
-    """Middleware to enforce request body size limit.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection; non-HTTP scopes pass straight through."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    Checks the Content-Length header and rejects requests exceeding the configured limit.
-    This prevents large payloads from consuming excessive server resources.
+        request = Request(scope, receive)
+        request.state.request_id = str(uuid.uuid4())
+        response_started = False
 
-    Args:
-    ----
-        request (Request): The incoming request.
-        call_next (callable): The next middleware in the chain.
-
-    Returns:
-    -------
-        Response: The response to the incoming request or 413 if body is too large.
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-    """
-    # Check Content-Length header if present
-    content_length = request.headers.get("content-length")
-    if content_length:
         try:
-            content_length_bytes = int(content_length)
-            if content_length_bytes > settings.API_REQUEST_BODY_SIZE_LIMIT:
-                max_size_mb = settings.API_REQUEST_BODY_SIZE_LIMIT / (1024 * 1024)
-                actual_size_mb = content_length_bytes / (1024 * 1024)
-                logger.warning(
-                    f"Request body too large: {actual_size_mb:.2f}MB exceeds limit "
-                    f"of {max_size_mb:.2f}MB for {request.method} {request.url}"
-                )
-                return JSONResponse(
-                    status_code=413,
-                    content={
-                        "detail": (
-                            f"Request body too large. Maximum size is {max_size_mb:.2f}MB, "
-                            f"but request is {actual_size_mb:.2f}MB"
-                        )
-                    },
+            await self._observe(request, send_tracking_start)
+        except Exception as exc:
+            if response_started:
+                raise
+
+            # Always log the full exception details
+            logger.error(f"Unhandled exception: {exc}\n{traceback.format_exc()}")
+
+            # Create error message with actual exception details
+            error_message = f"Internal Server Error: {exc.__class__.__name__}: {str(exc)}"
+
+            # Build response content
+            response_content = {"detail": error_message}
+
+            # Include stack trace only in development mode
+            if settings.LOCAL_CURSOR_DEVELOPMENT or settings.DEBUG:
+                response_content["trace"] = traceback.format_exc()
+
+            await JSONResponse(status_code=500, content=response_content)(scope, receive, send)
+
+    async def _observe(self, request: Request, send: Send) -> None:
+        """Track analytics, log the request and add rate limit headers."""
+        start_time = time.time()
+        start_monotonic = time.monotonic()
+        track_analytics = not _should_skip_analytics(request)
+
+        async def send_observed(message: Message) -> None:
+            if message["type"] != "http.response.start":
+                await send(message)
+                return
+
+            # Add rate limit headers if available from request state (RFC 6585)
+            rate_limit_result = getattr(request.state, "rate_limit_result", None)
+            if rate_limit_result:
+                headers = MutableHeaders(scope=message)
+                headers["RateLimit-Limit"] = str(rate_limit_result.limit)
+                headers["RateLimit-Remaining"] = str(rate_limit_result.remaining)
+                headers["RateLimit-Reset"] = str(int(time.time() + rate_limit_result.retry_after))
+
+            await send(message)
+
+            status_code = message["status"]
+            duration = time.time() - start_time
+            logger.info(
+                (
+                    f"Handled request {request.method} {request.url} in {duration:.2f} seconds."
+                    f"Response code: {status_code}"
                 )
-        except ValueError:
-            logger.warning(f"Invalid Content-Length header: {content_length}")
+            )
+
+            if not track_analytics:
+                return
+            context = getattr(request.state, "api_context", None)
+            if context:
+                duration_ms = (time.monotonic() - start_monotonic) * 1000
+                try:
+                    await _track_api_call_async(context, status_code, duration_ms, request)
+                except Exception as e:
+                    logger.warning(f"Failed to track API analytics: {e}")
+
+        await self._limit(request, send_observed)
+
+    async def _limit(self, request: Request, send: Send) -> None:
+        """Enforce the request timeout and the request body size limit.
+
+        The timeout covers the time until the response starts, so streaming
+        responses are not cut off once their headers have been sent. Some
+        paths are exempt from the timeout (e.g., agentic search).
+        """
+        path = request.scope["path"]
+        if any(exempt_path in path for exempt_path in TIMEOUT_EXEMPT_PATHS):
+            await self._limit_body_size(request, send)
+            return
 
-    return await call_next(request)
+        response_started = False
 
+        async def send_disarming_timeout(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                deadline.reschedule(None)
+            await send(message)
 
-async def rate_limit_headers_middleware(request: Request, call_next: callable) -> Response:
-    """Middleware to add rate limit headers to responses.
+        try:
+            async with asyncio.timeout(settings.API_REQUEST_TIMEOUT_SECONDS) as deadline:
+                await self._limit_body_size(request, send_disarming_timeout)
+        except TimeoutError:
+            if response_started:
+                raise
+            logger.warning(
+                f"Request timeout after {settings.API_REQUEST_TIMEOUT_SECONDS}s: "
+                f"{request.method} {request.url}"
+            )
+            response = JSONResponse(
+                status_code=504,
+                content={
+                    "detail": (
+                        f"Request timeout after {settings.API_REQUEST_TIMEOUT_SECONDS} seconds"
+                    )
+                },
+            )
+            await response(request.scope, request.receive, send)
+
+    async def _limit_body_size(self, request: Request, send: Send) -> None:
+        """Reject requests whose Content-Length exceeds the configured limit."""
+        content_length = request.headers.get("content-length")
+        if content_length:
+            try:
+                content_length_bytes = int(content_length)
+                if content_length_bytes > settings.API_REQUEST_BODY_SIZE_LIMIT:
+                    max_size_mb = settings.API_REQUEST_BODY_SIZE_LIMIT / (1024 * 1024)
+                    actual_size_mb = content_length_bytes / (1024 * 1024)
+                    logger.warning(
+                        f"Request body too large: {actual_size_mb:.2f}MB exceeds limit "
+                        f"of {max_size_mb:.2f}MB for {request.method} {request.url}"
+                    )
+                    response = JSONResponse(
+                        status_code=413,
+                        content={
+                            "detail": (
+                                f"Request body too large. Maximum size is {max_size_mb:.2f}MB, "
+                                f"but request is {actual_size_mb:.2f}MB"
+                            )
+                        },
+                    )
+                    await response(request.scope, request.receive, send)
+                    return
+            except ValueError:
+                logger.warning(f"Invalid Content-Length header: {content_length}")
+
+        await self._measure(request, send)
+
+    async def _measure(self, request: Request, send: Send) -> None:
+        """Record HTTP metrics through ``app.state.http_metrics``."""
+        scope = request.scope
+        path = scope["path"]
+        if path in _METRICS_SKIP_EXACT or path.startswith(_METRICS_SKIP_SLASH):
+            await self.app(scope, request.receive, send)
+            return
 
-    Follows standards defined in RFC 6585.
+        recorder = _ResponseMetricsRecorder(request.app.state.http_metrics, request)
 
-    Args:
-    ----
-        request (Request): The incoming request.
-        call_next (callable): The next middleware in the chain.
+        async def send_measured(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                recorder.response_started(message)
+                await send(message)
+            elif message["type"] == "http.response.body":
+                await send(message)
+                recorder.body_sent(message)
+            else:
+                await send(message)
 
-    Returns:
-    -------
-        Response: The response with rate limit headers added.
+        try:
+            await self.app(scope, request.receive, send_measured)
+        finally:
+            recorder.close()
 
+
+class _ResponseMetricsRecorder:
+    """HTTP metrics for one request, recorded as its response is sent.
+
+    Responses with a ``content-length`` header are recorded when their headers
+    are sent. Streaming responses are recorded when the last body message has
+    been sent, or on ``close()`` if the app stops early (client disconnect,
+    cancellation), with the bytes sent so far. If the app fails before
+    responding, only the in-flight gauge is decremented.
     """
-    response = await call_next(request)
 
-    # Add rate limit headers if available from request state
-    rate_limit_result = getattr(request.state, "rate_limit_result", None)
-    if rate_limit_result:
-        response.headers["RateLimit-Limit"] = str(rate_limit_result.limit)
-        response.headers["RateLimit-Remaining"] = str(rate_limit_result.remaining)
-        response.headers["RateLimit-Reset"] = str(int(time.time() + rate_limit_result.retry_after))
+    __slots__ = (
+        "_metrics",
+        "_request",
+        "_method",
+        "_start",
+        "_endpoint",
+        "_status_code",
+        "_total_bytes",
+        "_streaming",
+        "_closed",
+    )
+
+    def __init__(self, metrics: HttpMetrics, request: Request) -> None:
+        self._metrics = metrics
+        self._request = request
+        self._method = request.method
+        self._start = time.perf_counter()
+        self._endpoint = ""
+        self._status_code = ""
+        self._total_bytes = 0
+        self._streaming = False
+        self._closed = False
+        metrics.inc_in_progress(self._method)
+
+    def response_started(self, message: Message) -> None:
+        self._endpoint = _build_endpoint_name(self._request, fallback="unmatched")
+        self._status_code = str(message["status"])
+        content_length = Headers(raw=message["headers"]).get("content-length")
+        if content_length is None:
+            # Streaming: defer recording until the body has been sent.
+            self._streaming = True
+        else:
+            self._record(int(content_length))
 
-    return response
+    def body_sent(self, message: Message) -> None:
+        if not self._streaming:
+            return
+        self._total_bytes += len(message.get("body", b""))
+        if not message.get("more_body", False):
+            self._record(self._total_bytes)
 
+    def close(self) -> None:
+        if self._closed:
+            return
+        if self._streaming:
+            self._record(self._total_bytes)
+        else:
+            self._closed = True
+            self._metrics.dec_in_progress(self._method)
 
-class DynamicCORSMiddleware(BaseHTTPMiddleware):
+    def _record(self, size: int) -> None:
+        if self._closed:
+            return
+        self._closed = True
+
+        duration = time.perf_counter() - self._start
+        self._metrics.dec_in_progress(self._method)
+        self._metrics.observe_request(
+            method=self._method,
+            endpoint=self._endpoint,
+            status_code=self._status_code,
+            duration=duration,
+        )
+        self._metrics.observe_response_size(
+            method=self._method,
+            endpoint=self._endpoint,
+            size=size,
+        )
+
+
+class DynamicCORSMiddleware:
     """Middleware to dynamically update CORS origins based on configuration.
 
     Simple CORS handling that permits OPTIONS preflight requests and adds appropriate headers.
     """
 
-    def __init__(self, app, default_origins: list[str]):
+    def __init__(self, app: ASGIApp, default_origins: list[str]):
         """Initialize the middleware.
 
         Args:
-            app: The FastAPI application
+            app: The ASGI application to wrap
             default_origins: Default CORS origins to allow
         """
-        super().__init__(app)
+        self.app = app
         self.default_origins = default_origins
 
     def _is_connect_endpoint(self, path: str) -> bool:
@@ -253,34 +361,27 @@ class DynamicCORSMiddleware(BaseHTTPMiddleware):
             return False
         return True
 
-    async def dispatch(self, request: Request, call_next):
-        """Process the request and add dynamic CORS headers.
-
-        Args:
-            request: The incoming request
-            call_next: The next middleware function to call
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer preflight requests and add CORS headers for allowed origins."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        Returns:
-            The response with appropriate CORS headers
-        """
         # Get origin from request headers
-        origin = request.headers.get("origin")
-        path = request.url.path
+        origin = Headers(scope=scope).get("origin")
 
         # If no origin, no CORS headers needed
         if not origin:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # /connect endpoints allow all origins (CORS *) for frontend integration
-        is_connect_endpoint = self._is_connect_endpoint(path)
+        path = scope["path"]
+        is_allowed_origin = self._is_connect_endpoint(path) or origin in self.default_origins
 
         # Handle OPTIONS preflight requests - only if allowed
-        if request.method == "OPTIONS":
-            # Check if origin is allowed (connect endpoints allow any origin)
-            is_allowed_origin = is_connect_endpoint or origin in self.default_origins
-
+        if scope["method"] == "OPTIONS":
             if is_allowed_origin:
-                # Create a response with appropriate CORS headers
                 response = Response()
                 response.headers["Access-Control-Allow-Origin"] = origin
                 response.headers["Access-Control-Allow-Methods"] = (
@@ -289,26 +390,27 @@ class DynamicCORSMiddleware(BaseHTTPMiddleware):
                 response.headers["Access-Control-Allow-Headers"] = "*"
                 response.headers["Access-Control-Allow-Credentials"] = "true"
                 logger.debug(f"Handled OPTIONS preflight for {path} from origin {origin}")
-                return response
             else:
-                # Not allowed, return 403
                 logger.debug(
                     f"Rejected OPTIONS preflight for {path} from disallowed origin {origin}"
                 )
-                return Response(status_code=403)
-
-        # For non-OPTIONS requests, process the request
-        response = await call_next(request)
+                response = Response(status_code=403)
+            await response(scope, receive, send)
+            return
 
-        # Add CORS headers to the response for allowed origins
-        is_allowed_origin = is_connect_endpoint or origin in self.default_origins
+        if not is_allowed_origin:
+            await self.app(scope, receive, send)
+            return
 
-        if is_allowed_origin:
-            response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Credentials"] = "true"
-            logger.debug(f"Added CORS headers for origin {origin}")
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["Access-Control-Allow-Origin"] = origin
+                headers["Access-Control-Allow-Credentials"] = "true"
+                logger.debug(f"Added CORS headers for origin {origin}")
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_cors)
 
 
 # Exception handlers
@@ -499,188 +601,6 @@ async def rate_limit_exception_handler(
     )
 
 
-_METRICS_SKIP_PREFIXES = (
-    "/health",
-    "/metrics",
-    "/docs",
-    "/openapi.json",
-    "/favicon.ico",
-    "/redoc",
-)
-_METRICS_SKIP_EXACT = frozenset(_METRICS_SKIP_PREFIXES)
-_METRICS_SKIP_SLASH = tuple(p + "/" for p in _METRICS_SKIP_PREFIXES)
-
-
-async def http_metrics_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """Middleware to record HTTP metrics (counts, latency, in-flight).
-
-    Reads the ``HttpMetrics`` implementation from ``request.app.state.http_metrics``
-    so the middleware is decoupled from any concrete metrics library.
-
-    Streaming responses (no ``content-length`` header) are wrapped so that
-    duration and response-size are recorded when the body stream finishes
-    rather than when headers are sent.
-    """
-    path = request.url.path
-    if path in _METRICS_SKIP_EXACT or path.startswith(_METRICS_SKIP_SLASH):
-        return await call_next(request)
-
-    metrics = request.app.state.http_metrics
-    method = request.method
-    metrics.inc_in_progress(method)
-    start = time.perf_counter()
-    try:
-        response = await call_next(request)
-    except Exception:
-        metrics.dec_in_progress(method)
-        raise
-
-    endpoint = _build_endpoint_name(request, fallback="unmatched")
-    content_length = response.headers.get("content-length")
-
-    if content_length is not None:
-        # Non-streaming: record immediately (existing behaviour).
-        duration = time.perf_counter() - start
-        metrics.dec_in_progress(method)
-        metrics.observe_request(
-            method=method,
-            endpoint=endpoint,
-            status_code=str(response.status_code),
-            duration=duration,
-        )
-        metrics.observe_response_size(
-            method=method,
-            endpoint=endpoint,
-            size=int(content_length),
-        )
-    else:
-        # Streaming: defer recording until the body stream completes.
-        response.body_iterator = _StreamingMetricsIterator(
-            response.body_iterator,
-            metrics=metrics,
-            method=method,
-            endpoint=endpoint,
-            status_code=str(response.status_code),
-            start=start,
-        )
-
-    return response
-
-
-class _StreamingMetricsIterator:
-    """Wrap a streaming body iterator to record metrics on completion.
-
-    Accumulates total bytes while proxying chunks.  Cleanup runs in
-    ``aclose()`` which ASGI servers call on iterator disposal — even
-    when the body is never iterated or the client disconnects.
-    """
-
-    __slots__ = (
-        "_body_iterator",
-        "_inner_iter",
-        "_metrics",
-        "_method",
-        "_endpoint",
-        "_status_code",
-        "_start",
-        "_total_bytes",
-        "_closed",
-    )
-
-    def __init__(
-        self,
-        body_iterator: AsyncIterator[bytes | str],
-        *,
-        metrics: HttpMetrics,
-        method: str,
-        endpoint: str,
-        status_code: str,
-        start: float,
-    ) -> None:
-        self._body_iterator = body_iterator
-        self._inner_iter = body_iterator.__aiter__()
-        self._metrics = metrics
-        self._method = method
-        self._endpoint = endpoint
-        self._status_code = status_code
-        self._start = start
-        self._total_bytes = 0
-        self._closed = False
-
-    def __aiter__(self) -> "_StreamingMetricsIterator":
-        return self
-
-    async def __anext__(self) -> bytes | str:
-        try:
-            chunk = await self._inner_iter.__anext__()
-        except StopAsyncIteration:
-            await self.aclose()
-            raise
-        # BaseException is intentional: we must record metrics on
-        # GeneratorExit (client disconnect) and CancelledError
-        # (task cancellation), both BaseException subclasses.
-        except BaseException:
-            await self.aclose()
-            raise
-
-        if isinstance(chunk, str):
-            self._total_bytes += len(chunk.encode("utf-8"))
-        else:
-            self._total_bytes += len(chunk)
-        return chunk
-
-    async def aclose(self) -> None:
-        if self._closed:
-            return
-        self._closed = True
-
-        duration = time.perf_counter() - self._start
-        self._metrics.dec_in_progress(self._method)
-        self._metrics.observe_request(
-            method=self._method,
-            endpoint=self._endpoint,
-            status_code=self._status_code,
-            duration=duration,
-        )
-        self._metrics.observe_response_size(
-            method=self._method,
-            endpoint=self._endpoint,
-            size=self._total_bytes,
-        )
-
-        # Propagate close to the underlying iterator if possible.
-        inner_close = getattr(self._body_iterator, "aclose", None)
-        if inner_close is not None:
-            await inner_close()
-
-
-async def analytics_middleware(request: Request, call_next):
-    """Track API calls automatically via middleware.
-
-    Extracts context from request.state.api_context (set by deps.py) and tracks
-    API calls with PostHog analytics including user_id, org_id, and request_id.
-    """
-    start_time = time.monotonic()
-
-    if _should_skip_analytics(request):
-        return await call_next(request)
-
-    response = await call_next(request)
-
-    duration_ms = (time.monotonic() - start_time) * 1000
-
-    context = getattr(request.state, "api_context", None)
-    if context:
-        try:
-            await _track_api_call_async(context, response, duration_ms, request)
-        except Exception as e:
-            logger.warning(f"Failed to track API analytics: {e}")
-
-    return response
-
-
 def _build_endpoint_name(request: Request, *, fallback: str | None = None) -> str:
     """Build endpoint name using FastAPI's route information.
 
@@ -690,8 +610,8 @@ def _build_endpoint_name(request: Request, *, fallback: str | None = None) -> st
     Args:
         request: The incoming request.
         fallback: Value to return when no route is matched.  Defaults to the
-            raw request path (stripped of trailing slash).  The Prometheus
-            middleware passes ``"unmatched"`` to cap label cardinality from
+            raw request path (stripped of trailing slash).  The metrics
+            recorder passes ``"unmatched"`` to cap label cardinality from
             404-scanning bots.
 
     Returns:
@@ -716,7 +636,7 @@ def _should_skip_analytics(request: Request) -> bool:
 
 
 async def _track_api_call_async(
-    context: ApiContext, response: Response, duration_ms: float, request: Request
+    context: ApiContext, status_code: int, duration_ms: float, request: Request
 ):
     """Track API call asynchronously.
 
@@ -733,7 +653,7 @@ async def _track_api_call_async(
         "endpoint": endpoint,
         "request_method": request.method,
         "request_path": request.url.path,
-        "status_code": response.status_code,
+        "status_code": status_code,
         "duration_ms": duration_ms,
     }
 
@@ -743,6 +663,6 @@ async def _track_api_call_async(
         properties.update({k: str(v) for k, v in request.path_params.items()})
 
     # Determine event name
-    event_name = "api_call_error" if response.status_code >= 400 else "api_call"
+    event_name = "api_call_error" if status_code >= 400 else "api_call"
 
     analytics.track_event(event_name, properties, ctx=context)
@@ -248,8 +248,8 @@ class TestValidateOrganizationAccess:
         resolver = _make_resolver()
         auth = AuthResult(method=AuthMethod.AUTH0, user=None)
         with pytest.raises(HTTPException) as exc_info:
-            await resolver._validate_organization_access(
-                db=MagicMock(), organization_id=str(ORG_ID), auth=auth, x_api_key=None
+            resolver._validate_organization_access(
+                organization_id=str(ORG_ID), auth=auth
             )
         assert exc_info.value.status_code == 401
 
@@ -259,8 +259,8 @@ class TestValidateOrganizationAccess:
         resolver = _make_resolver()
         auth = AuthResult(method=AuthMethod.SYSTEM, user=None)
         with pytest.raises(HTTPException) as exc_info:
-            await resolver._validate_organization_access(
-                db=MagicMock(), organization_id=str(ORG_ID), auth=auth, x_api_key=None
+            resolver._validate_organization_access(
+                organization_id=str(ORG_ID), auth=auth
             )
         assert exc_info.value.status_code == 401
 
@@ -269,8 +269,8 @@ class TestValidateOrganizationAccess:
         resolver = _make_resolver()
         user = _make_user_with_orgs([ORG_ID])
         auth = AuthResult(method=AuthMethod.AUTH0, user=user)
-        await resolver._validate_organization_access(
-            db=MagicMock(), organization_id=str(ORG_ID), auth=auth, x_api_key=None
+        resolver._validate_organization_access(
+            organization_id=str(ORG_ID), auth=auth
         )
 
     @pytest.mark.asyncio
@@ -280,8 +280,8 @@ class TestValidateOrganizationAccess:
         user = _make_user_with_orgs([other_org])
         auth = AuthResult(method=AuthMethod.AUTH0, user=user)
         with pytest.raises(HTTPException) as exc_info:
-            await resolver._validate_organization_access(
-                db=MagicMock(), organization_id=str(ORG_ID), auth=auth, x_api_key=None
+            resolver._validate_organization_access(
+                organization_id=str(ORG_ID), auth=auth
             )
         assert exc_info.value.status_code == 403
 
@@ -292,7 +292,20 @@ class TestValidateOrganizationAccess:
         target_org = uuid4()
         auth = AuthResult(method=AuthMethod.AUTH0, user=None)
         with pytest.raises(HTTPException) as exc_info:
-            await resolver._validate_organization_access(
-                db=MagicMock(), organization_id=str(target_org), auth=auth, x_api_key=None
+            resolver._validate_organization_access(
+                organization_id=str(target_org), auth=auth
             )
         assert exc_info.value.status_code == 401
+
+    def test_api_key_for_requested_org_succeeds(self):
+        resolver = _make_resolver()
+        auth = AuthResult(method=AuthMethod.API_KEY, api_key_org_id=str(ORG_ID))
+        resolver._validate_organization_access(organization_id=str(ORG_ID), auth=auth)
+        resolver._api_keys.get_by_key.assert_not_called()
+
+    def test_api_key_for_other_org_raises_403(self):
+        resolver = _make_resolver()
+        auth = AuthResult(method=AuthMethod.API_KEY, api_key_org_id=str(uuid4()))
+        with pytest.raises(HTTPException) as exc_info:
+            resolver._validate_organization_access(organization_id=str(ORG_ID), auth=auth)
+        assert exc_info.value.status_code == 403
@@ -5,9 +5,11 @@ Verifies:
 - Auth0 cache hit returns cached user without DB call
 - Auth0 cache miss populates cache after DB call
 - API key cache hit returns org_id without DB call
+- API key cache miss caches the key no longer than it is valid
 - No auth raises 401
 """
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -17,6 +19,7 @@ from fastapi import HTTPException
 from airweave.adapters.cache.fake import FakeContextCache
 from airweave.adapters.rate_limiter.fake import FakeRateLimiter
 from airweave.api.context_resolver import AuthResult, ContextResolver
+from airweave.core.datetime_utils import utc_now_naive
 from airweave.core.shared_models import AuthMethod
 
 ORG_ID = uuid4()
@@ -167,3 +170,25 @@ class TestApiKeyCacheIntegration:
         assert result.method == AuthMethod.API_KEY
         assert result.api_key_org_id == str(ORG_ID)
         assert result.metadata["api_key_id"] == "cached"
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_caches_with_key_expiry(self):
+        cache = FakeContextCache()
+        cache.set_api_key_org_id = AsyncMock()
+        resolver = _make_resolver(cache=cache)
+        api_key_obj = MagicMock(
+            id=uuid4(),
+            organization_id=ORG_ID,
+            expiration_date=utc_now_naive() + timedelta(days=1),
+            created_by_email="owner@test.com",
+        )
+        resolver._api_keys.get_by_key = AsyncMock(return_value=api_key_obj)
+
+        result = await resolver._authenticate_api_key(
+            db=AsyncMock(), api_key="my-secret-key", request=MagicMock(),
+        )
+
+        assert result.api_key_org_id == str(ORG_ID)
+        cache.set_api_key_org_id.assert_awaited_once_with(
+            "my-secret-key", ORG_ID, expires_at=api_key_obj.expiration_date
+        )
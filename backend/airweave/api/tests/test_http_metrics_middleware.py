@@ -1,36 +1,71 @@
-"""Unit tests for HTTP metrics middleware."""
+"""Unit tests for the HTTP metrics recorded by ApiMiddleware."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 import pytest
+from starlette.responses import StreamingResponse
 
 from airweave.adapters.metrics import FakeHttpMetrics
+from airweave.api.middleware import ApiMiddleware
+
+
+def _route_app(inner, path: str | None):
+    """Wrap an ASGI app so it sets ``scope["route"]`` like the router does."""
+
+    async def app(scope, receive, send):
+        if path is not None:
+            scope["route"] = SimpleNamespace(path=path)
+        await inner(scope, receive, send)
+
+    return app
+
+
+def _response_app(status: int = 200, headers=((b"content-length", b"1234"),), on_start=None):
+    """ASGI app that sends one response, calling ``on_start`` after the headers."""
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": status, "headers": list(headers)})
+        if on_start is not None:
+            on_start()
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+async def _call(app, metrics, *, path: str = "/api/v1/sources", method: str = "GET"):
+    """Send one request through ApiMiddleware(app) and return the sent messages."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "scheme": "http",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "server": ("testserver", 80),
+        "app": SimpleNamespace(state=SimpleNamespace(http_metrics=metrics)),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await ApiMiddleware(app)(scope, receive, send)
+    return messages
 
 
 class TestHttpMetricsMiddleware:
-    """Tests for http_metrics_middleware using FakeHttpMetrics."""
+    """Tests for HTTP metrics using FakeHttpMetrics."""
 
     @pytest.fixture
     def fake_metrics(self):
         return FakeHttpMetrics()
 
-    @pytest.fixture
-    def _make_request(self, fake_metrics):
-        """Factory for mock Starlette Request objects with fake metrics."""
-
-        def factory(path: str = "/api/v1/sources", method: str = "GET"):
-            request = MagicMock()
-            request.url.path = path
-            request.method = method
-            request.app.state.http_metrics = fake_metrics
-            route = MagicMock()
-            route.path = path
-            request.scope = {"route": route}
-            return request
-
-        return factory
-
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "path",
@@ -46,34 +81,21 @@ class TestHttpMetricsMiddleware:
             "/redoc",
         ],
     )
-    async def test_skips_metrics_exempt_path(self, _make_request, fake_metrics, path):
-        """Middleware should skip exact matches and sub-paths of _METRICS_SKIP_PREFIXES."""
-        from airweave.api.middleware import http_metrics_middleware
-
-        request = _make_request(path=path)
-        sentinel = MagicMock()
-        call_next = AsyncMock(return_value=sentinel)
-
-        response = await http_metrics_middleware(request, call_next)
+    async def test_skips_metrics_exempt_path(self, fake_metrics, path):
+        """Exact matches and sub-paths of _METRICS_SKIP_PREFIXES are not measured."""
+        messages = await _call(_route_app(_response_app(), path), fake_metrics, path=path)
 
-        assert response is sentinel
-        call_next.assert_awaited_once_with(request)
+        assert messages[0]["status"] == 200
         assert len(fake_metrics.requests) == 0
+        assert fake_metrics.in_progress == {}
 
     @pytest.mark.asyncio
-    async def test_records_metrics_for_normal_request(self, _make_request, fake_metrics):
-        """Middleware should record request via the HttpMetrics protocol."""
-        from airweave.api.middleware import http_metrics_middleware
+    async def test_records_metrics_for_normal_request(self, fake_metrics):
+        """Request is recorded via the HttpMetrics protocol."""
+        app = _route_app(_response_app(), "/api/v1/sources")
 
-        request = _make_request(path="/api/v1/sources", method="GET")
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {"content-length": "1234"}
-        call_next = AsyncMock(return_value=mock_response)
+        await _call(app, fake_metrics, path="/api/v1/sources", method="GET")
 
-        response = await http_metrics_middleware(request, call_next)
-
-        assert response is mock_response
         assert len(fake_metrics.requests) == 1
 
         rec = fake_metrics.requests[0]
@@ -86,285 +108,154 @@ class TestHttpMetricsMiddleware:
         assert fake_metrics.response_sizes[0].size == 1234
 
     @pytest.mark.asyncio
-    async def test_decrements_in_progress_on_exception(self, _make_request, fake_metrics):
-        """In-progress gauge must be decremented even when call_next raises."""
-        from airweave.api.middleware import http_metrics_middleware
+    async def test_decrements_in_progress_on_exception(self, fake_metrics):
+        """In-progress gauge must be decremented even when the app raises."""
 
-        request = _make_request(path="/api/v1/fail", method="POST")
-        call_next = AsyncMock(side_effect=RuntimeError("boom"))
+        async def failing_app(scope, receive, send):
+            raise RuntimeError("boom")
 
-        with pytest.raises(RuntimeError, match="boom"):
-            await http_metrics_middleware(request, call_next)
+        messages = await _call(failing_app, fake_metrics, path="/api/v1/fail", method="POST")
 
-        # inc was called once, dec was called once → net zero
+        # The exception becomes a 500 outside the metrics, as before
+        assert messages[0]["status"] == 500
         assert fake_metrics.in_progress.get("POST", 0) == 0
+        assert len(fake_metrics.requests) == 0
 
     @pytest.mark.asyncio
     async def test_unmatched_route_uses_fallback(self, fake_metrics):
         """When no route is matched, endpoint label should be 'unmatched'."""
-        from airweave.api.middleware import http_metrics_middleware
-
-        request = MagicMock()
-        request.url.path = "/random-bot-path"
-        request.method = "GET"
-        request.scope = {}  # No route matched
-        request.app.state.http_metrics = fake_metrics
-
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.headers = {"content-length": "0"}
-        call_next = AsyncMock(return_value=mock_response)
+        app = _route_app(_response_app(status=404, headers=[(b"content-length", b"0")]), None)
 
-        await http_metrics_middleware(request, call_next)
+        await _call(app, fake_metrics, path="/random-bot-path")
 
         assert len(fake_metrics.requests) == 1
         assert fake_metrics.requests[0].endpoint == "unmatched"
         assert fake_metrics.requests[0].status_code == "404"
 
     @pytest.mark.asyncio
-    async def test_streaming_branch_when_content_length_absent(self, _make_request, fake_metrics):
-        """Missing content-length enters the streaming branch; no metrics until consumed."""
-        from airweave.api.middleware import http_metrics_middleware
-
-        request = _make_request(path="/api/v1/items", method="GET")
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {}
-        call_next = AsyncMock(return_value=mock_response)
-
-        await http_metrics_middleware(request, call_next)
-
-        # No metrics recorded yet — body iterator hasn't been consumed
-        assert len(fake_metrics.requests) == 0
-        assert len(fake_metrics.response_sizes) == 0
+    async def test_nonstreaming_records_when_headers_are_sent(self, fake_metrics):
+        """With content-length present the request is recorded before the body is sent."""
+        seen = []
+        app = _route_app(
+            _response_app(
+                headers=[(b"content-length", b"42")],
+                on_start=lambda: seen.append(len(fake_metrics.requests)),
+            ),
+            "/api/v1/items",
+        )
+
+        await _call(app, fake_metrics, path="/api/v1/items")
+
+        assert seen == [1]
+        assert fake_metrics.in_progress.get("GET", 0) == 0
+        assert fake_metrics.response_sizes[0].size == 42
 
 
 class TestHttpMetricsMiddlewareStreaming:
-    """Tests for streaming-response handling in http_metrics_middleware."""
+    """Tests for streaming-response handling (no content-length)."""
 
     @pytest.fixture
     def fake_metrics(self):
         return FakeHttpMetrics()
 
-    @pytest.fixture
-    def _make_streaming_request(self, fake_metrics):
-        """Factory for mock requests that return a streaming response (no content-length)."""
-
-        def factory(path: str = "/api/v1/stream", method: str = "GET", chunks=None):
-            request = MagicMock()
-            request.url.path = path
-            request.method = method
-            request.app.state.http_metrics = fake_metrics
-            route = MagicMock()
-            route.path = path
-            request.scope = {"route": route}
-
-            if chunks is None:
-                chunks = [b"chunk1", b"chunk2"]
-
-            async def body_iter():
-                for chunk in chunks:
-                    yield chunk
-
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.headers = {}  # No content-length → streaming
-            mock_response.body_iterator = body_iter()
-
-            call_next = AsyncMock(return_value=mock_response)
-            return request, call_next, mock_response
-
-        return factory
-
     @pytest.mark.asyncio
-    async def test_streaming_defers_metrics_until_body_consumed(
-        self, _make_streaming_request, fake_metrics
-    ):
-        """Metrics should NOT be recorded when middleware returns; only after iteration."""
-        from airweave.api.middleware import http_metrics_middleware
+    async def test_streaming_defers_metrics_until_body_sent(self, fake_metrics):
+        """Metrics are not recorded when headers are sent, only after the last chunk."""
+        seen = []
 
-        request, call_next, response = _make_streaming_request()
+        async def body():
+            seen.append((len(fake_metrics.requests), fake_metrics.in_progress.get("GET", 0)))
+            yield b"chunk1"
+            yield b"chunk2"
 
-        result = await http_metrics_middleware(request, call_next)
+        app = _route_app(StreamingResponse(body()), "/api/v1/stream")
 
-        # Middleware returned but body not consumed yet — no request recorded
-        assert len(fake_metrics.requests) == 0
-        assert fake_metrics.in_progress.get("GET", 0) == 1  # Still in-flight
+        messages = await _call(app, fake_metrics, path="/api/v1/stream")
 
-        # Now consume the stream
-        chunks = []
-        async for chunk in result.body_iterator:
-            chunks.append(chunk)
-
-        assert chunks == [b"chunk1", b"chunk2"]
+        # Headers sent but body not produced yet — no request recorded, still in-flight
+        assert seen == [(0, 1)]
+        assert [m.get("body") for m in messages[1:] if m.get("body")] == [b"chunk1", b"chunk2"]
         assert len(fake_metrics.requests) == 1
         assert fake_metrics.requests[0].status_code == "200"
         assert fake_metrics.requests[0].duration > 0
-        assert fake_metrics.in_progress.get("GET", 0) == 0  # Decremented
+        assert fake_metrics.in_progress.get("GET", 0) == 0
 
     @pytest.mark.asyncio
-    async def test_streaming_records_total_bytes(self, _make_streaming_request, fake_metrics):
-        """Streaming wrapper should accumulate and record total response bytes."""
-        from airweave.api.middleware import http_metrics_middleware
+    async def test_streaming_records_total_bytes(self, fake_metrics):
+        """Total streamed response bytes are recorded."""
+
+        async def body():
+            for chunk in (b"hello", b" ", b"world"):
+                yield chunk
 
-        chunks = [b"hello", b" ", b"world"]
-        request, call_next, _ = _make_streaming_request(chunks=chunks)
+        app = _route_app(StreamingResponse(body()), "/api/v1/stream")
 
-        result = await http_metrics_middleware(request, call_next)
-        async for _ in result.body_iterator:
-            pass
+        await _call(app, fake_metrics, path="/api/v1/stream")
 
         assert len(fake_metrics.response_sizes) == 1
         assert fake_metrics.response_sizes[0].size == 11  # len("hello world")
 
     @pytest.mark.asyncio
-    async def test_streaming_handles_str_chunks(self, _make_streaming_request, fake_metrics):
-        """SSE responses yield str chunks; bytes should be counted via UTF-8 encoding."""
-        from airweave.api.middleware import http_metrics_middleware
+    async def test_streaming_handles_str_chunks(self, fake_metrics):
+        """SSE responses yield str chunks; bytes are counted after UTF-8 encoding."""
+        str_chunks = ["data: héllo\n\n", "data: world\n\n"]
 
-        str_chunks = ["data: hello\n\n", "data: world\n\n"]
-
-        request = MagicMock()
-        request.url.path = "/api/v1/stream"
-        request.method = "GET"
-        request.app.state.http_metrics = fake_metrics
-        route = MagicMock()
-        route.path = "/api/v1/stream"
-        request.scope = {"route": route}
-
-        async def body_iter():
+        async def body():
             for chunk in str_chunks:
                 yield chunk
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {}
-        mock_response.body_iterator = body_iter()
-        call_next = AsyncMock(return_value=mock_response)
+        app = _route_app(StreamingResponse(body()), "/api/v1/stream")
 
-        result = await http_metrics_middleware(request, call_next)
-        async for _ in result.body_iterator:
-            pass
+        await _call(app, fake_metrics, path="/api/v1/stream")
 
-        assert len(fake_metrics.response_sizes) == 1
         expected = sum(len(c.encode("utf-8")) for c in str_chunks)
         assert fake_metrics.response_sizes[0].size == expected
 
     @pytest.mark.asyncio
-    async def test_streaming_records_on_client_disconnect(
-        self, _make_streaming_request, fake_metrics
-    ):
-        """Metrics should still be recorded if iteration is interrupted."""
-        from airweave.api.middleware import http_metrics_middleware
+    async def test_streaming_records_when_stream_fails(self, fake_metrics):
+        """Metrics are still recorded, with the bytes sent, if the stream stops early."""
 
         async def interrupted_body():
             yield b"first"
-            raise GeneratorExit()
-
-        request = MagicMock()
-        request.url.path = "/api/v1/stream"
-        request.method = "POST"
-        request.app.state.http_metrics = fake_metrics
-        route = MagicMock()
-        route.path = "/api/v1/stream"
-        request.scope = {"route": route}
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {}
-        mock_response.body_iterator = interrupted_body()
-        call_next = AsyncMock(return_value=mock_response)
-
-        result = await http_metrics_middleware(request, call_next)
-
-        # Consume until interruption
-        chunks = []
-        with pytest.raises(GeneratorExit):
-            async for chunk in result.body_iterator:
-                chunks.append(chunk)
-
-        # Metrics still recorded via aclose
+            raise RuntimeError("client went away")
+
+        app = _route_app(StreamingResponse(interrupted_body()), "/api/v1/stream")
+
+        # The response already started, so the error propagates instead of a 500
+        with pytest.raises(RuntimeError, match="client went away"):
+            await _call(app, fake_metrics, path="/api/v1/stream", method="POST")
+
         assert len(fake_metrics.requests) == 1
+        assert fake_metrics.response_sizes[0].size == len(b"first")
         assert fake_metrics.in_progress.get("POST", 0) == 0
 
     @pytest.mark.asyncio
     async def test_streaming_records_on_task_cancellation(self, fake_metrics):
-        """Metrics should be recorded when asyncio.CancelledError interrupts iteration."""
-        from airweave.api.middleware import http_metrics_middleware
+        """Metrics are recorded when asyncio.CancelledError interrupts the stream."""
 
         async def cancelled_body():
             yield b"first"
             raise asyncio.CancelledError()
 
-        request = MagicMock()
-        request.url.path = "/api/v1/stream"
-        request.method = "PUT"
-        request.app.state.http_metrics = fake_metrics
-        route = MagicMock()
-        route.path = "/api/v1/stream"
-        request.scope = {"route": route}
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {}
-        mock_response.body_iterator = cancelled_body()
-        call_next = AsyncMock(return_value=mock_response)
+        app = _route_app(StreamingResponse(cancelled_body()), "/api/v1/stream")
 
-        result = await http_metrics_middleware(request, call_next)
-
-        # Consume until cancellation
         with pytest.raises(asyncio.CancelledError):
-            async for _ in result.body_iterator:
-                pass
+            await _call(app, fake_metrics, path="/api/v1/stream", method="PUT")
 
-        # Metrics still recorded via aclose
         assert len(fake_metrics.requests) == 1
         assert fake_metrics.in_progress.get("PUT", 0) == 0
 
     @pytest.mark.asyncio
-    async def test_streaming_double_close_is_idempotent(
-        self, _make_streaming_request, fake_metrics
-    ):
-        """Calling aclose() twice must not record metrics a second time."""
-        from airweave.api.middleware import http_metrics_middleware
-
-        request, call_next, _ = _make_streaming_request()
-
-        result = await http_metrics_middleware(request, call_next)
+    async def test_streaming_records_once(self, fake_metrics):
+        """Finishing the stream and closing the recorder must not record twice."""
 
-        # Consume the full stream (triggers first aclose via StopAsyncIteration)
-        async for _ in result.body_iterator:
-            pass
+        async def body():
+            yield b"chunk"
 
-        assert len(fake_metrics.requests) == 1
+        app = _route_app(StreamingResponse(body()), "/api/v1/stream")
 
-        # Explicitly call aclose again — should be a no-op
-        await result.body_iterator.aclose()
+        await _call(app, fake_metrics, path="/api/v1/stream")
 
         assert len(fake_metrics.requests) == 1
+        assert len(fake_metrics.response_sizes) == 1
         assert fake_metrics.in_progress.get("GET", 0) == 0
-
-    @pytest.mark.asyncio
-    async def test_nonstreaming_still_records_immediately(self, fake_metrics):
-        """Non-streaming (content-length present) should record immediately as before."""
-        from airweave.api.middleware import http_metrics_middleware
-
-        request = MagicMock()
-        request.url.path = "/api/v1/items"
-        request.method = "GET"
-        request.app.state.http_metrics = fake_metrics
-        route = MagicMock()
-        route.path = "/api/v1/items"
-        request.scope = {"route": route}
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {"content-length": "42"}
-        call_next = AsyncMock(return_value=mock_response)
-
-        await http_metrics_middleware(request, call_next)
-
-        # Recorded immediately, no body iteration needed
-        assert len(fake_metrics.requests) == 1
-        assert fake_metrics.in_progress.get("GET", 0) == 0
-        assert fake_metrics.response_sizes[0].size == 42
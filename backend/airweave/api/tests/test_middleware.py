@@ -1,13 +1,25 @@
-"""Unit tests for exception handlers in middleware.py.
+"""Unit tests for middleware.py.
 
-Calls handlers directly to cover mappings that no endpoint currently triggers.
+Calls exception handlers directly to cover mappings that no endpoint currently
+triggers, and drives the ASGI middleware through a small FastAPI app.
 """
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 
-from airweave.api.middleware import airweave_exception_handler
+from airweave.adapters.metrics import FakeHttpMetrics
+from airweave.api.middleware import (
+    ApiMiddleware,
+    DynamicCORSMiddleware,
+    airweave_exception_handler,
+)
+from airweave.core.config import settings
 from airweave.core.exceptions import AirweaveException, TokenRefreshError
 
 
@@ -23,3 +35,123 @@ async def test_unmapped_airweave_exception_returns_500():
     response = await airweave_exception_handler(MagicMock(), AirweaveException("unexpected"))
     assert response.status_code == 500
     assert b"unexpected" in response.body
+
+
+# ---------------------------------------------------------------------------
+# ApiMiddleware / DynamicCORSMiddleware
+# ---------------------------------------------------------------------------
+
+
+def _app_with_middleware(monkeypatch, *, timeout: float = 5.0, body_limit: int = 1024):
+    monkeypatch.setattr(settings, "API_REQUEST_TIMEOUT_SECONDS", timeout)
+    monkeypatch.setattr(settings, "API_REQUEST_BODY_SIZE_LIMIT", body_limit)
+
+    app = FastAPI()
+    app.state.http_metrics = FakeHttpMetrics()
+
+    @app.get("/items")
+    async def items(request: Request):
+        request.state.rate_limit_result = SimpleNamespace(limit=100, remaining=99, retry_after=30)
+        return {"request_id": request.state.request_id}
+
+    @app.post("/items")
+    async def create_item():
+        return {"ok": True}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("kaput")
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(1)
+        return {}
+
+    @app.get("/slow-stream")
+    async def slow_stream():
+        async def body():
+            yield b"first"
+            await asyncio.sleep(0.1)
+            yield b"second"
+
+        return StreamingResponse(body())
+
+    app.add_middleware(ApiMiddleware)
+    app.add_middleware(DynamicCORSMiddleware, default_origins=["https://app.airweave.ai"])
+    return app
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_request_id_and_rate_limit_headers(monkeypatch):
+    app = _app_with_middleware(monkeypatch)
+    async with _client(app) as client:
+        response = await client.get("/items")
+
+    assert response.status_code == 200
+    assert len(response.json()["request_id"]) == 36
+    assert response.headers["RateLimit-Limit"] == "100"
+    assert response.headers["RateLimit-Remaining"] == "99"
+    assert int(response.headers["RateLimit-Reset"]) > 0
+    assert app.state.http_metrics.requests[0].endpoint == "/items"
+
+
+@pytest.mark.asyncio
+async def test_unhandled_exception_returns_500(monkeypatch):
+    app = _app_with_middleware(monkeypatch)
+    async with _client(app) as client:
+        response = await client.get("/boom")
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Internal Server Error: RuntimeError: kaput"
+
+
+@pytest.mark.asyncio
+async def test_timeout_returns_504_before_response_starts(monkeypatch):
+    app = _app_with_middleware(monkeypatch, timeout=0.05)
+    async with _client(app) as client:
+        slow = await client.get("/slow")
+        stream = await client.get("/slow-stream")
+
+    assert slow.status_code == 504
+    assert slow.json()["detail"] == "Request timeout after 0.05 seconds"
+    # Once headers are sent the timeout no longer applies
+    assert stream.status_code == 200
+    assert stream.content == b"firstsecond"
+
+
+@pytest.mark.asyncio
+async def test_oversized_body_returns_413(monkeypatch):
+    app = _app_with_middleware(monkeypatch, body_limit=10)
+    async with _client(app) as client:
+        response = await client.post("/items", content=b"x" * 11)
+        small = await client.post("/items", content=b"x" * 10)
+
+    assert response.status_code == 413
+    assert response.json()["detail"].startswith("Request body too large.")
+    assert small.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_and_response_headers(monkeypatch):
+    app = _app_with_middleware(monkeypatch)
+    allowed = {"origin": "https://app.airweave.ai"}
+    other = {"origin": "https://evil.example"}
+    async with _client(app) as client:
+        preflight = await client.options("/items", headers=allowed)
+        rejected = await client.options("/items", headers=other)
+        connect = await client.options("/connect/abc", headers=other)
+        response = await client.get("/items", headers=allowed)
+        foreign = await client.get("/items", headers=other)
+
+    assert preflight.status_code == 200
+    assert preflight.headers["Access-Control-Allow-Origin"] == "https://app.airweave.ai"
+    assert preflight.headers["Access-Control-Allow-Methods"] == "GET,POST,PUT,DELETE,OPTIONS,PATCH"
+    assert rejected.status_code == 403
+    assert connect.headers["Access-Control-Allow-Origin"] == "https://evil.example"
+    assert response.headers["Access-Control-Allow-Origin"] == "https://app.airweave.ai"
+    assert response.headers["Access-Control-Allow-Credentials"] == "true"
+    assert "Access-Control-Allow-Origin" not in foreign.headers
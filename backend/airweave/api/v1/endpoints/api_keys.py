@@ -8,9 +8,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from airweave import crud, schemas
 from airweave.api import deps
 from airweave.api.context import ApiContext
+from airweave.api.inject import Inject
 from airweave.api.router import TrailingSlashRouter
 from airweave.core import credentials
 from airweave.core.datetime_utils import utc_now_naive
+from airweave.core.protocols.cache import ContextCache
 from airweave.domains.organizations import logic
 
 router = TrailingSlashRouter()
@@ -238,6 +240,7 @@ async def delete_api_key(
     db: AsyncSession = Depends(deps.get_db),
     id: UUID,
     ctx: ApiContext = deps.require_org_role(logic.can_manage_api_keys, block_api_key_auth=True),
+    context_cache: ContextCache = Inject(ContextCache),
 ) -> schemas.APIKey:
     """Delete an API key.
 
@@ -246,6 +249,7 @@ async def delete_api_key(
         db (AsyncSession): The database session.
         id (UUID): The ID of the API key.
         ctx (ApiContext): The current authentication context.
+        context_cache (ContextCache): Cache of API key lookups, purged of the deleted key.
 
     Returns:
     -------
@@ -288,4 +292,7 @@ async def delete_api_key(
     # Now delete the API key
     await crud.api_key.remove(db=db, id=id, ctx=ctx)
 
+    # Requests authenticate from the cache, so the key must leave it right away
+    await context_cache.invalidate_api_key(decrypted_key)
+
     return schemas.APIKey(**api_key_data)
@@ -14,7 +14,8 @@ async def get_entity_definitions_by_source_short_name(
     registry: EntityDefinitionRegistryProtocol = Inject(EntityDefinitionRegistryProtocol),
 ) -> list[EntityDefinitionMetadata]:
     """Get all entity definitions for a given source."""
-    entries = registry.list_for_source(source_short_name)
+    # get() resolves each entity class and builds its schema on first use
+    entries = [registry.get(e.short_name) for e in registry.list_for_source(source_short_name)]
     return [
         EntityDefinitionMetadata(
             short_name=entry.short_name,
@@ -23,7 +24,7 @@ async def get_entity_definitions_by_source_short_name(
             class_name=entry.class_name,
             module_name=entry.module_name,
             entity_type=entry.entity_type,
-            entity_schema=entry.entity_schema,
+            entity_schema=entry.entity_schema or {},
         )
         for entry in entries
     ]
@@ -205,6 +205,21 @@ class Settings(BaseSettings):
     # Docling OCR fallback service (None = disabled)
     DOCLING_BASE_URL: Optional[str] = None
 
+    # In-process tier of the API context cache (orgs, users, API keys) in
+    # front of Redis; 0 disables it
+    CONTEXT_CACHE_LOCAL_TTL_SECONDS: float = 5.0
+    CONTEXT_CACHE_LOCAL_MAX_ENTRIES: int = 10_000
+
+    # Content-addressed conversion cache (markdown output keyed by file sha256)
+    CONVERSION_CACHE_ENABLED: bool = True
+    CONVERSION_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    CONVERSION_CACHE_MAX_ENTRY_BYTES: int = 5 * 1024 * 1024
+    CONVERSION_CACHE_MAX_MEMORY_BYTES: int = 64 * 1024 * 1024
+    # Storage tier: least recently used entries over the budget, and expired ones,
+    # are removed by a sweep every interval (0 disables the sweep)
+    CONVERSION_CACHE_MAX_STORAGE_BYTES: int = 10 * 1024 * 1024 * 1024
+    CONVERSION_CACHE_SWEEP_INTERVAL_SECONDS: int = 6 * 3600
+
     # Temporal configuration
     TEMPORAL_HOST: str = "localhost"
     TEMPORAL_PORT: int = 7233
@@ -220,6 +235,14 @@ class Settings(BaseSettings):
     # Temporal worker graceful shutdown configuration
     TEMPORAL_GRACEFUL_SHUTDOWN_TIMEOUT: int = 7200  # 2 hours in seconds
     WORKER_METRICS_PORT: int = 8888  # Port for /drain and /health endpoints
+    # Worker resource governor: new activities are only taken on while pod
+    # memory / CPU / DB pool usage (0-1) are below these targets
+    WORKER_MAX_CONCURRENT_ACTIVITIES: int = 100
+    WORKER_TARGET_MEMORY_USAGE: float = 0.8
+    WORKER_TARGET_CPU_USAGE: float = 0.9
+    WORKER_TARGET_DB_POOL_USAGE: float = 0.8
+    # Entity workers shared by all syncs on a pod (default: DB pool capacity)
+    WORKER_SYNC_WORKER_BUDGET: Optional[int] = None
     METRICS_PORT: int = 9090  # Port for Prometheus metrics endpoint
     METRICS_HOST: str = "0.0.0.0"  # Bind address for metrics server
 
@@ -258,6 +281,19 @@ class Settings(BaseSettings):
     WEB_FETCHER_MAX_CONCURRENT: int = 10  # Max concurrent web scraping requests
     OPENAI_MAX_CONCURRENT: int = 20  # Max concurrent OpenAI API requests
     CTTI_MAX_CONCURRENT: int = 3  # Max concurrent CTTI (ClinicalTrials.gov) requests
+    # Adaptive (AIMD) concurrency per source connection: starts at INITIAL,
+    # grows while the upstream is healthy and backs off on 429s / slow responses
+    SOURCE_CONCURRENCY_INITIAL: int = 10
+    SOURCE_CONCURRENCY_MIN: int = 1
+    SOURCE_CONCURRENCY_MAX: int = 50
+    # Size-aware micro-batching: entity batches close on an estimated payload
+    # budget that is tuned towards the target processing time per batch
+    SYNC_BATCH_TARGET_LATENCY_MS: int = 2000
+    SYNC_BATCH_INITIAL_BYTES: int = 4 * 2**20
+    SYNC_BATCH_MAX_BYTES: int = 64 * 2**20
+    # Estimated payload of the entities a sync's source stream may hold in memory
+    # ahead of processing (the stream also caps the count at 10,000 entities)
+    SYNC_STREAM_MAX_QUEUE_BYTES: int = 256 * 2**20
 
     # SSRF protection
     SSRF_ALLOW_PRIVATE_NETWORKS: bool = False
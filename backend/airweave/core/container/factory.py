@@ -39,6 +39,8 @@ from airweave.adapters.metrics import (
     PrometheusDbPoolMetrics,
     PrometheusHttpMetrics,
     PrometheusMetricsRenderer,
+    PrometheusPubSubMetrics,
+    PrometheusUsageLedgerMetrics,
 )
 from airweave.adapters.pubsub.redis import RedisPubSub
 from airweave.adapters.reranker.cohere import CohereReranker
@@ -51,9 +53,10 @@ from airweave.core.container.container import Container
 from airweave.core.health.service import HealthService
 from airweave.core.logging import logger
 from airweave.core.metrics_service import PrometheusMetricsService
-from airweave.core.protocols import CircuitBreaker, PubSub
+from airweave.core.protocols import CircuitBreaker, ContextCache, PubSub
 from airweave.core.protocols.event_bus import EventBus
 from airweave.core.protocols.identity import IdentityProvider
+from airweave.core.protocols.metrics import UsageLedgerMetrics
 from airweave.core.protocols.payment import PaymentGatewayProtocol
 from airweave.core.protocols.webhooks import WebhookPublisher
 from airweave.core.redis_client import redis_client
@@ -71,6 +74,7 @@ from airweave.domains.collections.vector_db_deployment_metadata_repository impor
     VectorDbDeploymentMetadataRepository,
 )
 from airweave.domains.connections.repository import ConnectionRepository
+from airweave.domains.converters.cache import ConversionCache
 from airweave.domains.converters.registry import ConverterRegistry
 from airweave.domains.credentials.repository import IntegrationCredentialRepository
 from airweave.domains.credentials.service import IntegrationCredentialService
@@ -107,6 +111,10 @@ from airweave.domains.search.adapters.vector_db.filter_translator import FilterT
 from airweave.domains.search.adapters.vector_db.vespa_client import VespaVectorDB
 from airweave.domains.search.agentic.service import AgenticSearchService
 from airweave.domains.search.agentic.subscribers.stream_relay import SearchStreamRelay
+from airweave.domains.search.builders.cached_collection_metadata import (
+    CachedCollectionMetadataBuilder,
+    CollectionMetadataCacheInvalidator,
+)
 from airweave.domains.search.builders.collection_metadata import CollectionMetadataBuilder
 from airweave.domains.search.classic.service import ClassicSearchService
 from airweave.domains.search.config import SearchConfig
@@ -122,6 +130,7 @@ from airweave.domains.sources.lifecycle import SourceLifecycleService
 from airweave.domains.sources.registry import SourceRegistry
 from airweave.domains.sources.service import SourceService
 from airweave.domains.sources.validation import SourceValidationService
+from airweave.domains.storage.protocols import StorageBackend
 from airweave.domains.storage.sync_file_manager import SyncFileManager
 from airweave.domains.sync_pipeline.factory import SyncFactory
 from airweave.domains.sync_pipeline.processors.chunk_embed import ChunkEmbedProcessor
@@ -171,13 +180,6 @@ def create_container(settings: Settings) -> Container:
     # Webhooks (Svix adapter)
     # SvixAdapter implements both WebhookPublisher and WebhookAdmin
     # -----------------------------------------------------------------
-    # -----------------------------------------------------------------
-    # Context cache (Redis-backed, used by deps.py hot path)
-    # -----------------------------------------------------------------
-    from airweave.adapters.cache.redis import RedisContextCache
-
-    context_cache = RedisContextCache(redis_client=redis_client.client)
-
     # -----------------------------------------------------------------
     # Rate limiter (Redis-backed or Null for local dev / disabled)
     # -----------------------------------------------------------------
@@ -212,11 +214,17 @@ def create_container(settings: Settings) -> Container:
     # -----------------------------------------------------------------
     source_deps = _create_source_services(settings)
 
+    # -----------------------------------------------------------------
+    # Metrics (Prometheus adapters, shared registry, wrapped in service)
+    # -----------------------------------------------------------------
+    metrics = _create_metrics_service(settings)
+
     # -----------------------------------------------------------------
     # Usage domain — checker (read) + ledger (write), both singletons
     # -----------------------------------------------------------------
     usage_checker = _create_usage_checker(settings, billing_services, source_deps, user_org_repo)
-    usage_ledger = _create_usage_ledger(settings, billing_services)
+    usage_ledger = _create_usage_ledger(settings, billing_services, metrics.usage)
+
     # -----------------------------------------------------------------
     # Webhook service (composes admin + verifier for API layer)
     # -----------------------------------------------------------------
@@ -226,12 +234,6 @@ def create_container(settings: Settings) -> Container:
         verify_endpoints=settings.WEBHOOK_VERIFY_ENDPOINTS,
     )
 
-    # -----------------------------------------------------------------
-    # PubSub (realtime message transport — Redis adapter)
-    # -----------------------------------------------------------------
-
-    pubsub = RedisPubSub()
-
     # -----------------------------------------------------------------
     # Circuit Breaker + OCR
     # Shared circuit breaker tracks provider health across the process.
@@ -247,9 +249,16 @@ def create_container(settings: Settings) -> Container:
     health = _create_health_service(settings)
 
     # -----------------------------------------------------------------
-    # Metrics (Prometheus adapters, shared registry, wrapped in service)
+    # PubSub (realtime message transport — Redis adapter)
+    # SSE subscribers share one Redis connection per namespace.
     # -----------------------------------------------------------------
-    metrics = _create_metrics_service(settings)
+    pubsub = RedisPubSub(metrics=metrics.pubsub)
+
+    # -----------------------------------------------------------------
+    # Context cache (used by deps.py hot path): in-process LRU in front
+    # of Redis, invalidated across pods over pubsub
+    # -----------------------------------------------------------------
+    context_cache = _create_context_cache(settings, pubsub)
 
     event_bus = _create_event_bus(
         webhook_publisher=svix_adapter,
@@ -354,18 +363,22 @@ def create_container(settings: Settings) -> Container:
     # -----------------------------------------------------------------
     acl_membership_repo = AccessControlMembershipRepository()
     access_broker = AccessBroker(acl_repo=acl_membership_repo)
-    converter_registry = ConverterRegistry(ocr_provider=ocr_provider)
-    chunk_embed_processor = ChunkEmbedProcessor(
-        converter_registry=converter_registry,
-        dense_embedder=dense_embedder,
-        sparse_embedder=sparse_embedder,
-    )
 
     # Storage domain
     # -----------------------------------------------------------------
     storage_backend = _create_storage_backend(settings)
     sync_file_manager = SyncFileManager(backend=storage_backend)
 
+    converter_registry = ConverterRegistry(
+        ocr_provider=ocr_provider,
+        conversion_cache=_create_conversion_cache(settings, storage_backend),
+    )
+    chunk_embed_processor = ChunkEmbedProcessor(
+        converter_registry=converter_registry,
+        dense_embedder=dense_embedder,
+        sparse_embedder=sparse_embedder,
+    )
+
     # ARF domain service (raw entity capture / replay)
     # -----------------------------------------------------------------
     arf_service = ArfService(storage=storage_backend)
@@ -665,12 +678,32 @@ def _create_metrics_service(settings: Settings) -> PrometheusMetricsService:
             registry=registry,
             max_overflow=settings.db_pool_max_overflow,
         ),
+        pubsub=PrometheusPubSubMetrics(registry=registry),
+        usage=PrometheusUsageLedgerMetrics(registry=registry),
         renderer=PrometheusMetricsRenderer(registry=registry),
         host=settings.METRICS_HOST,
         port=settings.METRICS_PORT,
     )
 
 
+def _create_context_cache(settings: Settings, pubsub: PubSub) -> ContextCache:
+    """Create the context cache for API context resolution.
+
+    The in-process tier only serves reads once ``start()`` has subscribed it
+    to invalidations (API pods, in the app lifespan); elsewhere every call
+    goes to Redis, and invalidations are still published to the API pods.
+    """
+    from airweave.adapters.cache.redis import RedisContextCache
+    from airweave.adapters.cache.two_tier import TwoTierContextCache
+
+    return TwoTierContextCache(
+        remote=RedisContextCache(redis_client=redis_client.client),
+        pubsub=pubsub,
+        ttl_seconds=settings.CONTEXT_CACHE_LOCAL_TTL_SECONDS,
+        max_entries=settings.CONTEXT_CACHE_LOCAL_MAX_ENTRIES,
+    )
+
+
 def _create_event_bus(
     webhook_publisher: WebhookPublisher,
     settings: Settings,
@@ -710,10 +743,10 @@ def _create_event_bus(
         bus.subscribe(pattern, progress_relay.handle)
 
     # UsageBillingListener — accumulates usage from entity/query/sync/
-    # source_connection events
+    # source_connection events; lossless, a dropped event is unbilled usage
     usage_billing_listener = UsageBillingListener(ledger=usage_ledger)
     for pattern in usage_billing_listener.EVENT_PATTERNS:
-        bus.subscribe(pattern, usage_billing_listener.handle)
+        bus.subscribe(pattern, usage_billing_listener.handle, lossless=True)
 
     # SearchStreamRelay — bridges search events to PubSub for SSE streaming
     search_stream_relay = SearchStreamRelay(pubsub=pubsub)
@@ -781,6 +814,22 @@ def _create_ocr_provider(
     return FallbackOcrProvider(providers=providers, circuit_breaker=circuit_breaker)
 
 
+def _create_conversion_cache(
+    settings: Settings, storage_backend: StorageBackend
+) -> Optional[ConversionCache]:
+    """Create the content-addressed conversion cache, or None when disabled."""
+    if not settings.CONVERSION_CACHE_ENABLED:
+        return None
+    return ConversionCache(
+        storage=storage_backend,
+        ttl_seconds=settings.CONVERSION_CACHE_TTL_SECONDS,
+        max_entry_bytes=settings.CONVERSION_CACHE_MAX_ENTRY_BYTES,
+        max_memory_bytes=settings.CONVERSION_CACHE_MAX_MEMORY_BYTES,
+        max_storage_bytes=settings.CONVERSION_CACHE_MAX_STORAGE_BYTES,
+        sweep_interval_seconds=settings.CONVERSION_CACHE_SWEEP_INTERVAL_SECONDS,
+    )
+
+
 def _create_dense_embedder(
     settings: Settings, registry: DenseEmbedderRegistry
 ) -> DenseEmbedderProtocol:
@@ -1059,7 +1108,9 @@ def _create_usage_checker(
     )
 
 
-def _create_usage_ledger(settings: Settings, billing_deps: dict) -> UsageLedgerProtocol:
+def _create_usage_ledger(
+    settings: Settings, billing_deps: dict, metrics: UsageLedgerMetrics
+) -> UsageLedgerProtocol:
     """Create the singleton UsageLedger."""
     from airweave.domains.usage.ledger import NullUsageLedger
     from airweave.domains.usage.repository import UsageRepository
@@ -1071,6 +1122,7 @@ def _create_usage_ledger(settings: Settings, billing_deps: dict) -> UsageLedgerP
         usage_repo=UsageRepository(),
         billing_repo=billing_deps["billing_repo"],
         period_repo=billing_deps["period_repo"],
+        metrics=metrics,
     )
 
 
@@ -1273,7 +1325,8 @@ def _create_search_services(
     1. Tokenizer (from SearchConfig)
     2. LLM fallback chain (from SearchConfig, skips providers without API keys)
     3. Reranker (optional, None if no COHERE_API_KEY)
-    4. CollectionMetadataBuilder (needs repos)
+    4. CollectionMetadataBuilder (needs repos), cached in-process + Redis and
+       invalidated from the event bus
     5. Per-tier services (instant, classic, agentic)
     """
     config = SearchConfig()
@@ -1308,13 +1361,23 @@ def _create_search_services(
         logger.info("[SearchFactory] Cohere reranker enabled")
 
     # 4. CollectionMetadataBuilder
-    metadata_builder = CollectionMetadataBuilder(
-        collection_repo=collection_repo,
-        sc_repo=sc_repo,
-        source_registry=source_registry,
-        entity_definition_registry=entity_definition_registry,
-        entity_count_repo=EntityCountRepository(),
+    metadata_builder = CachedCollectionMetadataBuilder(
+        CollectionMetadataBuilder(
+            collection_repo=collection_repo,
+            sc_repo=sc_repo,
+            source_registry=source_registry,
+            entity_definition_registry=entity_definition_registry,
+            entity_count_repo=EntityCountRepository(),
+        ),
+        redis_client=redis_client.client,
+        local_ttl_seconds=config.METADATA_CACHE_LOCAL_TTL_SECONDS,
+        redis_ttl_seconds=config.METADATA_CACHE_REDIS_TTL_SECONDS,
+        max_entries=config.METADATA_CACHE_MAX_ENTRIES,
     )
+    # Lossless: a dropped event would leave stale metadata cached until its TTL
+    metadata_invalidator = CollectionMetadataCacheInvalidator(metadata_builder)
+    for pattern in metadata_invalidator.EVENT_PATTERNS:
+        event_bus.subscribe(pattern, metadata_invalidator.handle, lossless=True)
 
     # 5. Vector DB + shared executor
     from vespa.application import Vespa
@@ -5,6 +5,7 @@ the three fields the EventBus protocol requires for routing and metadata.
 """
 
 from datetime import datetime, timezone
+from typing import Hashable, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -27,3 +28,15 @@ class DomainEvent(BaseModel):
     event_type: EventType
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     organization_id: UUID
+
+    def coalesce_key(self) -> Optional[Hashable]:
+        """Key under which queued events of this kind may be merged, or None.
+
+        The event bus merges an event into the previous one still waiting in
+        a subscriber's queue when both return the same non-None key.
+        """
+        return None
+
+    def coalesce(self, later: "DomainEvent") -> "DomainEvent":
+        """Merge a later event with the same ``coalesce_key`` into this one."""
+        raise NotImplementedError(f"{type(self).__name__} does not coalesce")
@@ -7,7 +7,7 @@ QueryProcessedEvent is emitted after a search completes and consumed
 by the billing accumulator for query usage tracking.
 """
 
-from typing import Dict, Optional
+from typing import Dict, Hashable, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -37,6 +37,8 @@ class EntityBatchProcessedEvent(DomainEvent):
 
     Carries per-type deltas for this batch. Running totals are derived
     by consumers (progress relay, billing), not embedded in the event.
+    Consecutive batches still queued for a slow subscriber are coalesced
+    into one event carrying the summed deltas.
 
     Consumers:
     - SyncProgressRelay: Accumulates deltas, publishes snapshots to Redis PubSub
@@ -63,6 +65,40 @@ class EntityBatchProcessedEvent(DomainEvent):
     batch_duration_ms: float = 0
     billable: bool = True
 
+    def coalesce_key(self) -> Optional[Hashable]:
+        """Batches of the same sync job (and billing mode) merge while queued."""
+        return (self.event_type, self.sync_job_id, self.billable)
+
+    def coalesce(self, later: DomainEvent) -> "EntityBatchProcessedEvent":
+        """Sum the deltas of two consecutive batches into one event."""
+        if not isinstance(later, EntityBatchProcessedEvent):
+            raise TypeError(f"Cannot coalesce {type(later).__name__} into {type(self).__name__}")
+        breakdown = dict(self.type_breakdown)
+        for entity_type, counts in later.type_breakdown.items():
+            prev = breakdown.get(entity_type)
+            breakdown[entity_type] = (
+                counts
+                if prev is None
+                else TypeActionCounts(
+                    inserted=prev.inserted + counts.inserted,
+                    updated=prev.updated + counts.updated,
+                    deleted=prev.deleted + counts.deleted,
+                    kept=prev.kept + counts.kept,
+                )
+            )
+        return self.model_copy(
+            update={
+                "timestamp": later.timestamp,
+                "inserted": self.inserted + later.inserted,
+                "updated": self.updated + later.updated,
+                "deleted": self.deleted + later.deleted,
+                "kept": self.kept + later.kept,
+                "type_breakdown": breakdown,
+                "batch_seq": later.batch_seq,
+                "batch_duration_ms": self.batch_duration_ms + later.batch_duration_ms,
+            }
+        )
+
 
 class AccessControlMembershipBatchProcessedEvent(DomainEvent):
     """Emitted during ACL membership collection to signal progress.
@@ -6,6 +6,8 @@ from airweave.core.protocols.metrics import (
     DbPoolMetrics,
     HttpMetrics,
     MetricsService,
+    PubSubMetrics,
+    UsageLedgerMetrics,
 )
 
 
@@ -21,10 +23,14 @@ class FakeMetricsService(MetricsService):
         http: HttpMetrics,
         agentic_search: AgenticSearchMetrics,
         db_pool: DbPoolMetrics,
+        pubsub: PubSubMetrics,
+        usage: UsageLedgerMetrics,
     ) -> None:
         self.http = http
         self.agentic_search = agentic_search
         self.db_pool = db_pool
+        self.pubsub = pubsub
+        self.usage = usage
 
     async def start(self, *, pool: DbPool) -> None:
         pass
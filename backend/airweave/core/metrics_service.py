@@ -19,6 +19,8 @@ from airweave.core.protocols.metrics import (
     HttpMetrics,
     MetricsRenderer,
     MetricsService,
+    PubSubMetrics,
+    UsageLedgerMetrics,
 )
 
 
@@ -27,8 +29,8 @@ class PrometheusMetricsService(MetricsService):
 
     Satisfies the ``MetricsService`` protocol structurally.
 
-    Public attributes (``http``, ``agentic_search``, ``db_pool``) are
-    typed with their respective protocols so ``Inject()`` in deps.py can
+    Public attributes (``http``, ``agentic_search``, ``db_pool``,
+    ``pubsub``, ``usage``) are typed with their respective protocols so ``Inject()`` in deps.py can
     resolve them via nested attribute lookup.
 
     ``_renderer`` is private to prevent accidental injection — it is an
@@ -38,12 +40,16 @@ class PrometheusMetricsService(MetricsService):
     http: HttpMetrics
     agentic_search: AgenticSearchMetrics
     db_pool: DbPoolMetrics
+    pubsub: PubSubMetrics
+    usage: UsageLedgerMetrics
 
     def __init__(
         self,
         http: HttpMetrics,
         agentic_search: AgenticSearchMetrics,
         db_pool: DbPoolMetrics,
+        pubsub: PubSubMetrics,
+        usage: UsageLedgerMetrics,
         renderer: MetricsRenderer,
         host: str,
         port: int,
@@ -51,6 +57,8 @@ class PrometheusMetricsService(MetricsService):
         self.http = http
         self.agentic_search = agentic_search
         self.db_pool = db_pool
+        self.pubsub = pubsub
+        self.usage = usage
         self._renderer = renderer
         self._host = host
         self._port = port
@@ -20,6 +20,8 @@ from airweave.core.protocols.metrics import (
     HttpMetrics,
     MetricsRenderer,
     MetricsService,
+    PubSubMetrics,
+    SyncPipelineMetrics,
     WorkerMetrics,
 )
 from airweave.core.protocols.payment import PaymentGatewayProtocol
@@ -59,9 +61,11 @@ __all__ = [
     "OcrProvider",
     "PaymentGatewayProtocol",
     "PubSub",
+    "PubSubMetrics",
     "PubSubSubscription",
     "RateLimiter",
     "RerankerProtocol",
+    "SyncPipelineMetrics",
     "WebhookAdmin",
     "WebhookPublisher",
     "TokenizerProtocol",
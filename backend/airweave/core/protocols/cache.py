@@ -1,16 +1,20 @@
 """Context cache protocol for API request data.
 
 Caches org/user/API-key data on the hot path (``deps.get_context``).
-Adapters: Redis (production), in-memory dict (testing).
+Adapters: in-process LRU in front of Redis (production), in-memory dict
+(testing).
 
 Invalidation strategy:
-- 30s TTL as fallback for everything
-- ``invalidate_organization`` + ``invalidate_user`` for instant invalidation
-  on critical mutation paths (org create/delete, membership changes)
+- 30s TTL as fallback for everything (API keys: 10 min, capped at expiry);
+  the in-process tier keeps entries for a few seconds at most
+- ``invalidate_organization`` + ``invalidate_user`` + ``invalidate_api_key``
+  for instant invalidation on critical mutation paths (org create/delete,
+  membership changes, API key deletion), on every API pod
 - Feature flags, billing plan changes, etc. rely on TTL — 30s max staleness
   is acceptable for admin operations
 """
 
+from datetime import datetime
 from typing import Optional, Protocol, runtime_checkable
 from uuid import UUID
 
@@ -45,8 +49,16 @@ class ContextCache(Protocol):
         """Cache a user."""
         ...
 
-    async def set_api_key_org_id(self, api_key: str, org_id: UUID) -> None:
-        """Cache an API key → org ID mapping."""
+    async def set_api_key_org_id(
+        self, api_key: str, org_id: UUID, expires_at: Optional[datetime] = None
+    ) -> None:
+        """Cache an API key → org ID mapping, never past the key's expiry.
+
+        Args:
+            api_key: The plain API key.
+            org_id: Organization the key belongs to.
+            expires_at: The key's expiration date (naive UTC), if known.
+        """
         ...
 
     # --- Invalidation ---
@@ -62,3 +74,13 @@ class ContextCache(Protocol):
     async def invalidate_api_key(self, api_key: str) -> None:
         """Remove cached API key entry."""
         ...
+
+    # --- Lifecycle ---
+
+    async def start(self) -> None:
+        """Start background work (e.g. listening for invalidations from other pods)."""
+        ...
+
+    async def close(self) -> None:
+        """Stop background work and release resources."""
+        ...
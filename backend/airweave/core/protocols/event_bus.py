@@ -13,6 +13,7 @@ Usage:
     event_bus.subscribe("sync.*", analytics_subscriber.handle)
 """
 
+from dataclasses import dataclass
 from typing import Awaitable, Callable, List, Protocol, runtime_checkable
 
 from airweave.core.events.base import DomainEvent
@@ -21,6 +22,20 @@ from airweave.core.events.base import DomainEvent
 EventHandler = Callable[[DomainEvent], Awaitable[None]]
 
 
+@dataclass(frozen=True)
+class EventSubscriberSnapshot:
+    """Point-in-time delivery state of one subscriber (for metrics)."""
+
+    subscriber: str
+    queue_depth: int
+    delivered: int
+    failed: int
+    dropped: int
+    coalesced: int
+    lag_ms: float
+    max_lag_ms: float
+
+
 @runtime_checkable
 class EventSubscriber(Protocol):
     """Protocol for classes that subscribe to domain events.
@@ -52,7 +67,8 @@ class EventBus(Protocol):
     """Protocol for publishing domain events to multiple subscribers.
 
     The bus matches events to subscribers by glob pattern on event_type.
-    Failures in one subscriber don't affect others.
+    Failures in one subscriber don't affect others. Delivery may happen
+    after ``publish`` returns; ``close`` delivers what is still queued.
     """
 
     async def publish(self, event: DomainEvent) -> None:
@@ -63,11 +79,24 @@ class EventBus(Protocol):
         """
         ...
 
-    def subscribe(self, event_pattern: str, handler: EventHandler) -> None:
+    def subscribe(
+        self, event_pattern: str, handler: EventHandler, *, lossless: bool = False
+    ) -> None:
         """Register a handler for events matching the pattern.
 
         Args:
             event_pattern: Glob pattern to match (e.g., 'sync.*', 'sync.completed').
             handler: Async callable invoked when a matching event is published.
+            lossless: Never drop events for this handler under load; publishers
+                wait instead. For consumers whose state must add up (billing,
+                cache invalidation), not for best-effort ones.
         """
         ...
+
+    async def close(self) -> None:
+        """Deliver queued events and stop background delivery (on shutdown)."""
+        ...
+
+    def snapshot(self) -> List[EventSubscriberSnapshot]:
+        """Return per-subscriber queue depth, lag, drop and coalescing counters."""
+        ...
@@ -4,7 +4,10 @@ Consolidates all metrics-related protocols into a single module:
 - HttpMetrics: HTTP request/response instrumentation
 - AgenticSearchMetrics: agentic search pipeline instrumentation
 - DbPoolMetrics: database connection pool gauges
+- PubSubMetrics: shared pub/sub connection and SSE subscriber gauges
 - WorkerMetrics: Temporal worker gauge instrumentation
+- SyncPipelineMetrics: per-stage sync pipeline latency histograms
+- UsageLedgerMetrics: pending usage deltas and usage flush latency
 - MetricsRenderer: metrics serialization for scraping
 - MetricsService: facade that owns all metrics adapters
 """
@@ -154,6 +157,30 @@ class DbPoolMetrics(Protocol):
         ...
 
 
+# ---------------------------------------------------------------------------
+# PubSubMetrics
+# ---------------------------------------------------------------------------
+
+
+@runtime_checkable
+class PubSubMetrics(Protocol):
+    """Protocol for pub/sub multiplexer metrics collection."""
+
+    def update(self, *, namespace: str, connections: int, subscribers: int) -> None:
+        """Record the current state of one namespace.
+
+        Args:
+            namespace: Channel namespace (e.g. ``sync_job``).
+            connections: Open Redis pub/sub connections for the namespace.
+            subscribers: Local subscribers fed by those connections.
+        """
+        ...
+
+    def inc_slow_consumer_disconnects(self, namespace: str) -> None:
+        """Count a subscriber disconnected for falling behind."""
+        ...
+
+
 # ---------------------------------------------------------------------------
 # WorkerMetrics
 # ---------------------------------------------------------------------------
@@ -168,6 +195,63 @@ class WorkerMetrics(Protocol):
         ...
 
 
+# ---------------------------------------------------------------------------
+# SyncPipelineMetrics
+# ---------------------------------------------------------------------------
+
+
+@runtime_checkable
+class SyncPipelineMetrics(Protocol):
+    """Protocol for sync pipeline stage latency collection."""
+
+    def observe_stage(self, stage: str, source: str, duration: float) -> None:
+        """Record time one batch spent in a pipeline stage.
+
+        Args:
+            stage: Stage name (e.g. ``hash``, ``embed``, ``feed``).
+            source: Source short name.
+            duration: Seconds spent in the stage for the batch.
+        """
+        ...
+
+    def observe_batch(self, source: str, duration: float, entity_count: int) -> None:
+        """Record the end-to-end duration and size of one processed batch."""
+        ...
+
+    def observe_batch_shape(self, source: str, payload_bytes: int, reason: str) -> None:
+        """Record the payload of one batch as the orchestrator closes it.
+
+        Args:
+            source: Source short name.
+            payload_bytes: Estimated payload of the batch.
+            reason: Why it closed (``bytes``, ``entities``, ``latency``, ...).
+        """
+        ...
+
+
+# ---------------------------------------------------------------------------
+# UsageLedgerMetrics
+# ---------------------------------------------------------------------------
+
+
+@runtime_checkable
+class UsageLedgerMetrics(Protocol):
+    """Protocol for usage ledger instrumentation."""
+
+    def set_pending(self, action_type: str, amount: int) -> None:
+        """Record the usage of one action type recorded but not yet written to the DB.
+
+        Args:
+            action_type: Billable action (e.g. ``entities``, ``queries``).
+            amount: Pending amount summed over all organizations.
+        """
+        ...
+
+    def observe_flush(self, duration: float, success: bool) -> None:
+        """Record how long writing one organization's pending usage took."""
+        ...
+
+
 # ---------------------------------------------------------------------------
 # MetricsRenderer
 # ---------------------------------------------------------------------------
@@ -201,14 +285,16 @@ class MetricsRenderer(Protocol):
 class MetricsService(Protocol):
     """Protocol for the metrics facade.
 
-    Public attributes (``http``, ``agentic_search``, ``db_pool``) are typed
-    with their respective protocols so ``Inject()`` in deps.py can resolve
-    them via nested attribute lookup.
+    Public attributes (``http``, ``agentic_search``, ``db_pool``, ``pubsub``,
+    ``usage``) are typed with their respective protocols so ``Inject()`` in deps.py can
+    resolve them via nested attribute lookup.
     """
 
     http: HttpMetrics
     agentic_search: AgenticSearchMetrics
     db_pool: DbPoolMetrics
+    pubsub: PubSubMetrics
+    usage: UsageLedgerMetrics
 
     async def start(self, *, pool: DbPool) -> None:
         """Start the metrics sidecar server and background samplers."""
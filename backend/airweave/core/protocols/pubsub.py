@@ -63,6 +63,10 @@ class PubSub(Protocol):
         """
         ...
 
+    async def close(self) -> None:
+        """End all subscriptions and release transport connections."""
+        ...
+
     async def store_snapshot(self, key: str, data: str, ttl_seconds: int) -> None:
         """Store a point-in-time snapshot with a TTL.
 
@@ -5,7 +5,7 @@ WorkerControlServer depends on, so the control server can accept any
 implementation (real registry, mock, or fake).
 """
 
-from typing import Any, Protocol, TypedDict, runtime_checkable
+from typing import Any, NotRequired, Optional, Protocol, TypedDict, runtime_checkable
 
 
 class SyncMetricDetail(TypedDict):
@@ -15,6 +15,10 @@ class SyncMetricDetail(TypedDict):
     sync_job_id: str
     org_name: str
     source_type: str
+    # Filled in by the control server's JSON status
+    workers_allocated: NotRequired[int]
+    pipeline_timings: NotRequired[Optional[dict[str, Any]]]
+    duration_seconds: NotRequired[float]
 
 
 class SyncWorkerCount(TypedDict):
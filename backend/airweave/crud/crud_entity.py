@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -291,6 +291,47 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
             )
             await db.execute(stmt)
 
+    async def bulk_remove(
+        self,
+        db: AsyncSession,
+        *,
+        ids: list[UUID],
+        ctx: BaseContext,
+        uow: Optional[UnitOfWork] = None,
+    ) -> list[Entity]:
+        """Delete many entities of the context's organization in one statement.
+
+        A single DELETE (instead of one per object) lets the statement-level
+        entity_count triggers apply one aggregated delta per definition.
+
+        Args:
+            db: The async database session.
+            ids: The UUIDs of the entities to delete.
+            ctx: The API context.
+            uow: Optional unit of work for transaction control.
+
+        Returns:
+            The deleted entities.
+        """
+        if not ids:
+            return []
+
+        await self._validate_organization_access(ctx, ctx.organization.id)
+
+        stmt = (
+            delete(Entity)
+            .where(Entity.id.in_(ids), Entity.organization_id == ctx.organization.id)
+            .returning(Entity)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        db_objs = list(result.scalars().all())
+
+        if not uow:
+            await db.commit()
+
+        return db_objs
+
     async def update_job_id(
         self,
         db: AsyncSession,
@@ -7,6 +7,11 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 
 from airweave.core.logging import logger
+from airweave.domains.converters.cache import (
+    ConversionCache,
+    conversion_namespace,
+    convert_with_cache,
+)
 from airweave.domains.ocr.protocols import OcrProvider
 
 
@@ -41,10 +46,22 @@ class HybridDocumentConverter(BaseTextConverter):
 
 
         converter = DocxConverter(ocr_provider=MistralOCR())
+
+    When a :class:`ConversionCache` is given, files whose content was already
+    converted are served from it, keyed per converter version and OCR
+    provider. Bump :attr:`CACHE_VERSION` whenever a subclass changes its
+    output so stale entries are no longer used.
     """
 
-    def __init__(self, ocr_provider: Optional[OcrProvider] = None) -> None:
+    CACHE_VERSION = 1
+
+    def __init__(
+        self,
+        ocr_provider: Optional[OcrProvider] = None,
+        conversion_cache: Optional[ConversionCache] = None,
+    ) -> None:
         self._ocr_provider = ocr_provider
+        self._cache = conversion_cache
 
     @abstractmethod
     async def _try_extract(self, path: str) -> Optional[str]:
@@ -85,6 +102,13 @@ class HybridDocumentConverter(BaseTextConverter):
             return None
 
     async def convert_batch(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
+        """Convert files to markdown, consulting the conversion cache first."""
+        namespace = conversion_namespace(
+            type(self).__name__, self.CACHE_VERSION, self._ocr_provider
+        )
+        return await convert_with_cache(self._cache, namespace, file_paths, self._convert_uncached)
+
+    async def _convert_uncached(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
         """Convert files to markdown, trying extraction first.
 
         For each file, calls :meth:`_try_extract`. If that returns content,
@@ -138,8 +162,14 @@ class HybridDocumentConverter(BaseTextConverter):
 class OcrConverterAdapter(BaseTextConverter):
     """Adapts an OcrProvider to the BaseTextConverter interface."""
 
-    def __init__(self, ocr: OcrProvider) -> None:
+    CACHE_VERSION = 1
+
+    def __init__(
+        self, ocr: OcrProvider, conversion_cache: Optional[ConversionCache] = None
+    ) -> None:
         self._ocr = ocr
+        self._cache = conversion_cache
 
     async def convert_batch(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
-        return await self._ocr.convert_batch(file_paths)
+        namespace = conversion_namespace(type(self).__name__, self.CACHE_VERSION, self._ocr)
+        return await convert_with_cache(self._cache, namespace, file_paths, self._ocr.convert_batch)
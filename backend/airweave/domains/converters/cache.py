@@ -0,0 +1,378 @@
+"""Content-addressed conversion cache.
+
+Conversion output (markdown) is keyed by ``(converter, converter version,
+sha256 of the file bytes)``. Identical files -- the same PDF attached to many
+emails, or a file whose metadata changed but whose bytes did not -- are
+therefore converted (and OCR'd) once.
+
+Two tiers:
+
+- an in-process LRU bounded by total markdown bytes, and
+- the storage backend (filesystem / blob), shared across workers, bounded by
+  ``max_storage_bytes``.
+
+Entries carry a creation timestamp; expired entries are treated as misses and
+removed on read. Outputs larger than ``max_entry_bytes`` are not cached.
+
+Next to every storage entry a small ``.meta.json`` records its creation time,
+last access and size; it is rewritten when the entry is read from storage.
+Every ``sweep_interval_seconds`` a worker sweeps the storage tier from those
+records alone: expired entries go first, then the least recently used until
+the tier fits its budget. Entries kept hot in a worker's memory tier are not
+re-touched in storage, so they may be evicted there first -- at worst costing
+other workers a reconversion.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from airweave.core.logging import logger
+from airweave.domains.ocr.protocols import OcrProvider, ocr_cache_identity
+from airweave.domains.storage.digests import local_file_digests
+from airweave.domains.storage.exceptions import StorageNotFoundError
+from airweave.domains.storage.paths import paths
+from airweave.domains.storage.protocols import StorageBackend
+from airweave.domains.sync_pipeline.async_helpers import run_in_thread_pool
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_ENTRY_BYTES = 5 * 1024 * 1024
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_STORAGE_BYTES = 10 * 1024 * 1024 * 1024
+DEFAULT_SWEEP_INTERVAL_SECONDS = 6 * 3600
+
+# Log the running hit rate every N lookups
+_STATS_LOG_INTERVAL = 500
+
+
+@dataclass
+class ConversionCacheStats:
+    """Hit/miss counters for one converter namespace."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class ConversionCache:
+    """Two-tier (memory + storage backend) cache for converter output.
+
+    All methods are fail-safe: storage errors are logged and treated as
+    misses so conversion always falls through to the real converter.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entry_bytes: int = DEFAULT_MAX_ENTRY_BYTES,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        max_storage_bytes: int = DEFAULT_MAX_STORAGE_BYTES,
+        sweep_interval_seconds: int = DEFAULT_SWEEP_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the cache on top of a storage backend."""
+        self._storage = storage
+        self._ttl_seconds = ttl_seconds
+        self._max_entry_bytes = max_entry_bytes
+        self._max_memory_bytes = max_memory_bytes
+        self._max_storage_bytes = max_storage_bytes
+        self._sweep_interval_seconds = sweep_interval_seconds
+        self._last_sweep = time.monotonic()
+        self._sweep_task: Optional[asyncio.Task] = None
+        self._memory: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._memory_bytes = 0
+        self._stats: Dict[str, ConversionCacheStats] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get(self, namespace: str, content_hash: str) -> Optional[str]:
+        """Return cached markdown for a file hash, or None on miss."""
+        key = paths.conversion_cache_path(namespace, content_hash)
+        markdown = self._memory_get(key)
+
+        if markdown is None:
+            markdown = await self._storage_get(key)
+            if markdown is not None:
+                self._memory_put(key, markdown, time.time())
+
+        self._record_lookup(namespace, hit=markdown is not None)
+        return markdown
+
+    async def put(self, namespace: str, content_hash: str, markdown: str) -> None:
+        """Store markdown for a file hash (skipped when over the size limit)."""
+        if len(markdown) > self._max_entry_bytes:
+            return
+
+        key = paths.conversion_cache_path(namespace, content_hash)
+        created_at = time.time()
+        self._memory_put(key, markdown, created_at)
+        try:
+            await self._storage.write_json(key, {"markdown": markdown, "created_at": created_at})
+            await self._write_meta(key, created_at, len(markdown))
+        except Exception as e:
+            logger.debug(f"Conversion cache write failed for {key}: {e}")
+            return
+        self._stats.setdefault(namespace, ConversionCacheStats()).stores += 1
+        self._maybe_schedule_sweep()
+
+    def stats(self) -> Dict[str, ConversionCacheStats]:
+        """Return hit/miss counters per converter namespace."""
+        return dict(self._stats)
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _is_expired(self, created_at: float) -> bool:
+        return time.time() - created_at > self._ttl_seconds
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        markdown, created_at = entry
+        if self._is_expired(created_at):
+            self._memory_evict(key)
+            return None
+        self._memory.move_to_end(key)
+        return markdown
+
+    def _memory_put(self, key: str, markdown: str, created_at: float) -> None:
+        if len(markdown) > self._max_memory_bytes:
+            return
+        if key in self._memory:
+            self._memory_evict(key)
+        self._memory[key] = (markdown, created_at)
+        self._memory_bytes += len(markdown)
+        while self._memory_bytes > self._max_memory_bytes:
+            oldest = next(iter(self._memory))
+            self._memory_evict(oldest)
+
+    def _memory_evict(self, key: str) -> None:
+        markdown, _ = self._memory.pop(key)
+        self._memory_bytes -= len(markdown)
+
+    # ------------------------------------------------------------------
+    # Storage tier
+    # ------------------------------------------------------------------
+
+    async def _storage_get(self, key: str) -> Optional[str]:
+        try:
+            data = await self._storage.read_json(key)
+        except StorageNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Conversion cache read failed for {key}: {e}")
+            return None
+
+        markdown = data.get("markdown")
+        created_at = data.get("created_at", 0.0)
+        if not markdown or self._is_expired(created_at):
+            await self._storage_delete(key)
+            return None
+
+        try:
+            await self._write_meta(key, created_at, len(markdown))
+        except Exception as e:
+            logger.debug(f"Conversion cache access update failed for {key}: {e}")
+        return markdown
+
+    async def _write_meta(self, key: str, created_at: float, size: int) -> None:
+        meta = {"created_at": created_at, "accessed_at": time.time(), "bytes": size}
+        await self._storage.write_json(paths.conversion_cache_meta_path(key), meta)
+
+    async def _storage_delete(self, key: str) -> None:
+        for path in (key, paths.conversion_cache_meta_path(key)):
+            try:
+                await self._storage.delete(path)
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # Storage sweep
+    # ------------------------------------------------------------------
+
+    def _maybe_schedule_sweep(self) -> None:
+        """Start a background sweep when the interval has passed and none is running."""
+        if self._sweep_interval_seconds <= 0:
+            return
+        if self._sweep_task is not None and not self._sweep_task.done():
+            return
+        if time.monotonic() - self._last_sweep < self._sweep_interval_seconds:
+            return
+        self._last_sweep = time.monotonic()
+        self._sweep_task = asyncio.create_task(self.sweep())
+
+    async def sweep(self) -> int:
+        """Remove expired entries, then least recently used ones over the storage budget.
+
+        Only the ``.meta.json`` records are read. Entries without one (a write
+        interrupted halfway) and records without an entry are removed too.
+
+        Returns:
+            Number of entries removed.
+        """
+        suffix = paths.CONVERSION_CACHE_META_SUFFIX
+        try:
+            files = set(await self._storage.list_files(paths.CONVERSION_CACHE_PREFIX))
+        except Exception as e:
+            logger.warning(f"Conversion cache sweep could not list entries: {e}")
+            return 0
+        metas = {f for f in files if f.endswith(suffix)}
+        keys = sorted(f for f in files - metas if f.endswith(".json"))
+
+        removed: List[str] = []
+        live: List[Tuple[float, int, str]] = []  # (accessed_at, bytes, key)
+        for key in keys:
+            meta_key = paths.conversion_cache_meta_path(key)
+            if meta_key not in metas:
+                removed.append(key)
+                continue
+            try:
+                meta = await self._storage.read_json(meta_key)
+            except Exception as e:
+                logger.debug(f"Conversion cache sweep could not read {meta_key}: {e}")
+                continue
+            created_at = meta.get("created_at", 0.0)
+            if self._is_expired(created_at):
+                removed.append(key)
+            else:
+                live.append((meta.get("accessed_at", created_at), meta.get("bytes", 0), key))
+
+        live.sort()
+        total_bytes = sum(size for _, size, _ in live)
+        evicted = 0
+        while evicted < len(live) and total_bytes > self._max_storage_bytes:
+            _, size, key = live[evicted]
+            removed.append(key)
+            total_bytes -= size
+            evicted += 1
+
+        orphan_metas = metas - {paths.conversion_cache_meta_path(key) for key in keys}
+        for key in removed + [m.removesuffix(suffix) + ".json" for m in orphan_metas]:
+            await self._storage_delete(key)
+            if key in self._memory:
+                self._memory_evict(key)
+
+        if removed:
+            logger.info(
+                f"Conversion cache sweep removed {len(removed)} entries; "
+                f"{len(live) - evicted} entries ({total_bytes} bytes) kept"
+            )
+        return len(removed)
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def _record_lookup(self, namespace: str, hit: bool) -> None:
+        stats = self._stats.setdefault(namespace, ConversionCacheStats())
+        if hit:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+        if stats.lookups % _STATS_LOG_INTERVAL == 0:
+            logger.info(
+                f"Conversion cache [{namespace}]: {stats.hit_rate:.1%} hit rate "
+                f"({stats.hits}/{stats.lookups} lookups, {stats.stores} stores)"
+            )
+
+
+def conversion_namespace(converter: str, version: int, ocr: Optional[OcrProvider]) -> str:
+    """Cache namespace of a converter version and the OCR provider behind it.
+
+    The OCR identity is hashed into a path-safe segment, so enabling or
+    switching OCR (or its model or endpoint) starts a fresh namespace.
+    """
+    identity = ocr_cache_identity(ocr)
+    ocr_segment = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:12]
+    return f"{converter}/v{version}/ocr-{ocr_segment}"
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file's content, read in 64KB chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(65536):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+async def convert_with_cache(
+    cache: Optional[ConversionCache],
+    namespace: str,
+    file_paths: List[str],
+    convert: Callable[[List[str]], Awaitable[Dict[str, Optional[str]]]],
+) -> Dict[str, Optional[str]]:
+    """Run ``convert`` only for files whose content is not cached yet.
+
+    Files with identical content inside the batch are converted once and the
+    result is fanned out to every path. Successful results are written back.
+    Files are keyed by the digest FileService recorded while writing them;
+    only files written some other way are read back and hashed.
+
+    Args:
+        cache: Conversion cache, or None to convert everything directly.
+        namespace: Cache namespace, see :func:`conversion_namespace`.
+        file_paths: Local file paths to convert.
+        convert: The converter's uncached batch conversion.
+
+    Returns:
+        Mapping of ``file_path -> markdown`` (``None`` on failure).
+    """
+    if cache is None:
+        return await convert(file_paths)
+
+    results: Dict[str, Optional[str]] = {}
+    paths_by_hash: Dict[str, List[str]] = {}
+    uncacheable: List[str] = []
+
+    for path in file_paths:
+        try:
+            content_hash = local_file_digests.get(path) or await run_in_thread_pool(hash_file, path)
+        except OSError as e:
+            logger.debug(f"{os.path.basename(path)}: cannot hash for conversion cache ({e})")
+            uncacheable.append(path)
+            continue
+        paths_by_hash.setdefault(content_hash, []).append(path)
+
+    # One representative path per distinct content hash that missed the cache
+    to_convert: Dict[str, str] = {}
+    for content_hash, same_paths in paths_by_hash.items():
+        cached = await cache.get(namespace, content_hash)
+        if cached is not None:
+            results.update(dict.fromkeys(same_paths, cached))
+        else:
+            to_convert[same_paths[0]] = content_hash
+
+    if not to_convert and not uncacheable:
+        return results
+
+    converted = await convert(list(to_convert) + uncacheable)
+    for path in uncacheable:
+        results[path] = converted.get(path)
+    for representative, content_hash in to_convert.items():
+        markdown = converted.get(representative)
+        results.update(dict.fromkeys(paths_by_hash[content_hash], markdown))
+        if markdown:
+            await cache.put(namespace, content_hash, markdown)
+
+    return results
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Dict, Optional
 
 from airweave.domains.converters._base import BaseTextConverter, OcrConverterAdapter
+from airweave.domains.converters.cache import ConversionCache
 from airweave.domains.converters.code import CodeConverter
 from airweave.domains.converters.doc import DocConverter
 from airweave.domains.converters.docx import DocxConverter
@@ -21,15 +22,21 @@ from airweave.domains.ocr.protocols import OcrProvider
 class ConverterRegistry(ConverterRegistryProtocol):
     """Concrete registry that creates and owns all converter instances.
 
-    Built once by the container factory with the resolved OCR provider.
+    Built once by the container factory with the resolved OCR provider and,
+    optionally, a content-addressed conversion cache shared by the document
+    and OCR converters.
     """
 
-    def __init__(self, ocr_provider: Optional[OcrProvider] = None) -> None:
+    def __init__(
+        self,
+        ocr_provider: Optional[OcrProvider] = None,
+        conversion_cache: Optional[ConversionCache] = None,
+    ) -> None:
         """Build all converter instances and the extension mapping."""
-        pdf = PdfConverter(ocr_provider=ocr_provider)
-        doc = DocConverter(ocr_provider=ocr_provider)
-        docx = DocxConverter(ocr_provider=ocr_provider)
-        pptx = PptxConverter(ocr_provider=ocr_provider)
+        pdf = PdfConverter(ocr_provider=ocr_provider, conversion_cache=conversion_cache)
+        doc = DocConverter(ocr_provider=ocr_provider, conversion_cache=conversion_cache)
+        docx = DocxConverter(ocr_provider=ocr_provider, conversion_cache=conversion_cache)
+        pptx = PptxConverter(ocr_provider=ocr_provider, conversion_cache=conversion_cache)
         html = HtmlConverter()
         txt = TxtConverter()
         xlsx = XlsxConverter()
@@ -79,7 +86,7 @@ class ConverterRegistry(ConverterRegistryProtocol):
 
         # Image extensions only available when OCR is configured
         if ocr_provider is not None:
-            ocr_adapter = OcrConverterAdapter(ocr_provider)
+            ocr_adapter = OcrConverterAdapter(ocr_provider, conversion_cache=conversion_cache)
             self._extension_map.update(
                 {
                     ".jpg": ocr_adapter,
@@ -0,0 +1,331 @@
+"""Tests for the content-addressed conversion cache."""
+
+import hashlib
+import os
+import time
+from typing import Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.domains.converters._base import HybridDocumentConverter, OcrConverterAdapter
+from airweave.domains.converters.cache import (
+    ConversionCache,
+    conversion_namespace,
+    convert_with_cache,
+)
+from airweave.domains.ocr.fallback import FallbackOcrProvider
+from airweave.domains.ocr.protocols import ocr_cache_identity
+from airweave.domains.storage.digests import local_file_digests
+from airweave.domains.storage.fakes import FakeStorageBackend
+from airweave.domains.storage.paths import paths
+
+
+def _write(tmp_path, name: str, content: bytes) -> str:
+    path = os.path.join(tmp_path, name)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+class _CountingConvert:
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    async def __call__(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
+        self.calls.append(list(file_paths))
+        return {p: f"markdown of {os.path.basename(p)}" for p in file_paths}
+
+
+class _ExtractingConverter(HybridDocumentConverter):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.extract_calls = 0
+
+    async def _try_extract(self, path: str) -> Optional[str]:
+        self.extract_calls += 1
+        return "# extracted"
+
+
+class _Ocr:
+    def __init__(self, identity: str, markdown: str) -> None:
+        self.cache_identity = identity
+        self.markdown = markdown
+        self.calls = 0
+
+    async def convert_batch(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
+        self.calls += 1
+        return {p: self.markdown for p in file_paths}
+
+
+class TestConversionCache:
+    @pytest.mark.asyncio
+    async def test_put_then_get_round_trips_through_storage(self):
+        storage = FakeStorageBackend()
+        await ConversionCache(storage).put("PdfConverter/v1", "ab" * 32, "# hello")
+
+        # Fresh instance: memory tier is empty, must hit the storage tier
+        cache = ConversionCache(storage)
+        assert await cache.get("PdfConverter/v1", "ab" * 32) == "# hello"
+        assert cache.stats()["PdfConverter/v1"].hits == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses_and_deleted(self):
+        storage = FakeStorageBackend()
+        key = paths.conversion_cache_path("PdfConverter/v1", "cd" * 32)
+        storage.seed_json(key, {"markdown": "# stale", "created_at": 0.0})
+
+        cache = ConversionCache(storage, ttl_seconds=60)
+
+        assert await cache.get("PdfConverter/v1", "cd" * 32) is None
+        assert not await storage.exists(key)
+        assert cache.stats()["PdfConverter/v1"].misses == 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_entries_are_not_cached(self):
+        storage = FakeStorageBackend()
+        cache = ConversionCache(storage, max_entry_bytes=4)
+
+        await cache.put("PdfConverter/v1", "ef" * 32, "too long")
+
+        assert await cache.get("PdfConverter/v1", "ef" * 32) is None
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        cache = ConversionCache(FakeStorageBackend(), max_memory_bytes=10)
+
+        cache._memory_put("a", "aaaa", 1e12)
+        cache._memory_put("b", "bbbb", 1e12)
+        cache._memory_get("a")
+        cache._memory_put("c", "cccc", 1e12)
+
+        assert list(cache._memory) == ["a", "c"]
+        assert cache._memory_bytes == 8
+
+    @pytest.mark.asyncio
+    async def test_storage_errors_fall_through_as_misses(self):
+        storage = AsyncMock()
+        storage.read_json = AsyncMock(side_effect=RuntimeError("blob down"))
+        storage.write_json = AsyncMock(side_effect=RuntimeError("blob down"))
+        cache = ConversionCache(storage)
+
+        await cache.put("PdfConverter/v1", "12" * 32, "# x")
+        assert await ConversionCache(storage).get("PdfConverter/v1", "12" * 32) is None
+
+
+class TestStorageSweep:
+    @staticmethod
+    def _seed(storage, name: str, created_at: float, accessed_at: float, size: int) -> str:
+        key = paths.conversion_cache_path("PdfConverter/v1", name * 32)
+        storage.seed_json(key, {"markdown": "x" * size, "created_at": created_at})
+        storage.seed_json(
+            paths.conversion_cache_meta_path(key),
+            {"created_at": created_at, "accessed_at": accessed_at, "bytes": size},
+        )
+        return key
+
+    @pytest.mark.asyncio
+    async def test_sweep_removes_expired_then_least_recently_used(self):
+        storage = FakeStorageBackend()
+        now = time.time()
+        expired = self._seed(storage, "aa", now - 120, now, 10)
+        cold = self._seed(storage, "bb", now, now - 50, 10)
+        warm = self._seed(storage, "cc", now, now - 10, 10)
+        hot = self._seed(storage, "dd", now, now, 10)
+        cache = ConversionCache(storage, ttl_seconds=60, max_storage_bytes=25)
+
+        assert await cache.sweep() == 2
+
+        assert not await storage.exists(expired)
+        assert not await storage.exists(cold)
+        assert not await storage.exists(paths.conversion_cache_meta_path(cold))
+        assert await storage.exists(warm)
+        assert await storage.exists(hot)
+
+    @pytest.mark.asyncio
+    async def test_reading_an_entry_marks_it_recently_used(self):
+        storage = FakeStorageBackend()
+        now = time.time()
+        first = self._seed(storage, "aa", now, now - 50, 10)
+        second = self._seed(storage, "bb", now, now - 10, 10)
+        cache = ConversionCache(storage, max_storage_bytes=15)
+
+        assert await cache.get("PdfConverter/v1", "aa" * 32) is not None
+        await cache.sweep()
+
+        assert await storage.exists(first)
+        assert not await storage.exists(second)
+
+    @pytest.mark.asyncio
+    async def test_entries_without_access_records_are_removed(self):
+        storage = FakeStorageBackend()
+        key = paths.conversion_cache_path("PdfConverter/v1", "ee" * 32)
+        storage.seed_json(key, {"markdown": "# half written", "created_at": time.time()})
+
+        assert await ConversionCache(storage).sweep() == 1
+        assert not await storage.exists(key)
+
+    @pytest.mark.asyncio
+    async def test_put_schedules_a_sweep_once_the_interval_has_passed(self):
+        storage = FakeStorageBackend()
+        cache = ConversionCache(storage, max_storage_bytes=0, sweep_interval_seconds=3600)
+
+        await cache.put("PdfConverter/v1", "ab" * 32, "# first")
+        assert cache._sweep_task is None
+
+        cache._last_sweep -= 3600
+        await cache.put("PdfConverter/v1", "cd" * 32, "# second")
+        await cache._sweep_task
+
+        assert await storage.list_files(paths.CONVERSION_CACHE_PREFIX) == []
+
+
+class TestConvertWithCache:
+    @pytest.mark.asyncio
+    async def test_identical_files_are_converted_once(self, tmp_path):
+        a = _write(tmp_path, "a.pdf", b"same bytes")
+        b = _write(tmp_path, "b.pdf", b"same bytes")
+        c = _write(tmp_path, "c.pdf", b"other bytes")
+        convert = _CountingConvert()
+
+        results = await convert_with_cache(
+            ConversionCache(FakeStorageBackend()), "PdfConverter/v1", [a, b, c], convert
+        )
+
+        assert len(convert.calls) == 1
+        assert sorted(convert.calls[0]) == sorted([a, c])
+        assert results[a] == results[b] == "markdown of a.pdf"
+        assert results[c] == "markdown of c.pdf"
+
+    @pytest.mark.asyncio
+    async def test_second_batch_is_served_from_cache(self, tmp_path):
+        a = _write(tmp_path, "a.pdf", b"content")
+        renamed = _write(tmp_path, "renamed.pdf", b"content")
+        cache = ConversionCache(FakeStorageBackend())
+        convert = _CountingConvert()
+
+        await convert_with_cache(cache, "PdfConverter/v1", [a], convert)
+        results = await convert_with_cache(cache, "PdfConverter/v1", [renamed], convert)
+
+        assert len(convert.calls) == 1
+        assert results[renamed] == "markdown of a.pdf"
+        stats = cache.stats()["PdfConverter/v1"]
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_failed_conversions_are_not_cached(self, tmp_path):
+        a = _write(tmp_path, "a.pdf", b"content")
+        cache = ConversionCache(FakeStorageBackend())
+
+        async def failing(file_paths):
+            return {p: None for p in file_paths}
+
+        assert (await convert_with_cache(cache, "PdfConverter/v1", [a], failing))[a] is None
+        assert await cache.get("PdfConverter/v1", hashlib.sha256(b"content").hexdigest()) is None
+
+    @pytest.mark.asyncio
+    async def test_digest_recorded_at_download_is_reused(self, tmp_path, monkeypatch):
+        a = _write(tmp_path, "a.pdf", b"content")
+        digest = hashlib.sha256(b"content").hexdigest()
+        local_file_digests.record(a, digest)
+        monkeypatch.setattr(
+            "airweave.domains.converters.cache.hash_file",
+            lambda path: pytest.fail("file was read back to hash it"),
+        )
+        cache = ConversionCache(FakeStorageBackend())
+
+        await convert_with_cache(cache, "PdfConverter/v1", [a], _CountingConvert())
+
+        assert await cache.get("PdfConverter/v1", digest) == "markdown of a.pdf"
+        local_file_digests.discard(a)
+
+    @pytest.mark.asyncio
+    async def test_unreadable_files_are_converted_without_caching(self, tmp_path):
+        missing = os.path.join(tmp_path, "missing.pdf")
+        convert = _CountingConvert()
+
+        results = await convert_with_cache(
+            ConversionCache(FakeStorageBackend()), "PdfConverter/v1", [missing], convert
+        )
+
+        assert convert.calls == [[missing]]
+        assert results[missing] == "markdown of missing.pdf"
+
+
+class TestConverterIntegration:
+    @pytest.mark.asyncio
+    async def test_hybrid_converter_skips_extraction_on_hit(self, tmp_path):
+        a = _write(tmp_path, "a.pdf", b"content")
+        cache = ConversionCache(FakeStorageBackend())
+        converter = _ExtractingConverter(conversion_cache=cache)
+
+        first = await converter.convert_batch([a])
+        second = await converter.convert_batch([a])
+
+        assert first == second == {a: "# extracted"}
+        assert converter.extract_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_ocr_adapter_skips_ocr_on_hit(self, tmp_path):
+        a = _write(tmp_path, "scan.png", b"pixels")
+        ocr = AsyncMock()
+        ocr.convert_batch = AsyncMock(side_effect=lambda ps: {p: "# ocr" for p in ps})
+        adapter = OcrConverterAdapter(ocr, conversion_cache=ConversionCache(FakeStorageBackend()))
+
+        await adapter.convert_batch([a])
+        assert await adapter.convert_batch([a]) == {a: "# ocr"}
+        ocr.convert_batch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_converter_without_cache_converts_directly(self, tmp_path):
+        a = _write(tmp_path, "a.pdf", b"content")
+        converter = _ExtractingConverter()
+
+        await converter.convert_batch([a])
+        await converter.convert_batch([a])
+
+        assert converter.extract_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_switching_ocr_provider_does_not_serve_stale_text(self, tmp_path):
+        a = _write(tmp_path, "scan.png", b"pixels")
+        cache = ConversionCache(FakeStorageBackend())
+        docling = _Ocr("docling:http://docling:5001", "# docling")
+        mistral = _Ocr("mistral:mistral-ocr-latest", "# mistral")
+
+        assert await OcrConverterAdapter(docling, conversion_cache=cache).convert_batch([a]) == {
+            a: "# docling"
+        }
+        assert await OcrConverterAdapter(mistral, conversion_cache=cache).convert_batch([a]) == {
+            a: "# mistral"
+        }
+        assert docling.calls == mistral.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_enabling_ocr_starts_a_fresh_namespace(self, tmp_path):
+        a = _write(tmp_path, "a.pdf", b"content")
+        cache = ConversionCache(FakeStorageBackend())
+        without_ocr = _ExtractingConverter(conversion_cache=cache)
+        with_ocr = _ExtractingConverter(ocr_provider=_Ocr("docling:x", "# ocr"), conversion_cache=cache)
+
+        await without_ocr.convert_batch([a])
+        await with_ocr.convert_batch([a])
+
+        assert without_ocr.extract_calls == with_ocr.extract_calls == 1
+
+
+class TestConversionNamespace:
+    def test_namespace_is_path_safe_and_tracks_ocr_configuration(self):
+        none = conversion_namespace("PdfConverter", 1, None)
+        local = conversion_namespace("PdfConverter", 1, _Ocr("docling:http://a:5001", ""))
+        remote = conversion_namespace("PdfConverter", 1, _Ocr("docling:http://b:5001", ""))
+
+        assert len({none, local, remote}) == 3
+        assert all(ns.startswith("PdfConverter/v1/ocr-") for ns in (none, local, remote))
+        assert ":" not in local
+
+    def test_fallback_chain_identity_follows_provider_order(self):
+        a, b = _Ocr("docling:x", ""), _Ocr("mistral:y", "")
+
+        assert ocr_cache_identity(FallbackOcrProvider([("docling", a), ("mistral", b)], MagicMock())) != (
+            ocr_cache_identity(FallbackOcrProvider([("mistral", b), ("docling", a)], MagicMock()))
+        )
@@ -0,0 +1,304 @@
+"""Cross-caller request coalescing for API embedders.
+
+Every sync's ``ChunkEmbedProcessor`` calls ``embed_many`` with whatever its
+micro-batch holds — often a handful of Slack messages or Linear issues. Sent
+as-is, each call is a tiny API request far below the provider's per-request
+limits, and concurrent syncs compete for rate limit with many small requests.
+
+``EmbeddingCoalescer`` sits between ``embed_many`` and the provider call:
+
+- callers enqueue their (already validated) texts and await a future;
+- a single flusher task lingers a few milliseconds for more texts, then packs
+  the queue into requests bounded by text count and token budget;
+- one semaphore caps in-flight requests for every caller sharing the
+  coalescer (the container builds one dense embedder per process, so this is
+  the pod-wide provider budget);
+- results are scattered back to each caller in input order.
+
+Requests are packed only when a concurrency slot is free, so under load the
+queue keeps filling while earlier requests are in flight and each call
+carries more texts.
+
+Failures stay scoped to the callers they belong to: a non-retryable provider
+error on a request mixing several callers is retried per caller, so one bad
+input cannot fail another sync's batch. A rate limit with ``Retry-After``
+pauses all new requests instead of letting every caller hit it again.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Optional
+
+from airweave.domains.embedders.exceptions import (
+    EmbedderAuthError,
+    EmbedderProviderError,
+    EmbedderRateLimitError,
+)
+from airweave.domains.embedders.types import DenseEmbedding
+
+SendBatch = Callable[[list[str]], Awaitable[list[DenseEmbedding]]]
+
+_MAX_PAUSE_SECONDS = 60.0
+
+
+@dataclass
+class CoalescerStats:
+    """Counters for observing coalescing efficiency."""
+
+    callers: int = 0
+    texts: int = 0
+    requests: int = 0
+    isolated_retries: int = 0
+
+    @property
+    def texts_per_request(self) -> float:
+        """Average number of texts carried by one provider request."""
+        return self.texts / self.requests if self.requests else 0.0
+
+
+class _Caller:
+    """One ``submit`` call waiting for its embeddings."""
+
+    __slots__ = ("future", "results", "remaining")
+
+    def __init__(self, future: asyncio.Future, size: int) -> None:
+        self.future = future
+        self.results: list[Optional[DenseEmbedding]] = [None] * size
+        self.remaining = size
+
+    def deliver(self, index: int, embedding: DenseEmbedding) -> None:
+        if self.future.done():
+            return
+        self.results[index] = embedding
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.future.set_result(self.results)
+
+    def fail(self, exc: BaseException) -> None:
+        if self.future.done():
+            return
+        if isinstance(exc, asyncio.CancelledError):
+            self.future.cancel()
+        else:
+            self.future.set_exception(exc)
+
+
+@dataclass
+class _Item:
+    caller: _Caller
+    index: int
+    text: str
+    tokens: int
+
+
+@dataclass
+class _LoopState:
+    """Primitives bound to the event loop the coalescer currently runs on."""
+
+    loop: asyncio.AbstractEventLoop
+    wakeup: asyncio.Event
+    slots: asyncio.Semaphore
+
+
+class EmbeddingCoalescer:
+    """Packs texts from concurrent callers into token-budgeted API requests.
+
+    Args:
+        send: Makes one provider call for a list of texts and returns one
+            embedding per text, in order.
+        max_texts_per_request: Upper bound on texts per provider call.
+        max_tokens_per_request: Upper bound on summed tokens per provider call.
+        max_concurrent_requests: Provider calls in flight across all callers.
+        max_wait_ms: How long to linger for more texts before sending a
+            request that is not yet full.
+    """
+
+    def __init__(
+        self,
+        send: SendBatch,
+        *,
+        max_texts_per_request: int,
+        max_tokens_per_request: int,
+        max_concurrent_requests: int,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        """Initialize the coalescer; the flusher starts on first use."""
+        self._send = send
+        self._max_texts = max_texts_per_request
+        self._max_tokens = max_tokens_per_request
+        self._max_concurrent = max_concurrent_requests
+        self._max_wait = max_wait_ms / 1000
+        self.stats = CoalescerStats()
+
+        self._queue: Deque[_Item] = deque()
+        self._queued_tokens = 0
+        self._paused_until = 0.0
+        self._state: Optional[_LoopState] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    async def submit(self, texts: list[str], token_counts: list[int]) -> list[DenseEmbedding]:
+        """Embed *texts* as part of whichever requests they get packed into."""
+        if not texts:
+            return []
+        state = self._ensure_running()
+
+        caller = _Caller(state.loop.create_future(), len(texts))
+        for index, (text, tokens) in enumerate(zip(texts, token_counts, strict=True)):
+            self._queue.append(_Item(caller, index, text, tokens))
+            self._queued_tokens += tokens
+        self.stats.callers += 1
+        state.wakeup.set()
+
+        results: list[DenseEmbedding] = await caller.future
+        return results
+
+    async def close(self) -> None:
+        """Stop the flusher and fail anything still queued."""
+        tasks = [t for t in (self._flusher, *self._in_flight) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        while self._queue:
+            self._queue.popleft().caller.fail(RuntimeError("Embedding coalescer closed"))
+        self._queued_tokens = 0
+        # Rebuild loop-bound state (and any slot held by the flusher) on next use
+        self._state = None
+        self._flusher = None
+
+    # ------------------------------------------------------------------
+    # Flusher
+    # ------------------------------------------------------------------
+
+    def _ensure_running(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._state
+        if state is None or state.loop is not loop:
+            # First use, or the previous loop is gone (tests, worker restarts)
+            state = _LoopState(loop, asyncio.Event(), asyncio.Semaphore(self._max_concurrent))
+            self._state = state
+            self._queue.clear()
+            self._queued_tokens = 0
+            self._in_flight = set()
+            self._flusher = None
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._run(state))
+        return state
+
+    async def _run(self, state: _LoopState) -> None:
+        while True:
+            await self._wait_for_batch(state)
+            await state.slots.acquire()
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            batch = self._take_batch()
+            if not batch:
+                state.slots.release()
+                continue
+            task = asyncio.create_task(self._dispatch(batch, state.slots))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _wait_for_batch(self, state: _LoopState) -> None:
+        while not self._queue:
+            state.wakeup.clear()
+            await state.wakeup.wait()
+
+        deadline = state.loop.time() + self._max_wait
+        while not self._batch_full():
+            remaining = deadline - state.loop.time()
+            if remaining <= 0:
+                return
+            state.wakeup.clear()
+            try:
+                await asyncio.wait_for(state.wakeup.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
+
+    def _batch_full(self) -> bool:
+        return len(self._queue) >= self._max_texts or self._queued_tokens >= self._max_tokens
+
+    def _take_batch(self) -> list[_Item]:
+        batch: list[_Item] = []
+        tokens = 0
+        while self._queue and len(batch) < self._max_texts:
+            item = self._queue[0]
+            if item.caller.future.done():
+                # Caller already failed or was cancelled: don't spend a request on it
+                self._queue.popleft()
+                self._queued_tokens -= item.tokens
+                continue
+            if batch and tokens + item.tokens > self._max_tokens:
+                break
+            self._queue.popleft()
+            self._queued_tokens -= item.tokens
+            batch.append(item)
+            tokens += item.tokens
+        return batch
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    async def _dispatch(self, batch: list[_Item], slots: asyncio.Semaphore) -> None:
+        try:
+            try:
+                embeddings = await self._call(batch)
+            except Exception as exc:
+                callers = list(dict.fromkeys(item.caller for item in batch))
+                if len(callers) > 1 and _is_input_specific(exc):
+                    await self._retry_per_caller(batch, callers)
+                else:
+                    for caller in callers:
+                        caller.fail(exc)
+                return
+            for item, embedding in zip(batch, embeddings, strict=True):
+                item.caller.deliver(item.index, embedding)
+        except BaseException as exc:
+            # Cancellation (close) or an unexpected error: never strand callers
+            for item in batch:
+                item.caller.fail(exc)
+            raise
+        finally:
+            slots.release()
+
+    async def _retry_per_caller(self, batch: list[_Item], callers: list[_Caller]) -> None:
+        for caller in callers:
+            items = [item for item in batch if item.caller is caller]
+            self.stats.isolated_retries += 1
+            try:
+                embeddings = await self._call(items)
+            except Exception as exc:
+                caller.fail(exc)
+                continue
+            for item, embedding in zip(items, embeddings, strict=True):
+                caller.deliver(item.index, embedding)
+
+    async def _call(self, items: list[_Item]) -> list[DenseEmbedding]:
+        self.stats.requests += 1
+        self.stats.texts += len(items)
+        try:
+            return await self._send([item.text for item in items])
+        except EmbedderRateLimitError as exc:
+            if exc.retry_after:
+                self._paused_until = max(
+                    self._paused_until,
+                    time.monotonic() + min(exc.retry_after, _MAX_PAUSE_SECONDS),
+                )
+            raise
+
+
+def _is_input_specific(exc: Exception) -> bool:
+    """Whether an error may be caused by one caller's texts rather than the provider."""
+    return (
+        isinstance(exc, EmbedderProviderError)
+        and not exc.retryable
+        and not isinstance(exc, EmbedderAuthError)
+    )
@@ -3,13 +3,16 @@
 Handles batching, concurrency, token validation, input/response
 validation, and error translation. Callers pass text, get
 DenseEmbedding back, handle errors themselves.
-"""
 
-import asyncio
+Requests from concurrent callers are coalesced (see ``EmbeddingCoalescer``),
+so many small ``embed_many`` calls share token-budgeted API requests and one
+concurrency budget.
+"""
 
 import tiktoken
 from openai import AsyncOpenAI
 
+from airweave.domains.embedders.coalescer import EmbeddingCoalescer
 from airweave.domains.embedders.exceptions import (
     EmbedderAuthError,
     EmbedderConnectionError,
@@ -38,6 +41,7 @@ class OpenAIDenseEmbedder(DenseEmbedderProtocol):
     _MAX_TEXTS_PER_SUB_BATCH: int = 100
     _MAX_TOKENS_PER_REQUEST: int = 100_000
     _MAX_CONCURRENT_REQUESTS: int = 10
+    _COALESCE_WAIT_MS: float = 5.0
     _CLIENT_TIMEOUT: float = 1200.0
     _CLIENT_MAX_RETRIES: int = 2
 
@@ -63,7 +67,13 @@ class OpenAIDenseEmbedder(DenseEmbedderProtocol):
             max_retries=self._CLIENT_MAX_RETRIES,
         )
         self._encoder = tiktoken.get_encoding("cl100k_base")
-        self._semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_REQUESTS)
+        self._coalescer = EmbeddingCoalescer(
+            self._embed_batch,
+            max_texts_per_request=self._MAX_TEXTS_PER_SUB_BATCH,
+            max_tokens_per_request=self._MAX_TOKENS_PER_REQUEST,
+            max_concurrent_requests=self._MAX_CONCURRENT_REQUESTS,
+            max_wait_ms=self._COALESCE_WAIT_MS,
+        )
 
     # ------------------------------------------------------------------
     # Public interface
@@ -90,22 +100,11 @@ class OpenAIDenseEmbedder(DenseEmbedderProtocol):
             return []
 
         token_counts = self._validate_inputs(texts)
-
-        sub_batches = [
-            (
-                texts[i : i + self._MAX_TEXTS_PER_SUB_BATCH],
-                token_counts[i : i + self._MAX_TEXTS_PER_SUB_BATCH],
-            )
-            for i in range(0, len(texts), self._MAX_TEXTS_PER_SUB_BATCH)
-        ]
-
-        tasks = [self._embed_sub_batch(batch, counts) for batch, counts in sub_batches]
-        nested_results = await asyncio.gather(*tasks)
-
-        return [embedding for batch_result in nested_results for embedding in batch_result]
+        return await self._coalescer.submit(texts, token_counts)
 
     async def close(self) -> None:
         """Release held resources."""
+        await self._coalescer.close()
         await self._client.close()
 
     # ------------------------------------------------------------------
@@ -145,23 +144,6 @@ class OpenAIDenseEmbedder(DenseEmbedderProtocol):
     # Batching
     # ------------------------------------------------------------------
 
-    async def _embed_sub_batch(
-        self, batch: list[str], token_counts: list[int]
-    ) -> list[DenseEmbedding]:
-        """Embed a sub-batch, splitting recursively if tokens exceed the limit."""
-        total_tokens = sum(token_counts)
-
-        if total_tokens > self._MAX_TOKENS_PER_REQUEST and len(batch) > 1:
-            mid = len(batch) // 2
-            left, right = await asyncio.gather(
-                self._embed_sub_batch(batch[:mid], token_counts[:mid]),
-                self._embed_sub_batch(batch[mid:], token_counts[mid:]),
-            )
-            return left + right
-
-        async with self._semaphore:
-            return await self._embed_batch(batch)
-
     async def _embed_batch(self, batch: list[str]) -> list[DenseEmbedding]:
         """Make a single API call and translate results/errors."""
         response = await self._call_api(batch)
@@ -422,3 +422,30 @@ async def test_close_calls_client_close():
     await embedder.close()
 
     client.close.assert_awaited_once()
+
+
+# ===========================================================================
+# Cross-caller coalescing
+# ===========================================================================
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embed_many_calls_are_coalesced():
+    """Small concurrent embed_many calls share API requests."""
+    import asyncio
+
+    requests: list[int] = []
+
+    async def fake_create(**kwargs):
+        requests.append(len(kwargs["input"]))
+        return _make_response([_vector(val=float(t.split()[1])) for t in kwargs["input"]])
+
+    client = AsyncMock()
+    client.embeddings.create.side_effect = fake_create
+    embedder = _build_embedder(client_mock=client)
+
+    batches = [[f"text {i * 10 + j}" for j in range(10)] for i in range(8)]
+    results = await asyncio.gather(*(embedder.embed_many(list(b)) for b in batches))
+
+    assert requests == [80]
+    assert [r.vector[0] for r in results[3]] == [float(30 + j) for j in range(10)]
@@ -0,0 +1,141 @@
+"""Unit tests for EmbeddingCoalescer."""
+
+import asyncio
+
+import pytest
+
+from airweave.domains.embedders.coalescer import EmbeddingCoalescer
+from airweave.domains.embedders.exceptions import (
+    EmbedderProviderError,
+    EmbedderRateLimitError,
+)
+from airweave.domains.embedders.types import DenseEmbedding
+
+
+class _FakeProvider:
+    """Records each request and embeds text ``"n"`` as ``[n]``."""
+
+    def __init__(self, *, delay: float = 0.0, fail_on: str | None = None) -> None:
+        self.requests: list[list[str]] = []
+        self.delay = delay
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __call__(self, texts: list[str]) -> list[DenseEmbedding]:
+        self.requests.append(list(texts))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_on in texts:
+                raise EmbedderProviderError("invalid input", provider="fake", retryable=False)
+            return [DenseEmbedding(vector=[float(t)]) for t in texts]
+        finally:
+            self.in_flight -= 1
+
+
+def _coalescer(provider: _FakeProvider, **overrides) -> EmbeddingCoalescer:
+    options = dict(
+        max_texts_per_request=100,
+        max_tokens_per_request=1_000,
+        max_concurrent_requests=4,
+        max_wait_ms=5.0,
+    )
+    options.update(overrides)
+    return EmbeddingCoalescer(provider, **options)
+
+
+async def _submit(coalescer: EmbeddingCoalescer, values: range, tokens: int = 1):
+    texts = [str(v) for v in values]
+    results = await coalescer.submit(texts, [tokens] * len(texts))
+    return [r.vector[0] for r in results]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_request():
+    provider = _FakeProvider()
+    coalescer = _coalescer(provider)
+
+    results = await asyncio.gather(*(_submit(coalescer, range(i * 5, i * 5 + 5)) for i in range(6)))
+
+    assert len(provider.requests) == 1
+    assert results == [[float(v) for v in range(i * 5, i * 5 + 5)] for i in range(6)]
+    assert coalescer.stats.texts_per_request == 30
+
+
+@pytest.mark.asyncio
+async def test_requests_respect_text_and_token_budgets():
+    provider = _FakeProvider()
+    coalescer = _coalescer(provider, max_texts_per_request=10, max_tokens_per_request=30)
+
+    # 25 texts x 4 tokens: the token budget allows 7 per request
+    results = await asyncio.gather(
+        _submit(coalescer, range(0, 15), tokens=4), _submit(coalescer, range(15, 25), tokens=4)
+    )
+
+    assert [len(r) for r in provider.requests] == [7, 7, 7, 4]
+    assert results[0] + results[1] == [float(v) for v in range(25)]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_budget_is_shared_across_callers():
+    provider = _FakeProvider(delay=0.01)
+    coalescer = _coalescer(provider, max_texts_per_request=2, max_concurrent_requests=3)
+
+    await asyncio.gather(*(_submit(coalescer, range(i * 4, i * 4 + 4)) for i in range(5)))
+
+    assert provider.peak_in_flight == 3
+    assert len(provider.requests) == 10
+
+
+@pytest.mark.asyncio
+async def test_input_error_only_fails_the_offending_caller():
+    provider = _FakeProvider(fail_on="13")
+    coalescer = _coalescer(provider)
+
+    good, bad = await asyncio.gather(
+        _submit(coalescer, range(0, 5)),
+        _submit(coalescer, range(10, 15)),
+        return_exceptions=True,
+    )
+
+    assert good == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert isinstance(bad, EmbedderProviderError)
+    assert coalescer.stats.isolated_retries == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_pauses_following_requests():
+    attempts = 0
+
+    async def send(texts: list[str]) -> list[DenseEmbedding]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise EmbedderRateLimitError("slow down", provider="fake", retry_after=0.05)
+        return [DenseEmbedding(vector=[0.0]) for _ in texts]
+
+    coalescer = _coalescer(send)
+    loop = asyncio.get_running_loop()
+
+    with pytest.raises(EmbedderRateLimitError):
+        await coalescer.submit(["a"], [1])
+    start = loop.time()
+    await coalescer.submit(["b"], [1])
+
+    assert loop.time() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_close_fails_queued_callers():
+    provider = _FakeProvider(delay=1.0)
+    coalescer = _coalescer(provider, max_texts_per_request=1, max_concurrent_requests=1)
+
+    pending = asyncio.gather(
+        *(_submit(coalescer, range(i, i + 1)) for i in range(3)), return_exceptions=True
+    )
+    await asyncio.sleep(0.02)
+    await coalescer.close()
+
+    assert all(isinstance(r, BaseException) for r in await pending)
@@ -1,4 +1,4 @@
-"""Entity definition registry — in-memory registry built once at startup."""
+"""Entity definition registry — in-memory registry built once at startup from the manifest."""
 
 import re
 from typing import Type
@@ -6,7 +6,7 @@ from typing import Type
 from airweave.core.logging import logger
 from airweave.domains.entities.protocols import EntityDefinitionRegistryProtocol
 from airweave.domains.entities.types import EntityDefinitionEntry
-from airweave.platform.entities import ENTITIES_BY_SOURCE
+from airweave.platform.manifest import class_ref, import_ref, load_manifest
 
 registry_logger = logger.with_prefix("EntityDefinitionRegistry: ").with_context(
     component="entity_definition_registry"
@@ -78,80 +78,109 @@ def _validate_entity_class_fields(cls: Type, name: str, module_name: str) -> Non
 
 
 class EntityDefinitionRegistry(EntityDefinitionRegistryProtocol):
-    """In-memory entity definition registry, built from ENTITIES_BY_SOURCE."""
+    """In-memory entity definition registry, built from the registry manifest.
+
+    Entity classes are imported, and their JSON schemas computed, on the
+    first ``get()`` of one of their definitions, so building the registry
+    imports no entity module.
+    """
 
     def __init__(self) -> None:
         """Initialize the entity definition registry."""
         self._entries: dict[str, EntityDefinitionEntry] = {}
         self._by_source: dict[str, list[EntityDefinitionEntry]] = {}
-        self._by_class: dict[Type, str] = {}
+        self._class_refs: dict[str, str] = {}
+        self._by_class: dict[Type, str] = {}  # filled by get_short_name_by_class()
 
     def get(self, short_name: str) -> EntityDefinitionEntry:
-        """Get an entity definition entry by short name.
+        """Get an entity definition entry by short name, resolving its class on first use.
 
         Args:
             short_name: The snake_case identifier (e.g., "asana_task_entity").
 
         Returns:
-            The entity definition entry.
+            The entity definition entry, with ``entity_class_ref`` and
+            ``entity_schema`` set.
 
         Raises:
             KeyError: If no entity with the given short name is registered.
         """
-        return self._entries[short_name]
+        entry = self._entries[short_name]
+        if entry.entity_class_ref is None:
+            entity_cls = import_ref(self._class_refs[short_name])
+            resolved = entry.model_copy(
+                update={
+                    "entity_class_ref": entity_cls,
+                    "entity_schema": _get_entity_schema_with_direct_fields_only(entity_cls),
+                }
+            )
+            self._entries[short_name] = resolved
+            self._by_source[entry.module_name] = [
+                resolved if e.short_name == short_name else e
+                for e in self._by_source[entry.module_name]
+            ]
+            entry = resolved
+        return entry
 
     def list_all(self) -> list[EntityDefinitionEntry]:
-        """List all registered entity definition entries."""
+        """List all registered entity definition entries.
+
+        Entity classes are not imported here; ``entity_class_ref`` and
+        ``entity_schema`` are only set on entries already looked up with ``get()``.
+        """
         return list(self._entries.values())
 
     def get_short_name_by_class(self, entity_class: Type) -> str | None:
         """Reverse-lookup: get short_name for an entity class.
 
-        Returns None if the class is not registered.
+        Matches the class by name and module against the manifest without
+        importing anything. Returns None if the class is not registered.
         """
-        return self._by_class.get(entity_class)
+        short_name = self._by_class.get(entity_class)
+        if short_name is None:
+            candidate = _to_snake_case(entity_class.__name__)
+            if self._class_refs.get(candidate) != class_ref(entity_class):
+                return None
+            short_name = self._by_class[entity_class] = candidate
+        return short_name
 
     def list_for_source(self, source_short_name: str) -> list[EntityDefinitionEntry]:
         """List all entity definitions for a given source.
 
+        Like ``list_all()``, this does not import entity classes.
+
         Args:
             source_short_name: The source short name (e.g., "asana").
 
         Returns:
             All entity definition entries for the source, or empty list if none.
         """
-        return self._by_source.get(source_short_name, [])
+        return list(self._by_source.get(source_short_name, []))
 
     def build(self) -> None:
-        """Build the registry from ENTITIES_BY_SOURCE.
+        """Build the registry from the registry manifest.
 
-        Iterates the explicit registration dict, creates entries, and builds
-        the by-source index for fast lookups.
+        Creates entries from the manifest definitions and builds the
+        by-source index for fast lookups.
 
         Called once at startup. After this, all lookups are dict reads.
         """
-        for module_name, entity_classes in ENTITIES_BY_SOURCE.items():
+        for module_name, records in load_manifest()["entities"].items():
             source_entries = []
 
-            for entity_cls in entity_classes:
-                class_name = entity_cls.__name__
-                short_name = _to_snake_case(class_name)
-
-                _validate_entity_class_fields(entity_cls, class_name, module_name)
-
+            for record in records:
+                short_name = record["short_name"]
                 entry = EntityDefinitionEntry(
                     short_name=short_name,
-                    name=class_name,
-                    description=entity_cls.__doc__,
-                    class_name=class_name,
-                    entity_class_ref=entity_cls,
+                    name=record["name"],
+                    description=record["description"],
+                    class_name=record["class_name"],
                     module_name=module_name,
                     entity_type="json",
-                    entity_schema=_get_entity_schema_with_direct_fields_only(entity_cls),
                 )
 
                 self._entries[short_name] = entry
-                self._by_class[entity_cls] = short_name
+                self._class_refs[short_name] = record["class_ref"]
                 source_entries.append(entry)
 
             self._by_source[module_name] = source_entries
@@ -160,3 +189,28 @@ class EntityDefinitionRegistry(EntityDefinitionRegistryProtocol):
             f"Built registry with {len(self._entries)} entity definitions "
             f"across {len(self._by_source)} sources."
         )
+
+    @staticmethod
+    def manifest_entries(entities_by_source: dict[str, list[type]]) -> dict[str, list[dict]]:
+        """Describe entity classes, grouped by source, for the registry manifest.
+
+        Validates field descriptions. Schemas are left out: they repeat the
+        shared ``$defs`` per class and are cheap to compute on ``get()``.
+        """
+        records_by_source = {}
+        for module_name, entity_classes in entities_by_source.items():
+            records = []
+            for entity_cls in entity_classes:
+                class_name = entity_cls.__name__
+                _validate_entity_class_fields(entity_cls, class_name, module_name)
+                records.append(
+                    {
+                        "short_name": _to_snake_case(class_name),
+                        "name": class_name,
+                        "description": entity_cls.__doc__,
+                        "class_name": class_name,
+                        "class_ref": class_ref(entity_cls),
+                    }
+                )
+            records_by_source[module_name] = records
+        return records_by_source
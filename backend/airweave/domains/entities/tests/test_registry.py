@@ -1,6 +1,6 @@
 """Unit tests for EntityDefinitionRegistry.
 
-Table-driven tests with patched ENTITIES_BY_SOURCE.
+Table-driven tests with a patched registry manifest built from stub classes.
 No real platform entities loaded.
 """
 
@@ -11,8 +11,13 @@ import pytest
 from pydantic import BaseModel
 
 from airweave.domains.entities.registry import EntityDefinitionRegistry, _to_snake_case
+from airweave.platform.manifest import class_ref
 
-_PATCH_ENTITIES = "airweave.domains.entities.registry.ENTITIES_BY_SOURCE"
+_PATCH_MANIFEST = "airweave.domains.entities.registry.load_manifest"
+_PATCH_IMPORT_REF = "airweave.domains.entities.registry.import_ref"
+
+# Class refs of the stubs built by the current test → stub class
+_STUB_CLASSES: dict[str, type] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -26,13 +31,25 @@ def _make_entity_cls(class_name: str, doc: str | None = None) -> type:
 
 
 def _build_registry(entities_by_source: dict):
-    """Build an EntityDefinitionRegistry with patched globals."""
+    """Build an EntityDefinitionRegistry from a manifest describing the stub classes."""
+    manifest = {"entities": EntityDefinitionRegistry.manifest_entries(entities_by_source)}
+    for entity_classes in entities_by_source.values():
+        _STUB_CLASSES.update({class_ref(cls): cls for cls in entity_classes})
+
     registry = EntityDefinitionRegistry()
-    with patch(_PATCH_ENTITIES, entities_by_source):
+    with patch(_PATCH_MANIFEST, return_value=manifest):
         registry.build()
     return registry
 
 
+@pytest.fixture(autouse=True)
+def _resolve_stub_classes():
+    """Resolve class refs to the stub classes instead of importing them."""
+    with patch(_PATCH_IMPORT_REF, side_effect=_STUB_CLASSES.__getitem__) as import_ref:
+        yield import_ref
+    _STUB_CLASSES.clear()
+
+
 # ---------------------------------------------------------------------------
 # _to_snake_case
 # ---------------------------------------------------------------------------
@@ -196,3 +213,49 @@ def test_entity_schema_is_dict():
     schema = registry.get("asana_task_entity").entity_schema
     assert isinstance(schema, dict)
     assert schema["type"] == "object"
+
+
+# ---------------------------------------------------------------------------
+# Lazy class resolution
+# ---------------------------------------------------------------------------
+
+
+def test_build_does_not_import_entity_classes(_resolve_stub_classes):
+    registry = _build_registry({"asana": [_make_entity_cls("AsanaTaskEntity")]})
+
+    assert _resolve_stub_classes.call_count == 0
+    assert registry.list_for_source("asana")[0].entity_class_ref is None
+    assert registry.list_for_source("asana")[0].entity_schema is None
+
+
+def test_get_resolves_class_once(_resolve_stub_classes):
+    cls = _make_entity_cls("AsanaTaskEntity")
+    registry = _build_registry({"asana": [cls]})
+
+    registry.get("asana_task_entity")
+    registry.get("asana_task_entity")
+
+    assert _resolve_stub_classes.call_count == 1
+    assert registry.list_for_source("asana")[0].entity_class_ref is cls
+    assert registry.list_for_source("asana")[0].entity_schema["type"] == "object"
+
+
+# ---------------------------------------------------------------------------
+# get_short_name_by_class()
+# ---------------------------------------------------------------------------
+
+
+def test_get_short_name_by_class():
+    cls = _make_entity_cls("AsanaTaskEntity")
+    registry = _build_registry({"asana": [cls]})
+
+    assert registry.get_short_name_by_class(cls) == "asana_task_entity"
+
+
+def test_get_short_name_by_class_unknown():
+    registry = _build_registry({"asana": [_make_entity_cls("AsanaTaskEntity")]})
+    same_name_elsewhere = _make_entity_cls("AsanaTaskEntity")
+    same_name_elsewhere.__module__ = "somewhere.else"
+
+    assert registry.get_short_name_by_class(_make_entity_cls("SlackMessageEntity")) is None
+    assert registry.get_short_name_by_class(same_name_elsewhere) is None
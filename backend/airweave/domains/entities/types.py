@@ -8,10 +8,11 @@ from airweave.core.protocols.registry import BaseRegistryEntry
 class EntityDefinitionEntry(BaseRegistryEntry):
     """Precomputed entity definition metadata."""
 
-    entity_class_ref: type
+    entity_class_ref: type | None = None  # imported on the first registry get() of this entry
     module_name: str  # source short_name this entity belongs to (e.g. "asana")
     entity_type: str  # "json" (always, for now)
-    entity_schema: dict  # filtered Pydantic JSON schema (direct fields + breadcrumbs)
+    # filtered Pydantic JSON schema (direct fields + breadcrumbs), built on the first registry get()
+    entity_schema: dict | None = None
 
 
 class EntityDefinitionMetadata(BaseModel):
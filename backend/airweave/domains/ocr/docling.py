@@ -64,6 +64,11 @@ class DoclingOcrAdapter:
             logger.warning(f"[DoclingOCR] Health check failed: {exc}")
             raise
 
+    @property
+    def cache_identity(self) -> str:
+        """Provider and endpoint, for conversion cache keys."""
+        return f"docling:{self._base_url}"
+
     async def convert_batch(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
         """Convert files to markdown via docling-serve.
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from airweave.core.logging import logger
+from airweave.domains.ocr.protocols import ocr_cache_identity
 
 if TYPE_CHECKING:
     from airweave.core.protocols import CircuitBreaker
@@ -51,6 +52,12 @@ class FallbackOcrProvider:
         self._providers = providers
         self._circuit_breaker = circuit_breaker
 
+    @property
+    def cache_identity(self) -> str:
+        """The ordered provider chain, for conversion cache keys."""
+        chain = ",".join(f"{key}={ocr_cache_identity(p)}" for key, p in self._providers)
+        return f"fallback[{chain}]"
+
     async def convert_batch(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
         """Convert files to markdown, trying providers in order.
 
@@ -35,7 +35,7 @@ from airweave.domains.ocr.mistral.models import (
     OcrResult,
     PreparedBatch,
 )
-from airweave.domains.ocr.mistral.ocr_client import MistralOcrClient
+from airweave.domains.ocr.mistral.ocr_client import OCR_MODEL, MistralOcrClient
 from airweave.domains.ocr.mistral.splitters import (
     DocxSplitter,
     PdfSplitter,
@@ -74,6 +74,11 @@ class MistralOCR:
         self._client = MistralOcrClient(concurrency=concurrency)
         self._client.ensure_initialized()
 
+    @property
+    def cache_identity(self) -> str:
+        """Provider and model, for conversion cache keys."""
+        return f"mistral:{OCR_MODEL}"
+
     # ==================================================================
     # Public API (OcrProvider protocol)
     # ==================================================================
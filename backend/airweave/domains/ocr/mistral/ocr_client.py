@@ -39,6 +39,8 @@ RETRY_MULTIPLIER = 2
 # Concurrent OCR calls cap (can be higher than batch uploads since OCR is the bottleneck)
 DEFAULT_OCR_CONCURRENCY = 10
 
+OCR_MODEL = "mistral-ocr-latest"
+
 
 def _is_retryable(exc: BaseException) -> bool:
     """Return True for transient errors worth retrying (5xx, timeouts, rate limits).
@@ -162,7 +164,7 @@ class MistralOcrClient:
 
             ocr_resp = await self._api_call(
                 lambda: self._client.ocr.process_async(
-                    model="mistral-ocr-latest",
+                    model=OCR_MODEL,
                     document=MistralFileChunk(file_id=file_resp.id),
                 ),
                 operation_name=f"ocr_{file_name}",
@@ -36,3 +36,16 @@ class OcrProvider(Protocol):
             Mapping of ``file_path -> markdown`` (``None`` on failure).
         """
         ...
+
+
+def ocr_cache_identity(provider: Optional[OcrProvider]) -> str:
+    """Identify an OCR provider and its configuration for conversion cache keys.
+
+    Providers may expose a ``cache_identity`` string covering whatever
+    changes their output (model, endpoint, wrapped providers); others are
+    identified by class name. ``"none"`` when OCR is disabled.
+    """
+    if provider is None:
+        return "none"
+    identity = getattr(provider, "cache_identity", None)
+    return identity if isinstance(identity, str) else type(provider).__name__
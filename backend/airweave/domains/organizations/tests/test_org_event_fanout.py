@@ -52,6 +52,7 @@ class TestOrgCreatedFanout:
                 plan="pro",
             )
         )
+        await bus.flush()
 
         assert webhook_pub.has_event("organization.created")
 
@@ -66,6 +67,7 @@ class TestOrgCreatedFanout:
                 owner_email="boss@acme.com",
             )
         )
+        await bus.flush()
 
         assert tracker.has("organization_created")
         assert tracker.has("$group_identify:organization")
@@ -83,6 +85,7 @@ class TestOrgDeletedFanout:
                 affected_user_emails=["a@acme.com"],
             )
         )
+        await bus.flush()
 
         assert webhook_pub.has_event("organization.deleted")
 
@@ -97,6 +100,7 @@ class TestOrgDeletedFanout:
                 affected_user_emails=["a@acme.com", "b@acme.com"],
             )
         )
+        await bus.flush()
 
         assert tracker.has("organization_deleted")
         event = tracker.get("organization_deleted")
@@ -13,6 +13,7 @@ delegates to:
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import TYPE_CHECKING, Optional
 
@@ -49,10 +50,7 @@ from airweave.core.protocols.tokenizer import TokenizerProtocol
 from airweave.domains.collections.protocols import CollectionRepositoryProtocol
 from airweave.domains.search.adapters.vector_db.protocol import VectorDBProtocol
 from airweave.domains.search.agentic.context_manager import ContextManager
-from airweave.domains.search.agentic.exceptions import (
-    ContextBudgetExhaustedError,
-    ToolError,
-)
+from airweave.domains.search.agentic.exceptions import ContextBudgetExhaustedError
 from airweave.domains.search.agentic.messages import (
     build_assistant_message,
     build_system_prompt,
@@ -552,15 +550,11 @@ class Agent:
         small_reserve = 500  # enough for all small tool results combined
         large_budget_each = (total_available - small_reserve) // max(1, large_count)
 
-        for tc in tool_calls:
-            tc_start = time.monotonic()
-            try:
-                result = await dispatcher.dispatch(tc, state)
-            except ToolError as e:
-                # Correctable errors — feed back to LLM for self-correction
-                result = ToolErrorResult(error=str(e))  # type: ignore[assignment]
-            tc_duration = int((time.monotonic() - tc_start) * 1000)
-
+        # Independent retrieval calls run concurrently; results arrive in call
+        # order so events and tool messages stay deterministic.
+        async for tc, result, tc_duration in dispatcher.dispatch_all(
+            tool_calls, state, max_concurrency=self._config.MAX_CONCURRENT_TOOL_CALLS
+        ):
             await self._event_bus.publish(
                 SearchToolCalledEvent(
                     organization_id=ctx.organization.id,
@@ -599,6 +593,7 @@ class Agent:
         user_principal: str | None = None,
     ) -> ToolDispatcher:
         """Construct tools and dispatcher for this request."""
+        db_lock = asyncio.Lock()
         return ToolDispatcher(
             {
                 ToolName.SEARCH: SearchTool(
@@ -609,6 +604,7 @@ class Agent:
                     ctx=ctx,
                     collection_readable_id=collection_readable_id,
                     user_principal=user_principal,
+                    db_lock=db_lock,
                 ),
                 ToolName.READ: ReadTool(
                     vector_db=self._vector_db,
@@ -11,6 +11,14 @@ Input budget = context_window - output_reserve.
 
 Only tool result messages are managed. The model's own assistant messages
 (thinking + tool calls) are NEVER truncated.
+
+The token count of the message list is kept as a running total: messages
+appended since the last check are counted and added, compress_history and
+emergency_compress adjust it for the messages they replace or drop, and
+recount_message handles a message edited in place. The budget checks that run
+several times per iteration therefore never walk the whole history. Each
+message records the count it contributed under ``_token_count`` (stripped by
+the LLM adapters like every ``_`` key) so it can be subtracted again.
 """
 
 from __future__ import annotations
@@ -38,6 +46,9 @@ from airweave.domains.search.agentic.tools.types import (
 from airweave.domains.search.config import SearchConfig
 from airweave.domains.search.types.results import SearchResult
 
+# Message key holding the token count the message contributes to the running total
+_TOKEN_COUNT_KEY = "_token_count"
+
 ToolResult = Union[
     SearchToolResult,
     ReadToolResult,
@@ -84,6 +95,11 @@ class ContextManager:
         self._system_prompt_tokens = tokenizer.count_tokens(system_prompt)
         self._tools_tokens = tokenizer.count_tokens(json.dumps(tools))
 
+        # Running total over the leading `_counted` messages of `_tracked`
+        self._tracked: list[dict] | None = None
+        self._counted = 0
+        self._messages_tokens = 0
+
     # ── Budget calculation ────────────────────────────────────────────
 
     @property
@@ -128,7 +144,10 @@ class ContextManager:
 
         if available < self._MIN_OUTPUT_TOKENS:
             # Last resort: drop oldest half of messages
-            messages[:] = self.emergency_compress(messages)
+            kept = self.emergency_compress(messages)
+            messages[:] = kept
+            if self._tracked is kept:
+                self._tracked = messages
             available = self._context_window - self.input_tokens(messages)
 
             if available < self._MIN_OUTPUT_TOKENS:
@@ -189,6 +208,7 @@ class ContextManager:
         if not has_compressible:
             return messages
 
+        tracked = self._sync_running_total(messages)
         result = list(messages)
         for idx, msg in enumerate(result):
             compressed = self._compress_message(
@@ -196,7 +216,13 @@ class ContextManager:
             )
             if compressed is not None:
                 result[idx] = compressed
+                if tracked:
+                    self._messages_tokens += self._count_message(compressed) - msg.get(
+                        _TOKEN_COUNT_KEY, 0
+                    )
 
+        if tracked:
+            self._tracked = result
         return result
 
     def _compress_message(
@@ -400,8 +426,12 @@ class ContextManager:
 
         Returns a new message list.
         """
+        tracked = self._sync_running_total(messages)
         if len(messages) <= 2:
-            return list(messages)
+            kept = list(messages)
+            if tracked:
+                self._tracked = kept
+            return kept
 
         # Keep the first message (user query) and the newest half
         midpoint = 1 + (len(messages) - 1) // 2
@@ -420,29 +450,62 @@ class ContextManager:
         )
         kept.extend(messages[midpoint:])
 
+        if tracked:
+            self._messages_tokens += self._count_message(kept[1]) - sum(
+                msg.get(_TOKEN_COUNT_KEY, 0) for msg in messages[1:midpoint]
+            )
+            self._tracked = kept
+            self._counted = len(kept)
         return kept
 
     # ── Token counting ────────────────────────────────────────────────
 
+    def recount_message(self, msg: dict) -> None:
+        """Recount a message of the tracked list after it was edited in place."""
+        old = msg.get(_TOKEN_COUNT_KEY)
+        if old is not None:
+            self._messages_tokens += self._count_message(msg) - old
+
     def _count_messages_tokens(self, messages: list[dict]) -> int:
-        """Count total tokens across all messages using the tokenizer."""
-        total = 0
-        for msg in messages:
-            content = msg.get("content") or ""
-            if isinstance(content, list):
-                content = json.dumps(content)
-            total += self._tokenizer.count_tokens(str(content))
-
-            # Tool calls in assistant messages also consume tokens
-            tool_calls = msg.get("tool_calls")
-            if tool_calls:
-                total += self._tokenizer.count_tokens(json.dumps(tool_calls))
-
-            # _thinking stored separately also consumes tokens
-            thinking = msg.get("_thinking")
-            if thinking:
-                total += self._tokenizer.count_tokens(thinking)
+        """Count total tokens across all messages from the running total."""
+        self._sync_running_total(messages)
+        return self._messages_tokens
+
+    def _sync_running_total(self, messages: list[dict]) -> bool:
+        """Bring the running total up to date with ``messages``.
 
+        Only messages appended since the last call are counted. Any other
+        list -- a different object, or one shorter than what was counted --
+        replaces the tracked one and is counted in full.
+
+        Returns True if ``messages`` was already the tracked list.
+        """
+        tracked = messages is self._tracked and len(messages) >= self._counted
+        if not tracked:
+            self._tracked = messages
+            self._counted = 0
+            self._messages_tokens = 0
+        for msg in messages[self._counted :]:
+            self._messages_tokens += self._count_message(msg)
+        self._counted = len(messages)
+        return tracked
+
+    def _count_message(self, msg: dict) -> int:
+        """Tokenize one message and record the count on it."""
+        content = msg.get("content") or ""
+        if isinstance(content, list):
+            content = json.dumps(content)
+        total = self._tokenizer.count_tokens(str(content))
+
+        # Tool calls in assistant messages also consume tokens
+        if msg.get("tool_calls"):
+            total += self._tokenizer.count_tokens(json.dumps(msg["tool_calls"]))
+
+        # _thinking stored separately also consumes tokens
+        if msg.get("_thinking"):
+            total += self._tokenizer.count_tokens(msg["_thinking"])
+
+        msg[_TOKEN_COUNT_KEY] = total
         return total
 
 
@@ -30,6 +30,26 @@ class AgentState:
         self.should_finish: bool = False
         self.return_warned: bool = False
 
+    def fork(self) -> AgentState:
+        """Return a private copy for a tool that runs concurrently with others.
+
+        Concurrent tools each work on their own branch so that which entity
+        object wins, and what counts as "new", does not depend on which tool
+        finishes first. Branches see the state as of the start of the turn and
+        are merged back with ``merge`` in tool-call order.
+        """
+        branch = AgentState()
+        branch.results = dict(self.results)
+        branch.collected_ids = set(self.collected_ids)
+        return branch
+
+    def merge(self, branch: AgentState) -> None:
+        """Fold a branch from ``fork`` back in; entities already present are kept."""
+        for entity_id, result in branch.results.items():
+            self.results.setdefault(entity_id, result)
+        self.results_by_tool_call_id.update(branch.results_by_tool_call_id)
+        self.reads_by_tool_call_id.update(branch.reads_by_tool_call_id)
+
     def add_to_collected(self, entity_ids: list[str]) -> tuple[list[str], list[str], list[str]]:
         """Add entity IDs to the collected result set.
 
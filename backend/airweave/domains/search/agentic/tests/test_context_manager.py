@@ -1,5 +1,7 @@
 """Tests for ContextManager — budget, fit, compress, and emergency compression."""
 
+import json
+
 import pytest
 
 from airweave.domains.search.agentic.context_manager import (
@@ -511,3 +513,120 @@ class TestInputTokens:
             {"id": "tc-1", "type": "function", "function": {"name": "s", "arguments": "x" * 500}}
         ]}])
         assert with_tc > without
+
+
+# ── Running token total ───────────────────────────────────────────────
+
+
+class TestTokenMemo:
+    """Messages are tokenized once and kept in a running total."""
+
+    def test_repeated_budget_checks_tokenize_each_message_once(self) -> None:
+        cm = make_context_mgr()
+        messages = [
+            {"role": "user", "content": "query"},
+            {"role": "assistant", "content": "hi", "_thinking": "hmm", "tool_calls": [{"id": "t"}]},
+            {"role": "tool", "tool_call_id": "t", "_tool_name": "search", "content": "x" * 400},
+        ]
+        tokenizer = cm._tokenizer
+        cm.input_tokens(messages)
+        calls_after_first = len(tokenizer._calls)
+
+        first = cm.input_tokens(messages)
+        cm.check_budget(messages)
+        cm.available_budget(messages)
+        cm.max_output_tokens(messages)
+
+        assert len(tokenizer._calls) == calls_after_first
+        assert cm.input_tokens(messages) == first
+
+    def test_appended_message_is_the_only_one_tokenized(self) -> None:
+        cm = make_context_mgr()
+        messages = [{"role": "user", "content": f"message {i}"} for i in range(50)]
+        before = cm.input_tokens(messages)
+        tokenizer = cm._tokenizer
+        calls_before = len(tokenizer._calls)
+
+        messages.append({"role": "user", "content": "x" * 400})
+
+        assert cm.input_tokens(messages) == before + 100
+        assert len(tokenizer._calls) == calls_before + 1
+
+    def test_running_total_matches_a_full_count_after_compression(self) -> None:
+        cm = make_context_mgr()
+        r = make_result(entity_id="ent-1")
+        state = make_state(results={"ent-1": r})
+        state.results_by_tool_call_id["tc-old"] = [r]
+        messages = [{"role": "user", "content": "query"}]
+        cm.input_tokens(messages)
+        messages.append(
+            {"role": "tool", "tool_call_id": "tc-old", "_tool_name": "search", "content": "x" * 4000}
+        )
+        messages.extend({"role": "assistant", "content": f"reply {i} " * 20} for i in range(6))
+
+        compressed = cm.compress_history(messages, state, set(), set(), set(), set())
+        assert cm.input_tokens(compressed) == make_context_mgr().input_tokens(compressed)
+
+        dropped = cm.emergency_compress(compressed)
+        assert cm.input_tokens(dropped) == make_context_mgr().input_tokens(dropped)
+
+    def test_compressed_messages_are_recounted(self) -> None:
+        cm = make_context_mgr()
+        r = make_result(entity_id="ent-1")
+        state = make_state(results={"ent-1": r})
+        state.results_by_tool_call_id["tc-old"] = [r]
+        messages = [
+            {
+                "role": "tool",
+                "tool_call_id": "tc-old",
+                "_tool_name": "search",
+                "content": "x" * 4000,
+            }
+        ]
+        before = cm.input_tokens(messages)
+
+        compressed = cm.compress_history(
+            messages,
+            state,
+            current_search_ids=set(),
+            current_read_ids=set(),
+            previous_search_ids=set(),
+            previous_read_ids=set(),
+        )
+
+        assert cm.input_tokens(compressed) < before
+        # The original message keeps its own (still valid) count
+        assert cm.input_tokens(messages) == before
+
+    def test_in_place_content_change_is_recounted(self) -> None:
+        cm = make_context_mgr()
+        messages = [{"role": "user", "content": "short"}]
+        before = cm.input_tokens(messages)
+
+        messages[0]["content"] = "much longer content " * 50
+        cm.recount_message(messages[0])
+
+        assert cm.input_tokens(messages) > before
+
+    def test_in_place_list_content_edit_is_recounted(self) -> None:
+        cm = make_context_mgr()
+        parts = [{"type": "text", "text": "short"}]
+        messages = [{"role": "user", "content": parts}]
+        before = cm.input_tokens(messages)
+
+        parts.append({"type": "text", "text": "much longer content " * 50})
+        cm.recount_message(messages[0])
+
+        assert messages[0]["content"] is parts
+        assert cm.input_tokens(messages) > before
+
+    def test_in_place_tool_call_edit_is_recounted(self) -> None:
+        cm = make_context_mgr()
+        tool_calls = [{"id": "t", "function": {"name": "search", "arguments": "{}"}}]
+        messages = [{"role": "assistant", "content": "", "tool_calls": tool_calls}]
+        before = cm.input_tokens(messages)
+
+        tool_calls[0]["function"]["arguments"] = json.dumps({"query": "q" * 400})
+        cm.recount_message(messages[0])
+
+        assert cm.input_tokens(messages) > before
@@ -1,5 +1,6 @@
 """Tests for ToolDispatcher — exception handling and routing."""
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -12,9 +13,15 @@ from airweave.domains.search.agentic.exceptions import (
     ToolValidationError,
 )
 from airweave.domains.search.agentic.state import AgentState
-from airweave.domains.search.agentic.tests.conftest import make_state
+from airweave.domains.search.agentic.tests.conftest import make_result, make_state
 from airweave.domains.search.agentic.tools.dispatcher import ToolDispatcher
-from airweave.domains.search.agentic.tools.types import CollectToolResult
+from airweave.domains.search.agentic.tools.types import (
+    CollectToolResult,
+    CountToolResult,
+    ToolErrorResult,
+    ToolName,
+)
+from airweave.domains.search.exceptions import SearchError
 
 
 class _FakeTool:
@@ -110,3 +117,138 @@ class TestDispatcher:
         """tool_names returns sorted list of registered names."""
         dispatcher = ToolDispatcher({"b_tool": _FakeTool(), "a_tool": _FakeTool()})
         assert dispatcher.tool_names == ["a_tool", "b_tool"]
+
+
+class _SlowTool:
+    """Records concurrency and adds one entity per call to state.results."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self._delays = delays
+        self.in_flight = 0
+        self.peak = 0
+        self.finished: list[str] = []
+
+    async def execute(self, arguments: dict, state: AgentState, tool_call_id: str = "") -> Any:
+        """Sleep, then record a result for the call's entity."""
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self._delays.get(tool_call_id, 0.0))
+        self.in_flight -= 1
+        self.finished.append(tool_call_id)
+        eid = arguments["entity_id"]
+        new = eid not in state.results
+        state.results.setdefault(eid, make_result(entity_id=eid, name=tool_call_id))
+        state.results_by_tool_call_id[tool_call_id] = [state.results[eid]]
+        return CountToolResult(count=int(new))
+
+
+class _CollectTool:
+    """Snapshots what it can see of state.results when it runs."""
+
+    def __init__(self) -> None:
+        self.seen: list[set[str]] = []
+
+    async def execute(self, arguments: dict, state: AgentState, tool_call_id: str = "") -> Any:
+        """Record the visible entity IDs."""
+        self.seen.append(set(state.results))
+        return CollectToolResult(total_collected=0)
+
+
+class TestDispatchAll:
+    """Tests for ToolDispatcher.dispatch_all."""
+
+    @staticmethod
+    async def _run(dispatcher: ToolDispatcher, calls: list[LLMToolCall], state, n: int):
+        return [(tc.id, r) async for tc, r, _ in dispatcher.dispatch_all(calls, state, n)]
+
+    @pytest.mark.asyncio
+    async def test_retrieval_calls_run_concurrently_in_call_order(self) -> None:
+        """Slow-first calls overlap, yet results and state follow call order."""
+        tool = _SlowTool({"tc-0": 0.05, "tc-1": 0.02, "tc-2": 0.0})
+        dispatcher = ToolDispatcher({ToolName.SEARCH: tool})
+        state = make_state()
+        calls = [
+            LLMToolCall(id=f"tc-{i}", name=ToolName.SEARCH, arguments={"entity_id": "ent-1"})
+            for i in range(3)
+        ]
+
+        results = await self._run(dispatcher, calls, state, 4)
+
+        assert tool.peak == 3
+        assert tool.finished == ["tc-2", "tc-1", "tc-0"]
+        assert [tc_id for tc_id, _ in results] == ["tc-0", "tc-1", "tc-2"]
+        # The first call in order wins, regardless of which finished first
+        assert state.results["ent-1"].name == "tc-0"
+        assert set(state.results_by_tool_call_id) == {"tc-0", "tc-1", "tc-2"}
+
+    @pytest.mark.asyncio
+    async def test_fan_out_is_bounded(self) -> None:
+        """No more than max_concurrency calls are in flight."""
+        tool = _SlowTool({f"tc-{i}": 0.01 for i in range(6)})
+        dispatcher = ToolDispatcher({ToolName.READ: tool})
+        calls = [
+            LLMToolCall(id=f"tc-{i}", name=ToolName.READ, arguments={"entity_id": f"e{i}"})
+            for i in range(6)
+        ]
+
+        await self._run(dispatcher, calls, make_state(), 2)
+
+        assert tool.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_state_tools_see_earlier_calls(self) -> None:
+        """A collect call runs after every earlier retrieval call has been merged."""
+        search = _SlowTool({"tc-0": 0.02})
+        collect = _CollectTool()
+        dispatcher = ToolDispatcher(
+            {ToolName.SEARCH: search, ToolName.ADD_TO_RESULTS: collect}
+        )
+        calls = [
+            LLMToolCall(id="tc-0", name=ToolName.SEARCH, arguments={"entity_id": "ent-1"}),
+            LLMToolCall(id="tc-1", name=ToolName.ADD_TO_RESULTS, arguments={}),
+            LLMToolCall(id="tc-2", name=ToolName.SEARCH, arguments={"entity_id": "ent-2"}),
+        ]
+
+        await self._run(dispatcher, calls, make_state(), 4)
+
+        assert collect.seen == [{"ent-1"}]
+
+    @pytest.mark.asyncio
+    async def test_tool_errors_are_yielded_per_call(self) -> None:
+        """Correctable errors become ToolErrorResult without affecting other calls."""
+        dispatcher = ToolDispatcher(
+            {
+                ToolName.SEARCH: _SlowTool({}),
+                ToolName.READ: _FakeTool(error=ToolValidationError("bad ids")),
+            }
+        )
+        calls = [
+            LLMToolCall(id="tc-0", name=ToolName.READ, arguments={}),
+            LLMToolCall(id="tc-1", name=ToolName.SEARCH, arguments={"entity_id": "ent-1"}),
+        ]
+
+        results = await self._run(dispatcher, calls, make_state(), 4)
+
+        assert isinstance(results[0][1], ToolErrorResult)
+        assert results[0][1].error == "bad ids"
+        assert isinstance(results[1][1], CountToolResult)
+
+    @pytest.mark.asyncio
+    async def test_infrastructure_error_cancels_remaining_calls(self) -> None:
+        """An uncorrectable error propagates and cancels calls still running."""
+        slow = _SlowTool({"tc-1": 10.0})
+        dispatcher = ToolDispatcher(
+            {
+                ToolName.SEARCH: _FakeTool(error=SearchError("vespa down")),
+                ToolName.READ: slow,
+            }
+        )
+        calls = [
+            LLMToolCall(id="tc-0", name=ToolName.SEARCH, arguments={}),
+            LLMToolCall(id="tc-1", name=ToolName.READ, arguments={"entity_id": "ent-1"}),
+        ]
+
+        with pytest.raises(SearchError):
+            await asyncio.wait_for(self._run(dispatcher, calls, make_state(), 4), 1.0)
+
+        assert slow.finished == []
@@ -78,3 +78,32 @@ class TestRemoveFromCollected:
 
         assert removed == []
         assert not_in == ["ent-1"]
+
+
+class TestForkMerge:
+    """Tests for AgentState.fork / merge used by concurrent tool calls."""
+
+    def test_fork_writes_do_not_leak_until_merged(self) -> None:
+        """Branch writes stay private until merge."""
+        state = make_state(results={"ent-1": make_result(entity_id="ent-1")})
+        branch = state.fork()
+
+        branch.results["ent-2"] = make_result(entity_id="ent-2")
+        branch.results_by_tool_call_id["tc-1"] = [branch.results["ent-2"]]
+
+        assert "ent-2" not in state.results
+        state.merge(branch)
+        assert set(state.results) == {"ent-1", "ent-2"}
+        assert "tc-1" in state.results_by_tool_call_id
+
+    def test_first_merged_branch_wins(self) -> None:
+        """For an entity found by two branches, merge order decides, not finish order."""
+        state = make_state()
+        first, second = state.fork(), state.fork()
+        first.results["ent-1"] = make_result(entity_id="ent-1", score=0.1)
+        second.results["ent-1"] = make_result(entity_id="ent-1", score=0.9)
+
+        state.merge(first)
+        state.merge(second)
+
+        assert state.results["ent-1"].relevance_score == 0.1
@@ -3,11 +3,17 @@
 All tool errors are caught and converted to ToolError subclasses.
 The agent loop catches ToolError and returns the message to the LLM,
 allowing it to self-correct.
+
+``dispatch_all`` runs the tool calls of one LLM turn: retrieval tools run
+concurrently on forked state, everything else runs in call order, and
+results are always yielded in call order.
 """
 
 from __future__ import annotations
 
-from typing import Any, Protocol, Union
+import asyncio
+import time
+from typing import Any, AsyncIterator, Protocol, Union
 
 from pydantic import ValidationError
 
@@ -29,6 +35,8 @@ from airweave.domains.search.agentic.tools.types import (
     ReadToolResult,
     ReviewToolResult,
     SearchToolResult,
+    ToolErrorResult,
+    ToolName,
 )
 from airweave.domains.search.exceptions import SearchError
 
@@ -42,6 +50,20 @@ ToolResult = Union[
     FinishToolResult,
 ]
 
+# Retrieval tools only add entities to state.results and their own
+# per-tool-call lineage, so they can run concurrently on forked state.
+# Collect/review/finish tools read or change the collected set and run in order.
+CONCURRENT_TOOLS: frozenset[str] = frozenset(
+    {
+        ToolName.SEARCH,
+        ToolName.READ,
+        ToolName.COUNT,
+        ToolName.GET_CHILDREN,
+        ToolName.GET_SIBLINGS,
+        ToolName.GET_PARENT,
+    }
+)
+
 
 class Tool(Protocol):
     """Protocol for a tool that can be dispatched."""
@@ -111,3 +133,64 @@ class ToolDispatcher:
             raise ToolValidationError(f"Invalid arguments for '{tc.name}': {e}") from e
         except Exception as e:
             raise ToolExecutionError(f"Tool '{tc.name}' failed: {e}") from e
+
+    async def dispatch_all(
+        self,
+        tool_calls: list[LLMToolCall],
+        state: AgentState,
+        max_concurrency: int = 1,
+    ) -> AsyncIterator[tuple[LLMToolCall, ToolResult | ToolErrorResult, int]]:
+        """Run one turn's tool calls, yielding ``(call, result, duration_ms)`` in call order.
+
+        Calls to ``CONCURRENT_TOOLS`` start immediately (at most
+        ``max_concurrency`` at a time), each on ``state.fork()``; their
+        branches are merged back in call order as results are yielded. Other
+        tools run in order once every earlier call has been merged, so they
+        see the same state as with sequential execution.
+
+        Correctable errors are yielded as ``ToolErrorResult``. Infrastructure
+        errors propagate and cancel the calls still running.
+        """
+        slots = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _run_branch(
+            tc: LLMToolCall,
+        ) -> tuple[AgentState, ToolResult | ToolErrorResult, int]:
+            branch = state.fork()
+            async with slots:
+                result, duration_ms = await self._timed_dispatch(tc, branch)
+            return branch, result, duration_ms
+
+        concurrent: dict[int, asyncio.Task] = {}
+        if max_concurrency > 1:
+            concurrent = {
+                i: asyncio.create_task(_run_branch(tc))
+                for i, tc in enumerate(tool_calls)
+                if tc.name in CONCURRENT_TOOLS
+            }
+
+        try:
+            for i, tc in enumerate(tool_calls):
+                task = concurrent.get(i)
+                if task is None:
+                    result, duration_ms = await self._timed_dispatch(tc, state)
+                else:
+                    branch, result, duration_ms = await task
+                    state.merge(branch)
+                yield tc, result, duration_ms
+        finally:
+            pending = [t for t in concurrent.values() if not t.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _timed_dispatch(
+        self, tc: LLMToolCall, state: AgentState
+    ) -> tuple[ToolResult | ToolErrorResult, int]:
+        start = time.monotonic()
+        try:
+            result: ToolResult | ToolErrorResult = await self.dispatch(tc, state)
+        except ToolError as e:
+            # Correctable errors — fed back to the LLM for self-correction
+            result = ToolErrorResult(error=str(e))
+        return result, int((time.monotonic() - start) * 1000)
@@ -7,7 +7,8 @@ decides how many fit in the window.
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import Any, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -44,8 +45,13 @@ class SearchTool(Tool):
         ctx: ApiContext,
         collection_readable_id: str,
         user_principal: str | None = None,
+        db_lock: Optional[asyncio.Lock] = None,
     ) -> None:
-        """Initialize with executor, user filter, collection ID, and request context."""
+        """Initialize with executor, user filter, collection ID, and request context.
+
+        ``db_lock`` is shared by every search in the request so concurrent
+        searches take turns on the request's database session.
+        """
         self._executor = executor
         self._user_filter = user_filter
         self._collection_id = collection_id
@@ -53,6 +59,7 @@ class SearchTool(Tool):
         self._ctx = ctx
         self._collection_readable_id = collection_readable_id
         self._user_principal = user_principal
+        self._db_lock = db_lock
 
     async def execute(
         self,
@@ -70,6 +77,7 @@ class SearchTool(Tool):
             ctx=self._ctx,
             collection_readable_id=self._collection_readable_id,
             user_principal=self._user_principal,
+            db_lock=self._db_lock,
         )
 
         # Track new results in state
@@ -1,9 +1,15 @@
 """Builders for the search module."""
 
+from airweave.domains.search.builders.cached_collection_metadata import (
+    CachedCollectionMetadataBuilder,
+    CollectionMetadataCacheInvalidator,
+)
 from airweave.domains.search.builders.collection_metadata import CollectionMetadataBuilder
 from airweave.domains.search.builders.search_plan import SearchPlanBuilder
 
 __all__ = [
+    "CachedCollectionMetadataBuilder",
+    "CollectionMetadataCacheInvalidator",
     "CollectionMetadataBuilder",
     "SearchPlanBuilder",
 ]
@@ -0,0 +1,197 @@
+"""Two-tier cache in front of CollectionMetadataBuilder.
+
+Collection metadata only changes when a sync finishes or a source connection
+or collection changes, yet every classic and agentic search rebuilds it from
+several queries. ``CachedCollectionMetadataBuilder`` keeps the built metadata
+per (organization, collection):
+
+- an in-process LRU with a short TTL (no I/O on the hot path);
+- a Redis tier shared by all pods, so a miss on one pod rarely hits the DB.
+
+``CollectionMetadataCacheInvalidator`` drops entries on the events that change
+the metadata. Redis entries are deleted wherever the event is published (API
+or worker); in-process entries on other pods age out within the local TTL.
+
+Returning the same metadata between changes also keeps the rendered system
+prompt byte-identical, which lets LLM provider prompt caching hit.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave.api.context import ApiContext
+from airweave.core.events.base import DomainEvent
+from airweave.core.protocols.event_bus import EventSubscriber
+from airweave.domains.search.protocols import CollectionMetadataBuilderProtocol
+from airweave.domains.search.types.metadata import CollectionMetadata
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "search:collection_metadata"
+
+_Key = Tuple[UUID, str]
+
+
+class CachedCollectionMetadataBuilder(CollectionMetadataBuilderProtocol):
+    """Caches another builder's output in-process and in Redis.
+
+    Redis errors are logged and treated as misses, so the cache never fails
+    a search.
+    """
+
+    def __init__(
+        self,
+        builder: CollectionMetadataBuilderProtocol,
+        redis_client=None,
+        *,
+        local_ttl_seconds: float = 30,
+        redis_ttl_seconds: int = 600,
+        max_entries: int = 1024,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            builder: Builder used on a miss.
+            redis_client: Async Redis client, or None for in-process caching only.
+            local_ttl_seconds: Lifetime of in-process entries.
+            redis_ttl_seconds: Lifetime of Redis entries.
+            max_entries: In-process LRU capacity.
+        """
+        self._builder = builder
+        self._redis = redis_client
+        self._local_ttl = local_ttl_seconds
+        self._redis_ttl = redis_ttl_seconds
+        self._max_entries = max_entries
+        self._local: "OrderedDict[_Key, Tuple[float, CollectionMetadata]]" = OrderedDict()
+        # Bumped on every invalidation so a build that raced one is not cached
+        self._epoch = 0
+
+    async def build(
+        self,
+        db: AsyncSession,
+        ctx: ApiContext,
+        collection_readable_id: str,
+    ) -> CollectionMetadata:
+        """Return cached metadata, building it on a miss."""
+        key = (ctx.organization.id, collection_readable_id)
+
+        metadata = self._get_local(key)
+        if metadata is not None:
+            return metadata
+
+        epoch = self._epoch
+        metadata = await self._get_redis(key)
+        if metadata is None:
+            metadata = await self._builder.build(db, ctx, collection_readable_id)
+            if self._epoch != epoch:
+                return metadata
+            await self._set_redis(key, metadata)
+
+        if self._epoch == epoch:
+            self._set_local(key, metadata)
+        return metadata
+
+    async def invalidate(self, organization_id: UUID, collection_readable_id: str) -> None:
+        """Drop the cached metadata for one collection."""
+        key = (organization_id, collection_readable_id)
+        self._epoch += 1
+        self._local.pop(key, None)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(self._redis_key(key))
+        except Exception as e:
+            logger.debug("Metadata cache invalidation error (%s): %s", key, e)
+
+    def invalidate_organization(self, organization_id: UUID) -> None:
+        """Drop every in-process entry for an organization."""
+        self._epoch += 1
+        for key in [k for k in self._local if k[0] == organization_id]:
+            del self._local[key]
+
+    # ------------------------------------------------------------------
+    # In-process tier
+    # ------------------------------------------------------------------
+
+    def _get_local(self, key: _Key) -> Optional[CollectionMetadata]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, metadata = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return metadata
+
+    def _set_local(self, key: _Key, metadata: CollectionMetadata) -> None:
+        self._local[key] = (time.monotonic() + self._local_ttl, metadata)
+        self._local.move_to_end(key)
+        while len(self._local) > self._max_entries:
+            self._local.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Redis tier
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _redis_key(key: _Key) -> str:
+        organization_id, collection_readable_id = key
+        return f"{REDIS_KEY_PREFIX}:{organization_id}:{collection_readable_id}"
+
+    async def _get_redis(self, key: _Key) -> Optional[CollectionMetadata]:
+        if self._redis is None:
+            return None
+        try:
+            data = await self._redis.get(self._redis_key(key))
+            if data:
+                return CollectionMetadata.model_validate_json(data)
+            return None
+        except Exception as e:
+            logger.debug("Metadata cache read error (%s): %s", key, e)
+            return None
+
+    async def _set_redis(self, key: _Key, metadata: CollectionMetadata) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.setex(
+                self._redis_key(key), self._redis_ttl, metadata.model_dump_json()
+            )
+        except Exception as e:
+            logger.debug("Metadata cache write error (%s): %s", key, e)
+
+
+class CollectionMetadataCacheInvalidator(EventSubscriber):
+    """Invalidates cached collection metadata when its inputs change.
+
+    - ``sync.completed`` / ``sync.failed`` / ``sync.cancelled``: entity counts moved
+    - ``source_connection.*``: sources were added to or removed from the collection
+    - ``collection.*``: the collection itself changed
+    """
+
+    EVENT_PATTERNS: List[str] = [
+        "sync.completed",
+        "sync.failed",
+        "sync.cancelled",
+        "source_connection.*",
+        "collection.*",
+    ]
+
+    def __init__(self, cache: CachedCollectionMetadataBuilder) -> None:
+        """Initialize with the cache to invalidate."""
+        self._cache = cache
+
+    async def handle(self, event: DomainEvent) -> None:
+        """Invalidate the collection the event refers to."""
+        collection_readable_id = getattr(event, "collection_readable_id", "")
+        if not collection_readable_id:
+            # Older sync events may not carry the readable ID
+            self._cache.invalidate_organization(event.organization_id)
+            return
+        await self._cache.invalidate(event.organization_id, collection_readable_id)
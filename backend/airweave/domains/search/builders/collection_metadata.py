@@ -331,7 +331,11 @@ class CollectionMetadataBuilder:
             entity_types: list[EntityTypeMetadata] = []
             for entity_def in entity_definitions:
                 count = counts_by_short_name.get(entity_def.short_name, 0)
-                fields = self._extract_fields(entity_def.entity_schema)
+                # get() resolves the entity class and builds its schema on first use
+                entity_schema = self._entity_definition_registry.get(
+                    entity_def.short_name
+                ).entity_schema
+                fields = self._extract_fields(entity_schema or {})
 
                 entity_types.append(
                     EntityTypeMetadata(
@@ -120,10 +120,17 @@ class SearchConfig:
     AGENT_LLM_RETRY_DELAY = 2.0  # seconds, initial delay for exponential backoff
     STAGNATION_THRESHOLD = 4  # iterations without new marks before nudging
     READ_SURROUNDING_CHUNKS = 2  # ±N chunks around matched chunk in read tool
+    MAX_CONCURRENT_TOOL_CALLS = 4  # search/read/navigate calls from one turn run in parallel
 
     # Context management
     MIN_USEFUL_BUDGET_TOKENS = 5_000  # safety valve threshold (~50 summaries or 2-3 full reads)
     NON_THINKING_OUTPUT_RESERVE = 10_000  # tokens reserved for non-thinking model output
 
+    # Collection metadata cache (invalidated by sync/source connection/collection events;
+    # the local TTL bounds staleness on pods that did not see the event)
+    METADATA_CACHE_LOCAL_TTL_SECONDS = 30
+    METADATA_CACHE_REDIS_TTL_SECONDS = 600
+    METADATA_CACHE_MAX_ENTRIES = 1024
+
 
 config = SearchConfig()
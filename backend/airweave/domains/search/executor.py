@@ -8,6 +8,7 @@ applies filters in-memory, and merges results using Reciprocal Rank Fusion.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
@@ -88,18 +89,22 @@ class SearchPlanExecutor(SearchPlanExecutorProtocol):
         ctx: ApiContext,
         collection_readable_id: str,
         user_principal: Optional[str] = None,
+        db_lock: Optional[asyncio.Lock] = None,
     ) -> SearchResults:
         """Execute the full search pipeline including federated sources."""
-        # 0. Resolve access control principals
-        acl_principals = await self._resolve_acl_principals(
-            db, ctx, user_principal, collection_readable_id
-        )
+        async with db_lock or contextlib.nullcontext():
+            # 0. Resolve access control principals
+            acl_principals = await self._resolve_acl_principals(
+                db, ctx, user_principal, collection_readable_id
+            )
 
-        # 1. Merge plan filters with user filters
-        complete_plan = SearchPlanBuilder.build(plan, user_filter)
+            # 1. Discover federated sources for this collection
+            federated_sources = await self._discover_federated_sources(
+                db, ctx, collection_readable_id
+            )
 
-        # 2. Discover federated sources for this collection
-        federated_sources = await self._discover_federated_sources(db, ctx, collection_readable_id)
+        # 2. Merge plan filters with user filters
+        complete_plan = SearchPlanBuilder.build(plan, user_filter)
 
         # 3. Adjust limit/offset for RRF pagination (if federated sources exist)
         original_limit = complete_plan.limit
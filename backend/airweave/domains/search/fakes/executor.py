@@ -41,6 +41,7 @@ class FakeSearchPlanExecutor(SearchPlanExecutorProtocol):
         ctx: Any = None,
         collection_readable_id: str = "",
         user_principal: str | None = None,
+        db_lock: Any = None,
     ) -> SearchResults:
         """Record the call and return seeded result, or raise seeded error."""
         self._calls.append(("execute", plan, user_filter, collection_id))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Optional, Protocol, runtime_checkable
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -40,8 +41,13 @@ class SearchPlanExecutorProtocol(Protocol):
         ctx: ApiContext,
         collection_readable_id: str,
         user_principal: Optional[str] = None,
+        db_lock: Optional[asyncio.Lock] = None,
     ) -> SearchResults:
-        """Execute a search plan and return results."""
+        """Execute a search plan and return results.
+
+        ``db_lock`` serializes use of ``db`` when several plans for the same
+        request run concurrently (an AsyncSession is not concurrency-safe).
+        """
         ...
 
 
@@ -0,0 +1,223 @@
+"""Tests for CachedCollectionMetadataBuilder and its event-driven invalidation."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from airweave.adapters.event_bus.in_memory import InMemoryEventBus
+from airweave.core.events.collection import CollectionLifecycleEvent
+from airweave.core.events.source_connection import SourceConnectionLifecycleEvent
+from airweave.core.events.sync import SyncLifecycleEvent
+from airweave.domains.search.builders.cached_collection_metadata import (
+    CachedCollectionMetadataBuilder,
+    CollectionMetadataCacheInvalidator,
+)
+from airweave.domains.search.fakes.metadata_builder import FakeCollectionMetadataBuilder
+
+
+class _FakeRedis:
+    """Dict-backed stand-in for the async Redis calls the cache makes."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.data: dict[str, bytes] = {}
+        self.fail = fail
+
+    async def get(self, key: str):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value.encode()
+
+    async def delete(self, key: str) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data.pop(key, None)
+
+
+def _ctx(org_id=None):
+    ctx = MagicMock()
+    ctx.organization.id = org_id or uuid4()
+    return ctx
+
+
+def _build_calls(inner: FakeCollectionMetadataBuilder) -> int:
+    return len(inner._calls)
+
+
+def _cached(inner, redis=None, **kwargs) -> CachedCollectionMetadataBuilder:
+    return CachedCollectionMetadataBuilder(inner, redis_client=redis, **kwargs)
+
+
+class TestCachedBuild:
+    @pytest.mark.asyncio
+    async def test_repeat_builds_hit_local_cache(self):
+        inner = FakeCollectionMetadataBuilder()
+        cache = _cached(inner, _FakeRedis())
+        ctx = _ctx()
+
+        first = await cache.build(None, ctx, "docs")
+        second = await cache.build(None, ctx, "docs")
+
+        assert second is first
+        assert _build_calls(inner) == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_are_scoped_per_organization(self):
+        inner = FakeCollectionMetadataBuilder()
+        cache = _cached(inner, _FakeRedis())
+
+        await cache.build(None, _ctx(), "docs")
+        await cache.build(None, _ctx(), "docs")
+
+        assert _build_calls(inner) == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_is_shared_between_processes(self):
+        redis = _FakeRedis()
+        inner_a, inner_b = FakeCollectionMetadataBuilder(), FakeCollectionMetadataBuilder()
+        ctx = _ctx()
+
+        built = await _cached(inner_a, redis).build(None, ctx, "docs")
+        loaded = await _cached(inner_b, redis).build(None, ctx, "docs")
+
+        assert loaded == built
+        assert _build_calls(inner_b) == 0
+
+    @pytest.mark.asyncio
+    async def test_local_entries_expire(self):
+        inner = FakeCollectionMetadataBuilder()
+        cache = _cached(inner, local_ttl_seconds=0)
+        ctx = _ctx()
+
+        await cache.build(None, ctx, "docs")
+        await cache.build(None, ctx, "docs")
+
+        assert _build_calls(inner) == 2
+
+    @pytest.mark.asyncio
+    async def test_local_cache_is_bounded(self):
+        inner = FakeCollectionMetadataBuilder()
+        cache = _cached(inner, max_entries=2)
+        ctx = _ctx()
+
+        for readable_id in ("a", "b", "c"):
+            await cache.build(None, ctx, readable_id)
+        await cache.build(None, ctx, "a")
+
+        assert _build_calls(inner) == 4
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_fall_back_to_builder(self):
+        inner = FakeCollectionMetadataBuilder()
+        cache = _cached(inner, _FakeRedis(fail=True))
+        ctx = _ctx()
+
+        result = await cache.build(None, ctx, "docs")
+        await cache.invalidate(ctx.organization.id, "docs")
+
+        assert result.collection_readable_id == "docs"
+
+
+class TestInvalidation:
+    @pytest.fixture
+    def setup(self):
+        redis = _FakeRedis()
+        inner = FakeCollectionMetadataBuilder()
+        cache = _cached(inner, redis)
+        bus = InMemoryEventBus()
+        invalidator = CollectionMetadataCacheInvalidator(cache)
+        for pattern in invalidator.EVENT_PATTERNS:
+            bus.subscribe(pattern, invalidator.handle)
+        return redis, inner, cache, bus
+
+    @pytest.mark.asyncio
+    async def test_sync_completed_invalidates_both_tiers(self, setup):
+        redis, inner, cache, bus = setup
+        ctx = _ctx()
+        await cache.build(None, ctx, "docs")
+        assert redis.data
+
+        await bus.publish(
+            SyncLifecycleEvent.completed(
+                organization_id=ctx.organization.id,
+                sync_id=uuid4(),
+                sync_job_id=uuid4(),
+                collection_id=uuid4(),
+                source_connection_id=uuid4(),
+                source_type="slack",
+                collection_name="Docs",
+                collection_readable_id="docs",
+            )
+        )
+        await bus.flush()
+        await cache.build(None, ctx, "docs")
+
+        assert _build_calls(inner) == 2
+
+    @pytest.mark.asyncio
+    async def test_source_connection_and_collection_events_invalidate(self, setup):
+        redis, inner, cache, bus = setup
+        ctx = _ctx()
+        org_id = ctx.organization.id
+
+        await cache.build(None, ctx, "docs")
+        await bus.publish(
+            SourceConnectionLifecycleEvent.deleted(
+                organization_id=org_id,
+                source_connection_id=uuid4(),
+                source_type="slack",
+                collection_readable_id="docs",
+            )
+        )
+        await bus.flush()
+        await cache.build(None, ctx, "docs")
+        await bus.publish(
+            CollectionLifecycleEvent.updated(
+                organization_id=org_id,
+                collection_id=uuid4(),
+                collection_name="Docs",
+                collection_readable_id="docs",
+            )
+        )
+        await bus.flush()
+        await cache.build(None, ctx, "docs")
+
+        assert _build_calls(inner) == 3
+
+    @pytest.mark.asyncio
+    async def test_other_collections_stay_cached(self, setup):
+        redis, inner, cache, bus = setup
+        ctx = _ctx()
+        await cache.build(None, ctx, "docs")
+        await cache.build(None, ctx, "tickets")
+
+        await cache.invalidate(ctx.organization.id, "tickets")
+        await cache.build(None, ctx, "docs")
+
+        assert _build_calls(inner) == 2
+
+    @pytest.mark.asyncio
+    async def test_build_racing_an_invalidation_is_not_cached(self):
+        cache: CachedCollectionMetadataBuilder
+        ctx = _ctx()
+
+        class _RacingBuilder(FakeCollectionMetadataBuilder):
+            async def build(self, db, ctx, collection_readable_id):
+                result = await super().build(db, ctx, collection_readable_id)
+                if len(self._calls) == 1:
+                    await cache.invalidate(ctx.organization.id, collection_readable_id)
+                return result
+
+        inner = _RacingBuilder()
+        redis = _FakeRedis()
+        cache = _cached(inner, redis)
+
+        await cache.build(None, ctx, "docs")
+        await cache.build(None, ctx, "docs")
+
+        assert _build_calls(inner) == 2
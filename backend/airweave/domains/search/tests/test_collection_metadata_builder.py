@@ -84,6 +84,7 @@ class TestCollectionMetadataBuilder:
         builder._collection_repo.get_by_readable_id.return_value = collection  # type: ignore[attr-defined]
         builder._sc_repo.get_by_collection_ids.return_value = [sc]  # type: ignore[attr-defined]
         builder._entity_definition_registry.list_for_source.return_value = [entity_def]  # type: ignore[attr-defined]
+        builder._entity_definition_registry.get.return_value = entity_def  # type: ignore[attr-defined]
         builder._entity_count_repo.get_counts_per_sync_and_type.return_value = [entity_count]  # type: ignore[attr-defined]
 
         db = AsyncMock()
@@ -138,6 +139,7 @@ class TestCollectionMetadataBuilder:
         builder._collection_repo.get_by_readable_id.return_value = collection  # type: ignore[attr-defined]
         builder._sc_repo.get_by_collection_ids.return_value = [sc]  # type: ignore[attr-defined]
         builder._entity_definition_registry.list_for_source.return_value = [entity_def]  # type: ignore[attr-defined]
+        builder._entity_definition_registry.get.return_value = entity_def  # type: ignore[attr-defined]
         # No counts for this entity type
         builder._entity_count_repo.get_counts_per_sync_and_type.return_value = []  # type: ignore[attr-defined]
 
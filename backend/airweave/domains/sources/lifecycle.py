@@ -18,6 +18,7 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.api.context import ApiContext
+from airweave.core.config import settings
 from airweave.core.context import BaseContext
 from airweave.core.exceptions import NotFoundException
 from airweave.core.logging import ContextualLogger, LoggerConfigurator
@@ -57,6 +58,7 @@ from airweave.domains.sources.token_providers.oauth import OAuthTokenProvider
 from airweave.domains.sources.token_providers.static import StaticTokenProvider
 from airweave.domains.sources.types import AuthConfig, SourceConnectionData, SourceRegistryEntry
 from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+from airweave.platform.http_client.concurrency import adaptive_concurrency
 from airweave.platform.sources._base import BaseSource
 
 SourceCredentials = Union[str, dict, BaseModel]
@@ -720,6 +722,13 @@ class SourceLifecycleService(SourceLifecycleServiceProtocol):
             source_connection_id=source_connection_id,
             feature_flag_enabled=feature_enabled,
             logger=logger,
+            concurrency=adaptive_concurrency.for_source(
+                source_short_name,
+                source_connection_id,
+                initial_limit=settings.SOURCE_CONCURRENCY_INITIAL,
+                min_limit=settings.SOURCE_CONCURRENCY_MIN,
+                max_limit=settings.SOURCE_CONCURRENCY_MAX,
+            ),
         )
         logger.debug(
             f"AirweaveHttpClient built for {source_short_name} "
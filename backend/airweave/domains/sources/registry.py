@@ -1,4 +1,4 @@
-"""Source registry — in-memory registry built once at startup from @source decorators."""
+"""Source registry — in-memory registry built once at startup from the registry manifest."""
 
 import inspect
 import re
@@ -12,7 +12,7 @@ from airweave.domains.sources.types import SourceRegistryEntry
 from airweave.platform.auth.schemas import OAuth2Settings
 from airweave.platform.auth.settings import integration_settings
 from airweave.platform.configs._base import Fields
-from airweave.platform.sources import ALL_SOURCES
+from airweave.platform.manifest import class_ref, import_ref, load_manifest
 
 registry_logger = logger.with_prefix("SourceRegistry: ").with_context(component="source_registry")
 
@@ -25,7 +25,11 @@ def _enum_to_str(value: object | None) -> str | None:
 
 
 class SourceRegistry(SourceRegistryProtocol):
-    """In-memory source registry, built once at startup from ALL_SOURCES."""
+    """In-memory source registry, built once at startup from the registry manifest.
+
+    Source classes are imported on the first ``get()`` of their short name,
+    so a process only loads the connectors (and SDKs) it actually uses.
+    """
 
     def __init__(
         self,
@@ -43,86 +47,136 @@ class SourceRegistry(SourceRegistryProtocol):
         self._auth_provider_registry = auth_provider_registry
         self._entity_definition_registry = entity_definition_registry
         self._entries: dict[str, SourceRegistryEntry] = {}
+        self._class_refs: dict[str, str] = {}
 
     def get(self, short_name: str) -> SourceRegistryEntry:
-        """Get a source entry by short name.
+        """Get a source entry by short name, importing its source class on first use.
 
         Args:
             short_name: The unique identifier for the source (e.g., "github", "slack").
 
         Returns:
-            The precomputed source registry entry.
+            The precomputed source registry entry, with ``source_class_ref`` set.
 
         Raises:
             KeyError: If no source with the given short name is registered.
         """
-        return self._entries[short_name]
+        entry = self._entries[short_name]
+        if entry.source_class_ref is None:
+            source_cls = import_ref(self._class_refs[short_name])
+            entry = entry.model_copy(update={"source_class_ref": source_cls})
+            self._entries[short_name] = entry
+        return entry
 
     def list_all(self) -> list[SourceRegistryEntry]:
         """List all registered source entries.
 
+        Source classes are not imported here; ``source_class_ref`` is only
+        set on entries already looked up with ``get()``.
+
         Returns:
             All source registry entries.
         """
         return list(self._entries.values())
 
     def build(self) -> None:
-        """Build the registry from ALL_SOURCES.
+        """Build the registry from the registry manifest.
 
-        Reads class references directly from @source decorator attributes —
-        no ResourceLocator or database needed. Precomputes all derived fields
+        Decorator metadata comes from the manifest, so no source module is
+        imported. Config classes are resolved to precompute all derived fields
         (Fields, supported auth providers, runtime auth field names, output entities).
 
         Called once at startup. After this, all lookups are dict reads.
         """
+        records = load_manifest()["sources"]
+
         # Filter internal sources based on settings
-        source_classes = ALL_SOURCES
         if not settings.ENABLE_INTERNAL_SOURCES:
-            source_classes = [s for s in source_classes if not s.is_internal()]
+            records = [r for r in records if not r["internal"]]
 
-        for source_cls in source_classes:
-            short_name = source_cls.short_name
+        for record in records:
+            short_name = record["short_name"]
 
             try:
-                entry = self._build_entry(source_cls)
+                entry = self._build_entry(record)
                 self._entries[short_name] = entry
+                self._class_refs[short_name] = record["class_ref"]
             except Exception as e:
                 registry_logger.error(f"Failed to build registry entry for '{short_name}': {e}")
                 raise
 
         registry_logger.info(f"Built registry with {len(self._entries)} sources.")
 
+    @classmethod
+    def manifest_entries(cls, source_classes: list[type]) -> list[dict]:
+        """Describe decorated source classes for the registry manifest.
+
+        Reads all fields directly from class attributes (set by @source decorator,
+        with ClassVar defaults on BaseSource). Missing required fields will raise
+        AttributeError when the manifest is generated.
+        """
+        records = []
+        for source_cls in source_classes:
+            cls._validate_source_contract(source_cls)
+            config_class = source_cls.config_class
+            auth_config_class = source_cls.auth_config_class
+            records.append(
+                {
+                    "short_name": source_cls.short_name,
+                    "name": source_cls.source_name,
+                    "description": source_cls.__doc__,
+                    "class_name": source_cls.__name__,
+                    "class_ref": class_ref(source_cls),
+                    "config_ref": class_ref(config_class) if config_class else None,
+                    "auth_config_ref": class_ref(auth_config_class) if auth_config_class else None,
+                    "auth_methods": [m.value for m in source_cls.auth_methods],
+                    "oauth_type": _enum_to_str(source_cls.oauth_type),
+                    "requires_byoc": source_cls.requires_byoc,
+                    "supports_continuous": source_cls.supports_continuous,
+                    "supports_cursor": source_cls.cursor_class is not None,
+                    "federated_search": source_cls.federated_search,
+                    "supports_temporal_relevance": source_cls.supports_temporal_relevance,
+                    "supports_access_control": source_cls.supports_access_control,
+                    "supports_browse_tree": source_cls.supports_browse_tree,
+                    "rate_limit_level": _enum_to_str(source_cls.rate_limit_level),
+                    "feature_flag": source_cls.feature_flag,
+                    "labels": source_cls.labels,
+                    "internal": source_cls.is_internal(),
+                }
+            )
+        return records
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _build_entry(self, source_cls: type) -> SourceRegistryEntry:
-        """Build a single SourceRegistryEntry from a decorated source class.
+    def _build_entry(self, record: dict) -> SourceRegistryEntry:
+        """Build a single SourceRegistryEntry from its manifest record.
 
-        Reads all fields directly from class attributes (set by @source decorator,
-        with ClassVar defaults on BaseSource). Missing required fields will raise
-        AttributeError at startup.
+        Only the config classes are imported (from ``airweave.platform.configs``);
+        the source class is resolved later by ``get()``.
         """
-        self._validate_template_config(source_cls)
-        self._validate_source_contract(source_cls)
+        short_name = record["short_name"]
+        config_ref = import_ref(record["config_ref"]) if record["config_ref"] else None
+        auth_config_ref = (
+            import_ref(record["auth_config_ref"]) if record["auth_config_ref"] else None
+        )
 
-        config_ref = source_cls.config_class
-        auth_config_ref = source_cls.auth_config_class
+        self._validate_template_config(short_name, config_ref)
 
         runtime_all, runtime_optional = self._compute_runtime_auth_fields(
-            auth_config_ref, oauth_type=source_cls.oauth_type
+            auth_config_ref, oauth_type=record["oauth_type"]
         )
 
         # Resolve output entity definition short_names from the entity definition registry
-        entity_entries = self._entity_definition_registry.list_for_source(source_cls.short_name)
+        entity_entries = self._entity_definition_registry.list_for_source(short_name)
         output_entity_definitions = [entry.short_name for entry in entity_entries]
 
         return SourceRegistryEntry(
-            short_name=source_cls.short_name,
-            name=source_cls.source_name,
-            description=source_cls.__doc__,
-            class_name=source_cls.__name__,
-            source_class_ref=source_cls,
+            short_name=short_name,
+            name=record["name"],
+            description=record["description"],
+            class_name=record["class_name"],
             config_ref=config_ref,
             auth_config_ref=auth_config_ref,
             # OAuth sources have no auth config — empty fields is correct
@@ -131,22 +185,22 @@ class SourceRegistry(SourceRegistryProtocol):
             else Fields(fields=[]),
             config_fields=Fields.from_config_class(config_ref) if config_ref else Fields(fields=[]),
             supported_auth_providers=self._compute_supported_auth_providers(
-                source_cls.short_name, self._auth_provider_registry
+                short_name, self._auth_provider_registry
             ),
             runtime_auth_all_fields=runtime_all,
             runtime_auth_optional_fields=runtime_optional,
-            auth_methods=[m.value for m in source_cls.auth_methods],
-            oauth_type=_enum_to_str(source_cls.oauth_type),
-            requires_byoc=source_cls.requires_byoc,
-            supports_continuous=source_cls.supports_continuous,
-            supports_cursor=source_cls.cursor_class is not None,
-            federated_search=source_cls.federated_search,
-            supports_temporal_relevance=source_cls.supports_temporal_relevance,
-            supports_access_control=source_cls.supports_access_control,
-            supports_browse_tree=source_cls.supports_browse_tree,
-            rate_limit_level=_enum_to_str(source_cls.rate_limit_level),
-            feature_flag=source_cls.feature_flag,
-            labels=source_cls.labels,
+            auth_methods=record["auth_methods"],
+            oauth_type=record["oauth_type"],
+            requires_byoc=record["requires_byoc"],
+            supports_continuous=record["supports_continuous"],
+            supports_cursor=record["supports_cursor"],
+            federated_search=record["federated_search"],
+            supports_temporal_relevance=record["supports_temporal_relevance"],
+            supports_access_control=record["supports_access_control"],
+            supports_browse_tree=record["supports_browse_tree"],
+            rate_limit_level=record["rate_limit_level"],
+            feature_flag=record["feature_flag"],
+            labels=record["labels"],
             output_entity_definitions=output_entity_definitions,
         )
 
@@ -248,13 +302,11 @@ class SourceRegistry(SourceRegistryProtocol):
             )
 
     @staticmethod
-    def _validate_template_config(source_cls: type) -> None:
+    def _validate_template_config(short_name: str, config_class: type | None) -> None:
         """Validate that YAML template variables match config RequiredTemplateConfig fields.
 
         Raises ValueError on mismatch so the app fails fast at startup.
         """
-        short_name = source_cls.short_name
-        config_class = source_cls.config_class
         if not config_class:
             return
 
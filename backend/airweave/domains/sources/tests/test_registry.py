@@ -1,6 +1,7 @@
 """Unit tests for SourceRegistry.
 
-Table-driven tests with patched ALL_SOURCES and fake sibling registries.
+Table-driven tests with a patched registry manifest built from stub classes
+and fake sibling registries.
 No real platform sources loaded.
 """
 
@@ -16,15 +17,20 @@ from airweave.domains.auth_provider.types import AuthProviderRegistryEntry
 from airweave.domains.entities.fakes.registry import FakeEntityDefinitionRegistry
 from airweave.domains.entities.types import EntityDefinitionEntry
 from airweave.domains.sources.registry import SourceRegistry
-from airweave.platform.configs._base import Fields
+from airweave.platform.configs._base import BaseConfig, Fields
+from airweave.platform.manifest import class_ref
 
 # ---------------------------------------------------------------------------
 # Stub helpers
 # ---------------------------------------------------------------------------
 
-_PATCH_ALL_SOURCES = "airweave.domains.sources.registry.ALL_SOURCES"
+_PATCH_MANIFEST = "airweave.domains.sources.registry.load_manifest"
+_PATCH_IMPORT_REF = "airweave.domains.sources.registry.import_ref"
 _PATCH_SETTINGS = "airweave.domains.sources.registry.settings"
 
+# Class refs of the stubs built by the current test → stub class
+_STUB_CLASSES: dict[str, type] = {}
+
 
 class _AuthMethod(Enum):
     DIRECT = "direct"
@@ -53,7 +59,7 @@ def _make_source_cls(
             return
             yield
 
-    Stub.__name__ = f"{source_name.replace(' ', '')}Source"
+    Stub.__name__ = Stub.__qualname__ = f"{source_name.replace(' ', '')}Source"
     Stub.__doc__ = f"Stub {source_name}"
     Stub.short_name = short_name
     Stub.source_name = source_name
@@ -119,9 +125,15 @@ def _build_registry(
     if entity_entries:
         entity_reg.seed(*entity_entries)
 
+    manifest = {"sources": SourceRegistry.manifest_entries(source_classes)}
+    for source_cls in source_classes:
+        for cls in (source_cls, source_cls.config_class, source_cls.auth_config_class):
+            if cls is not None:
+                _STUB_CLASSES[class_ref(cls)] = cls
+
     registry = SourceRegistry(auth_reg, entity_reg)
     with (
-        patch(_PATCH_ALL_SOURCES, source_classes),
+        patch(_PATCH_MANIFEST, return_value=manifest),
         patch(_PATCH_SETTINGS) as mock_settings,
     ):
         mock_settings.ENABLE_INTERNAL_SOURCES = enable_internal
@@ -129,6 +141,14 @@ def _build_registry(
     return registry
 
 
+@pytest.fixture(autouse=True)
+def _resolve_stub_classes():
+    """Resolve class refs to the stub classes instead of importing them."""
+    with patch(_PATCH_IMPORT_REF, side_effect=_STUB_CLASSES.__getitem__) as import_ref:
+        yield import_ref
+    _STUB_CLASSES.clear()
+
+
 # ---------------------------------------------------------------------------
 # get()
 # ---------------------------------------------------------------------------
@@ -167,6 +187,18 @@ def test_get(case: GetCase):
         assert entry.name == case.expect_name
 
 
+def test_get_imports_source_class_on_first_use(_resolve_stub_classes):
+    cls = _make_source_cls("slack", "Slack")
+    registry = _build_registry([cls])
+
+    assert _resolve_stub_classes.call_count == 0
+    assert registry.list_all()[0].source_class_ref is None
+
+    assert registry.get("slack").source_class_ref is cls
+    assert registry.get("slack").source_class_ref is cls
+    assert _resolve_stub_classes.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # list_all()
 # ---------------------------------------------------------------------------
@@ -395,3 +427,16 @@ def test_build_entry_oauth_source_has_runtime_auth_fields():
     entry = registry.get("todoist")
     assert entry.runtime_auth_all_fields == ["access_token"]
     assert entry.runtime_auth_optional_fields == set()
+
+
+class _StubAuthConfig(BaseConfig):
+    api_key: str = Field(title="API Key")
+
+
+def test_auth_config_resolved_at_build():
+    cls = _make_source_cls("slack", "Slack", auth_config_class=_StubAuthConfig)
+    registry = _build_registry([cls])
+
+    entry = registry.list_all()[0]
+    assert entry.auth_config_ref is _StubAuthConfig
+    assert entry.runtime_auth_all_fields == ["api_key"]
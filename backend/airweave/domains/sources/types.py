@@ -15,10 +15,11 @@ from airweave.platform.configs._base import BaseConfig, Fields
 
 
 class SourceRegistryEntry(BaseRegistryEntry):
-    """Precomputed source metadata. Built once at startup from @source decorators."""
+    """Precomputed source metadata. Built once at startup from the registry manifest."""
 
-    # Resolved classes (read directly from decorator — no locator needed)
-    source_class_ref: type
+    # Resolved classes. The source class is imported on the first registry
+    # get() of this source; entries from list_all() may not have it yet.
+    source_class_ref: type | None = None
     config_ref: type[BaseConfig] | None
     auth_config_ref: type[BaseConfig] | None
 
@@ -0,0 +1,64 @@
+"""Content digests of the temp files FileService writes.
+
+FileService hashes file bytes while writing them to the sync temp directory.
+Stages that only see the local path -- the converters' conversion cache --
+look the digest up here instead of reading the file back from disk.
+
+Each digest is stored with the file's size and modification time and is only
+returned while both still match, so a file rewritten in place is re-hashed.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# Digests kept; far more than the files of the batches in flight in a pod
+DEFAULT_MAX_ENTRIES = 50_000
+
+
+class LocalFileDigests:
+    """Bounded, thread-safe map of local file path -> SHA-256 hex digest."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty registry."""
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._digests: "OrderedDict[str, Tuple[str, int, int]]" = OrderedDict()
+
+    def record(self, path: str, digest: str) -> None:
+        """Record the digest of the file just written at ``path``."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            self._digests[path] = (digest, stat.st_size, stat.st_mtime_ns)
+            self._digests.move_to_end(path)
+            while len(self._digests) > self._max_entries:
+                self._digests.popitem(last=False)
+
+    def get(self, path: str) -> Optional[str]:
+        """Return the recorded digest of ``path`` if the file is unchanged since."""
+        with self._lock:
+            entry = self._digests.get(path)
+        if entry is None:
+            return None
+        digest, size, mtime_ns = entry
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.discard(path)
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+            self.discard(path)
+            return None
+        return digest
+
+    def discard(self, path: str) -> None:
+        """Forget the digest of ``path`` (the file was removed)."""
+        with self._lock:
+            self._digests.pop(path, None)
+
+
+local_file_digests = LocalFileDigests()
@@ -1,7 +1,7 @@
 """File download and restoration service for Airweave.
 
 Handles:
-- Downloading files from URLs to temp directory
+- Downloading files from URLs to temp directory (hashing content while streaming)
 - Restoring files from ARF storage to temp directory
 - File validation (extension, size)
 - Temp directory cleanup
@@ -10,6 +10,7 @@ Does NOT handle domain exception translation — that's the source's job.
 Raw httpx errors propagate to the caller.
 """
 
+import hashlib
 import os
 import shutil
 from typing import Optional
@@ -21,6 +22,7 @@ from tenacity import retry, stop_after_attempt
 
 from airweave.core.logging import ContextualLogger
 from airweave.domains.sources.token_providers.protocol import SourceAuthProvider
+from airweave.domains.storage.digests import local_file_digests
 from airweave.domains.storage.exceptions import FileSkippedException
 from airweave.domains.storage.paths import paths
 from airweave.domains.storage.protocols import StorageBackend
@@ -72,27 +74,6 @@ class FileService:
     # URL Download
     # =========================================================================
 
-    async def _check_file_size_via_head(
-        self,
-        client: AirweaveHttpClient,
-        url: str,
-        headers: dict,
-        logger: ContextualLogger,
-    ) -> Optional[str]:
-        """HEAD request to check file size. Returns skip reason or None."""
-        try:
-            response = await client.head(url, headers=headers, follow_redirects=True, timeout=10.0)
-            response.raise_for_status()
-            content_length = response.headers.get("Content-Length")
-            if content_length:
-                size_bytes = int(content_length)
-                if size_bytes > self.MAX_FILE_SIZE_BYTES:
-                    size_mb = size_bytes / (1024 * 1024)
-                    return f"File too large: {size_mb:.1f}MB (max 200MB)"
-        except (httpx.HTTPError, ValueError) as e:
-            logger.debug(f"HEAD request failed for size check: {e}, will attempt download")
-        return None
-
     @staticmethod
     def _validate_extension(filename: str) -> Optional[str]:
         """Check if the file extension is supported. Returns skip reason or None."""
@@ -115,8 +96,15 @@ class FileService:
         headers: dict,
         temp_path: str,
         logger: ContextualLogger,
-    ) -> None:
-        """Stream-download a file to disk with retry on 429/5xx/timeout."""
+    ) -> str:
+        """Stream-download a file to disk with retry on 429/5xx/timeout.
+
+        The size guard relies on Content-Length when present and on the running
+        byte count otherwise, so no separate HEAD request is needed.
+
+        Returns:
+            SHA-256 hex digest of the downloaded bytes, computed while streaming.
+        """
         async with client.stream(
             "GET",
             url,
@@ -137,6 +125,7 @@ class FileService:
 
             os.makedirs(os.path.dirname(temp_path), exist_ok=True)
             bytes_written = 0
+            digest = hashlib.sha256()
             async with aiofiles.open(temp_path, "wb") as f:
                 async for chunk in response.aiter_bytes():
                     bytes_written += len(chunk)
@@ -146,8 +135,11 @@ class FileService:
                             reason=f"File exceeded {max_mb}MB during download",
                             filename=temp_path,
                         )
+                    digest.update(chunk)
                     await f.write(chunk)
 
+            return digest.hexdigest()
+
     async def download_from_url(
         self,
         entity: FileEntity,
@@ -157,6 +149,9 @@ class FileService:
     ) -> FileEntity:
         """Download file from URL to temp directory.
 
+        Sets ``local_path`` and ``local_content_sha256`` on the entity (and records
+        the digest for the path) so later stages do not read the file back from disk.
+
         Raises httpx errors on HTTP failures — the source handles
         domain exception translation.
         """
@@ -170,10 +165,6 @@ class FileService:
 
         headers = await self._resolve_headers(auth, entity.url)
 
-        size_skip = await self._check_file_size_via_head(client, entity.url, headers, logger)
-        if size_skip:
-            raise FileSkippedException(reason=size_skip, filename=entity.name)
-
         file_uuid = str(uuid4())
         safe_filename = self._safe_filename(entity.name)
         temp_path = f"{self.base_temp_dir}/{file_uuid}-{safe_filename}"
@@ -183,7 +174,9 @@ class FileService:
         )
 
         try:
-            await self._stream_download(client, entity.url, headers, temp_path, logger)
+            content_hash = await self._stream_download(
+                client, entity.url, headers, temp_path, logger
+            )
         except FileSkippedException:
             self._cleanup_temp(temp_path)
             raise
@@ -193,7 +186,9 @@ class FileService:
                 new_token = await auth.force_refresh()
                 headers = {"Authorization": f"Bearer {new_token}"}
                 try:
-                    await self._stream_download(client, entity.url, headers, temp_path, logger)
+                    content_hash = await self._stream_download(
+                        client, entity.url, headers, temp_path, logger
+                    )
                 except Exception:
                     self._cleanup_temp(temp_path)
                     raise
@@ -203,10 +198,13 @@ class FileService:
 
         logger.debug(f"Downloaded file to: {temp_path}")
         entity.local_path = temp_path
+        entity.local_content_sha256 = content_hash
+        local_file_digests.record(temp_path, content_hash)
         return entity
 
     def _cleanup_temp(self, temp_path: str) -> None:
         """Remove a partially-downloaded temp file."""
+        local_file_digests.discard(temp_path)
         if os.path.exists(temp_path):
             try:
                 os.remove(temp_path)
@@ -280,6 +278,8 @@ class FileService:
             async with aiofiles.open(temp_path, "wb") as f:
                 await f.write(content)
             entity.local_path = temp_path
+            entity.local_content_sha256 = hashlib.sha256(content).hexdigest()
+            local_file_digests.record(temp_path, entity.local_content_sha256)
             return entity
         except Exception as e:
             self._cleanup_temp(temp_path)
@@ -28,6 +28,9 @@ class StoragePaths:
 
     CTTI_GLOBAL_DIR = "aactmarkdowns"
 
+    CONVERSION_CACHE_PREFIX = "conversion_cache"
+    CONVERSION_CACHE_META_SUFFIX = ".meta.json"
+
     # =========================================================================
     # ARF path builders
     # =========================================================================
@@ -71,6 +74,20 @@ class StoragePaths:
         """Files directory: raw/{sync_id}/files/."""
         return f"{cls.arf_sync_path(sync_id)}/files"
 
+    # =========================================================================
+    # Conversion cache path builders
+    # =========================================================================
+
+    @classmethod
+    def conversion_cache_path(cls, namespace: str, content_hash: str) -> str:
+        """Cache entry: conversion_cache/{converter}/{version}/{hash[:2]}/{hash}.json."""
+        return f"{cls.CONVERSION_CACHE_PREFIX}/{namespace}/{content_hash[:2]}/{content_hash}.json"
+
+    @classmethod
+    def conversion_cache_meta_path(cls, entry_path: str) -> str:
+        """Access metadata of a cache entry: .../{hash}.meta.json next to .../{hash}.json."""
+        return entry_path.removesuffix(".json") + cls.CONVERSION_CACHE_META_SUFFIX
+
     # =========================================================================
     # Temp path builders
     # =========================================================================
@@ -1,12 +1,15 @@
-"""Unit tests for FileService — save_bytes, restore_from_arf, cleanup, validation."""
+"""Unit tests for FileService — downloads, save_bytes, restore_from_arf, cleanup, validation."""
 
+import hashlib
 import os
 import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import httpx
 import pytest
 
+from airweave.domains.storage.digests import LocalFileDigests, local_file_digests
 from airweave.domains.storage.exceptions import FileSkippedException
 from airweave.domains.storage.file_service import FileService
 
@@ -19,9 +22,7 @@ def _make_service(tmpdir: str) -> FileService:
     storage.write_file = AsyncMock()
     storage.delete_directory = AsyncMock()
 
-    with patch(
-        "airweave.domains.storage.file_service.paths.temp_sync_dir", return_value=tmpdir
-    ):
+    with patch("airweave.domains.storage.file_service.paths.temp_sync_dir", return_value=tmpdir):
         svc = FileService(sync_job_id=sync_job_id, storage_backend=storage)
 
     return svc, storage
@@ -46,6 +47,9 @@ class TestSaveBytes:
             assert entity.local_path is not None
             assert entity.local_path.endswith(".pdf")
             assert os.path.exists(entity.local_path)
+            assert (
+                entity.local_content_sha256 == hashlib.sha256(b"%PDF-1.4 test content").hexdigest()
+            )
 
     @pytest.mark.asyncio
     async def test_raises_file_skipped_for_unsupported_extension(self):
@@ -88,6 +92,66 @@ class TestSaveBytes:
                 )
 
 
+def _download_entity(url: str = "https://files.example.com/report.pdf") -> MagicMock:
+    entity = MagicMock()
+    entity.name = "report.pdf"
+    entity.url = url
+    entity.local_path = None
+    entity.local_content_sha256 = None
+    return entity
+
+
+def _download_auth() -> MagicMock:
+    auth = MagicMock()
+    auth.get_token = AsyncMock(return_value="token")
+    auth.supports_refresh = False
+    return auth
+
+
+class TestDownloadFromUrl:
+    @pytest.mark.asyncio
+    async def test_hashes_while_streaming_without_head_request(self):
+        body = b"%PDF-1.4 " + b"x" * 200_000
+        methods: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200, content=body)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            svc, _ = _make_service(tmpdir)
+            entity = _download_entity()
+
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                await svc.download_from_url(entity, client, _download_auth(), MagicMock())
+
+            assert methods == ["GET"]
+            assert entity.local_content_sha256 == hashlib.sha256(body).hexdigest()
+            assert local_file_digests.get(entity.local_path) == entity.local_content_sha256
+            with open(entity.local_path, "rb") as f:
+                assert f.read() == body
+
+    @pytest.mark.asyncio
+    async def test_skips_when_content_length_exceeds_limit(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                content=b"tiny",
+                headers={"Content-Length": str(FileService.MAX_FILE_SIZE_BYTES + 1)},
+            )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            svc, _ = _make_service(tmpdir)
+            entity = _download_entity()
+
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                with pytest.raises(FileSkippedException, match="too large"):
+                    await svc.download_from_url(entity, client, _download_auth(), MagicMock())
+
+            assert entity.local_content_sha256 is None
+            assert os.listdir(tmpdir) == []
+
+
 class TestRestoreFromArf:
     @pytest.mark.asyncio
     async def test_restores_file_to_temp_and_returns_path(self):
@@ -128,3 +192,32 @@ class TestCleanupSyncDirectory:
 
         # tmpdir has been deleted by the context manager exit
         await svc.cleanup_sync_directory(logger=MagicMock())
+
+
+class TestLocalFileDigests:
+    def test_digest_is_dropped_once_the_file_changes(self):
+        digests = LocalFileDigests()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "report.pdf")
+            with open(path, "wb") as f:
+                f.write(b"data")
+            digests.record(path, "abc123")
+            assert digests.get(path) == "abc123"
+
+            with open(path, "ab") as f:
+                f.write(b" more")
+
+            assert digests.get(path) is None
+
+    def test_registry_is_bounded(self):
+        digests = LocalFileDigests(max_entries=2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = []
+            for name in ("a", "b", "c"):
+                path = os.path.join(tmpdir, name)
+                with open(path, "wb") as f:
+                    f.write(name.encode())
+                digests.record(path, name)
+                files.append(path)
+
+            assert [digests.get(path) for path in files] == [None, "b", "c"]
@@ -0,0 +1,226 @@
+"""Size-aware micro-batching for the sync orchestrator.
+
+Counting entities alone treats 64 chat messages and 64 hundred-page PDFs the
+same: the first makes tiny, under-filled embedding requests, the second a
+memory spike. ``AdaptiveBatcher`` weighs every entity by its estimated
+payload — the file size for file entities, the length of its text otherwise
+(roughly four bytes per token) — and closes a batch when the payload reaches
+a byte budget or the entity count reaches a ceiling, whichever comes first.
+
+Both limits are tuned from the processing time of finished batches:
+
+- byte budget    -> an EWMA of seconds per payload byte gives the budget
+                    that would take ``target_latency_ms`` to process; the
+                    budget moves towards it by at most x2 / x0.5 per batch
+- entity ceiling -> starts at ``batch_size``; doubles (up to
+                    ``max_entity_growth`` times) while batches of small
+                    entities close on count well under the target latency,
+                    halves back when batches run over it
+
+Batches still close after ``max_batch_latency_ms``, and the orchestrator
+closes the open batch at cursor checkpoints, guardrail failures and the end
+of the stream. Every closed batch reports its shape (entities, payload bytes
+and close reason) to the sync flight recorder.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from airweave.platform.entities._base import FileEntity
+
+DEFAULT_TARGET_LATENCY_MS = 2000
+DEFAULT_INITIAL_BYTES = 4 * 2**20
+DEFAULT_MIN_BYTES = 256 * 2**10
+DEFAULT_MAX_BYTES = 64 * 2**20
+DEFAULT_MAX_ENTITY_GROWTH = 4
+
+# Metadata, breadcrumbs and bookkeeping every entity carries besides its text
+ENTITY_OVERHEAD_BYTES = 512
+
+_RATE_SMOOTHING = 0.3
+_MAX_STEP = 2.0
+# Batches faster than this share of the target may grow the entity ceiling
+_FAST_BATCH_SHARE = 0.5
+
+
+class BatchCloseReason:
+    """Why a batch was closed, as reported in batch-shape metrics."""
+
+    ENTITIES = "entities"
+    BYTES = "bytes"
+    LATENCY = "latency"
+    CHECKPOINT = "checkpoint"
+    GUARDRAIL = "guardrail"
+    END = "end"
+
+
+@dataclass(frozen=True)
+class EntityBatch:
+    """A closed micro-batch and its shape."""
+
+    entities: List[Any]
+    payload_bytes: int
+    reason: str
+
+
+def estimate_payload_bytes(entity: Any) -> int:
+    """Estimate how much data an entity brings into the pipeline.
+
+    File entities are weighed by their file size; other entities by their
+    textual representation when it is already built, or by the length of
+    their top-level text fields. Cheap enough to call for every entity.
+    """
+    if isinstance(entity, FileEntity) and entity.size and entity.size > 0:
+        return ENTITY_OVERHEAD_BYTES + entity.size
+
+    text = getattr(entity, "textual_representation", None)
+    if text:
+        return ENTITY_OVERHEAD_BYTES + len(text)
+
+    total = ENTITY_OVERHEAD_BYTES
+    for value in getattr(entity, "__dict__", {}).values():
+        if isinstance(value, (str, bytes)):
+            total += len(value)
+        elif isinstance(value, (list, tuple)):
+            total += sum(len(item) for item in value if isinstance(item, (str, bytes)))
+    return total
+
+
+class AdaptiveBatcher:
+    """Builds micro-batches closed by a payload budget, an entity ceiling or a deadline.
+
+    Args:
+        batch_size: Initial entity ceiling per batch.
+        max_batch_latency_ms: Close a batch this long after its first entity
+            (checked as entities arrive); 0 disables the deadline.
+        target_latency_ms: Processing time per batch the limits are tuned to.
+        initial_bytes: Starting payload budget.
+        min_bytes: Floor the budget never drops below.
+        max_bytes: Ceiling the budget never grows above.
+        max_entity_growth: How far the entity ceiling may grow past ``batch_size``.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_batch_latency_ms: int = 0,
+        target_latency_ms: int = DEFAULT_TARGET_LATENCY_MS,
+        initial_bytes: int = DEFAULT_INITIAL_BYTES,
+        min_bytes: int = DEFAULT_MIN_BYTES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entity_growth: int = DEFAULT_MAX_ENTITY_GROWTH,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize with an empty batch."""
+        if batch_size < 1 or min_bytes < 1 or max_bytes < min_bytes:
+            raise ValueError("require batch_size >= 1 and 1 <= min_bytes <= max_bytes")
+        self.min_bytes = min_bytes
+        self.max_bytes = max_bytes
+        self.min_entities = batch_size
+        self.max_entities = batch_size * max(1, max_entity_growth)
+        self._max_latency = max_batch_latency_ms / 1000.0
+        self._target_latency = target_latency_ms / 1000.0
+        self._clock = clock
+
+        self._budget: float = min(max(initial_bytes, min_bytes), max_bytes)
+        self._entity_limit = batch_size
+        self._seconds_per_byte: Optional[float] = None
+
+        self._entities: List[Any] = []
+        self._bytes = 0
+        self._deadline: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def budget_bytes(self) -> int:
+        """Current payload budget per batch."""
+        return int(self._budget)
+
+    @property
+    def entity_limit(self) -> int:
+        """Current entity ceiling per batch."""
+        return self._entity_limit
+
+    @property
+    def pending(self) -> int:
+        """Entities in the open batch."""
+        return len(self._entities)
+
+    @property
+    def pending_bytes(self) -> int:
+        """Estimated payload of the open batch."""
+        return self._bytes
+
+    # ------------------------------------------------------------------
+    # Building batches
+    # ------------------------------------------------------------------
+
+    def add(self, entity: Any) -> List[EntityBatch]:
+        """Add an entity; return the batches that closed because of it.
+
+        An entity that would push the open batch over its budget closes that
+        batch first, so a large file never rides along with a full batch of
+        small entities; one that exceeds the budget on its own goes alone.
+        """
+        closed: List[EntityBatch] = []
+        size = estimate_payload_bytes(entity)
+        if self._entities and self._bytes + size > self._budget:
+            closed.append(self._close(BatchCloseReason.BYTES))
+
+        if not self._entities and self._max_latency > 0:
+            self._deadline = self._clock() + self._max_latency
+        self._entities.append(entity)
+        self._bytes += size
+
+        if self._bytes >= self._budget:
+            closed.append(self._close(BatchCloseReason.BYTES))
+        elif len(self._entities) >= self._entity_limit:
+            closed.append(self._close(BatchCloseReason.ENTITIES))
+        elif self._deadline is not None and self._clock() >= self._deadline:
+            closed.append(self._close(BatchCloseReason.LATENCY))
+        return closed
+
+    def flush(self, reason: str) -> Optional[EntityBatch]:
+        """Close the open batch, if it has any entities."""
+        if not self._entities:
+            return None
+        return self._close(reason)
+
+    def _close(self, reason: str) -> EntityBatch:
+        batch = EntityBatch(entities=self._entities, payload_bytes=self._bytes, reason=reason)
+        self._entities = []
+        self._bytes = 0
+        self._deadline = None
+        return batch
+
+    # ------------------------------------------------------------------
+    # Tuning
+    # ------------------------------------------------------------------
+
+    def observe(self, batch: EntityBatch, seconds: float) -> None:
+        """Tune the limits from the processing time of a finished batch."""
+        if batch.payload_bytes <= 0 or seconds <= 0:
+            return
+
+        rate = seconds / batch.payload_bytes
+        if self._seconds_per_byte is None:
+            self._seconds_per_byte = rate
+        else:
+            self._seconds_per_byte += _RATE_SMOOTHING * (rate - self._seconds_per_byte)
+
+        target = self._target_latency / self._seconds_per_byte
+        target = min(max(target, self._budget / _MAX_STEP), self._budget * _MAX_STEP)
+        self._budget = min(max(target, self.min_bytes), self.max_bytes)
+
+        if seconds > self._target_latency:
+            self._entity_limit = max(self.min_entities, self._entity_limit // 2)
+        elif (
+            batch.reason == BatchCloseReason.ENTITIES
+            and seconds < self._target_latency * _FAST_BATCH_SHARE
+        ):
+            self._entity_limit = min(self.max_entities, self._entity_limit * 2)
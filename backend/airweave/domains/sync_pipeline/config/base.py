@@ -37,6 +37,11 @@ class CursorConfig(BaseModel):
 
     skip_load: bool = Field(False, description="Don't load cursor (fetch all entities)")
     skip_updates: bool = Field(False, description="Don't persist cursor progress")
+    checkpoint_interval_seconds: int = Field(
+        300,
+        ge=0,
+        description="Seconds between mid-sync cursor checkpoints (0 disables them)",
+    )
 
 
 class BehaviorConfig(BaseModel):
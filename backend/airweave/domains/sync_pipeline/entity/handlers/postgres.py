@@ -21,6 +21,7 @@ from airweave.domains.sync_pipeline.entity.actions import (
 )
 from airweave.domains.sync_pipeline.entity.handlers.protocol import EntityActionHandler
 from airweave.domains.sync_pipeline.exceptions import SyncFailureError
+from airweave.domains.sync_pipeline.flight_recorder import SyncStage, stage
 
 if TYPE_CHECKING:
     from airweave.domains.sync_pipeline.contexts import SyncContext
@@ -53,7 +54,8 @@ class EntityPostgresHandler(EntityActionHandler):
         if not batch.has_mutations:
             return
 
-        await self._do_batch_with_retry(batch, sync_context)
+        with stage(SyncStage.POSTGRES):
+            await self._do_batch_with_retry(batch, sync_context)
 
     async def handle_inserts(
         self,
@@ -140,14 +142,19 @@ class EntityPostgresHandler(EntityActionHandler):
         batch: EntityActionBatch,
         sync_context: "SyncContext",
     ) -> None:
-        """Execute INSERT, UPDATE, DELETE in single transaction."""
+        """Execute UPDATE, DELETE, INSERT in single transaction.
+
+        Inserts and deletes lock the sync's entity_count rows (via the entity
+        table triggers) until commit, so they run last to keep that window short
+        for concurrent batches of the same sync. Hash updates don't touch counts.
+        """
         async with get_db_context() as db:
-            if batch.inserts:
-                await self._do_inserts(batch.inserts, sync_context, db)
             if batch.updates:
                 await self._do_updates(batch.updates, batch.existing_map, sync_context, db)
             if batch.deletes:
                 await self._do_deletes(batch.deletes, batch.existing_map, sync_context, db)
+            if batch.inserts:
+                await self._do_inserts(batch.inserts, sync_context, db)
             await db.commit()
 
         sync_context.logger.debug(
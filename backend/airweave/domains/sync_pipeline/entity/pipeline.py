@@ -22,6 +22,7 @@ from airweave.domains.sync_pipeline.contexts import SyncContext
 from airweave.domains.sync_pipeline.contexts.runtime import SyncRuntime
 from airweave.domains.sync_pipeline.entity.actions import EntityActionBatch
 from airweave.domains.sync_pipeline.exceptions import SyncFailureError
+from airweave.domains.sync_pipeline.flight_recorder import SyncStage, stage, sync_flight_recorder
 from airweave.domains.sync_pipeline.pipeline.cleanup_service import cleanup_service
 from airweave.domains.sync_pipeline.pipeline.entity_tracker import EntityTracker
 from airweave.domains.sync_pipeline.pipeline.hash_computer import hash_computer
@@ -67,16 +68,33 @@ class EntityPipeline:
         sync_context: SyncContext,
         runtime: SyncRuntime,
     ) -> None:
-        """Process a batch of entities through the full pipeline."""
+        """Process a batch of entities through the full pipeline.
+
+        Stage timings are collected by the sync flight recorder.
+        """
+        with sync_flight_recorder.batch(
+            sync_context.sync_job.id, sync_context.source_short_name, len(entities)
+        ):
+            await self._process(entities, sync_context, runtime)
+
+    async def _process(
+        self,
+        entities: List[BaseEntity],
+        sync_context: SyncContext,
+        runtime: SyncRuntime,
+    ) -> None:
         batch_start = time.monotonic()
 
-        unique_entities = await self._track_and_dedupe(entities, sync_context)
+        with stage(SyncStage.TRACK):
+            unique_entities = await self._track_and_dedupe(entities, sync_context)
         if not unique_entities:
             return
 
-        await self._prepare_entities(unique_entities, sync_context, runtime)
+        with stage(SyncStage.HASH):
+            await self._prepare_entities(unique_entities, sync_context, runtime)
 
-        batch = await self._resolver.resolve(unique_entities, sync_context)
+        with stage(SyncStage.RESOLVE):
+            batch = await self._resolver.resolve(unique_entities, sync_context)
 
         if not batch.has_mutations:
             await self._handle_keep_only_batch(batch, sync_context, batch_start)
@@ -120,28 +138,29 @@ class EntityPipeline:
         entities: List[BaseEntity],
         sync_context: SyncContext,
     ) -> List[BaseEntity]:
-        """Track entities and filter duplicates."""
+        """Track entities and filter duplicates.
+
+        The whole batch is tracked, and its duplicates counted as skipped, in a
+        single tracker update, so concurrent batches don't queue on the
+        tracker's lock once per entity.
+        """
         for entity in entities:
             self._populate_base_entity_fields_from_flags(entity)
 
-        unique = []
-        skipped_count = 0
+        keys = [(entity.__class__.__name__, entity.entity_id) for entity in entities]
+        new_keys = set(
+            await self._tracker.track_entities_batch(keys, record_duplicates_as_skipped=True)
+        )
 
-        for entity in entities:
-            is_new = await self._tracker.track_entity(
-                entity.__class__.__name__,
-                entity.entity_id,
-            )
-            if is_new:
+        unique = []
+        for entity, key in zip(entities, keys, strict=True):
+            # A key repeated within the batch is new only on its first occurrence
+            if key in new_keys:
+                new_keys.discard(key)
                 unique.append(entity)
-            else:
-                skipped_count += 1
-                sync_context.logger.debug(
-                    f"Skipping duplicate: {entity.__class__.__name__}[{entity.entity_id}]"
-                )
 
+        skipped_count = len(entities) - len(unique)
         if skipped_count > 0:
-            await self._tracker.record_skipped(skipped_count)
             sync_context.logger.debug(
                 f"Filtered {skipped_count} duplicates from batch of {len(entities)}"
             )
@@ -18,6 +18,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
+from airweave.core.config import settings
 from airweave.core.context import BaseContext
 from airweave.core.exceptions import NotFoundException
 from airweave.core.logging import ContextualLogger, LoggerConfigurator, logger
@@ -324,6 +325,8 @@ class SyncFactory(SyncFactoryProtocol):
             ),
             queue_size=10000,
             logger=sync_context.logger,
+            cursor=runtime.cursor,
+            max_queue_bytes=settings.SYNC_STREAM_MAX_QUEUE_BYTES,
         )
 
     # -------------------------------------------------------------------------
@@ -0,0 +1,269 @@
+"""Per-stage timing for the sync pipeline.
+
+``EntityPipeline.process`` opens a batch with ``sync_flight_recorder.batch(...)``;
+the components it calls wrap their work in ``stage(...)``. The active batch is
+carried in a context variable, so stages time themselves without the
+recorder being threaded through every handler, processor and destination,
+and concurrent batches never mix their timings.
+
+When a batch ends its stage timings are:
+
+- observed into the ``SyncPipelineMetrics`` histograms (per stage and source);
+- appended to the job's flight recorder, a ring buffer of recent batches
+  plus running per-stage totals.
+
+The orchestrator reports the shape of every batch it closes (entities,
+estimated payload bytes and why it closed) with ``record_batch_shape``.
+
+The worker control server exposes the flight recorders of active and recently
+finished jobs, and the orchestrator stores the job summary in the sync job's
+``sync_metadata``, which together show where a sync spends its time.
+"""
+
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from airweave.core.logging import logger
+from airweave.core.protocols.metrics import SyncPipelineMetrics
+
+DEFAULT_BATCH_CAPACITY = 100
+DEFAULT_FINISHED_JOBS = 20
+
+
+class SyncStage:
+    """Stage names used by ``stage()`` across the pipeline."""
+
+    TRACK = "track"
+    HASH = "hash"
+    RESOLVE = "resolve"
+    TEXT_BUILD = "text_build"
+    CONVERT = "convert"
+    CHUNK = "chunk"
+    EMBED = "embed"
+    TRANSFORM = "transform"
+    FEED = "feed"
+    POSTGRES = "postgres"
+
+
+@dataclass(frozen=True)
+class BatchTiming:
+    """Timings of one processed batch."""
+
+    batch_seq: int
+    entities: int
+    total_ms: float
+    stages_ms: Dict[str, float]
+    finished_at: float
+
+
+class _BatchTimer:
+    """Stage durations accumulated while one batch is processed."""
+
+    __slots__ = ("stages",)
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+
+    def add(self, stage_name: str, seconds: float) -> None:
+        self.stages[stage_name] = self.stages.get(stage_name, 0.0) + seconds
+
+
+_current_batch: ContextVar[Optional[_BatchTimer]] = ContextVar(
+    "sync_flight_recorder_batch", default=None
+)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a pipeline stage for the batch being processed.
+
+    A no-op outside ``SyncFlightRecorder.batch`` (e.g. orphan cleanup).
+    Time spent in the same stage by concurrent sub-tasks is summed.
+    """
+    batch = _current_batch.get()
+    if batch is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        batch.add(name, time.perf_counter() - start)
+
+
+class JobFlightRecorder:
+    """Recent batch timings and running stage totals for one sync job."""
+
+    def __init__(self, sync_job_id: str, source: str, capacity: int) -> None:
+        """Initialize an empty recorder."""
+        self.sync_job_id = sync_job_id
+        self.source = source
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.batches: Deque[BatchTiming] = deque(maxlen=capacity)
+        self.batch_count = 0
+        self.entity_count = 0
+        self.total_seconds = 0.0
+        self.stage_seconds: Dict[str, float] = {}
+        self.payload_bytes = 0
+        self.close_reasons: Dict[str, int] = {}
+
+    def record(self, timer: _BatchTimer, entities: int, total_seconds: float) -> None:
+        """Add one finished batch."""
+        self.batch_count += 1
+        self.entity_count += entities
+        self.total_seconds += total_seconds
+        for stage_name, seconds in timer.stages.items():
+            self.stage_seconds[stage_name] = self.stage_seconds.get(stage_name, 0.0) + seconds
+        self.batches.append(
+            BatchTiming(
+                batch_seq=self.batch_count,
+                entities=entities,
+                total_ms=round(total_seconds * 1000, 2),
+                stages_ms={k: round(v * 1000, 2) for k, v in timer.stages.items()},
+                finished_at=time.time(),
+            )
+        )
+
+    def record_shape(self, payload_bytes: int, reason: str) -> None:
+        """Add the shape of one batch closed by the orchestrator."""
+        self.payload_bytes += payload_bytes
+        self.close_reasons[reason] = self.close_reasons.get(reason, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals per stage and their share of batch processing time."""
+        total = self.total_seconds
+        closed = sum(self.close_reasons.values())
+        return {
+            "source": self.source,
+            "batches": self.batch_count,
+            "entities": self.entity_count,
+            "payload_bytes": self.payload_bytes,
+            "avg_batch_payload_bytes": self.payload_bytes // closed if closed else 0,
+            "batch_close_reasons": dict(self.close_reasons),
+            "batch_ms_total": round(total * 1000, 2),
+            "entities_per_second": round(self.entity_count / total, 2) if total else 0.0,
+            "stage_ms_total": {
+                k: round(v * 1000, 2)
+                for k, v in sorted(self.stage_seconds.items(), key=lambda kv: -kv[1])
+            },
+            "stage_share": {
+                k: round(v / total, 4) if total else 0.0 for k, v in self.stage_seconds.items()
+            },
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summary plus the recent batch ring buffer."""
+        return {
+            "sync_job_id": self.sync_job_id,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            **self.summary(),
+            "recent_batches": [asdict(b) for b in self.batches],
+        }
+
+
+class SyncFlightRecorder:
+    """Process-wide registry of job flight recorders.
+
+    Args:
+        batch_capacity: Recent batches kept per job.
+        finished_jobs: Finished jobs kept for inspection after they end.
+    """
+
+    def __init__(
+        self,
+        batch_capacity: int = DEFAULT_BATCH_CAPACITY,
+        finished_jobs: int = DEFAULT_FINISHED_JOBS,
+    ) -> None:
+        """Initialize with no jobs and no metrics backend."""
+        self._batch_capacity = batch_capacity
+        self._finished_capacity = finished_jobs
+        self._active: Dict[str, JobFlightRecorder] = {}
+        self._finished: "OrderedDict[str, JobFlightRecorder]" = OrderedDict()
+        self._metrics: Optional[SyncPipelineMetrics] = None
+
+    def set_metrics(self, metrics: Optional[SyncPipelineMetrics]) -> None:
+        """Export stage timings to ``metrics`` (set once by the worker)."""
+        self._metrics = metrics
+
+    @contextmanager
+    def batch(self, sync_job_id: UUID | str, source: str, entity_count: int) -> Iterator[None]:
+        """Collect the stage timings of one batch processed inside the block."""
+        timer = _BatchTimer()
+        token = _current_batch.set(timer)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            total = time.perf_counter() - start
+            _current_batch.reset(token)
+            self._record(str(sync_job_id), source, timer, entity_count, total)
+
+    def record_batch_shape(
+        self, sync_job_id: UUID | str, source: str, payload_bytes: int, reason: str
+    ) -> None:
+        """Record the shape of a batch as it is closed, before it is processed."""
+        self._job(str(sync_job_id), source).record_shape(payload_bytes, reason)
+        if self._metrics is None:
+            return
+        try:
+            self._metrics.observe_batch_shape(source, payload_bytes, reason)
+        except Exception as e:
+            logger.warning(f"Failed to record sync batch shape metrics: {e}")
+
+    def summary(self, sync_job_id: UUID | str) -> Optional[Dict[str, Any]]:
+        """Stage totals for a job, or None if it processed no batches here."""
+        recorder = self._active.get(str(sync_job_id)) or self._finished.get(str(sync_job_id))
+        return recorder.summary() if recorder else None
+
+    def finish_job(self, sync_job_id: UUID | str) -> None:
+        """Move a job to the recently-finished list."""
+        recorder = self._active.pop(str(sync_job_id), None)
+        if recorder is None:
+            return
+        recorder.finished_at = time.time()
+        self._finished[recorder.sync_job_id] = recorder
+        while len(self._finished) > self._finished_capacity:
+            self._finished.popitem(last=False)
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Flight recorders of active and recently finished jobs."""
+        return {
+            "active": [r.snapshot() for r in self._active.values()],
+            "finished": [r.snapshot() for r in reversed(self._finished.values())],
+        }
+
+    def _job(self, sync_job_id: str, source: str) -> JobFlightRecorder:
+        recorder = self._active.get(sync_job_id)
+        if recorder is None:
+            recorder = JobFlightRecorder(sync_job_id, source, self._batch_capacity)
+            self._active[sync_job_id] = recorder
+        return recorder
+
+    def _record(
+        self,
+        sync_job_id: str,
+        source: str,
+        timer: _BatchTimer,
+        entity_count: int,
+        total_seconds: float,
+    ) -> None:
+        self._job(sync_job_id, source).record(timer, entity_count, total_seconds)
+
+        if self._metrics is None:
+            return
+        try:
+            for stage_name, seconds in timer.stages.items():
+                self._metrics.observe_stage(stage_name, source, seconds)
+            self._metrics.observe_batch(source, total_seconds, entity_count)
+        except Exception as e:
+            logger.warning(f"Failed to record sync stage metrics: {e}")
+
+
+sync_flight_recorder = SyncFlightRecorder()
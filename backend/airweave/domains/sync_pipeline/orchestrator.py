@@ -6,6 +6,7 @@ from typing import Optional
 
 from airweave import schemas
 from airweave.analytics import business_events
+from airweave.core.config import settings
 from airweave.core.datetime_utils import utc_now_naive
 from airweave.core.events.sync import (
     AccessControlMembershipBatchProcessedEvent,
@@ -15,11 +16,14 @@ from airweave.core.shared_models import SyncJobStatus, SyncStatus
 from airweave.db.session import get_db_context
 from airweave.domains.access_control.pipeline import AccessControlPipeline
 from airweave.domains.sources.exceptions.classifier import classify_error
+from airweave.domains.sync_pipeline.batching import AdaptiveBatcher, BatchCloseReason, EntityBatch
+from airweave.domains.sync_pipeline.config.base import CursorConfig
 from airweave.domains.sync_pipeline.contexts import SyncContext
 from airweave.domains.sync_pipeline.contexts.runtime import SyncRuntime
 from airweave.domains.sync_pipeline.entity.pipeline import EntityPipeline
 from airweave.domains.sync_pipeline.exceptions import EntityProcessingError, SyncFailureError
-from airweave.domains.sync_pipeline.stream import AsyncSourceStream
+from airweave.domains.sync_pipeline.flight_recorder import sync_flight_recorder
+from airweave.domains.sync_pipeline.stream import AsyncSourceStream, CursorCheckpoint
 from airweave.domains.sync_pipeline.worker_pool import AsyncWorkerPool
 from airweave.domains.syncs.cursors.service import SyncCursorService
 from airweave.domains.syncs.jobs.protocols import SyncJobStateMachineProtocol
@@ -81,14 +85,18 @@ class SyncOrchestrator:
         self.should_batch = sync_context.should_batch
         self.batch_size = sync_context.batch_size
         self.max_batch_latency_ms = sync_context.max_batch_latency_ms
+        self._batcher: Optional[AdaptiveBatcher] = None
 
     async def run(self) -> schemas.Sync:
         """Execute the synchronization process."""
-        # Register worker pool for metrics tracking (using sync_id and sync_job_id)
-        # Format: sync_{sync_id}_job_{sync_job_id} for easier parsing in metrics
+        # Register worker pool and source stream for metrics tracking (using sync_id
+        # and sync_job_id). Format: sync_{sync_id}_job_{sync_job_id} for easier parsing
         pool_id = f"sync_{self.sync_context.sync.id}_job_{self.sync_context.sync_job.id}"
         try:
             worker_metrics.register_worker_pool(pool_id, self.worker_pool)
+            worker_metrics.register_source_stream(
+                pool_id, self.stream, self.sync_context.source_short_name
+            )
         except Exception as e:
             self.sync_context.logger.warning(
                 f"Failed to register worker pool for metrics: {e}",
@@ -149,9 +157,12 @@ class SyncOrchestrator:
             # Note: Removed aggregate metrics recording (histograms/counters)
             # Real-time visibility via Gauge metrics which clear on completion
 
-            # Unregister worker pool from metrics
+            sync_flight_recorder.finish_job(self.sync_context.sync_job.id)
+
+            # Unregister worker pool and source stream from metrics
             try:
                 worker_metrics.unregister_worker_pool(pool_id)
+                worker_metrics.unregister_source_stream(pool_id)
             except Exception as e:
                 self.sync_context.logger.warning(
                     f"Failed to unregister worker pool from metrics: {e}",
@@ -196,24 +207,50 @@ class SyncOrchestrator:
         )
 
     async def _process_entities(self) -> None:  # noqa: C901
-        """Process entities using micro-batching with bounded inner concurrency."""
+        """Process entities using size-aware micro-batching with bounded inner concurrency."""
         source_name = self.runtime.source.source_name
+        batcher = self._batcher = AdaptiveBatcher(
+            batch_size=self.batch_size,
+            max_batch_latency_ms=self.max_batch_latency_ms,
+            target_latency_ms=settings.SYNC_BATCH_TARGET_LATENCY_MS,
+            initial_bytes=settings.SYNC_BATCH_INITIAL_BYTES,
+            max_bytes=settings.SYNC_BATCH_MAX_BYTES,
+        )
         self.sync_context.logger.info(
             f"Starting pull-based processing from source {source_name} "
             f"(max workers: {self.worker_pool.max_workers}, "
-            f"batch_size: {self.batch_size}, max_batch_latency_ms: {self.max_batch_latency_ms})"
+            f"batch_size: {self.batch_size}, max_batch_latency_ms: {self.max_batch_latency_ms}, "
+            f"batch budget: {batcher.budget_bytes} bytes)"
         )
 
         stream_error: Optional[Exception] = None
         pending_tasks: set[asyncio.Task] = set()
 
-        # Micro-batch aggregation state
-        batch_buffer: list = []
-        flush_deadline: Optional[float] = None  # event-loop time when we must flush
+        # Cursor checkpoint state: the next one is requested once the deadline passes
+        # and re-armed when its marker has come through the stream and been persisted
+        checkpoint_interval = self._checkpoint_interval()
+        checkpoint_deadline: Optional[float] = None
+        if checkpoint_interval:
+            checkpoint_deadline = asyncio.get_running_loop().time() + checkpoint_interval
 
         try:
             # Use the pre-created stream (already started in _start_sync)
             async for entity in self.stream.get_entities():
+                if isinstance(entity, CursorCheckpoint):
+                    pending_tasks = await self._submit_batch_and_trim(
+                        batcher.flush(BatchCloseReason.CHECKPOINT), pending_tasks
+                    )
+                    pending_tasks = await self._checkpoint_cursor(entity, pending_tasks)
+                    checkpoint_deadline = asyncio.get_running_loop().time() + checkpoint_interval
+                    continue
+
+                if (
+                    checkpoint_deadline is not None
+                    and asyncio.get_running_loop().time() >= checkpoint_deadline
+                ):
+                    self.stream.request_checkpoint()
+                    checkpoint_deadline = None
+
                 # Check guardrails unless explicitly skipped
                 if not self.sync_context.execution_config.behavior.skip_guardrails:
                     try:
@@ -233,44 +270,20 @@ class SyncOrchestrator:
                         )
                         stream_error = guard_error
                         # Flush any buffered work so we don't drop it
-                        if batch_buffer:
-                            pending_tasks = await self._submit_batch_and_trim(
-                                batch_buffer, pending_tasks
-                            )
-                            batch_buffer = []
-                            flush_deadline = None
+                        pending_tasks = await self._submit_batch_and_trim(
+                            batcher.flush(BatchCloseReason.GUARDRAIL), pending_tasks
+                        )
                         break
 
-                # Accumulate into batch
-                batch_buffer.append(entity)
-
-                # Set a latency-based flush deadline on first element
-                if flush_deadline is None and self.max_batch_latency_ms > 0:
-                    flush_deadline = (
-                        asyncio.get_running_loop().time() + self.max_batch_latency_ms / 1000.0
-                    )
-
-                # Size-based flush
-                if len(batch_buffer) >= self.batch_size:
-                    pending_tasks = await self._submit_batch_and_trim(batch_buffer, pending_tasks)
-                    batch_buffer = []
-                    flush_deadline = None
-                    continue
-
-                # Time-based flush (checked when new items arrive)
-                if (
-                    flush_deadline is not None
-                    and asyncio.get_running_loop().time() >= flush_deadline
-                ):
-                    pending_tasks = await self._submit_batch_and_trim(batch_buffer, pending_tasks)
-                    batch_buffer = []
-                    flush_deadline = None
+                # Accumulate into the open batch; it closes on its payload budget,
+                # entity ceiling or latency deadline (checked when new items arrive)
+                for batch in batcher.add(entity):
+                    pending_tasks = await self._submit_batch_and_trim(batch, pending_tasks)
 
             # End-of-stream: flush any remaining buffered entities
-            if batch_buffer:
-                pending_tasks = await self._submit_batch_and_trim(batch_buffer, pending_tasks)
-                batch_buffer = []
-                flush_deadline = None
+            pending_tasks = await self._submit_batch_and_trim(
+                batcher.flush(BatchCloseReason.END), pending_tasks
+            )
 
         except asyncio.CancelledError as e:
             # Propagate cancellation: set stream_error so finalize cancels tasks and stop stream
@@ -289,19 +302,20 @@ class SyncOrchestrator:
 
     async def _submit_batch_and_trim(
         self,
-        batch: list,
+        batch: Optional[EntityBatch],
         pending_tasks: set[asyncio.Task],
     ) -> set[asyncio.Task]:
         """Submit a micro-batch to the worker pool and trim to max parallelism if needed."""
-        if not batch:
+        if batch is None or not batch.entities:
             return pending_tasks
 
-        task = await self.worker_pool.submit(
-            self.entity_pipeline.process,
-            entities=list(batch),
-            sync_context=self.sync_context,
-            runtime=self.runtime,
+        sync_flight_recorder.record_batch_shape(
+            self.sync_context.sync_job.id,
+            self.sync_context.source_short_name,
+            payload_bytes=batch.payload_bytes,
+            reason=batch.reason,
         )
+        task = await self.worker_pool.submit(self._process_batch, batch)
         pending_tasks.add(task)
 
         # Check for completed tasks and fail fast on sync errors
@@ -313,6 +327,17 @@ class SyncOrchestrator:
 
         return pending_tasks
 
+    async def _process_batch(self, batch: EntityBatch) -> None:
+        """Run one batch through the entity pipeline and feed its timing to the batcher."""
+        start = time.perf_counter()
+        await self.entity_pipeline.process(
+            entities=batch.entities,
+            sync_context=self.sync_context,
+            runtime=self.runtime,
+        )
+        if self._batcher is not None:
+            self._batcher.observe(batch, time.perf_counter() - start)
+
     async def _check_completed_tasks_fail_fast(
         self, pending_tasks: set[asyncio.Task]
     ) -> set[asyncio.Task]:
@@ -337,6 +362,41 @@ class SyncOrchestrator:
 
         return pending_tasks
 
+    def _checkpoint_interval(self) -> Optional[float]:
+        """Seconds between mid-sync cursor checkpoints, or None if there are none.
+
+        Only cursors that are valid resume points at any time are checkpointed.
+        Forced full syncs and syncs that don't load the cursor are not: their
+        retries start over anyway, and a partial cursor would replace the one
+        the next regular sync resumes from.
+        """
+        cursor = self.runtime.cursor
+        if cursor is None or not cursor.supports_checkpoints or self.sync_context.force_full_sync:
+            return None
+
+        config = self.sync_context.execution_config
+        cursor_config = config.cursor if config else CursorConfig()
+        if cursor_config.skip_load or cursor_config.skip_updates:
+            return None
+        return cursor_config.checkpoint_interval_seconds or None
+
+    async def _checkpoint_cursor(
+        self,
+        checkpoint: CursorCheckpoint,
+        pending_tasks: set[asyncio.Task],
+    ) -> set[asyncio.Task]:
+        """Persist a cursor checkpoint once every entity queued before it is processed.
+
+        A retried sync loads the checkpoint like any stored cursor and resumes from it.
+        """
+        await self._wait_for_remaining_tasks(pending_tasks)
+        if checkpoint.cursor_data:
+            self.sync_context.logger.info(
+                f"📍 Cursor checkpoint after {checkpoint.entities_produced} entities"
+            )
+            await self._persist_cursor(checkpoint.cursor_data)
+        return set()
+
     # ----------------------------- Shared helpers -----------------------------
     def _check_task_errors(self, tasks: set[asyncio.Task]) -> list[EntityProcessingError]:
         """Check tasks for errors and handle based on error type.
@@ -532,6 +592,7 @@ class SyncOrchestrator:
             ctx=self.sync_context,
             lifecycle_data=self._lifecycle_data,
             stats=stats,
+            sync_metadata=self._pipeline_timings(),
         )
 
         entities_processed = 0
@@ -569,6 +630,11 @@ class SyncOrchestrator:
             f"Completed sync job {self.sync_context.sync_job.id} successfully. Stats: {stats}"
         )
 
+    def _pipeline_timings(self) -> Optional[dict]:
+        """Per-stage timing summary from the flight recorder, for the job record."""
+        summary = sync_flight_recorder.summary(self.sync_context.sync_job.id)
+        return {"pipeline_timings": summary} if summary else None
+
     async def _update_snapshot_short_name(self) -> None:
         """For snapshot sources, update source_connection.short_name to the original source.
 
@@ -637,12 +703,16 @@ class SyncOrchestrator:
             )
             return
 
+        await self._persist_cursor(self.runtime.cursor.cursor_data)
+
+    async def _persist_cursor(self, cursor_data: dict) -> None:
+        """Store cursor data for the sync; failures are logged, not raised."""
         try:
             async with get_db_context() as db:
                 await self._sync_cursor_service.create_or_update_cursor(
                     db=db,
                     sync_id=self.sync_context.sync.id,
-                    cursor_data=self.runtime.cursor.cursor_data,
+                    cursor_data=cursor_data,
                     ctx=self.sync_context,
                     cursor_field=self.runtime.cursor.cursor_field,
                 )
@@ -674,6 +744,7 @@ class SyncOrchestrator:
             error=error_message,
             stats=stats,
             error_category=classification.category,
+            sync_metadata=self._pipeline_timings(),
         )
 
         if classification.category is not None:
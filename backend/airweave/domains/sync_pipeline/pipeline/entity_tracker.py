@@ -121,27 +121,42 @@ class EntityTracker:
             )
             return True  # New
 
-    async def track_entities_batch(self, entities: List[tuple]) -> List[tuple]:
+    async def track_entities_batch(
+        self, entities: List[tuple], record_duplicates_as_skipped: bool = False
+    ) -> List[tuple]:
         """Track multiple entities and return only the new ones.
 
-        More efficient than calling track_entity in a loop when batch is large.
+        More efficient than calling track_entity in a loop when batch is large:
+        the whole batch is tracked under one lock acquisition. An entity that
+        appears twice in the batch is new the first time only.
 
         Args:
             entities: List of (entity_type, entity_id) tuples
+            record_duplicates_as_skipped: Also count the duplicates as skipped,
+                in the same locked update
 
         Returns:
             List of (entity_type, entity_id) tuples that are NEW (not duplicates)
         """
         new_entities = []
         async with self._lock:
+            new_by_type: Dict[str, int] = defaultdict(int)
             for entity_type, entity_id in entities:
-                if entity_id not in self._encountered_by_type[entity_type]:
-                    self._encountered_by_type[entity_type].add(entity_id)
-                    # Update stats directly
-                    self.stats.entities_encountered[entity_type] = (
-                        self.stats.entities_encountered.get(entity_type, 0) + 1
-                    )
+                encountered = self._encountered_by_type[entity_type]
+                if entity_id not in encountered:
+                    encountered.add(entity_id)
+                    new_by_type[entity_type] += 1
                     new_entities.append((entity_type, entity_id))
+
+            for entity_type, count in new_by_type.items():
+                self.stats.entities_encountered[entity_type] = (
+                    self.stats.entities_encountered.get(entity_type, 0) + count
+                )
+
+            duplicates = len(entities) - len(new_entities)
+            if record_duplicates_as_skipped and duplicates:
+                self.stats.skipped += duplicates
+                self.stats.total_operations += duplicates
         return new_entities
 
     def get_encountered_ids(self) -> Dict[str, Set[str]]:
@@ -206,6 +206,9 @@ class HashComputer:
     async def _compute_file_content_hash(self, entity: BaseEntity) -> str:
         """Compute SHA256 hash of file content.
 
+        Uses the digest recorded by FileService while the file was written when
+        available; only falls back to re-reading the file from disk otherwise.
+
         Args:
             entity: FileEntity or CodeFileEntity with local_path
 
@@ -222,6 +225,10 @@ class HashComputer:
                 f"missing local_path - cannot compute hash"
             )
 
+        content_hash = getattr(entity, "local_content_sha256", None)
+        if content_hash:
+            return content_hash
+
         try:
             return await run_in_thread_pool(self._sync_hash_file, str(local_path))
         except Exception as e:
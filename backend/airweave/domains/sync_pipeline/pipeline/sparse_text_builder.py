@@ -0,0 +1,133 @@
+"""Sparse (BM25) text builder for chunk entities."""
+
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from airweave.core.shared_models import AirweaveFieldFlag
+from airweave.platform.entities._base import BaseEntity, CodeFileEntity
+
+# Longer values of embeddable fields are left to the chunk text (see below)
+MAX_EMBEDDED_VALUE_CHARS = 200
+
+# Never part of the keyword block: the chunk text is added separately, the
+# chunk's entity_id carries a per-chunk suffix (the original ID is added
+# instead), and system metadata and access control are not searchable content.
+_BASE_EXCLUDED_FIELDS = frozenset(
+    {"textual_representation", "entity_id", "airweave_system_metadata", "access"}
+)
+
+
+class SparseTextBuilder:
+    """Builds the text that is embedded into each chunk's sparse (BM25) vector.
+
+    The sparse text of a chunk is its own text followed by a keyword block
+    listing the scalar values of the parent entity's fields (name, breadcrumbs,
+    source-specific fields, ...), so keyword search matches a chunk on its
+    content and on any field of the entity it came from.
+
+    All chunks of an entity share the same keyword block, so it is built once
+    per parent rather than by serializing the whole entity for every chunk.
+    Per-class field metadata decides what goes in:
+
+    - values of ``embeddable`` fields longer than ``MAX_EMBEDDED_VALUE_CHARS``
+      are left out: they are already part of the textual representation that
+      was chunked, so their terms are in the chunk that contains them instead
+      of in every chunk (code files, whose representation has no metadata
+      section, keep them);
+    - fields marked ``unhashable`` (volatile URLs, download links, passwords)
+      are left out, as are JSON keys and booleans, which only add noise terms.
+    """
+
+    def build_for_batch(self, chunk_entities: List[BaseEntity]) -> List[str]:
+        """Build the sparse text for each chunk entity, in order.
+
+        Args:
+            chunk_entities: Chunk entities produced by the chunker
+
+        Returns:
+            One sparse text per chunk entity
+        """
+        keyword_blocks: Dict[Tuple[type, Any], str] = {}
+        texts = []
+
+        for entity in chunk_entities:
+            original_id = entity.airweave_system_metadata.original_entity_id or entity.entity_id
+            key = (type(entity), original_id)
+            block = keyword_blocks.get(key)
+            if block is None:
+                block = self.build_keyword_block(entity, original_id)
+                keyword_blocks[key] = block
+
+            chunk_text = entity.textual_representation or ""
+            texts.append(f"{chunk_text}\n\n{block}" if block else chunk_text)
+
+        return texts
+
+    def build_keyword_block(self, entity: BaseEntity, original_id: Any = None) -> str:
+        """Build the keyword block for an entity: one line per distinct field value.
+
+        Args:
+            entity: Entity (or any of its chunks) to take field values from
+            original_id: ID of the parent entity, listed first when given
+
+        Returns:
+            Newline-separated field values
+        """
+        excluded, chunked = _field_metadata(type(entity))
+        values = entity.model_dump(mode="json", exclude=excluded)
+
+        seen = set()
+        lines = []
+        if original_id is not None:
+            seen.add(str(original_id))
+            lines.append(str(original_id))
+        for field_name, field_value in values.items():
+            max_chars = MAX_EMBEDDED_VALUE_CHARS if field_name in chunked else None
+            for value in _scalar_values(field_value, max_chars):
+                if value not in seen:
+                    seen.add(value)
+                    lines.append(value)
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _field_metadata(entity_cls: type) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Fields excluded from the keyword block, and fields already in the chunk text."""
+    excluded = set(_BASE_EXCLUDED_FIELDS)
+    chunked = set()
+    has_metadata_section = not issubclass(entity_cls, CodeFileEntity)
+
+    for field_name, field_info in getattr(entity_cls, "model_fields", {}).items():
+        json_extra = field_info.json_schema_extra
+        if not isinstance(json_extra, dict):
+            continue
+        if json_extra.get(AirweaveFieldFlag.UNHASHABLE.value):
+            excluded.add(field_name)
+        elif has_metadata_section and json_extra.get(AirweaveFieldFlag.EMBEDDABLE.value):
+            chunked.add(field_name)
+
+    return frozenset(excluded), frozenset(chunked)
+
+
+def _scalar_values(value: Any, max_chars: Optional[int] = None) -> List[str]:
+    """Flatten a JSON-mode value into its non-empty string and number values.
+
+    Strings longer than ``max_chars`` are skipped when it is given.
+    """
+    out: List[str] = []
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(reversed(list(item.values())))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+        elif isinstance(item, bool) or item is None:
+            continue
+        elif isinstance(item, str):
+            item = item.strip()
+            if item and (max_chars is None or len(item) <= max_chars):
+                out.append(item)
+        else:
+            out.append(str(item))
+    return out
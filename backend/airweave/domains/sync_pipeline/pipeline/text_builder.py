@@ -9,6 +9,7 @@ from airweave.core.shared_models import AirweaveFieldFlag
 from airweave.domains.converters.protocols import ConverterRegistryProtocol
 from airweave.domains.sync_pipeline.exceptions import EntityProcessingError, SyncFailureError
 from airweave.domains.sync_pipeline.file_types import SUPPORTED_FILE_EXTENSIONS
+from airweave.domains.sync_pipeline.flight_recorder import SyncStage, stage
 from airweave.platform.entities._base import BaseEntity, CodeFileEntity, FileEntity, WebEntity
 
 if TYPE_CHECKING:
@@ -62,14 +63,16 @@ class TextualRepresentationBuilder:
         """
         source_name = sync_context.source_short_name
 
-        # Step 1: Build metadata section for all entities
-        await self._build_metadata_for_all(entities, source_name)
+        with stage(SyncStage.TEXT_BUILD):
+            # Step 1: Build metadata section for all entities
+            await self._build_metadata_for_all(entities, source_name)
 
-        # Step 2: Partition entities by converter
-        converter_groups, failed_entities = self._partition_by_converter(entities, sync_context)
+            # Step 2: Partition entities by converter
+            converter_groups, failed_entities = self._partition_by_converter(entities, sync_context)
 
         # Step 3: Convert each partition
-        additional_failures = await self._convert_partitions(converter_groups, sync_context)
+        with stage(SyncStage.CONVERT):
+            additional_failures = await self._convert_partitions(converter_groups, sync_context)
         failed_entities.extend(additional_failures)
 
         # Step 4: Handle failures
@@ -5,21 +5,25 @@ Used by: Qdrant, Vespa, Pinecone, and similar vector DBs.
 Both destinations use chunk-as-document model where each chunk becomes
 a separate document with its own embedding. Both Qdrant and Vespa use:
 - Dense embeddings (3072-dim) for neural/semantic search
-- Sparse embeddings (FastEmbed Qdrant/bm25) for keyword search scoring
+- Sparse embeddings (FastEmbed Qdrant/bm25) for keyword search scoring, computed
+  from the chunk text plus a keyword block of the parent entity's field values
 
 This ensures consistent keyword search behavior across both vector databases,
 with benefits of pre-trained vocabulary/IDF, stopword removal, and learned term weights.
 """
 
-import json
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from airweave.domains.converters.protocols import ConverterRegistryProtocol
 from airweave.domains.embedders.exceptions import EmbedderProviderError
 from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
+from airweave.domains.sync_pipeline.async_helpers import run_in_thread_pool
 from airweave.domains.sync_pipeline.exceptions import EntityProcessingError, SyncFailureError
+from airweave.domains.sync_pipeline.flight_recorder import SyncStage, stage
+from airweave.domains.sync_pipeline.pipeline.sparse_text_builder import SparseTextBuilder
 from airweave.domains.sync_pipeline.pipeline.text_builder import TextualRepresentationBuilder
 from airweave.domains.sync_pipeline.processors.utils import filter_empty_representations
+from airweave.platform.chunkers._base import BaseChunker
 from airweave.platform.entities._base import BaseEntity, CodeFileEntity
 
 if TYPE_CHECKING:
@@ -35,11 +39,20 @@ class ChunkEmbedProcessor:
         converter_registry: ConverterRegistryProtocol,
         dense_embedder: DenseEmbedderProtocol,
         sparse_embedder: SparseEmbedderProtocol,
+        text_chunker: Optional[BaseChunker] = None,
+        code_chunker: Optional[BaseChunker] = None,
     ) -> None:
-        """Initialize with converter registry and embedding providers."""
+        """Initialize with converter registry, embedding providers and optional chunkers.
+
+        When no chunkers are given, the SemanticChunker and CodeChunker
+        singletons are used.
+        """
         self._text_builder = TextualRepresentationBuilder(converter_registry)
+        self._sparse_text_builder = SparseTextBuilder()
         self._dense_embedder = dense_embedder
         self._sparse_embedder = sparse_embedder
+        self._text_chunker = text_chunker
+        self._code_chunker = code_chunker
 
     async def process(
         self,
@@ -63,14 +76,16 @@ class ChunkEmbedProcessor:
             return []
 
         # Step 3: Chunk entities
-        chunk_entities = await self._chunk_entities(processed, sync_context, runtime)
+        with stage(SyncStage.CHUNK):
+            chunk_entities = await self._chunk_entities(processed, sync_context, runtime)
 
         # Step 4: Release parent text (memory optimization)
         for entity in processed:
             entity.textual_representation = None
 
         # Step 5: Embed chunks (may remove entities that fail embedding)
-        chunk_entities = await self._embed_entities(chunk_entities, sync_context)
+        with stage(SyncStage.EMBED):
+            chunk_entities = await self._embed_entities(chunk_entities, sync_context)
 
         sync_context.logger.debug(
             f"[ChunkEmbedProcessor] {len(entities)} entities -> {len(chunk_entities)} chunks"
@@ -121,7 +136,7 @@ class ChunkEmbedProcessor:
         if not supported:
             return []
 
-        chunker = CodeChunker()
+        chunker = self._code_chunker or CodeChunker()
         texts = [e.textual_representation for e in supported]
 
         try:
@@ -139,7 +154,7 @@ class ChunkEmbedProcessor:
         """Chunk text with SemanticChunker."""
         from airweave.platform.chunkers.semantic import SemanticChunker
 
-        chunker = SemanticChunker()
+        chunker = self._text_chunker or SemanticChunker()
         texts = [e.textual_representation for e in entities]
 
         try:
@@ -153,26 +168,26 @@ class ChunkEmbedProcessor:
         self,
         entities: List[BaseEntity],
     ) -> Tuple[List[BaseEntity], List[BaseEntity]]:
-        """Filter code entities by tree-sitter support."""
+        """Filter code entities by tree-sitter support.
+
+        Languages are detected by the pod-wide CodeLanguageDetector in the
+        thread pool; CodeChunker reuses the results when it chunks the batch.
+        """
+        from airweave.platform.chunkers.code_language import CodeLanguageDetector
+
+        texts = [entity.textual_representation for entity in entities]
         try:
-            from magika import Magika
-            from tree_sitter_language_pack import get_parser
+            languages = await run_in_thread_pool(CodeLanguageDetector().detect_batch, texts)
         except ImportError:
             return entities, []
 
-        magika = Magika()
         supported: List[BaseEntity] = []
         unsupported: List[BaseEntity] = []
-
-        for entity in entities:
-            try:
-                text_bytes = entity.textual_representation.encode("utf-8")
-                result = magika.identify_bytes(text_bytes)
-                lang = result.output.label.lower()
-                get_parser(lang)
-                supported.append(entity)
-            except (LookupError, Exception):
+        for entity, language in zip(entities, languages, strict=True):
+            if language is None:
                 unsupported.append(entity)
+            else:
+                supported.append(entity)
 
         return supported, unsupported
 
@@ -242,13 +257,7 @@ class ChunkEmbedProcessor:
         self._validate_dense_dimensions(dense_results)
 
         # Sparse embeddings (FastEmbed Qdrant/bm25 for keyword search scoring)
-        sparse_texts = [
-            json.dumps(
-                e.model_dump(mode="json", exclude={"airweave_system_metadata"}),
-                sort_keys=True,
-            )
-            for e in chunk_entities
-        ]
+        sparse_texts = self._sparse_text_builder.build_for_batch(chunk_entities)
         sparse_embeddings = await self._sparse_embedder.embed_many(sparse_texts)
 
         # Assign and validate embeddings
@@ -1,15 +1,20 @@
 """Module for async data streaming with backpressure."""
 
 import asyncio
+from dataclasses import dataclass
 from enum import Enum
-from typing import AsyncGenerator, Generic, Optional, TypeVar
+from typing import AsyncGenerator, Generic, Optional, TypeVar, Union
 
 from airweave.core.logging import ContextualLogger
+from airweave.domains.sync_pipeline.batching import estimate_payload_bytes
+from airweave.domains.syncs.cursors.cursor import SyncCursor
 from airweave.platform.entities._base import BaseEntity
 from airweave.platform.utils.error_utils import get_error_message
 
 T = TypeVar("T", bound=BaseEntity)
 
+DEFAULT_MAX_QUEUE_BYTES = 256 * 2**20
+
 
 class StreamState(Enum):
     """State of the async source stream."""
@@ -23,6 +28,18 @@ class StreamState(Enum):
     FAILED = "failed"
 
 
+@dataclass(frozen=True)
+class CursorCheckpoint:
+    """Cursor snapshot, queued right after the last entity it covers.
+
+    Once a consumer has processed every entity it received before this marker,
+    ``cursor_data`` is a consistent resume point for the source.
+    """
+
+    cursor_data: dict
+    entities_produced: int
+
+
 class AsyncSourceStream(Generic[T]):
     """Manages asynchronous processing of entity streams with separate producer/consumer loops.
 
@@ -30,7 +47,19 @@ class AsyncSourceStream(Generic[T]):
     - Consumer: processes entities independently
     - State management: explicit lifecycle states for better control
 
-    Uses async queue to buffer entities and implement backpressure.
+    Uses async queue to buffer entities and implement backpressure. The queue is
+    bounded by the estimated payload of the entities in it (``max_queue_bytes``,
+    see ``estimate_payload_bytes``) and, secondarily, by their count
+    (``queue_size``): the producer waits while either is reached, so a source
+    yielding large files holds few of them in memory while one yielding small
+    messages can run far ahead. An entity larger than the whole byte budget is
+    still let through once the queue is empty.
+
+    The producer runs up to ``queue_size`` entities ahead of the consumer, so the
+    source's cursor describes what was produced, not what was consumed. When a
+    checkpoint is requested, the producer snapshots the cursor while the source
+    generator is suspended and queues a ``CursorCheckpoint`` right behind the
+    entity it just produced.
     """
 
     def __init__(
@@ -38,17 +67,29 @@ class AsyncSourceStream(Generic[T]):
         source_generator: AsyncGenerator[T, None],
         queue_size: int = 10000,
         logger: Optional[ContextualLogger] = None,
+        cursor: Optional[SyncCursor] = None,
+        max_queue_bytes: int = DEFAULT_MAX_QUEUE_BYTES,
     ):
         """Initialize the async source stream.
 
         Args:
             source_generator: The source async generator
-            queue_size: Size of the queue connecting producer and consumer
+            queue_size: Maximum number of entities queued between producer and consumer
             logger: Optional contextualized logger, falls back to global logger if not provided
+            cursor: Cursor the source generator updates, snapshotted for checkpoints
+            max_queue_bytes: Maximum estimated payload of the queued entities
         """
         self.source_generator = source_generator
         # Queue is used to buffer entities and implement backpressure
-        self.queue: asyncio.Queue[Optional[T]] = asyncio.Queue(maxsize=queue_size)
+        self.queue: asyncio.Queue[Optional[Union[T, CursorCheckpoint]]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self.max_queue_bytes = max_queue_bytes
+        self._queued_bytes = 0
+        self._peak_queued_bytes = 0
+        self._bytes_freed = asyncio.Event()
+        self.cursor = cursor
+        self._checkpoint_requested = False
         self.producer_task = None
         self.producer_done = asyncio.Event()
         self.producer_exception = None
@@ -67,6 +108,29 @@ class AsyncSourceStream(Generic[T]):
         """Check if stream is in an active state."""
         return self._state in (StreamState.RUNNING, StreamState.STARTING)
 
+    @property
+    def queue_depth(self) -> int:
+        """Items waiting in the queue."""
+        return self.queue.qsize()
+
+    @property
+    def queued_bytes(self) -> int:
+        """Estimated payload of the queued entities, and of one waiting for a free slot."""
+        return self._queued_bytes
+
+    @property
+    def peak_queued_bytes(self) -> int:
+        """Largest estimated payload queued at once so far."""
+        return self._peak_queued_bytes
+
+    def request_checkpoint(self) -> None:
+        """Ask the producer to queue a ``CursorCheckpoint`` after its next entity.
+
+        No-op without a cursor or while a requested checkpoint is still pending.
+        """
+        if self.cursor is not None:
+            self._checkpoint_requested = True
+
     async def __aenter__(self):
         """Context manager entry point."""
         await self.start()
@@ -88,17 +152,25 @@ class AsyncSourceStream(Generic[T]):
                     self.logger.debug(f"Producer stopping early due to state: {self._state}")
                     break
 
-                # Put item in queue, waiting if queue is full.
-                # This is a blocking call, so producer will wait until the queue has space
+                # Put item in queue, waiting until the queued entities leave room for
+                # it (bytes) and the queue has a free slot (count).
                 # Effectively, this is a backpressure mechanism.
+                await self._reserve_bytes(self._item_bytes(item))
                 await self.queue.put(item)
                 items_produced += 1
 
+                # The generator is suspended at its yield, so the cursor covers
+                # at most the entities queued so far.
+                if self._checkpoint_requested:
+                    self._checkpoint_requested = False
+                    await self.queue.put(CursorCheckpoint(self.cursor.get(), items_produced))
+
                 # Log progress periodically
                 if items_produced % 50 == 0:
                     self.logger.debug(
                         f"AsyncSourceStream producer progress: {items_produced} items queued, "
-                        f"queue size: {self.queue.qsize()}/{self.queue.maxsize}"
+                        f"queue size: {self.queue.qsize()}/{self.queue.maxsize}, "
+                        f"queued bytes: {self._queued_bytes}/{self.max_queue_bytes}"
                     )
 
             self.logger.info(f"Source generator exhausted after producing {items_produced} items")
@@ -187,8 +259,11 @@ class AsyncSourceStream(Generic[T]):
             if self._state == StreamState.STOPPING:
                 self._state = StreamState.FINISHED
 
-    async def get_entities(self) -> AsyncGenerator[T, None]:
-        """Get entities with timeout to prevent cleanup deadlock."""
+    async def get_entities(self) -> AsyncGenerator[Union[T, CursorCheckpoint], None]:
+        """Get entities with timeout to prevent cleanup deadlock.
+
+        ``CursorCheckpoint`` markers are only yielded after ``request_checkpoint``.
+        """
         if not self.producer_task:
             await self.start()
 
@@ -212,7 +287,7 @@ class AsyncSourceStream(Generic[T]):
         finally:
             await self._drain_queue()
 
-    async def _get_next_item(self) -> Optional[T]:
+    async def _get_next_item(self) -> Optional[Union[T, CursorCheckpoint]]:
         """Get next item from queue with timeout handling.
 
         Returns:
@@ -223,6 +298,7 @@ class AsyncSourceStream(Generic[T]):
                 # Try to get with timeout
                 item = await asyncio.wait_for(self.queue.get(), timeout=2)
                 self.queue.task_done()
+                self._release_bytes(self._item_bytes(item))
                 return item
 
             except asyncio.TimeoutError:
@@ -251,7 +327,8 @@ class AsyncSourceStream(Generic[T]):
             if item is None:
                 return True  # Stream complete
 
-            # Put back real entities for consumer to process
+            # Put back real entities for consumer to process (the producer is done,
+            # so there's nothing to wait for; the bytes were never released)
             await self.queue.put(item)
             return False  # Still have items to process
         except asyncio.QueueEmpty:
@@ -271,3 +348,25 @@ class AsyncSourceStream(Generic[T]):
                 self.queue.task_done()
         except Exception:
             pass  # Best effort cleanup
+        self._queued_bytes = 0
+        self._bytes_freed.set()
+
+    @staticmethod
+    def _item_bytes(item: Optional[Union[T, CursorCheckpoint]]) -> int:
+        """Bytes an item counts for against the budget (markers count for none)."""
+        if item is None or isinstance(item, CursorCheckpoint):
+            return 0
+        return estimate_payload_bytes(item)
+
+    async def _reserve_bytes(self, size: int) -> None:
+        """Wait until ``size`` more bytes fit in the budget, then count them as queued."""
+        while self._queued_bytes > 0 and self._queued_bytes + size > self.max_queue_bytes:
+            self._bytes_freed.clear()
+            await self._bytes_freed.wait()
+        self._queued_bytes += size
+        self._peak_queued_bytes = max(self._peak_queued_bytes, self._queued_bytes)
+
+    def _release_bytes(self, size: int) -> None:
+        if size:
+            self._queued_bytes = max(0, self._queued_bytes - size)
+            self._bytes_freed.set()
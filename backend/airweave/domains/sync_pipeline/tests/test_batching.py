@@ -0,0 +1,211 @@
+"""Tests for size-aware micro-batching — payload estimates, batch closing and tuning."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.domains.sync_pipeline.batching import (
+    ENTITY_OVERHEAD_BYTES,
+    AdaptiveBatcher,
+    BatchCloseReason,
+    EntityBatch,
+    estimate_payload_bytes,
+)
+from airweave.domains.sync_pipeline.config import SyncConfig
+from airweave.domains.sync_pipeline.config.base import BehaviorConfig
+from airweave.domains.sync_pipeline.orchestrator import SyncOrchestrator
+from airweave.domains.sync_pipeline.stream import AsyncSourceStream
+from airweave.domains.sync_pipeline.worker_pool import AsyncWorkerPool
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.entities._base import FileEntity
+
+KiB = 2**10
+
+
+class _TestFileEntity(FileEntity):
+    file_id: str = AirweaveField(..., is_entity_id=True)
+    title: str = AirweaveField(..., is_name=True)
+
+
+def _file(size: int) -> _TestFileEntity:
+    return _TestFileEntity(
+        file_id="f1",
+        title="report.pdf",
+        breadcrumbs=[],
+        url="https://files.example.com/report.pdf",
+        size=size,
+        file_type="pdf",
+    )
+
+
+def _message(chars: int) -> SimpleNamespace:
+    return SimpleNamespace(text="x" * chars, channel="general", reactions=None)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestEstimatePayloadBytes:
+    def test_file_entities_weigh_their_file_size(self):
+        assert estimate_payload_bytes(_file(5 * 2**20)) == ENTITY_OVERHEAD_BYTES + 5 * 2**20
+
+    def test_other_entities_weigh_their_text_fields(self):
+        assert estimate_payload_bytes(_message(1000)) == ENTITY_OVERHEAD_BYTES + 1000 + 7
+
+    def test_built_textual_representation_is_preferred(self):
+        entity = SimpleNamespace(text="x" * 1000, textual_representation="short")
+
+        assert estimate_payload_bytes(entity) == ENTITY_OVERHEAD_BYTES + 5
+
+
+class TestClosingBatches:
+    def test_small_entities_close_on_the_entity_ceiling(self):
+        batcher = AdaptiveBatcher(batch_size=3, initial_bytes=2**20)
+
+        closed = [batch for _ in range(7) for batch in batcher.add(_message(100))]
+
+        assert [(len(b.entities), b.reason) for b in closed] == [
+            (3, BatchCloseReason.ENTITIES),
+            (3, BatchCloseReason.ENTITIES),
+        ]
+        assert batcher.pending == 1
+
+    def test_large_entities_close_on_the_payload_budget(self):
+        batcher = AdaptiveBatcher(batch_size=64, initial_bytes=512 * KiB, min_bytes=KiB)
+
+        closed = [batch for _ in range(10) for batch in batcher.add(_file(200 * KiB))]
+
+        assert [len(b.entities) for b in closed] == [2, 2, 2, 2]
+        assert all(b.reason == BatchCloseReason.BYTES for b in closed)
+        assert all(b.payload_bytes <= 512 * KiB for b in closed)
+
+    def test_oversized_entity_goes_alone(self):
+        batcher = AdaptiveBatcher(batch_size=64, initial_bytes=512 * KiB, min_bytes=KiB)
+        batcher.add(_message(100))
+        batcher.add(_message(100))
+
+        closed = batcher.add(_file(10 * 2**20))
+
+        assert [len(b.entities) for b in closed] == [2, 1]
+        assert batcher.pending == 0
+
+    def test_latency_deadline_closes_a_slow_filling_batch(self):
+        clock = _Clock()
+        batcher = AdaptiveBatcher(batch_size=64, max_batch_latency_ms=200, clock=clock)
+
+        assert batcher.add(_message(10)) == []
+        clock.now = 0.25
+        closed = batcher.add(_message(10))
+
+        assert [(len(b.entities), b.reason) for b in closed] == [(2, BatchCloseReason.LATENCY)]
+
+    def test_flush_closes_the_open_batch_once(self):
+        batcher = AdaptiveBatcher(batch_size=64)
+        batcher.add(_message(10))
+
+        batch = batcher.flush(BatchCloseReason.END)
+
+        assert batch.reason == BatchCloseReason.END
+        assert len(batch.entities) == 1
+        assert batcher.flush(BatchCloseReason.END) is None
+
+
+class TestTuning:
+    def _batch(self, payload_bytes: int, reason: str = BatchCloseReason.BYTES) -> EntityBatch:
+        return EntityBatch(entities=[object()], payload_bytes=payload_bytes, reason=reason)
+
+    def test_slow_batches_shrink_the_budget_by_at_most_half(self):
+        batcher = AdaptiveBatcher(batch_size=64, target_latency_ms=1000, initial_bytes=2**20)
+
+        batcher.observe(self._batch(2**20), seconds=10.0)
+
+        assert batcher.budget_bytes == 2**19
+
+    def test_fast_batches_grow_the_budget_up_to_the_maximum(self):
+        batcher = AdaptiveBatcher(
+            batch_size=64, target_latency_ms=1000, initial_bytes=2**20, max_bytes=3 * 2**20
+        )
+
+        for _ in range(5):
+            batcher.observe(self._batch(batcher.budget_bytes), seconds=0.01)
+
+        assert batcher.budget_bytes == 3 * 2**20
+
+    def test_budget_settles_where_batches_take_the_target_latency(self):
+        batcher = AdaptiveBatcher(batch_size=64, target_latency_ms=1000, initial_bytes=2**20)
+
+        # 4 MiB per second
+        for _ in range(10):
+            batcher.observe(self._batch(batcher.budget_bytes), batcher.budget_bytes / 2**22)
+
+        assert batcher.budget_bytes == 2**22
+
+    def test_entity_ceiling_grows_for_fast_batches_of_small_entities(self):
+        batcher = AdaptiveBatcher(batch_size=64, target_latency_ms=1000, max_entity_growth=4)
+
+        for _ in range(5):
+            batcher.observe(self._batch(64 * KiB, BatchCloseReason.ENTITIES), seconds=0.1)
+        assert batcher.entity_limit == 256
+
+        batcher.observe(self._batch(64 * KiB, BatchCloseReason.ENTITIES), seconds=2.0)
+        assert batcher.entity_limit == 128
+
+    def test_invalid_limits_are_rejected(self):
+        with pytest.raises(ValueError):
+            AdaptiveBatcher(batch_size=0)
+
+
+class TestOrchestratorBatching:
+    @pytest.mark.asyncio
+    async def test_large_files_are_processed_apart_from_small_entities(self, monkeypatch):
+        monkeypatch.setattr(
+            "airweave.domains.sync_pipeline.orchestrator.settings.SYNC_BATCH_INITIAL_BYTES",
+            2**20,
+        )
+        processed: list[list] = []
+
+        async def process(entities, sync_context, runtime):
+            processed.append(list(entities))
+
+        async def source():
+            for _ in range(3):
+                yield _message(100)
+            yield _file(20 * 2**20)
+            for _ in range(3):
+                yield _message(100)
+
+        sync_context = MagicMock()
+        sync_context.execution_config = SyncConfig(behavior=BehaviorConfig(skip_guardrails=True))
+        sync_context.batch_size = 64
+        sync_context.max_batch_latency_ms = 0
+
+        runtime = MagicMock()
+        runtime.source = SimpleNamespace(source_name="test")
+        runtime.entity_tracker.record_skipped = AsyncMock()
+
+        orchestrator = SyncOrchestrator(
+            entity_pipeline=SimpleNamespace(process=process),
+            worker_pool=AsyncWorkerPool(logger=MagicMock()),
+            stream=AsyncSourceStream(source(), queue_size=10, logger=MagicMock()),
+            sync_context=sync_context,
+            runtime=runtime,
+            access_control_pipeline=MagicMock(),
+            event_bus=MagicMock(),
+            usage_checker=MagicMock(),
+            usage_ledger=MagicMock(),
+            sync_cursor_service=MagicMock(),
+            state_machine=MagicMock(),
+            lifecycle_data=MagicMock(),
+            sync_state_machine=MagicMock(),
+        )
+        await orchestrator.stream.start()
+        await orchestrator._process_entities()
+
+        assert sorted(len(batch) for batch in processed) == [1, 3, 3]
+        assert [b for b in processed if len(b) == 1][0][0].size == 20 * 2**20
@@ -12,6 +12,7 @@ _TEXT_BUILDER_CLS = (
     "airweave.domains.sync_pipeline.processors.chunk_embed.TextualRepresentationBuilder"
 )
 _SEMANTIC_CHUNKER = "airweave.platform.chunkers.semantic.SemanticChunker"
+_CODE_LANGUAGE_DETECTOR = "airweave.platform.chunkers.code_language.CodeLanguageDetector"
 
 
 @pytest.fixture
@@ -95,6 +96,52 @@ class TestChunkEmbedProcessor:
 
             mock_chunker.chunk_batch.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_injected_text_chunker_replaces_semantic_chunker(
+        self, mock_dense_embedder, mock_sparse_embedder, mock_sync_context, mock_entity
+    ):
+        text_chunker = MagicMock()
+        text_chunker.chunk_batch = AsyncMock(return_value=[[{"text": "Only chunk"}]])
+        processor = ChunkEmbedProcessor(
+            converter_registry=FakeConverterRegistry(),
+            dense_embedder=mock_dense_embedder,
+            sparse_embedder=mock_sparse_embedder,
+            text_chunker=text_chunker,
+        )
+
+        with patch(_SEMANTIC_CHUNKER) as MockSemanticChunker:
+            chunks = await processor._chunk_textual_entities([mock_entity], mock_sync_context)
+
+        text_chunker.chunk_batch.assert_awaited_once_with(["Test content"])
+        MockSemanticChunker.assert_not_called()
+        assert len(chunks) == 1
+
+    @pytest.mark.asyncio
+    async def test_code_without_a_grammar_is_skipped_before_chunking(
+        self, mock_dense_embedder, mock_sparse_embedder, mock_sync_context, mock_runtime
+    ):
+        code, prose = _make_entity("code", "def f(): pass"), _make_entity("prose", "hello")
+        code_chunker = MagicMock()
+        code_chunker.chunk_batch = AsyncMock(return_value=[[{"text": "def f(): pass"}]])
+        processor = ChunkEmbedProcessor(
+            converter_registry=FakeConverterRegistry(),
+            dense_embedder=mock_dense_embedder,
+            sparse_embedder=mock_sparse_embedder,
+            code_chunker=code_chunker,
+        )
+        detector = MagicMock()
+        detector.detect_batch.return_value = ["python", None]
+
+        with patch(_CODE_LANGUAGE_DETECTOR, return_value=detector):
+            chunks = await processor._chunk_code_entities(
+                [code, prose], mock_sync_context, mock_runtime
+            )
+
+        detector.detect_batch.assert_called_once_with(["def f(): pass", "hello"])
+        code_chunker.chunk_batch.assert_awaited_once_with(["def f(): pass"])
+        mock_runtime.entity_tracker.record_skipped.assert_awaited_once_with(1)
+        assert len(chunks) == 1
+
     @pytest.mark.asyncio
     async def test_multiply_entities_creates_chunk_suffix(self, processor, mock_sync_context):
         mock_entity = MagicMock()
@@ -206,15 +253,14 @@ class TestChunkEmbedProcessor:
         assert mock_entity.airweave_system_metadata.sparse_embedding == sparse_embedding
 
     @pytest.mark.asyncio
-    async def test_embed_entities_uses_full_json_for_sparse(
+    async def test_embed_entities_uses_chunk_text_and_keywords_for_sparse(
         self, processor, mock_sync_context, mock_dense_embedder, mock_sparse_embedder
     ):
         mock_entity = MagicMock()
-        mock_entity.textual_representation = "Test"
+        mock_entity.textual_representation = "Chunk body"
         mock_entity.airweave_system_metadata = MagicMock()
-        mock_entity.model_dump = MagicMock(
-            return_value={"entity_id": "test-123", "name": "Test Entity"}
-        )
+        mock_entity.airweave_system_metadata.original_entity_id = "test-123"
+        mock_entity.model_dump = MagicMock(return_value={"name": "Test Entity"})
 
         dense_result = MagicMock()
         dense_result.vector = [0.1] * 3072
@@ -224,13 +270,7 @@ class TestChunkEmbedProcessor:
         await processor._embed_entities([mock_entity], mock_sync_context)
 
         call_args = mock_sparse_embedder.embed_many.call_args[0][0]
-        assert isinstance(call_args, list)
-        assert isinstance(call_args[0], str)
-
-        import json
-
-        parsed = json.loads(call_args[0])
-        assert "entity_id" in parsed
+        assert call_args == ["Chunk body\n\ntest-123\nTest Entity"]
 
     @pytest.mark.asyncio
     async def test_embed_entities_validates_embeddings_exist(
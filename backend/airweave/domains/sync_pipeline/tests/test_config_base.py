@@ -66,6 +66,7 @@ class TestCursorConfig:
         config = CursorConfig()
         assert config.skip_load is False
         assert config.skip_updates is False
+        assert config.checkpoint_interval_seconds == 300
 
     def test_with_custom_values(self):
         """Test cursor config with custom values."""
@@ -0,0 +1,171 @@
+"""Tests for mid-sync cursor checkpoints (stream markers and orchestrator persistence)."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import ClassVar
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.domains.sync_pipeline.config.base import BehaviorConfig, CursorConfig, SyncConfig
+from airweave.domains.sync_pipeline.orchestrator import SyncOrchestrator
+from airweave.domains.sync_pipeline.stream import AsyncSourceStream, CursorCheckpoint
+from airweave.domains.sync_pipeline.worker_pool import AsyncWorkerPool
+from airweave.domains.syncs.cursors.cursor import SyncCursor
+from airweave.platform.cursors import BaseCursor, GmailCursor
+
+MODULE = "airweave.domains.sync_pipeline.orchestrator"
+
+
+class _PositionCursor(BaseCursor):
+    supports_checkpoints: ClassVar[bool] = True
+
+    position: int = -1
+
+
+def _source(cursor: SyncCursor, count: int):
+    """Source that records each entity in the cursor just before yielding it."""
+
+    async def generate():
+        for i in range(count):
+            cursor.update(position=i)
+            yield i
+            await asyncio.sleep(0)
+
+    return generate()
+
+
+async def _consume(stream: AsyncSourceStream, request_at: set) -> list:
+    items = []
+    async for item in stream.get_entities():
+        items.append(item)
+        if not isinstance(item, CursorCheckpoint) and item in request_at:
+            stream.request_checkpoint()
+    return items
+
+
+class TestStreamCheckpoints:
+    @pytest.mark.asyncio
+    async def test_marker_follows_the_entities_its_cursor_covers(self):
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=_PositionCursor)
+        stream = AsyncSourceStream(
+            _source(cursor, 50), queue_size=5, logger=MagicMock(), cursor=cursor
+        )
+        await stream.start()
+
+        items = await _consume(stream, request_at={10, 30})
+
+        markers = [(i, m) for i, m in enumerate(items) if isinstance(m, CursorCheckpoint)]
+        assert len(markers) == 2
+        for index, marker in markers:
+            entities_before = [e for e in items[:index] if not isinstance(e, CursorCheckpoint)]
+            assert marker.entities_produced == len(entities_before)
+            assert marker.cursor_data["position"] == entities_before[-1]
+        assert [e for e in items if not isinstance(e, CursorCheckpoint)] == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_no_markers_without_cursor(self):
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=_PositionCursor)
+        stream = AsyncSourceStream(_source(cursor, 20), queue_size=5, logger=MagicMock())
+        await stream.start()
+
+        items = await _consume(stream, request_at={5})
+
+        assert items == list(range(20))
+
+
+def _make_orchestrator(cursor, *, force_full_sync=False, cursor_config=None, delay=0.0):
+    processed: list = []
+    saved: list = []
+
+    async def process(entities, sync_context, runtime):
+        await asyncio.sleep(delay)
+        processed.extend(entities)
+
+    async def create_or_update_cursor(db, sync_id, cursor_data, ctx, cursor_field=None):
+        saved.append((cursor_data, list(processed)))
+
+    sync_context = MagicMock()
+    sync_context.force_full_sync = force_full_sync
+    sync_context.execution_config = SyncConfig(
+        cursor=cursor_config or CursorConfig(),
+        behavior=BehaviorConfig(skip_guardrails=True),
+    )
+    sync_context.batch_size = 4
+    sync_context.max_batch_latency_ms = 0
+
+    runtime = MagicMock()
+    runtime.cursor = cursor
+    runtime.source = SimpleNamespace(source_name="test")
+    runtime.entity_tracker.record_skipped = AsyncMock()
+
+    stream = AsyncSourceStream(
+        _source(cursor, 200), queue_size=20, logger=MagicMock(), cursor=cursor
+    )
+    orchestrator = SyncOrchestrator(
+        entity_pipeline=SimpleNamespace(process=process),
+        worker_pool=AsyncWorkerPool(logger=MagicMock()),
+        stream=stream,
+        sync_context=sync_context,
+        runtime=runtime,
+        access_control_pipeline=MagicMock(),
+        event_bus=MagicMock(),
+        usage_checker=MagicMock(),
+        usage_ledger=MagicMock(),
+        sync_cursor_service=SimpleNamespace(create_or_update_cursor=create_or_update_cursor),
+        state_machine=MagicMock(),
+        lifecycle_data=MagicMock(),
+        sync_state_machine=MagicMock(),
+    )
+    return orchestrator, processed, saved
+
+
+async def _process(orchestrator, interval):
+    await orchestrator.stream.start()
+    with (
+        patch(f"{MODULE}.get_db_context", MagicMock()),
+        patch.object(orchestrator, "_checkpoint_interval", return_value=interval),
+    ):
+        await orchestrator._process_entities()
+
+
+class TestOrchestratorCheckpoints:
+    @pytest.mark.asyncio
+    async def test_checkpoints_only_after_covered_entities_are_processed(self):
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=_PositionCursor)
+        orchestrator, processed, saved = _make_orchestrator(cursor, delay=0.002)
+
+        await _process(orchestrator, interval=0.005)
+
+        assert sorted(processed) == list(range(200))
+        assert saved
+        for cursor_data, processed_before in saved:
+            covered = range(cursor_data["position"] + 1)
+            assert set(covered) <= set(processed_before)
+
+    @pytest.mark.parametrize(
+        "cursor_schema, force_full_sync, cursor_config",
+        [
+            (GmailCursor, False, CursorConfig()),
+            (_PositionCursor, True, CursorConfig()),
+            (_PositionCursor, False, CursorConfig(skip_load=True)),
+            (_PositionCursor, False, CursorConfig(skip_updates=True)),
+            (_PositionCursor, False, CursorConfig(checkpoint_interval_seconds=0)),
+        ],
+    )
+    def test_checkpoint_interval_disabled(self, cursor_schema, force_full_sync, cursor_config):
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=cursor_schema)
+        orchestrator, _, _ = _make_orchestrator(
+            cursor, force_full_sync=force_full_sync, cursor_config=cursor_config
+        )
+
+        assert orchestrator._checkpoint_interval() is None
+
+    def test_checkpoint_interval_from_config(self):
+        cursor = SyncCursor(sync_id=uuid4(), cursor_schema=_PositionCursor)
+        orchestrator, _, _ = _make_orchestrator(
+            cursor, cursor_config=CursorConfig(checkpoint_interval_seconds=60)
+        )
+
+        assert orchestrator._checkpoint_interval() == 60
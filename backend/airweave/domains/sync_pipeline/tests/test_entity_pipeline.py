@@ -1,4 +1,4 @@
-"""Tests for EntityPipeline — DI wiring and orphan identification."""
+"""Tests for EntityPipeline — DI wiring, dedupe and orphan identification."""
 
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -6,6 +6,9 @@ from uuid import uuid4
 import pytest
 
 from airweave.domains.sync_pipeline.entity.pipeline import EntityPipeline
+from airweave.domains.sync_pipeline.pipeline.entity_tracker import EntityTracker
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.entities._base import BaseEntity
 
 # ---------------------------------------------------------------------------
 # Constructor
@@ -117,3 +120,41 @@ async def test_identify_orphans_empty_when_all_encountered():
         orphans = await pipeline._identify_orphans(sync_context)
 
     assert orphans == {}
+
+
+# ---------------------------------------------------------------------------
+# _track_and_dedupe — one batched tracker update per batch
+# ---------------------------------------------------------------------------
+
+
+class _DocEntity(BaseEntity):
+    doc_id: str = AirweaveField(..., is_entity_id=True)
+    title: str = AirweaveField(..., is_name=True)
+
+
+def _docs(*ids: str) -> list:
+    return [_DocEntity(doc_id=i, title=f"Doc {i}", breadcrumbs=[]) for i in ids]
+
+
+@pytest.mark.asyncio
+async def test_track_and_dedupe_tracks_the_batch_in_one_update():
+    """Duplicates across and within batches are dropped and counted as skipped."""
+    tracker = EntityTracker(job_id=uuid4(), sync_id=uuid4(), logger=MagicMock())
+    tracker.track_entity = AsyncMock(side_effect=AssertionError("per-entity tracking"))
+    tracker.record_skipped = AsyncMock(side_effect=AssertionError("separate skip count"))
+    pipeline = EntityPipeline(
+        entity_tracker=tracker,
+        event_bus=MagicMock(),
+        action_resolver=MagicMock(),
+        action_dispatcher=MagicMock(),
+        entity_repo=MagicMock(),
+    )
+    sync_context = MagicMock()
+
+    first = await pipeline._track_and_dedupe(_docs("a", "b", "a"), sync_context)
+    second = await pipeline._track_and_dedupe(_docs("b", "c"), sync_context)
+
+    assert [e.entity_id for e in first] == ["a", "b"]
+    assert [e.entity_id for e in second] == ["c"]
+    assert tracker.get_encountered_count() == {"_DocEntity": 3}
+    assert tracker.stats.skipped == 2
@@ -0,0 +1,130 @@
+"""Tests for the sync pipeline flight recorder."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from airweave.adapters.metrics import FakeSyncPipelineMetrics
+from airweave.domains.sync_pipeline.flight_recorder import (
+    SyncFlightRecorder,
+    SyncStage,
+    stage,
+)
+
+
+async def _work(stage_name: str, seconds: float) -> None:
+    with stage(stage_name):
+        await asyncio.sleep(seconds)
+
+
+@pytest.fixture
+def recorder():
+    return SyncFlightRecorder(batch_capacity=3, finished_jobs=2)
+
+
+class TestBatches:
+    @pytest.mark.asyncio
+    async def test_stages_are_recorded_per_batch(self, recorder):
+        job_id = uuid4()
+        with recorder.batch(job_id, "slack", entity_count=10):
+            await _work(SyncStage.HASH, 0.01)
+            await _work(SyncStage.EMBED, 0.03)
+
+        summary = recorder.summary(job_id)
+
+        assert summary["batches"] == 1
+        assert summary["entities"] == 10
+        assert list(summary["stage_ms_total"]) == ["embed", "hash"]
+        assert summary["stage_ms_total"]["embed"] >= 30
+        assert summary["stage_share"]["embed"] > summary["stage_share"]["hash"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sub_tasks_add_to_the_same_batch(self, recorder):
+        job_id = uuid4()
+        with recorder.batch(job_id, "slack", entity_count=2):
+            await asyncio.gather(_work(SyncStage.FEED, 0.02), _work(SyncStage.FEED, 0.02))
+
+        assert recorder.summary(job_id)["stage_ms_total"]["feed"] >= 40
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_do_not_mix(self, recorder):
+        job_a, job_b = uuid4(), uuid4()
+
+        async def run(job_id, stage_name):
+            with recorder.batch(job_id, "slack", entity_count=1):
+                await _work(stage_name, 0.01)
+
+        await asyncio.gather(run(job_a, SyncStage.CHUNK), run(job_b, SyncStage.POSTGRES))
+
+        assert list(recorder.summary(job_a)["stage_ms_total"]) == ["chunk"]
+        assert list(recorder.summary(job_b)["stage_ms_total"]) == ["postgres"]
+
+    def test_stage_outside_a_batch_is_a_noop(self, recorder):
+        with stage(SyncStage.FEED):
+            pass
+
+        assert recorder.snapshot() == {"active": [], "finished": []}
+
+    def test_recent_batches_are_a_ring_buffer(self, recorder):
+        job_id = uuid4()
+        for _ in range(5):
+            with recorder.batch(job_id, "slack", entity_count=1):
+                pass
+
+        [job] = recorder.snapshot()["active"]
+
+        assert job["batches"] == 5
+        assert [b["batch_seq"] for b in job["recent_batches"]] == [3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_timings_are_exported_to_metrics(self, recorder):
+        metrics = FakeSyncPipelineMetrics()
+        recorder.set_metrics(metrics)
+
+        with recorder.batch(uuid4(), "notion", entity_count=7):
+            await _work(SyncStage.EMBED, 0.01)
+
+        assert [(s.stage, s.source) for s in metrics.stages] == [("embed", "notion")]
+        assert metrics.batches[0].entity_count == 7
+        assert metrics.batches[0].duration >= metrics.stages[0].duration
+
+    def test_batch_shapes_are_summarized_and_exported(self, recorder):
+        metrics = FakeSyncPipelineMetrics()
+        recorder.set_metrics(metrics)
+        job_id = uuid4()
+
+        recorder.record_batch_shape(job_id, "drive", payload_bytes=3000, reason="bytes")
+        recorder.record_batch_shape(job_id, "drive", payload_bytes=1000, reason="latency")
+        recorder.record_batch_shape(job_id, "drive", payload_bytes=2000, reason="bytes")
+
+        summary = recorder.summary(job_id)
+        assert summary["payload_bytes"] == 6000
+        assert summary["avg_batch_payload_bytes"] == 2000
+        assert summary["batch_close_reasons"] == {"bytes": 2, "latency": 1}
+        assert [(s.payload_bytes, s.reason) for s in metrics.shapes][0] == (3000, "bytes")
+
+
+class TestJobs:
+    def test_finished_jobs_are_kept_up_to_capacity(self, recorder):
+        job_ids = [uuid4() for _ in range(3)]
+        for job_id in job_ids:
+            with recorder.batch(job_id, "slack", entity_count=1):
+                pass
+            recorder.finish_job(job_id)
+
+        snapshot = recorder.snapshot()
+
+        assert snapshot["active"] == []
+        assert [j["sync_job_id"] for j in snapshot["finished"]] == [
+            str(job_ids[2]),
+            str(job_ids[1]),
+        ]
+        assert recorder.summary(job_ids[0]) is None
+        assert recorder.summary(job_ids[2])["batches"] == 1
+
+    def test_job_without_batches_has_no_summary(self, recorder):
+        job_id = uuid4()
+        recorder.finish_job(job_id)
+
+        assert recorder.summary(job_id) is None
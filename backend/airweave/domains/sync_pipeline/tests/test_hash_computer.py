@@ -0,0 +1,105 @@
+"""Tests for HashComputer file content hashing."""
+
+import hashlib
+import os
+import tempfile
+
+import pytest
+
+from airweave.domains.sync_pipeline.exceptions import EntityProcessingError
+from airweave.domains.sync_pipeline.pipeline.hash_computer import HashComputer
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.entities._base import FileEntity
+
+
+class _TestFileEntity(FileEntity):
+    file_id: str = AirweaveField(..., is_entity_id=True)
+    title: str = AirweaveField(..., is_name=True)
+
+
+def _make_file_entity(local_path: str, content_hash: str | None = None) -> _TestFileEntity:
+    entity = _TestFileEntity(
+        file_id="f1",
+        title="report.pdf",
+        breadcrumbs=[],
+        url="https://files.example.com/report.pdf",
+        size=4,
+        file_type="pdf",
+        local_path=local_path,
+    )
+    entity.local_content_sha256 = content_hash
+    return entity
+
+
+class TestFileContentHash:
+    @pytest.mark.asyncio
+    async def test_uses_digest_recorded_at_download(self):
+        entity = _make_file_entity("/does/not/exist.pdf", content_hash="abc123")
+
+        assert await HashComputer()._compute_file_content_hash(entity) == "abc123"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_reading_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "report.pdf")
+            with open(path, "wb") as f:
+                f.write(b"data")
+            entity = _make_file_entity(path)
+
+            result = await HashComputer()._compute_file_content_hash(entity)
+
+        assert result == hashlib.sha256(b"data").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_missing_local_path_raises(self):
+        entity = _make_file_entity(None, content_hash="abc123")
+
+        with pytest.raises(EntityProcessingError, match="missing local_path"):
+            await HashComputer()._compute_file_content_hash(entity)
+
+    @pytest.mark.asyncio
+    async def test_entity_hash_independent_of_hash_source(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "report.pdf")
+            with open(path, "wb") as f:
+                f.write(b"data")
+            from_disk = _make_file_entity(path)
+            precomputed = _make_file_entity(path, hashlib.sha256(b"data").hexdigest())
+
+            computer = HashComputer()
+            assert await computer.compute_for_entity(from_disk) == (
+                await computer.compute_for_entity(precomputed)
+            )
+
+    @pytest.mark.asyncio
+    async def test_source_content_hash_field_stays_in_the_metadata_hash(self):
+        """A source's own ``content_hash`` field (Dropbox) is hashed like any other field."""
+
+        class _HashedFileEntity(_TestFileEntity):
+            content_hash: str | None = AirweaveField(None)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "report.pdf")
+            with open(path, "wb") as f:
+                f.write(b"data")
+            entities = [
+                _HashedFileEntity(
+                    file_id="f1",
+                    title="report.pdf",
+                    breadcrumbs=[],
+                    url="https://files.example.com/report.pdf",
+                    size=4,
+                    file_type="pdf",
+                    local_path=path,
+                    content_hash=block_hash,
+                )
+                for block_hash in ("block-a", "block-b")
+            ]
+            for entity in entities:
+                entity.local_content_sha256 = hashlib.sha256(b"data").hexdigest()
+
+            computer = HashComputer()
+            first, second = [await computer.compute_for_entity(e) for e in entities]
+
+        assert entities[0].content_hash == "block-a"
+        assert first != second
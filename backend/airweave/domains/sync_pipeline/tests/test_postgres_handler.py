@@ -309,3 +309,33 @@ class TestHandleBatch:
         await handler.handle_batch(batch, ctx, MagicMock())
 
         repo.bulk_create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_writes_inserts_last(self):
+        """Inserts lock the sync's entity_count rows until commit, so they run last."""
+        handler, repo = _make_handler()
+        ctx = FakeSyncContext()
+        calls = []
+        repo.bulk_update_hash.side_effect = lambda *a, **kw: calls.append("update")
+        repo.bulk_remove.side_effect = lambda *a, **kw: calls.append("delete")
+        repo.bulk_create.side_effect = lambda *a, **kw: calls.append("insert")
+        update, delete = _make_update("e2"), _make_delete("e3")
+        batch = EntityActionBatch(
+            inserts=[_make_insert("e1")],
+            updates=[update],
+            deletes=[delete],
+            existing_map={
+                ("e2", "stub"): SimpleNamespace(id=uuid4()),
+                ("e3", "stub"): SimpleNamespace(id=uuid4()),
+            },
+        )
+
+        with patch(_GET_DB_CTX) as mock_db_ctx:
+            mock_db = MagicMock()
+            mock_db.commit = AsyncMock(side_effect=lambda: calls.append("commit"))
+            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_db)
+            mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=False)
+
+            await handler.handle_batch(batch, ctx, MagicMock())
+
+        assert calls == ["update", "delete", "insert", "commit"]
@@ -0,0 +1,99 @@
+"""Tests for SparseTextBuilder."""
+
+from typing import Any, Dict, List, Optional
+
+from airweave.domains.sync_pipeline.pipeline.sparse_text_builder import SparseTextBuilder
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.entities._base import (
+    AccessControl,
+    AirweaveSystemMetadata,
+    BaseEntity,
+    Breadcrumb,
+)
+
+
+class _TicketEntity(BaseEntity):
+    ticket_id: str = AirweaveField(..., is_entity_id=True)
+    title: str = AirweaveField(..., is_name=True, embeddable=True)
+    status: Optional[str] = AirweaveField(None, embeddable=True)
+    priority: Optional[int] = AirweaveField(None, embeddable=True)
+    is_urgent: bool = AirweaveField(False, embeddable=True)
+    labels: List[str] = AirweaveField(default_factory=list, embeddable=True)
+    assignee: Optional[Dict[str, Any]] = AirweaveField(None, embeddable=True)
+    download_url: Optional[str] = AirweaveField(None, embeddable=False, unhashable=True)
+
+
+def _chunk(idx: int, text: str, parent_id: str = "TCK-1", **fields) -> _TicketEntity:
+    entity = _TicketEntity(
+        ticket_id=parent_id,
+        entity_id=f"{parent_id}__chunk_{idx}",
+        title=fields.pop("title", "Login page times out"),
+        name="Login page times out",
+        breadcrumbs=[Breadcrumb(entity_id="p1", name="Platform", entity_type="ProjectEntity")],
+        status=fields.pop("status", "open"),
+        priority=2,
+        is_urgent=True,
+        labels=["auth", "frontend"],
+        assignee={"name": "Dana Smith", "email": "dana@example.com"},
+        download_url="https://files.example.com/x?token=secret",
+        access=AccessControl(viewers=["user:dana@example.com"]),
+        textual_representation=text,
+        airweave_system_metadata=AirweaveSystemMetadata(
+            original_entity_id=parent_id, chunk_index=idx, hash="abc"
+        ),
+        **fields,
+    )
+    return entity
+
+
+class TestSparseTextBuilder:
+    def test_chunk_text_followed_by_parent_keywords(self):
+        [text] = SparseTextBuilder().build_for_batch([_chunk(0, "Users see a spinner")])
+
+        body, block = text.split("\n\n", 1)
+        assert body == "Users see a spinner"
+        lines = block.split("\n")
+        assert lines[0] == "TCK-1"
+        for expected in ("Login page times out", "Platform", "open", "2", "auth", "Dana Smith"):
+            assert expected in lines
+
+    def test_excludes_noise_and_unhashable_fields(self):
+        [text] = SparseTextBuilder().build_for_batch([_chunk(0, "body")])
+
+        assert "token=secret" not in text
+        assert "user:dana@example.com" not in text
+        assert "__chunk_" not in text
+        assert "abc" not in text.split("\n")  # system metadata hash
+        assert "True" not in text and "true" not in text
+        assert '"' not in text  # no JSON keys or quoting
+
+    def test_keyword_values_are_deduplicated(self):
+        [text] = SparseTextBuilder().build_for_batch([_chunk(0, "body")])
+
+        # title and name carry the same value
+        assert text.split("\n").count("Login page times out") == 1
+
+    def test_keyword_block_built_once_per_parent(self, monkeypatch):
+        builder = SparseTextBuilder()
+        calls = []
+        original = builder.build_keyword_block
+
+        def counting(entity, original_id=None):
+            calls.append(original_id)
+            return original(entity, original_id)
+
+        monkeypatch.setattr(builder, "build_keyword_block", counting)
+        chunks = [_chunk(i, f"part {i}") for i in range(3)] + [_chunk(0, "other", "TCK-2")]
+
+        texts = builder.build_for_batch(chunks)
+
+        assert calls == ["TCK-1", "TCK-2"]
+        assert [t.split("\n\n", 1)[0] for t in texts] == ["part 0", "part 1", "part 2", "other"]
+        assert texts[0].split("\n\n", 1)[1] == texts[2].split("\n\n", 1)[1]
+
+    def test_long_embeddable_values_are_left_to_the_chunk_text(self):
+        long_text = "retry budget exhausted " * 20
+        [text] = SparseTextBuilder().build_for_batch([_chunk(0, "body", status=long_text)])
+
+        assert "exhausted" not in text
+        assert "Login page times out" in text  # short embeddable values stay
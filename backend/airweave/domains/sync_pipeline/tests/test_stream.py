@@ -0,0 +1,82 @@
+"""Tests for AsyncSourceStream's byte-budgeted backpressure."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.domains.sync_pipeline.batching import ENTITY_OVERHEAD_BYTES
+from airweave.domains.sync_pipeline.stream import AsyncSourceStream
+
+KiB = 2**10
+
+
+def _entity(chars: int) -> SimpleNamespace:
+    return SimpleNamespace(text="x" * chars)
+
+
+def _source(entities: list):
+    async def generate():
+        for entity in entities:
+            yield entity
+
+    return generate()
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestByteBudget:
+    @pytest.mark.asyncio
+    async def test_producer_waits_once_the_byte_budget_is_full(self):
+        size = ENTITY_OVERHEAD_BYTES + 100 * KiB
+        stream = AsyncSourceStream(
+            _source([_entity(100 * KiB) for _ in range(10)]),
+            queue_size=1000,
+            logger=MagicMock(),
+            max_queue_bytes=3 * size,
+        )
+        await stream.start()
+        await _settle()
+
+        assert stream.queue_depth == 3
+        assert stream.queued_bytes == 3 * size
+
+        items = [item async for item in stream.get_entities()]
+
+        assert len(items) == 10
+        assert stream.peak_queued_bytes == 3 * size
+        assert stream.queued_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_entity_count_still_caps_small_entities(self):
+        stream = AsyncSourceStream(
+            _source([_entity(10) for _ in range(50)]),
+            queue_size=5,
+            logger=MagicMock(),
+        )
+        await stream.start()
+        await _settle()
+
+        assert stream.queue_depth == 5
+        # The sixth entity has its bytes reserved while it waits for a free slot
+        assert stream.queued_bytes == 6 * (ENTITY_OVERHEAD_BYTES + 10)
+        assert len([item async for item in stream.get_entities()]) == 50
+
+    @pytest.mark.asyncio
+    async def test_oversized_entity_passes_through_an_empty_queue(self):
+        stream = AsyncSourceStream(
+            _source([_entity(10), _entity(10 * KiB), _entity(10)]),
+            queue_size=100,
+            logger=MagicMock(),
+            max_queue_bytes=KiB,
+        )
+        await stream.start()
+
+        items = [item async for item in stream.get_entities()]
+
+        assert [len(item.text) for item in items] == [10, 10 * KiB, 10]
+        assert stream.peak_queued_bytes == ENTITY_OVERHEAD_BYTES + 10 * KiB
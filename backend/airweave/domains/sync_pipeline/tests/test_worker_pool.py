@@ -0,0 +1,106 @@
+"""Tests for AsyncWorkerPool — bounded concurrency and resizing while running."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.domains.sync_pipeline.worker_pool import AsyncWorkerPool
+
+
+class _Work:
+    """Tasks that block until released, counting how many run at once."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> None:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+
+
+def _pool(max_workers: int) -> AsyncWorkerPool:
+    pool = AsyncWorkerPool(logger=MagicMock())
+    pool.set_max_workers(max_workers)
+    return pool
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_runs_at_most_max_workers_at_once():
+    pool = _pool(3)
+    work = _Work()
+
+    tasks = [await pool.submit(work) for _ in range(10)]
+    await _settle()
+    assert work.running == 3
+    assert pool.active_and_pending_count == 10
+
+    work.release.set()
+    await asyncio.gather(*tasks)
+    assert work.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_growing_admits_waiting_tasks():
+    pool = _pool(2)
+    work = _Work()
+    tasks = [await pool.submit(work) for _ in range(6)]
+    await _settle()
+
+    pool.set_max_workers(5)
+    await _settle()
+
+    assert work.running == 5
+    work.release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_shrinking_holds_back_new_tasks_until_under_the_limit():
+    pool = _pool(4)
+    release_first = asyncio.Event()
+    started: list[int] = []
+
+    async def job(i: int) -> None:
+        started.append(i)
+        if i < 4:
+            await release_first.wait()
+
+    tasks = [await pool.submit(job, i) for i in range(8)]
+    await _settle()
+    assert started == [0, 1, 2, 3]
+
+    pool.set_max_workers(1)
+    release_first.set()
+    await asyncio.gather(*tasks)
+
+    assert sorted(started) == list(range(8))
+    assert pool._running == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    pool = _pool(1)
+    work = _Work()
+    running = await pool.submit(work)
+    waiting = await pool.submit(work)
+    await _settle()
+
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    work.release.set()
+    await running
+
+    assert pool._running == 0
+    assert not pool._waiters
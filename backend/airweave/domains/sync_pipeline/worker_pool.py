@@ -2,7 +2,8 @@
 
 import asyncio
 import threading
-from typing import Any, Callable
+from collections import deque
+from typing import Any, Callable, Deque
 
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
@@ -11,8 +12,10 @@ from airweave.core.logging import ContextualLogger
 class AsyncWorkerPool:
     """Manages a pool of workers with controlled concurrency.
 
-    This class limits how many async tasks can run at once using a semaphore,
-    preventing system overload when processing many items in parallel.
+    This class limits how many async tasks can run at once, preventing system
+    overload when processing many items in parallel. The limit starts at
+    ``SYNC_MAX_WORKERS`` and can be changed while the pool is running (the
+    worker's resource governor shrinks it when several syncs share a pod).
     """
 
     def __init__(self, logger: ContextualLogger):
@@ -21,14 +24,29 @@ class AsyncWorkerPool:
         Args:
             logger: Logger instance for contextual logging
         """
-        self.max_workers = settings.SYNC_MAX_WORKERS
-        self.semaphore = asyncio.Semaphore(self.max_workers)
+        self._max_workers = settings.SYNC_MAX_WORKERS
+        self._running = 0
+        self._waiters: Deque[asyncio.Future] = deque()
         self.pending_tasks = set()
         self.logger = logger
 
         # Simple flag to prevent submissions after cancellation
         self._cancelled = False
 
+    @property
+    def max_workers(self) -> int:
+        """Current limit on concurrently executing tasks."""
+        return self._max_workers
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """Change the concurrency limit.
+
+        Growing admits waiting tasks right away; shrinking lets running tasks
+        finish and holds new ones back until the pool is under the new limit.
+        """
+        self._max_workers = max(1, max_workers)
+        self._wake()
+
     @property
     def active_and_pending_count(self) -> int:
         """Number of workers with tasks active or pending.
@@ -67,57 +85,88 @@ class AsyncWorkerPool:
         )
 
         task = asyncio.create_task(
-            self._run_with_semaphore(coro, task_id, *args, **kwargs), name=task_id
+            self._run_with_slot(coro, task_id, *args, **kwargs), name=task_id
         )
         task.task_id = task_id  # Store task ID for logging
         self.pending_tasks.add(task)
         task.add_done_callback(self._handle_task_completion)
         return task
 
-    async def _run_with_semaphore(self, coro: Callable, task_id: str, *args, **kwargs) -> Any:
-        """Run a coroutine with semaphore control.
+    async def _run_with_slot(self, coro: Callable, task_id: str, *args, **kwargs) -> Any:
+        """Run a coroutine in a worker slot.
 
-        Acquires a semaphore before running the coroutine, limiting concurrency.
-        Semaphore is automatically released when coroutine completes.
+        Waits for a worker slot before running the coroutine, limiting
+        concurrency. The slot is released when the coroutine completes.
         """
         thread_id = threading.get_ident()
 
         self.logger.debug(
-            f"⏳ WORKER_WAIT [{task_id}] Waiting for semaphore "
-            f"(thread: {thread_id}, available: {self.semaphore._value})"
+            f"⏳ WORKER_WAIT [{task_id}] Waiting for a worker slot "
+            f"(thread: {thread_id}, available: {self._max_workers - self._running})"
         )
 
-        async with self.semaphore:
+        await self._acquire()
+        self.logger.debug(
+            f"🚀 WORKER_START [{task_id}] Acquired worker slot, starting execution "
+            f"(thread: {thread_id})"
+        )
+
+        start_time = asyncio.get_running_loop().time()
+        try:
+            result = await coro(*args, **kwargs)
+            elapsed = asyncio.get_running_loop().time() - start_time
+
             self.logger.debug(
-                f"🚀 WORKER_START [{task_id}] Acquired semaphore, starting execution "
-                f"(thread: {thread_id})"
+                f"✅ WORKER_COMPLETE [{task_id}] Task completed successfully "
+                f"in {elapsed:.2f}s (thread: {thread_id})"
             )
+            return result
 
-            start_time = asyncio.get_running_loop().time()
-            try:
-                result = await coro(*args, **kwargs)
-                elapsed = asyncio.get_running_loop().time() - start_time
-
-                self.logger.debug(
-                    f"✅ WORKER_COMPLETE [{task_id}] Task completed successfully "
-                    f"in {elapsed:.2f}s (thread: {thread_id})"
-                )
-                return result
-
-            except asyncio.CancelledError:
-                elapsed = asyncio.get_running_loop().time() - start_time
-                self.logger.warning(
-                    f"🚫 WORKER_CANCELLED [{task_id}] "
-                    f"Cancelled after {elapsed:.2f}s (thread: {thread_id})"
-                )
-                raise
-            except Exception as e:
-                elapsed = asyncio.get_running_loop().time() - start_time
-                self.logger.warning(
-                    f"❌ WORKER_ERROR [{task_id}] Task failed after {elapsed:.2f}s "
-                    f"(thread: {thread_id}): {type(e).__name__}: {str(e)}"
-                )
-                raise
+        except asyncio.CancelledError:
+            elapsed = asyncio.get_running_loop().time() - start_time
+            self.logger.warning(
+                f"🚫 WORKER_CANCELLED [{task_id}] "
+                f"Cancelled after {elapsed:.2f}s (thread: {thread_id})"
+            )
+            raise
+        except Exception as e:
+            elapsed = asyncio.get_running_loop().time() - start_time
+            self.logger.warning(
+                f"❌ WORKER_ERROR [{task_id}] Task failed after {elapsed:.2f}s "
+                f"(thread: {thread_id}): {type(e).__name__}: {str(e)}"
+            )
+            raise
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        """Wait until fewer than ``max_workers`` tasks are executing."""
+        if self._running < self._max_workers and not self._waiters:
+            self._running += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # _wake hands the slot over before resolving the waiter
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._running -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._running < self._max_workers and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._running += 1
+                waiter.set_result(None)
 
     def _handle_task_completion(self, task: asyncio.Task) -> None:
         """Handle task completion and clean up."""
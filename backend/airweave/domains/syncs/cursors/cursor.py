@@ -84,6 +84,14 @@ class SyncCursor:
         """
         return self.get()
 
+    @property
+    def supports_checkpoints(self) -> bool:
+        """Whether the cursor may be persisted mid-sync as a resume point.
+
+        Only typed cursors whose schema opts in (``BaseCursor.supports_checkpoints``).
+        """
+        return bool(getattr(self.cursor_schema, "supports_checkpoints", False))
+
     @property
     def loaded_from_db(self) -> bool:
         """Whether this cursor was initialized with data from the database.
@@ -0,0 +1,60 @@
+"""Fake sync job state machine for testing."""
+
+from typing import Optional
+from uuid import UUID
+
+from airweave.core.context import BaseContext
+from airweave.core.shared_models import SourceConnectionErrorCategory, SyncJobStatus
+from airweave.domains.sync_pipeline.pipeline.entity_tracker import SyncStats
+from airweave.domains.syncs.jobs.protocols import SyncJobStateMachineProtocol
+from airweave.domains.syncs.jobs.types import LifecycleData, TransitionResult
+
+
+class FakeSyncJobStateMachine(SyncJobStateMachineProtocol):
+    """In-memory fake for SyncJobStateMachineProtocol.
+
+    Applies every transition and remembers the latest status per job.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with empty state."""
+        self._calls: list[tuple] = []
+        self._status: dict[UUID, SyncJobStatus] = {}
+        self._sync_metadata: dict[UUID, dict] = {}
+        self._should_raise: Optional[Exception] = None
+
+    def set_error(self, error: Exception) -> None:
+        """Make all subsequent calls raise this error."""
+        self._should_raise = error
+
+    async def transition(
+        self,
+        sync_job_id: UUID,
+        target: SyncJobStatus,
+        ctx: BaseContext,
+        *,
+        lifecycle_data: Optional[LifecycleData] = None,
+        error: Optional[str] = None,
+        stats: Optional[SyncStats] = None,
+        error_category: Optional[SourceConnectionErrorCategory] = None,
+        sync_metadata: Optional[dict] = None,
+    ) -> TransitionResult:
+        """Record call and apply the transition."""
+        self._calls.append(("transition", sync_job_id, target, error, stats))
+        if self._should_raise:
+            raise self._should_raise
+        previous = self._status.get(sync_job_id, SyncJobStatus.PENDING)
+        self._status[sync_job_id] = target
+        if sync_metadata:
+            self._sync_metadata.setdefault(sync_job_id, {}).update(sync_metadata)
+        return TransitionResult(applied=True, previous=previous, current=target)
+
+    # Test helpers
+
+    def status_of(self, sync_job_id: UUID) -> Optional[SyncJobStatus]:
+        """Latest status applied to a job."""
+        return self._status.get(sync_job_id)
+
+    def sync_metadata_of(self, sync_job_id: UUID) -> dict:
+        """sync_metadata merged into a job by its transitions."""
+        return self._sync_metadata.get(sync_job_id, {})
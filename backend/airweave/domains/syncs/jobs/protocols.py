@@ -107,6 +107,7 @@ class SyncJobStateMachineProtocol(Protocol):
         error: Optional[str] = None,
         stats: Optional[SyncStats] = None,
         error_category: Optional[SourceConnectionErrorCategory] = None,
+        sync_metadata: Optional[dict] = None,
     ) -> TransitionResult:
         """Execute a validated, idempotent status transition."""
         ...
@@ -94,6 +94,7 @@ class SyncJobStateMachine(SyncJobStateMachineProtocol):
         error: Optional[str] = None,
         stats: Optional[SyncStats] = None,
         error_category: Optional[SourceConnectionErrorCategory] = None,
+        sync_metadata: Optional[dict] = None,
     ) -> TransitionResult:
         """Execute a validated, idempotent status transition.
 
@@ -105,6 +106,7 @@ class SyncJobStateMachine(SyncJobStateMachineProtocol):
             error: Error message (valid for FAILED and CANCELLED).
             stats: Sync statistics (valid for any terminal state).
             error_category: Credential error category (written to DB for NEEDS_REAUTH UI).
+            sync_metadata: Keys merged into the job's ``sync_metadata``.
 
         Returns:
             TransitionResult indicating whether the write was applied.
@@ -129,6 +131,8 @@ class SyncJobStateMachine(SyncJobStateMachineProtocol):
             update = self._build_update(
                 target, error=error, stats=stats, error_category=error_category
             )
+            if sync_metadata:
+                update.sync_metadata = {**(db_job.sync_metadata or {}), **sync_metadata}
             await self.sync_job_repo.update(db=db, db_obj=db_job, obj_in=update, ctx=ctx)
             await db.commit()
 
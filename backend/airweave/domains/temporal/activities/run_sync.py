@@ -79,6 +79,10 @@ class RunSyncActivity:
     or update sync job status. The workflow handles state transitions via
     TransitionSyncJobActivity; RUNNING is published by the orchestrator.
 
+    A retried attempt loads the stored cursor like any other run, so it resumes
+    from the last checkpoint the orchestrator persisted mid-sync (except for
+    forced full syncs, which always start over).
+
     Dependencies:
         sync_service: Build orchestrator and run sync
         collection_repo: Fetch fresh collection data from DB
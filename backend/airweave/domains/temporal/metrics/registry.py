@@ -15,6 +15,10 @@ from uuid import UUID
 
 from airweave.core.logging import logger as _logger
 from airweave.core.protocols.worker_metrics_registry import SyncMetricDetail, SyncWorkerCount
+from airweave.platform.http_client.concurrency import (
+    AdaptiveConcurrencyRegistry,
+    adaptive_concurrency,
+)
 
 
 @runtime_checkable
@@ -30,13 +34,38 @@ class WorkerPoolProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class SourceStreamProtocol(Protocol):
+    """Structural protocol for source streams tracked by WorkerMetricsRegistry.
+
+    AsyncSourceStream (sync_pipeline) satisfies this implicitly.
+    """
+
+    @property
+    def queue_depth(self) -> int:
+        """Items waiting between the source and the orchestrator."""
+        ...
+
+    @property
+    def queued_bytes(self) -> int:
+        """Estimated payload of the waiting entities."""
+        ...
+
+
 class WorkerMetricsRegistry:
     """Global registry for tracking active activities in this worker process."""
 
-    def __init__(self) -> None:
-        """Initialize the metrics registry."""
+    def __init__(self, concurrency: Optional[AdaptiveConcurrencyRegistry] = None) -> None:
+        """Initialize the metrics registry.
+
+        Args:
+            concurrency: Per-source adaptive concurrency registry to export
+                (defaults to the process-wide one).
+        """
+        self._concurrency = concurrency or adaptive_concurrency
         self._active_activities: Dict[str, Dict[str, Any]] = {}
         self._worker_pools: Dict[str, Any] = {}
+        self._source_streams: Dict[str, tuple[str, Any]] = {}
         self._lock = asyncio.Lock()
         self._worker_start_time = datetime.now(timezone.utc)
         self._worker_id = self._generate_worker_id()
@@ -246,8 +275,31 @@ class WorkerMetricsRegistry:
         """Unregister a worker pool from metrics tracking (synchronous)."""
         self._worker_pools.pop(pool_id, None)
 
+    def get_worker_pools(self) -> Dict[str, Any]:
+        """Return the registered worker pools by pool ID (synchronous)."""
+        return dict(self._worker_pools)
+
+    def register_source_stream(self, stream_id: str, stream: Any, source_type: str) -> None:
+        """Register a sync's source stream for queue metrics (synchronous).
+
+        Args:
+            stream_id: Unique identifier (format: sync_{sync_id}_job_{sync_job_id})
+            stream: AsyncSourceStream instance to track
+            source_type: Connector short name the queue metrics are aggregated by
+        """
+        self._source_streams[stream_id] = (source_type, stream)
+
+    def unregister_source_stream(self, stream_id: str) -> None:
+        """Unregister a source stream from metrics tracking (synchronous)."""
+        self._source_streams.pop(stream_id, None)
+
     async def get_per_connector_metrics(self) -> Dict[str, Dict[str, int]]:
-        """Aggregate metrics by connector type for low-cardinality Prometheus metrics."""
+        """Aggregate metrics by connector type for low-cardinality Prometheus metrics.
+
+        Includes the adaptive concurrency state (limit, in-flight requests,
+        throttle events) summed over the connector's live source connections,
+        and the depth and estimated bytes of its syncs' source stream queues.
+        """
         async with self._lock:
             connector_stats: Dict[str, Dict[str, int]] = {}
 
@@ -283,8 +335,26 @@ class WorkerMetricsRegistry:
                         pool.active_and_pending_count
                     )
 
+            self._add_source_stream_stats(connector_stats)
+
+            for connector, concurrency_stats in self._concurrency.per_connector().items():
+                connector_stats.setdefault(
+                    connector, {"active_syncs": 0, "active_and_pending_workers": 0}
+                ).update(concurrency_stats)
+
             return connector_stats
 
+    def _add_source_stream_stats(self, connector_stats: Dict[str, Dict[str, int]]) -> None:
+        """Sum source stream queue depth and bytes into ``connector_stats``."""
+        for connector, stream in self._source_streams.values():
+            if not isinstance(stream, SourceStreamProtocol):
+                continue
+            stats = connector_stats.setdefault(
+                connector, {"active_syncs": 0, "active_and_pending_workers": 0}
+            )
+            stats["stream_queue_depth"] = stats.get("stream_queue_depth", 0) + stream.queue_depth
+            stats["stream_queued_bytes"] = stats.get("stream_queued_bytes", 0) + stream.queued_bytes
+
     async def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary metrics about this worker."""
         activities = await self.get_active_activities()
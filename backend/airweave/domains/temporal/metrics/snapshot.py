@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass, field
 
+from airweave.core.protocols.event_bus import EventSubscriberSnapshot
+
 
 @dataclass(frozen=True)
 class ConnectorSnapshot:
@@ -9,6 +11,11 @@ class ConnectorSnapshot:
 
     active_syncs: int
     active_and_pending_workers: int
+    concurrency_limit: int = 0
+    requests_in_flight: int = 0
+    throttle_events: int = 0
+    stream_queue_depth: int = 0
+    stream_queued_bytes: int = 0
 
 
 @dataclass(frozen=True)
@@ -24,5 +31,7 @@ class WorkerMetricsSnapshot:
     worker_pool_active_and_pending_count: int = 0
     connector_metrics: dict[str, ConnectorSnapshot] = field(default_factory=dict)
     sync_max_workers: int = 20
+    stream_max_queue_bytes: int = 0
     thread_pool_size: int = 100
     thread_pool_active: int = 0
+    event_subscribers: tuple[EventSubscriberSnapshot, ...] = ()
@@ -3,6 +3,7 @@
 Package structure:
     config.py         - WorkerConfig dataclass
     control_server.py - HTTP server for health/metrics/drain
+    resources.py      - ResourceGovernor (activity slots, per-sync worker counts)
     wiring.py         - Activity and workflow registration (DI wiring)
     __init__.py       - TemporalWorker class and main() entry point
 """
@@ -12,16 +13,18 @@ import signal
 from datetime import timedelta
 from typing import Any
 
-from temporalio.worker import Worker
+from temporalio.worker import FixedSizeSlotSupplier, Worker, WorkerTuner
 
 from airweave.core.config import settings
 from airweave.core.logging import logger
 
 from .config import WorkerConfig
 from .control_server import WorkerControlServer, WorkerState
+from .resources import ResourceGovernor, SystemResourceProbe
 from .wiring import create_activities, get_workflows
 
 __all__ = [
+    "ResourceGovernor",
     "TemporalWorker",
     "WorkerConfig",
     "WorkerControlServer",
@@ -30,6 +33,9 @@ __all__ = [
 ]
 
 
+# Slots for task types the governor does not size (the SDK's default)
+_SDK_DEFAULT_SLOTS = 100
+
 # =============================================================================
 # Temporal Worker
 # =============================================================================
@@ -41,6 +47,7 @@ class TemporalWorker:
     Responsibilities:
         - Start/stop the Temporal worker
         - Manage control server for health/metrics/drain
+        - Size activity concurrency to the pod's resources
         - Handle graceful shutdown
     """
 
@@ -56,8 +63,17 @@ class TemporalWorker:
         from prometheus_client import CollectorRegistry
         from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 
-        from airweave.adapters.metrics import PrometheusMetricsRenderer, PrometheusWorkerMetrics
+        from airweave.adapters.metrics import (
+            PrometheusMetricsRenderer,
+            PrometheusSyncPipelineMetrics,
+            PrometheusUsageLedgerMetrics,
+            PrometheusWorkerMetrics,
+        )
+        from airweave.core import container as container_mod
+        from airweave.db.session import async_engine
+        from airweave.domains.sync_pipeline.flight_recorder import sync_flight_recorder
         from airweave.domains.temporal.metrics import worker_metrics as metrics_registry
+        from airweave.domains.usage.ledger import UsageLedger
 
         self._config = config
         self._runtime = Runtime(
@@ -69,14 +85,30 @@ class TemporalWorker:
         )
         self._worker: Worker | None = None
         self._state = WorkerState()
+        self._governor = ResourceGovernor(
+            config,
+            SystemResourceProbe(
+                async_engine.pool,
+                pool_capacity=settings.db_pool_size + settings.db_pool_max_overflow,
+            ),
+        )
+        self._event_bus = container_mod.container.event_bus if container_mod.container else None
+        self._usage_ledger = (
+            container_mod.container.usage_ledger if container_mod.container else None
+        )
 
         registry = CollectorRegistry()
+        sync_flight_recorder.set_metrics(PrometheusSyncPipelineMetrics(registry=registry))
+        if isinstance(self._usage_ledger, UsageLedger):
+            self._usage_ledger.set_metrics(PrometheusUsageLedgerMetrics(registry=registry))
         self._control_server = WorkerControlServer(
             worker_state=self._state,
             config=config,
             registry=metrics_registry,
             worker_metrics=PrometheusWorkerMetrics(registry=registry),
             renderer=PrometheusMetricsRenderer(registry=registry),
+            event_bus=self._event_bus,
+            governor=self._governor,
         )
 
     async def start(self) -> None:
@@ -87,6 +119,8 @@ class TemporalWorker:
         except Exception as e:
             logger.warning(f"Failed to start control server (metrics unavailable): {e}")
 
+        await self._governor.start()
+
         from airweave.domains.temporal.client import get_client as get_temporal_client
 
         client = await get_temporal_client(runtime=self._runtime)
@@ -101,6 +135,7 @@ class TemporalWorker:
             workflow_runner=self._get_sandbox_runner(),
             max_concurrent_workflow_task_polls=self._config.max_concurrent_workflow_polls,
             max_concurrent_activity_task_polls=self._config.max_concurrent_activity_polls,
+            tuner=self._get_tuner(),
             sticky_queue_schedule_to_start_timeout=self._config.sticky_queue_schedule_to_start_timeout,
             nonsticky_to_sticky_poll_ratio=self._config.nonsticky_to_sticky_poll_ratio,
             default_heartbeat_throttle_interval=self._config.default_heartbeat_throttle_interval,
@@ -128,6 +163,16 @@ class TemporalWorker:
             self._state.running = False
             await self._worker.shutdown()
 
+        await self._governor.stop()
+
+        # Deliver domain events finished activities published (webhooks, billing)
+        if self._event_bus is not None:
+            await self._event_bus.close()
+
+        # Write the usage those events recorded
+        if self._usage_ledger is not None:
+            await self._usage_ledger.close()
+
         await self._control_server.stop()
 
         from airweave.domains.temporal.client import close as close_temporal_client
@@ -144,6 +189,15 @@ class TemporalWorker:
         except Exception as e:
             logger.error(f"Error during worker shutdown: {e}")
 
+    def _get_tuner(self) -> WorkerTuner:
+        """Activity slots come from the resource governor; the rest stay at SDK defaults."""
+        return WorkerTuner.create_composite(
+            workflow_supplier=FixedSizeSlotSupplier(_SDK_DEFAULT_SLOTS),
+            activity_supplier=self._governor,
+            local_activity_supplier=FixedSizeSlotSupplier(_SDK_DEFAULT_SLOTS),
+            nexus_supplier=FixedSizeSlotSupplier(_SDK_DEFAULT_SLOTS),
+        )
+
     def _get_sandbox_runner(self):
         """Get the appropriate sandbox configuration."""
         if self._config.disable_sandbox:
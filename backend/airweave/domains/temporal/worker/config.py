@@ -25,6 +25,16 @@ class WorkerConfig:
         max_heartbeat_throttle_interval: Max heartbeat interval
 
         disable_sandbox: Disable Temporal sandbox (debugging only)
+
+        max_concurrent_activities: Ceiling on concurrent activities
+        min_concurrent_activities: Activity slots granted even under resource pressure
+        target_memory_usage: Memory usage (0-1) above which no new activities start
+        target_cpu_usage: CPU usage (0-1) above which no new activities start
+        target_db_pool_usage: DB pool usage (0-1) above which no new activities start
+        sync_worker_budget: Entity workers shared by all syncs running on the pod
+        min_sync_workers: Entity workers a sync keeps however many share the pod
+        resource_sample_interval: How often usage is read and sync pools resized
+        activity_slot_ramp_interval: Minimum time between activity slot grants
     """
 
     task_queue: str
@@ -49,6 +59,17 @@ class WorkerConfig:
     # Temporal SDK built-in Prometheus exporter
     sdk_metrics_port: int = 9090
 
+    # Resource governor (activity slots and per-sync entity workers)
+    max_concurrent_activities: int = 100
+    min_concurrent_activities: int = 2
+    target_memory_usage: float = 0.8
+    target_cpu_usage: float = 0.9
+    target_db_pool_usage: float = 0.8
+    sync_worker_budget: int = 60
+    min_sync_workers: int = 2
+    resource_sample_interval: timedelta = timedelta(seconds=2)
+    activity_slot_ramp_interval: timedelta = timedelta(milliseconds=50)
+
     @classmethod
     def from_settings(cls) -> "WorkerConfig":
         """Build config from environment settings."""
@@ -58,4 +79,10 @@ class WorkerConfig:
             graceful_shutdown_timeout_seconds=settings.TEMPORAL_GRACEFUL_SHUTDOWN_TIMEOUT,
             disable_sandbox=settings.TEMPORAL_DISABLE_SANDBOX,
             sdk_metrics_port=settings.TEMPORAL_SDK_METRICS_PORT,
+            max_concurrent_activities=settings.WORKER_MAX_CONCURRENT_ACTIVITIES,
+            target_memory_usage=settings.WORKER_TARGET_MEMORY_USAGE,
+            target_cpu_usage=settings.WORKER_TARGET_CPU_USAGE,
+            target_db_pool_usage=settings.WORKER_TARGET_DB_POOL_USAGE,
+            sync_worker_budget=settings.WORKER_SYNC_WORKER_BUDGET
+            or settings.db_pool_size + settings.db_pool_max_overflow,
         )
@@ -4,6 +4,8 @@ Endpoints:
     GET  /health  - Liveness/readiness probe
     GET  /metrics - Prometheus metrics
     GET  /status  - JSON debug status
+    GET  /flight-recorder - Per-stage batch timings of active and recent sync jobs
+    GET  /resources - Resource usage and the governor's concurrency decisions
     POST /drain   - Initiate graceful shutdown
 
 Security Notes:
@@ -13,7 +15,7 @@ Security Notes:
 """
 
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any, Callable, Coroutine
 
 from aiohttp import web
@@ -21,14 +23,17 @@ from aiohttp import web
 from airweave.core.config import settings
 from airweave.core.logging import logger
 from airweave.core.protocols import (
+    EventBus,
     MetricsRenderer,
     WorkerMetrics,
     WorkerMetricsRegistryProtocol,
 )
 from airweave.domains.sync_pipeline.async_helpers import get_active_thread_count
+from airweave.domains.sync_pipeline.flight_recorder import SyncFlightRecorder, sync_flight_recorder
 from airweave.domains.temporal.metrics import ConnectorSnapshot, WorkerMetricsSnapshot
 
 from .config import WorkerConfig
+from .resources import ResourceGovernor
 
 # =============================================================================
 # Worker State
@@ -59,6 +64,9 @@ class WorkerControlServer:
         registry: WorkerMetricsRegistryProtocol,
         worker_metrics: WorkerMetrics,
         renderer: MetricsRenderer,
+        event_bus: EventBus | None = None,
+        flight_recorder: SyncFlightRecorder = sync_flight_recorder,
+        governor: ResourceGovernor | None = None,
     ) -> None:
         """Initialize the control server."""
         self._state = worker_state
@@ -66,6 +74,9 @@ class WorkerControlServer:
         self._registry = registry
         self._worker_metrics = worker_metrics
         self._renderer = renderer
+        self._event_bus = event_bus
+        self._flight_recorder = flight_recorder
+        self._governor = governor
         self._runner: web.AppRunner | None = None
 
     async def start(self) -> None:
@@ -74,6 +85,8 @@ class WorkerControlServer:
         app.router.add_get("/health", self._handle_health)
         app.router.add_get("/metrics", self._handle_metrics)
         app.router.add_get("/status", self._handle_status)
+        app.router.add_get("/flight-recorder", self._handle_flight_recorder)
+        app.router.add_get("/resources", self._handle_resources)
         app.router.add_post("/drain", self._handle_drain)
 
         self._runner = web.AppRunner(app)
@@ -83,7 +96,7 @@ class WorkerControlServer:
 
         logger.info(
             f"Control server started on 0.0.0.0:{self._config.metrics_port} "
-            f"(endpoints: /health, /metrics, /status, /drain)"
+            f"(endpoints: /health, /metrics, /status, /flight-recorder, /resources, /drain)"
         )
 
     async def stop(self) -> None:
@@ -140,6 +153,21 @@ class WorkerControlServer:
                 {"error": "Failed to generate status", "detail": str(e)}, status=500
             )
 
+    async def _handle_flight_recorder(self, request: web.Request) -> web.Response:
+        """Recent batch timings per sync job (``?sync_job_id=`` to filter)."""
+        snapshot = self._flight_recorder.snapshot()
+        sync_job_id = request.query.get("sync_job_id")
+        if sync_job_id:
+            snapshot = {
+                state: [job for job in jobs if job["sync_job_id"] == sync_job_id]
+                for state, jobs in snapshot.items()
+            }
+        return web.json_response(snapshot)
+
+    async def _handle_resources(self, request: web.Request) -> web.Response:
+        """Resource usage, pressure and the activity / per-sync worker limits."""
+        return web.json_response(self._resource_decision())
+
     # -------------------------------------------------------------------------
     # Metrics Collection
     # -------------------------------------------------------------------------
@@ -163,12 +191,19 @@ class WorkerControlServer:
                 ct: ConnectorSnapshot(
                     active_syncs=m.get("active_syncs", 0),
                     active_and_pending_workers=m.get("active_and_pending_workers", 0),
+                    concurrency_limit=m.get("concurrency_limit", 0),
+                    requests_in_flight=m.get("requests_in_flight", 0),
+                    throttle_events=m.get("throttle_events", 0),
+                    stream_queue_depth=m.get("stream_queue_depth", 0),
+                    stream_queued_bytes=m.get("stream_queued_bytes", 0),
                 )
                 for ct, m in connector_metrics.items()
             },
             sync_max_workers=settings.SYNC_MAX_WORKERS,
+            stream_max_queue_bytes=settings.SYNC_STREAM_MAX_QUEUE_BYTES,
             thread_pool_size=settings.SYNC_THREAD_POOL_SIZE,
             thread_pool_active=thread_pool_active,
+            event_subscribers=tuple(self._event_bus.snapshot()) if self._event_bus else (),
         )
 
         self._worker_metrics.update(snapshot)
@@ -180,6 +215,7 @@ class WorkerControlServer:
         detailed_syncs = await self._registry.get_detailed_sync_metrics()
         per_sync_workers = await self._registry.get_per_sync_worker_counts()
         active_and_pending = await self._registry.get_total_active_and_pending_workers()
+        connector_metrics = await self._registry.get_per_connector_metrics()
         thread_pool_active = get_active_thread_count()
 
         # Merge worker counts into detailed_syncs
@@ -188,6 +224,7 @@ class WorkerControlServer:
         }
         for sync in detailed_syncs:
             sync["workers_allocated"] = worker_counts_map.get(sync["sync_id"], 0)
+            sync["pipeline_timings"] = self._flight_recorder.summary(sync["sync_job_id"])
             sync["duration_seconds"] = 0
             for activity in metrics["active_activities"]:
                 if activity.get("sync_job_id") == sync["sync_job_id"]:
@@ -205,9 +242,15 @@ class WorkerControlServer:
             "capacity": {
                 "max_workflow_polls": self._config.max_concurrent_workflow_polls,
                 "max_activity_polls": self._config.max_concurrent_activity_polls,
+                "max_activities": self._config.max_concurrent_activities,
             },
+            "resources": self._resource_decision(),
             "active_activities_count": metrics["active_activities_count"],
             "active_syncs": detailed_syncs,
+            "connectors": connector_metrics,
+            "event_bus": (
+                [asdict(sub) for sub in self._event_bus.snapshot()] if self._event_bus else []
+            ),
             "metrics": {
                 "total_workers": settings.SYNC_MAX_WORKERS,
                 "active_and_pending_workers": active_and_pending,
@@ -218,6 +261,10 @@ class WorkerControlServer:
             },
         }
 
+    def _resource_decision(self) -> dict[str, Any] | None:
+        """The governor's last decision, or None when it is not running."""
+        return asdict(self._governor.decision()) if self._governor else None
+
     def _get_status_string(self) -> str:
         """Get worker status as string."""
         if self._state.draining:
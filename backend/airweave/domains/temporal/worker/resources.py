@@ -0,0 +1,341 @@
+"""Resource governor — sizes activity concurrency and per-sync workers to the pod.
+
+Without it every worker pod accepts up to the SDK's 100 concurrent activities
+and every sync runs ``SYNC_MAX_WORKERS`` entity workers, whatever else the
+pod is doing: several heavy file syncs oversubscribe memory, CPU and the DB
+pool, while a pod running light syncs could take many more.
+
+``ResourceGovernor`` is the Temporal activity slot supplier. A slot (and so
+a new activity) is only handed out while memory, CPU and DB pool usage are
+below their targets, up to ``max_concurrent_activities``; a few slots are
+always available so the pod keeps making progress. It also shares a per-pod
+budget of entity workers between the running syncs and resizes their
+``AsyncWorkerPool``s on every sample. The last decision is served by the
+control server at ``/resources``.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Protocol
+
+from temporalio.worker import (
+    CustomSlotSupplier,
+    SlotMarkUsedContext,
+    SlotPermit,
+    SlotReleaseContext,
+    SlotReserveContext,
+)
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.protocols.metrics import DbPool
+from airweave.domains.sync_pipeline.worker_pool import AsyncWorkerPool
+from airweave.domains.temporal.metrics import WorkerMetricsRegistry, worker_metrics
+
+from .config import WorkerConfig
+
+_CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+# =============================================================================
+# Resource usage
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ResourceUsage:
+    """Fraction (0-1) of each governed resource in use."""
+
+    memory: float = 0.0
+    cpu: float = 0.0
+    db_pool: float = 0.0
+
+
+class ResourceProbe(Protocol):
+    """Reads current resource usage."""
+
+    def read(self) -> ResourceUsage:
+        """Return the current usage."""
+        ...
+
+
+class SystemResourceProbe:
+    """Reads usage from the container's cgroup, the host as a fallback, and the DB pool.
+
+    Memory and CPU are measured against the pod's cgroup (v2) limits when it
+    has them, so the targets mean "of what Kubernetes gives us", not of the
+    node. Memory excludes inactive page cache, which the kernel reclaims
+    before it OOM-kills.
+
+    Args:
+        pool: The SQLAlchemy pool of the worker's engine.
+        pool_capacity: Connections the pool can hand out (size + max overflow).
+        cgroup_root: Where the cgroup filesystem is mounted.
+    """
+
+    def __init__(self, pool: DbPool, pool_capacity: int, cgroup_root: Path = _CGROUP_ROOT) -> None:
+        """Initialize the probe; CPU usage is measured from the first read on."""
+        self._pool = pool
+        self._pool_capacity = max(1, pool_capacity)
+        self._cgroup_root = cgroup_root
+        self._last_cpu: Optional[tuple[float, float]] = None  # (monotonic, usage seconds)
+
+    def read(self) -> ResourceUsage:
+        """Return the current memory, CPU and DB pool usage."""
+        return ResourceUsage(
+            memory=round(self._memory(), 3),
+            cpu=round(self._cpu(), 3),
+            db_pool=round(self._pool.checkedout() / self._pool_capacity, 3),
+        )
+
+    def _cgroup_file(self, name: str) -> Optional[str]:
+        try:
+            return (self._cgroup_root / name).read_text().strip()
+        except OSError:
+            return None
+
+    def _memory(self) -> float:
+        limit = self._cgroup_file("memory.max")
+        current = self._cgroup_file("memory.current")
+        if limit and current and limit != "max":
+            inactive_file = 0
+            for line in (self._cgroup_file("memory.stat") or "").splitlines():
+                key, _, value = line.partition(" ")
+                if key == "inactive_file":
+                    inactive_file = int(value)
+                    break
+            return max(0, int(current) - inactive_file) / int(limit)
+
+        import psutil
+
+        return psutil.virtual_memory().percent / 100
+
+    def _cpu(self) -> float:
+        quota = (self._cgroup_file("cpu.max") or "max").split()
+        stat = self._cgroup_file("cpu.stat")
+        if quota[0] != "max" and len(quota) == 2 and stat:
+            usage_usec = next(
+                (
+                    int(line.split()[1])
+                    for line in stat.splitlines()
+                    if line.startswith("usage_usec")
+                ),
+                None,
+            )
+            if usage_usec is not None:
+                cores = int(quota[0]) / int(quota[1])
+                now, usage = time.monotonic(), usage_usec / 1_000_000
+                last, self._last_cpu = self._last_cpu, (now, usage)
+                if last is None or now <= last[0]:
+                    return 0.0
+                return (usage - last[1]) / (now - last[0]) / cores
+
+        import psutil
+
+        # Host-wide usage since the previous call
+        return psutil.cpu_percent(interval=None) / 100
+
+
+# =============================================================================
+# Governor
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ResourceDecision:
+    """What the governor last measured and decided, as served at ``/resources``."""
+
+    usage: ResourceUsage
+    targets: ResourceUsage
+    pressure: tuple[str, ...]
+    activity_slot_limit: int
+    activity_slots_reserved: int
+    activity_slots_in_use: int
+    activities_by_type: dict[str, int]
+    admitting_activities: bool
+    sync_worker_budget: int
+    active_syncs: int
+    workers_per_sync: int
+    sampled_at: float = 0.0
+
+
+class ResourceGovernor(CustomSlotSupplier):
+    """Activity slot supplier and per-sync worker sizing driven by pod resources.
+
+    Temporal reserves a slot before each activity poll, so idle pollers hold
+    reserved slots too. Reservations beyond ``min_concurrent_activities``
+    are refused while any resource is over its target, and granted at most
+    one per ``activity_slot_ramp_interval`` otherwise, so the usage of the
+    work just admitted shows up before more is taken on.
+
+    Args:
+        config: Worker configuration with the limits and targets.
+        probe: Source of resource usage readings.
+        registry: Where running syncs register their worker pools.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        config: WorkerConfig,
+        probe: ResourceProbe,
+        registry: WorkerMetricsRegistry = worker_metrics,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize with no slots reserved; usage is unknown until the first sample."""
+        self._config = config
+        self._probe = probe
+        self._registry = registry
+        self._clock = clock
+        self._targets = ResourceUsage(
+            memory=config.target_memory_usage,
+            cpu=config.target_cpu_usage,
+            db_pool=config.target_db_pool_usage,
+        )
+
+        self._usage = ResourceUsage()
+        self._pressure: tuple[str, ...] = ()
+        self._sampled_at = 0.0
+        self._reserved = 0
+        self._in_use: Counter[str] = Counter()
+        self._last_grant = float("-inf")
+        self._active_syncs = 0
+        self._workers_per_sync = settings.SYNC_MAX_WORKERS
+        self._changed: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Take the first sample and keep sampling in the background."""
+        self.sample()
+        if self._task is None:
+            self._task = asyncio.create_task(self._sample_loop(), name="resource_governor")
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    # -------------------------------------------------------------------------
+    # Decisions
+    # -------------------------------------------------------------------------
+
+    def sample(self) -> ResourceDecision:
+        """Read resource usage, update admission and resize the running syncs' pools."""
+        try:
+            self._usage = self._probe.read()
+        except Exception as e:
+            logger.warning(f"Resource governor could not read usage: {e}")
+        self._sampled_at = time.time()
+        self._pressure = tuple(
+            name
+            for name in ("memory", "cpu", "db_pool")
+            if getattr(self._usage, name) >= getattr(self._targets, name)
+        )
+
+        pools = [
+            pool
+            for pool in self._registry.get_worker_pools().values()
+            if isinstance(pool, AsyncWorkerPool)
+        ]
+        self._active_syncs = len(pools)
+        self._workers_per_sync = self._size_sync_workers(len(pools))
+        for pool in pools:
+            if pool.max_workers != self._workers_per_sync:
+                pool.set_max_workers(self._workers_per_sync)
+
+        self._notify()
+        return self.decision()
+
+    def decision(self) -> ResourceDecision:
+        """Return the current measurements and decisions."""
+        return ResourceDecision(
+            usage=self._usage,
+            targets=self._targets,
+            pressure=self._pressure,
+            activity_slot_limit=self._config.max_concurrent_activities,
+            activity_slots_reserved=self._reserved,
+            activity_slots_in_use=sum(self._in_use.values()),
+            activities_by_type=dict(self._in_use),
+            admitting_activities=self._can_grant(ramp=False),
+            sync_worker_budget=self._config.sync_worker_budget,
+            active_syncs=self._active_syncs,
+            workers_per_sync=self._workers_per_sync,
+            sampled_at=self._sampled_at,
+        )
+
+    def _size_sync_workers(self, active_syncs: int) -> int:
+        """Split the worker budget between syncs; halve the share under pressure."""
+        share = self._config.sync_worker_budget // max(1, active_syncs)
+        if self._pressure:
+            share //= 2
+        return max(self._config.min_sync_workers, min(settings.SYNC_MAX_WORKERS, share))
+
+    def _can_grant(self, ramp: bool = True) -> bool:
+        if self._reserved >= self._config.max_concurrent_activities:
+            return False
+        if self._reserved < self._config.min_concurrent_activities:
+            return True
+        if self._pressure:
+            return False
+        ramp_interval = self._config.activity_slot_ramp_interval.total_seconds()
+        return not ramp or self._clock() - self._last_grant >= ramp_interval
+
+    def _grant(self) -> SlotPermit:
+        self._reserved += 1
+        self._last_grant = self._clock()
+        return SlotPermit()
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+
+    async def _sample_loop(self) -> None:
+        interval = self._config.resource_sample_interval.total_seconds()
+        while True:
+            await asyncio.sleep(interval)
+            self.sample()
+
+    # -------------------------------------------------------------------------
+    # CustomSlotSupplier
+    # -------------------------------------------------------------------------
+
+    async def reserve_slot(self, ctx: SlotReserveContext) -> SlotPermit:
+        """Wait until a slot may be granted (see class docstring)."""
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        ramp_interval = self._config.activity_slot_ramp_interval.total_seconds()
+        while not self._can_grant():
+            self._changed.clear()
+            # Woken by a release or a new sample; the timeout covers the ramp interval
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=max(ramp_interval, 0.01))
+            except asyncio.TimeoutError:
+                pass
+        return self._grant()
+
+    def try_reserve_slot(self, ctx: SlotReserveContext) -> Optional[SlotPermit]:
+        """Grant a slot for an eager activity if one is available right now."""
+        return self._grant() if self._can_grant() else None
+
+    def mark_slot_used(self, ctx: SlotMarkUsedContext) -> None:
+        """Count the activity now running in a reserved slot."""
+        self._in_use[getattr(ctx.slot_info, "activity_type", "unknown")] += 1
+
+    def release_slot(self, ctx: SlotReleaseContext) -> None:
+        """Return a slot, whether or not an activity ran in it."""
+        self._reserved -= 1
+        if ctx.slot_info is not None:
+            activity_type = getattr(ctx.slot_info, "activity_type", "unknown")
+            self._in_use[activity_type] -= 1
+            if self._in_use[activity_type] <= 0:
+                del self._in_use[activity_type]
+        self._notify()
@@ -49,6 +49,11 @@ def test_from_settings_wires_all_fields():
         mock.TEMPORAL_GRACEFUL_SHUTDOWN_TIMEOUT = 60
         mock.TEMPORAL_DISABLE_SANDBOX = True
         mock.TEMPORAL_SDK_METRICS_PORT = 9999
+        mock.WORKER_MAX_CONCURRENT_ACTIVITIES = 40
+        mock.WORKER_TARGET_MEMORY_USAGE = 0.7
+        mock.WORKER_TARGET_CPU_USAGE = 0.85
+        mock.WORKER_TARGET_DB_POOL_USAGE = 0.75
+        mock.WORKER_SYNC_WORKER_BUDGET = 80
 
         config = WorkerConfig.from_settings()
 
@@ -57,6 +62,11 @@ def test_from_settings_wires_all_fields():
     assert config.graceful_shutdown_timeout_seconds == 60
     assert config.disable_sandbox is True
     assert config.sdk_metrics_port == 9999
+    assert config.max_concurrent_activities == 40
+    assert config.target_memory_usage == 0.7
+    assert config.target_cpu_usage == 0.85
+    assert config.target_db_pool_usage == 0.75
+    assert config.sync_worker_budget == 80
 
     # Defaults for fields not covered by from_settings()
     assert config.max_concurrent_workflow_polls == 8
@@ -65,3 +75,15 @@ def test_from_settings_wires_all_fields():
     assert config.nonsticky_to_sticky_poll_ratio == 0.5
     assert config.default_heartbeat_throttle_interval == timedelta(seconds=2)
     assert config.max_heartbeat_throttle_interval == timedelta(seconds=2)
+
+
+def test_sync_worker_budget_defaults_to_db_pool_capacity():
+    """Without WORKER_SYNC_WORKER_BUDGET the budget is the DB pool's capacity."""
+    with patch("airweave.domains.temporal.worker.config.settings") as mock:
+        mock.WORKER_SYNC_WORKER_BUDGET = None
+        mock.db_pool_size = 20
+        mock.db_pool_max_overflow = 40
+
+        config = WorkerConfig.from_settings()
+
+    assert config.sync_worker_budget == 60
@@ -0,0 +1,223 @@
+"""Tests for the resource governor — activity slot admission and per-sync worker sizing."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from temporalio.worker import SlotReleaseContext
+
+from airweave.core.config import settings
+from airweave.domains.sync_pipeline.worker_pool import AsyncWorkerPool
+from airweave.domains.temporal.metrics import WorkerMetricsRegistry
+from airweave.domains.temporal.worker.config import WorkerConfig
+from airweave.domains.temporal.worker.resources import (
+    ResourceGovernor,
+    ResourceUsage,
+    SystemResourceProbe,
+)
+
+
+class _Probe:
+    def __init__(self) -> None:
+        self.usage = ResourceUsage()
+
+    def read(self) -> ResourceUsage:
+        return self.usage
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_config(**overrides) -> WorkerConfig:
+    defaults = dict(
+        task_queue="test-queue",
+        metrics_port=8080,
+        graceful_shutdown_timeout_seconds=30,
+        max_concurrent_activities=4,
+        min_concurrent_activities=1,
+        sync_worker_budget=40,
+        min_sync_workers=2,
+        activity_slot_ramp_interval=timedelta(seconds=1),
+    )
+    defaults.update(overrides)
+    return WorkerConfig(**defaults)
+
+
+@pytest.fixture
+def probe():
+    return _Probe()
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def registry():
+    return WorkerMetricsRegistry()
+
+
+@pytest.fixture
+def governor(probe, clock, registry):
+    return ResourceGovernor(_make_config(), probe, registry=registry, clock=clock)
+
+
+def _activity(activity_type: str) -> SimpleNamespace:
+    return SimpleNamespace(activity_type=activity_type)
+
+
+class TestActivitySlots:
+    def test_grants_up_to_the_limit(self, governor, clock):
+        permits = []
+        for _ in range(6):
+            clock.now += 1
+            permits.append(governor.try_reserve_slot(MagicMock()))
+
+        assert sum(p is not None for p in permits) == 4
+        assert governor.decision().activity_slots_reserved == 4
+
+    def test_ramp_interval_spaces_grants(self, governor, clock):
+        assert governor.try_reserve_slot(MagicMock()) is not None  # the minimum
+        assert governor.try_reserve_slot(MagicMock()) is None
+
+        clock.now += 1
+        assert governor.try_reserve_slot(MagicMock()) is not None
+        assert governor.try_reserve_slot(MagicMock()) is None
+
+    def test_pressure_holds_back_slots_above_the_minimum(self, governor, probe, clock):
+        probe.usage = ResourceUsage(memory=0.95)
+        governor.sample()
+
+        assert governor.try_reserve_slot(MagicMock()) is not None
+        clock.now += 1
+        assert governor.try_reserve_slot(MagicMock()) is None
+
+        decision = governor.decision()
+        assert decision.pressure == ("memory",)
+        assert decision.admitting_activities is False
+
+    @pytest.mark.asyncio
+    async def test_reserve_waits_until_pressure_clears(self, governor, probe, clock):
+        probe.usage = ResourceUsage(db_pool=0.9)
+        governor.sample()
+        await governor.reserve_slot(MagicMock())
+
+        waiting = asyncio.create_task(governor.reserve_slot(MagicMock()))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+
+        probe.usage = ResourceUsage()
+        clock.now += 1
+        governor.sample()
+
+        await asyncio.wait_for(waiting, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_release_wakes_a_waiting_reservation(self, probe, clock, registry):
+        governor = ResourceGovernor(
+            _make_config(max_concurrent_activities=1), probe, registry=registry, clock=clock
+        )
+        permit = await governor.reserve_slot(MagicMock())
+        waiting = asyncio.create_task(governor.reserve_slot(MagicMock()))
+        await asyncio.sleep(0)
+
+        governor.release_slot(SlotReleaseContext(slot_info=None, permit=permit))
+
+        await asyncio.wait_for(waiting, timeout=1)
+
+    def test_tracks_running_activities_by_type(self, governor, clock):
+        permit = governor.try_reserve_slot(MagicMock())
+        governor.mark_slot_used(SimpleNamespace(slot_info=_activity("run_sync_activity")))
+        assert governor.decision().activities_by_type == {"run_sync_activity": 1}
+
+        governor.release_slot(
+            SlotReleaseContext(slot_info=_activity("run_sync_activity"), permit=permit)
+        )
+
+        decision = governor.decision()
+        assert decision.activities_by_type == {}
+        assert decision.activity_slots_reserved == 0
+
+
+class TestSyncWorkers:
+    def test_budget_is_split_between_running_syncs(self, governor, registry):
+        pools = [AsyncWorkerPool(logger=MagicMock()) for _ in range(4)]
+        for i, pool in enumerate(pools):
+            registry.register_worker_pool(f"sync_{i}_job_{i}", pool)
+
+        decision = governor.sample()
+
+        assert decision.active_syncs == 4
+        assert decision.workers_per_sync == 10
+        assert [pool.max_workers for pool in pools] == [10] * 4
+
+    def test_share_is_capped_at_sync_max_workers(self, governor, registry):
+        pool = AsyncWorkerPool(logger=MagicMock())
+        registry.register_worker_pool("sync_a_job_a", pool)
+
+        governor.sample()
+
+        assert pool.max_workers == min(settings.SYNC_MAX_WORKERS, 40)
+
+    def test_pressure_halves_the_share_down_to_the_minimum(self, governor, probe, registry):
+        pools = [AsyncWorkerPool(logger=MagicMock()) for _ in range(4)]
+        for i, pool in enumerate(pools):
+            registry.register_worker_pool(f"sync_{i}_job_{i}", pool)
+        probe.usage = ResourceUsage(cpu=0.99)
+
+        assert governor.sample().workers_per_sync == 5
+
+        for i in range(4, 40):
+            registry.register_worker_pool(f"sync_{i}_job_{i}", AsyncWorkerPool(logger=MagicMock()))
+        assert governor.sample().workers_per_sync == 2
+
+    def test_probe_failure_keeps_the_last_reading(self, governor, probe):
+        probe.usage = ResourceUsage(memory=0.5)
+        governor.sample()
+        probe.read = MagicMock(side_effect=OSError("cgroup gone"))
+
+        assert governor.sample().usage == ResourceUsage(memory=0.5)
+
+
+class TestSystemResourceProbe:
+    def test_reads_cgroup_memory_without_inactive_cache(self, tmp_path):
+        (tmp_path / "memory.max").write_text("1000\n")
+        (tmp_path / "memory.current").write_text("700\n")
+        (tmp_path / "memory.stat").write_text("anon 400\ninactive_file 200\n")
+        pool = MagicMock(checkedout=MagicMock(return_value=15))
+
+        usage = SystemResourceProbe(pool, pool_capacity=60, cgroup_root=tmp_path).read()
+
+        assert usage.memory == 0.5
+        assert usage.db_pool == 0.25
+
+    def test_reads_cgroup_cpu_against_the_quota(self, tmp_path, monkeypatch):
+        (tmp_path / "cpu.max").write_text("200000 100000\n")  # 2 cores
+        times = iter([10.0, 12.0])
+        monkeypatch.setattr(
+            "airweave.domains.temporal.worker.resources.time",
+            SimpleNamespace(monotonic=lambda: next(times)),
+        )
+        probe = SystemResourceProbe(MagicMock(), pool_capacity=1, cgroup_root=tmp_path)
+
+        (tmp_path / "cpu.stat").write_text("usage_usec 5000000\n")
+        assert probe._cpu() == 0.0  # no previous reading
+        (tmp_path / "cpu.stat").write_text("usage_usec 8000000\n")
+        assert probe._cpu() == 0.75  # 3 CPU-seconds over 2 seconds on 2 cores
+
+    def test_falls_back_to_host_memory_without_a_cgroup_limit(self, tmp_path, monkeypatch):
+        (tmp_path / "memory.max").write_text("max\n")
+        (tmp_path / "memory.current").write_text("700\n")
+        monkeypatch.setattr("psutil.virtual_memory", lambda: SimpleNamespace(percent=42.0))
+
+        probe = SystemResourceProbe(MagicMock(), pool_capacity=1, cgroup_root=tmp_path)
+
+        assert probe._memory() == 0.42
@@ -31,6 +31,7 @@ class FakeUsageLedger(UsageLedgerProtocol):
         self.recorded: dict[tuple[UUID, ActionType], int] = defaultdict(int)
         self.record_calls: list[tuple[UUID, ActionType, int]] = []
         self.flushed_orgs: list[Optional[UUID]] = []
+        self.closed = False
 
     async def record(
         self,
@@ -46,8 +47,13 @@ class FakeUsageLedger(UsageLedgerProtocol):
         """Record that a flush was requested."""
         self.flushed_orgs.append(organization_id)
 
+    async def close(self) -> None:
+        """Record that the ledger was closed."""
+        self.closed = True
+
     def clear(self) -> None:
         """Reset all recorded state."""
         self.recorded.clear()
         self.record_calls.clear()
         self.flushed_orgs.clear()
+        self.closed = False
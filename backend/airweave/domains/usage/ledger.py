@@ -1,16 +1,19 @@
 """Usage ledger — singleton write service that accumulates and flushes usage.
 
 One instance lives in the container. Callers just call ``record()`` with
-an org ID and action type; the ledger batches increments in memory and
-flushes to the database when a threshold is crossed, or when ``flush()``
-is called explicitly (e.g. at sync completion or app shutdown).
+an org ID and action type; the ledger adds the increment in memory and a
+background task writes pending usage to the database, periodically and
+as soon as a threshold is crossed. ``flush()`` writes immediately (e.g. at
+sync completion) and ``close()`` does the final flush at shutdown.
 """
 
 import asyncio
 import logging
+import time
 from typing import Optional
 from uuid import UUID
 
+from airweave.core.protocols.metrics import UsageLedgerMetrics
 from airweave.domains.billing.repository import (
     BillingPeriodRepositoryProtocol,
     OrganizationBillingRepositoryProtocol,
@@ -29,14 +32,18 @@ _FLUSH_THRESHOLDS: dict[ActionType, int] = {
 
 
 class UsageLedger(UsageLedgerProtocol):
-    """In-memory accumulator with threshold-based and time-based flushing.
-
-    Thread-safe via per-org locks.  Owns its own DB sessions through
-    ``get_db_context`` so callers never pass a session.
-
-    A background task flushes all pending accumulators every
-    ``flush_interval_seconds``.  The task is started lazily on the
-    first ``record()`` call so no external wiring is needed.
+    """In-memory accumulator flushed by a background task.
+
+    ``record()`` never waits: it adds to the org's pending counts and, when
+    a threshold is crossed, wakes the flush task. Flushing swaps an org's
+    pending counts out before writing them, so records made meanwhile go
+    to a fresh accumulator; counts whose write failed are merged back and
+    retried on the next flush. Usage is therefore written at least once —
+    a write that fails after committing is counted again.
+
+    Owns its own DB sessions through ``get_db_context`` so callers never
+    pass a session. The flush task is started lazily on the first
+    ``record()`` call so no external wiring is needed.
     """
 
     def __init__(
@@ -45,23 +52,30 @@ class UsageLedger(UsageLedgerProtocol):
         billing_repo: OrganizationBillingRepositoryProtocol,
         period_repo: BillingPeriodRepositoryProtocol,
         flush_interval_seconds: float = 30.0,
+        metrics: Optional[UsageLedgerMetrics] = None,
     ) -> None:
         """Initialize the ledger with repository dependencies."""
         self._usage_repo = usage_repo
         self._billing_repo = billing_repo
         self._period_repo = period_repo
         self._flush_interval = flush_interval_seconds
+        self._metrics = metrics
 
         # org_id → { ActionType → pending_count }
         self._accumulators: dict[UUID, dict[ActionType, int]] = {}
-        self._locks: dict[UUID, asyncio.Lock] = {}
+        # ActionType → pending_count summed over all orgs (for metrics)
+        self._pending: dict[ActionType, int] = {}
         self._billing_cache: dict[UUID, bool] = {}
         self._flush_task: Optional[asyncio.Task] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        # Set by close(): the flush task finishes its current flush and exits
+        self._stopping = False
+        # Serializes flushes; record() never takes it
+        self._flush_lock = asyncio.Lock()
 
-    def _get_lock(self, organization_id: UUID) -> asyncio.Lock:
-        if organization_id not in self._locks:
-            self._locks[organization_id] = asyncio.Lock()
-        return self._locks[organization_id]
+    def set_metrics(self, metrics: Optional[UsageLedgerMetrics]) -> None:
+        """Export pending usage and flush latency to ``metrics``."""
+        self._metrics = metrics
 
     async def record(
         self,
@@ -72,54 +86,76 @@ class UsageLedger(UsageLedgerProtocol):
         """Record usage increment for an organization and action type."""
         if action_type in (ActionType.TEAM_MEMBERS, ActionType.SOURCE_CONNECTIONS):
             return
+        # Orgs without billing are only known after their first flush
+        if self._billing_cache.get(organization_id) is False:
+            return
 
-        self._ensure_flush_task()
-
-        lock = self._get_lock(organization_id)
-        async with lock:
-            if not await self._has_billing(organization_id):
-                return
+        flush_requested = self._ensure_flush_task()
 
-            acc = self._accumulators.setdefault(organization_id, {})
-            acc[action_type] = acc.get(action_type, 0) + amount
+        acc = self._accumulators.setdefault(organization_id, {})
+        acc[action_type] = acc.get(action_type, 0) + amount
+        self._add_pending(action_type, amount)
 
-            threshold = _FLUSH_THRESHOLDS.get(action_type, 10)
-            if abs(acc[action_type]) >= threshold:
-                await self._flush_action(organization_id, action_type)
+        if abs(acc[action_type]) >= _FLUSH_THRESHOLDS.get(action_type, 10):
+            flush_requested.set()
 
     async def flush(self, organization_id: Optional[UUID] = None) -> None:
         """Flush pending usage to the database for one org or all orgs."""
-        if organization_id is not None:
-            lock = self._get_lock(organization_id)
-            async with lock:
+        async with self._flush_lock:
+            if organization_id is not None:
                 await self._flush_org(organization_id)
-        else:
-            org_ids = list(self._accumulators.keys())
-            for oid in org_ids:
-                lock = self._get_lock(oid)
-                async with lock:
+            else:
+                for oid in list(self._accumulators.keys()):
                     await self._flush_org(oid)
 
+    async def close(self) -> None:
+        """Stop the flush task and write everything still pending.
+
+        The task is asked to stop rather than cancelled, so a flush it is in
+        the middle of completes (or merges its counts back) first.
+        """
+        if self._flush_task is not None:
+            self._stopping = True
+            self._flush_requested.set()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+
+        # Usage recorded while the task was stopping
+        await self.flush()
+        if self._accumulators:
+            logger.error(
+                "UsageLedger closed with unwritten usage: %s",
+                {str(oid): acc for oid, acc in self._accumulators.items()},
+            )
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
-    def _ensure_flush_task(self) -> None:
-        """Lazily start the periodic flush background task."""
-        if self._flush_task is not None and not self._flush_task.done():
-            return
-        self._flush_task = asyncio.create_task(self._periodic_flush_loop())
+    def _ensure_flush_task(self) -> asyncio.Event:
+        """Lazily start the background flush task; returns the event that wakes it."""
+        if self._flush_requested is not None and self._flush_task and not self._flush_task.done():
+            return self._flush_requested
+        self._flush_requested = asyncio.Event()
+        self._stopping = False
+        self._flush_task = asyncio.create_task(self._periodic_flush_loop(self._flush_requested))
         logger.info("UsageLedger periodic flush started (interval=%ss)", self._flush_interval)
+        return self._flush_requested
 
-    async def _periodic_flush_loop(self) -> None:
-        """Background loop that flushes all pending accumulators periodically.
+    async def _periodic_flush_loop(self, flush_requested: asyncio.Event) -> None:
+        """Flush all pending accumulators every interval, or sooner when a threshold is hit.
 
-        On cancellation (e.g. event-loop shutdown) does a final flush
-        so no pending counts are lost.
+        Exits once ``close()`` sets ``_stopping``, after finishing the flush
+        in progress. On cancellation (e.g. event-loop shutdown) does a final flush so no
+        pending counts are lost.
         """
         try:
-            while True:
-                await asyncio.sleep(self._flush_interval)
+            while not self._stopping:
+                try:
+                    await asyncio.wait_for(flush_requested.wait(), timeout=self._flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                flush_requested.clear()
                 try:
                     await self.flush()
                 except Exception:
@@ -132,6 +168,11 @@ class UsageLedger(UsageLedgerProtocol):
                 logger.error("UsageLedger final flush failed on shutdown", exc_info=True)
             raise
 
+    def _add_pending(self, action_type: ActionType, amount: int) -> None:
+        self._pending[action_type] = self._pending.get(action_type, 0) + amount
+        if self._metrics is not None:
+            self._metrics.set_pending(action_type.value, self._pending[action_type])
+
     async def _has_billing(self, organization_id: UUID) -> bool:
         if organization_id in self._billing_cache:
             return self._billing_cache[organization_id]
@@ -144,59 +185,56 @@ class UsageLedger(UsageLedgerProtocol):
         self._billing_cache[organization_id] = result
         return result
 
-    async def _flush_action(self, organization_id: UUID, action_type: ActionType) -> None:
-        """Flush a single action type for one org. Must be called under lock."""
-        acc = self._accumulators.get(organization_id, {})
-        pending = acc.get(action_type, 0)
-        if pending == 0:
-            return
-
-        from airweave.db.session import get_db_context
-
-        try:
-            async with get_db_context() as db:
-                await self._usage_repo.increment_usage(
-                    db,
-                    organization_id=organization_id,
-                    increments={action_type: pending},
-                )
-            acc[action_type] = 0
-            logger.debug("Flushed %s=%d for org %s", action_type.value, pending, organization_id)
-        except Exception:
-            logger.error(
-                "Failed to flush %s=%d for org %s",
-                action_type.value,
-                pending,
-                organization_id,
-                exc_info=True,
-            )
-
     async def _flush_org(self, organization_id: UUID) -> None:
-        """Flush all pending action types for one org. Must be called under lock."""
-        acc = self._accumulators.get(organization_id, {})
+        """Write one org's pending counts. Must be called under the flush lock."""
+        acc = self._accumulators.pop(organization_id, None) or {}
         to_flush = {at: count for at, count in acc.items() if count != 0}
         if not to_flush:
             return
+        for at, count in to_flush.items():
+            self._add_pending(at, -count)
 
         from airweave.db.session import get_db_context
 
+        start = time.perf_counter()
         try:
+            if not await self._has_billing(organization_id):
+                return
             async with get_db_context() as db:
                 await self._usage_repo.increment_usage(
                     db,
                     organization_id=organization_id,
                     increments=to_flush,
                 )
-            for at in to_flush:
-                acc[at] = 0
-            logger.info("Flushed usage for org %s: %s", organization_id, to_flush)
+        except asyncio.CancelledError:
+            # Cancelled mid-write (event-loop shutdown): keep the counts for the final flush
+            self._merge_back(organization_id, to_flush)
+            raise
         except Exception:
+            self._observe_flush(start, success=False)
+            self._merge_back(organization_id, to_flush)
             logger.error(
                 "Failed to flush usage for org %s: %s",
                 organization_id,
                 to_flush,
                 exc_info=True,
             )
+            return
+
+        self._observe_flush(start, success=True)
+        logger.info("Flushed usage for org %s: %s", organization_id, to_flush)
+
+    def _merge_back(self, organization_id: UUID, counts: dict[ActionType, int]) -> None:
+        """Return unwritten counts to the org's accumulator; the next flush retries them."""
+        # Merged with whatever was recorded meanwhile
+        acc = self._accumulators.setdefault(organization_id, {})
+        for at, count in counts.items():
+            acc[at] = acc.get(at, 0) + count
+            self._add_pending(at, count)
+
+    def _observe_flush(self, start: float, success: bool) -> None:
+        if self._metrics is not None:
+            self._metrics.observe_flush(time.perf_counter() - start, success)
 
 
 class NullUsageLedger(UsageLedgerProtocol):
@@ -214,3 +252,7 @@ class NullUsageLedger(UsageLedgerProtocol):
     async def flush(self, organization_id: Optional[UUID] = None) -> None:
         """No-op flush."""
         pass
+
+    async def close(self) -> None:
+        """No-op close."""
+        pass
@@ -44,9 +44,13 @@ class UsageLedgerProtocol(Protocol):
     """
 
     async def record(self, organization_id: UUID, action_type: ActionType, amount: int = 1) -> None:
-        """Accumulate a billable action. May flush internally on threshold."""
+        """Accumulate a billable action in memory. Never waits on the database."""
         ...
 
     async def flush(self, organization_id: Optional[UUID] = None) -> None:
         """Force-flush pending records to DB. None = flush all orgs."""
         ...
+
+    async def close(self) -> None:
+        """Stop background flushing and write all pending records (at shutdown)."""
+        ...
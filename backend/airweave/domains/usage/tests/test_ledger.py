@@ -1,11 +1,13 @@
-"""Unit tests for UsageLedger — accumulation, threshold flushing, and explicit flush."""
+"""Unit tests for UsageLedger — accumulation, background flushing, explicit flush and close."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
 from uuid import UUID
 
 import pytest
 
+from airweave.adapters.metrics import FakeUsageLedgerMetrics
 from airweave.domains.billing.fakes.repository import (
     FakeBillingPeriodRepository,
     FakeOrganizationBillingRepository,
@@ -39,6 +41,7 @@ def _make_ledger(
     billing_repo=None,
     period_repo=None,
     seed_billing: bool = True,
+    metrics=None,
 ):
     """Build a UsageLedger wired to fakes. Optionally seeds a billing record."""
     ur = usage_repo or FakeUsageRepository()
@@ -53,10 +56,16 @@ def _make_ledger(
         usage = _make_usage_model(billing_period_id=period.id)
         ur.seed_current(DEFAULT_ORG_ID, usage)
 
-    ledger = UsageLedger(usage_repo=ur, billing_repo=br, period_repo=pr)
+    ledger = UsageLedger(usage_repo=ur, billing_repo=br, period_repo=pr, metrics=metrics)
     return ledger, ur, br, pr
 
 
+async def _let_flush_task_run():
+    """Yield to the background flush task until it has written what it was woken for."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
 # ---------------------------------------------------------------------------
 # record — accumulation without flush
 # ---------------------------------------------------------------------------
@@ -109,9 +118,11 @@ class TestRecordAutoFlush:
         threshold = _FLUSH_THRESHOLDS[ActionType.ENTITIES]
 
         await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=threshold)
+        await _let_flush_task_run()
 
         assert usage_repo.call_count("increment_usage") == 1
-        assert ledger._accumulators[DEFAULT_ORG_ID][ActionType.ENTITIES] == 0
+        assert DEFAULT_ORG_ID not in ledger._accumulators
+        await ledger.close()
 
     @pytest.mark.asyncio
     async def test_flushes_at_query_threshold(self):
@@ -119,9 +130,11 @@ class TestRecordAutoFlush:
         threshold = _FLUSH_THRESHOLDS[ActionType.QUERIES]
 
         await ledger.record(DEFAULT_ORG_ID, ActionType.QUERIES, amount=threshold)
+        await _let_flush_task_run()
 
         assert usage_repo.call_count("increment_usage") == 1
-        assert ledger._accumulators[DEFAULT_ORG_ID][ActionType.QUERIES] == 0
+        assert DEFAULT_ORG_ID not in ledger._accumulators
+        await ledger.close()
 
     @pytest.mark.asyncio
     async def test_flushes_over_threshold(self):
@@ -129,8 +142,10 @@ class TestRecordAutoFlush:
         threshold = _FLUSH_THRESHOLDS[ActionType.ENTITIES]
 
         await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=threshold + 50)
+        await _let_flush_task_run()
 
         assert usage_repo.call_count("increment_usage") == 1
+        await ledger.close()
 
     @pytest.mark.asyncio
     async def test_incremental_accumulation_triggers_flush(self):
@@ -140,9 +155,35 @@ class TestRecordAutoFlush:
 
         for _ in range(threshold):
             await ledger.record(DEFAULT_ORG_ID, ActionType.QUERIES, amount=1)
+        await _let_flush_task_run()
 
         assert usage_repo.call_count("increment_usage") == 1
-        assert ledger._accumulators[DEFAULT_ORG_ID][ActionType.QUERIES] == 0
+        assert DEFAULT_ORG_ID not in ledger._accumulators
+        await ledger.close()
+
+    @pytest.mark.asyncio
+    async def test_record_does_not_wait_for_the_write(self):
+        """A slow database write never holds up record()."""
+        ledger, usage_repo, *_ = _make_ledger()
+        release = asyncio.Event()
+        increment_usage = usage_repo.increment_usage
+
+        async def slow_increment(*args, **kwargs):
+            await release.wait()
+            return await increment_usage(*args, **kwargs)
+
+        usage_repo.increment_usage = slow_increment
+        threshold = _FLUSH_THRESHOLDS[ActionType.QUERIES]
+
+        await ledger.record(DEFAULT_ORG_ID, ActionType.QUERIES, amount=threshold)
+        await _let_flush_task_run()  # flush is now blocked on the write
+        await asyncio.wait_for(
+            ledger.record(DEFAULT_ORG_ID, ActionType.QUERIES, amount=1), timeout=1
+        )
+
+        assert ledger._accumulators[DEFAULT_ORG_ID][ActionType.QUERIES] == 1
+        release.set()
+        await ledger.close()
 
 
 # ---------------------------------------------------------------------------
@@ -179,24 +220,30 @@ class TestRecordSkippedActions:
 @patch("airweave.db.session.get_db_context", _fake_db_context)
 class TestRecordNoBilling:
     @pytest.mark.asyncio
-    async def test_skips_when_no_billing(self):
+    async def test_drops_usage_when_no_billing(self):
         ledger, usage_repo, *_ = _make_ledger(seed_billing=False)
 
-        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=500)
+        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=5)
+        await ledger.flush()
+        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=5)
 
         assert DEFAULT_ORG_ID not in ledger._accumulators
         assert usage_repo.call_count("increment_usage") == 0
+        await ledger.close()
 
     @pytest.mark.asyncio
     async def test_caches_billing_check(self):
-        """Second call for same org uses cached result."""
+        """Later flushes for the same org use the cached result."""
         ledger, _, billing_repo, _ = _make_ledger(seed_billing=False)
 
         await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=1)
+        await ledger.flush()
         await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=1)
+        await ledger.flush()
 
         get_calls = [c for c in billing_repo._calls if c[0] == "get_by_org_id"]
         assert len(get_calls) == 1
+        await ledger.close()
 
 
 # ---------------------------------------------------------------------------
@@ -215,8 +262,7 @@ class TestExplicitFlush:
         await ledger.flush(DEFAULT_ORG_ID)
 
         assert usage_repo.call_count("increment_usage") == 1
-        assert ledger._accumulators[DEFAULT_ORG_ID][ActionType.ENTITIES] == 0
-        assert ledger._accumulators[DEFAULT_ORG_ID][ActionType.QUERIES] == 0
+        assert DEFAULT_ORG_ID not in ledger._accumulators
 
     @pytest.mark.asyncio
     async def test_flush_all_orgs(self):
@@ -269,6 +315,95 @@ class TestExplicitFlush:
         assert ledger._accumulators[OTHER_ORG_ID][ActionType.ENTITIES] == 7
 
 
+# ---------------------------------------------------------------------------
+# failed writes, close and metrics
+# ---------------------------------------------------------------------------
+
+
+@patch("airweave.db.session.get_db_context", _fake_db_context)
+class TestDurability:
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self):
+        ledger, usage_repo, *_ = _make_ledger()
+        increment_usage = usage_repo.increment_usage
+        usage_repo.increment_usage = AsyncMock(side_effect=RuntimeError("db down"))
+        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=5)
+
+        await ledger.flush()
+        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=2)
+
+        assert ledger._accumulators[DEFAULT_ORG_ID][ActionType.ENTITIES] == 7
+
+        usage_repo.increment_usage = increment_usage
+        await ledger.close()
+
+        usage = await usage_repo.get_current_usage(AsyncMock(), organization_id=DEFAULT_ORG_ID)
+        assert usage.entities == 7
+        assert DEFAULT_ORG_ID not in ledger._accumulators
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending_usage(self):
+        ledger, usage_repo, *_ = _make_ledger()
+        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=5)
+
+        await ledger.close()
+
+        assert usage_repo.call_count("increment_usage") == 1
+        assert ledger._flush_task is None
+        assert DEFAULT_ORG_ID not in ledger._accumulators
+
+    @pytest.mark.asyncio
+    async def test_close_during_a_slow_flush_loses_nothing(self):
+        ledger, usage_repo, *_ = _make_ledger()
+        started, release = asyncio.Event(), asyncio.Event()
+        increment_usage = usage_repo.increment_usage
+
+        async def slow_increment(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return await increment_usage(*args, **kwargs)
+
+        usage_repo.increment_usage = slow_increment
+        threshold = _FLUSH_THRESHOLDS[ActionType.ENTITIES]
+        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=threshold)
+        await asyncio.wait_for(started.wait(), timeout=1)  # the flush task is mid-write
+        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=3)
+
+        closing = asyncio.create_task(ledger.close())
+        await _let_flush_task_run()
+        release.set()
+        await asyncio.wait_for(closing, timeout=1)
+
+        usage = await usage_repo.get_current_usage(AsyncMock(), organization_id=DEFAULT_ORG_ID)
+        assert usage.entities == threshold + 3
+        assert DEFAULT_ORG_ID not in ledger._accumulators
+
+    @pytest.mark.asyncio
+    async def test_cancelled_write_is_merged_back(self):
+        ledger, usage_repo, *_ = _make_ledger()
+        usage_repo.increment_usage = AsyncMock(side_effect=asyncio.CancelledError())
+        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=5)
+
+        with pytest.raises(asyncio.CancelledError):
+            await ledger.flush()
+
+        assert ledger._accumulators[DEFAULT_ORG_ID][ActionType.ENTITIES] == 5
+
+    @pytest.mark.asyncio
+    async def test_metrics_track_pending_and_flushes(self):
+        metrics = FakeUsageLedgerMetrics()
+        ledger, *_ = _make_ledger(metrics=metrics)
+
+        await ledger.record(DEFAULT_ORG_ID, ActionType.ENTITIES, amount=5)
+        await ledger.record(DEFAULT_ORG_ID, ActionType.QUERIES, amount=3)
+        assert metrics.pending == {"entities": 5, "queries": 3}
+
+        await ledger.close()
+
+        assert metrics.pending == {"entities": 0, "queries": 0}
+        assert [f.success for f in metrics.flushes] == [True]
+
+
 # ---------------------------------------------------------------------------
 # NullUsageLedger
 # ---------------------------------------------------------------------------
@@ -285,3 +420,7 @@ class TestNullUsageLedger:
         ledger = NullUsageLedger()
         await ledger.flush(DEFAULT_ORG_ID)
         await ledger.flush()
+
+    @pytest.mark.asyncio
+    async def test_close_is_noop(self):
+        await NullUsageLedger().close()
@@ -59,6 +59,7 @@ class TestEventBusFanout:
             collection_readable_id="test-abc",
         )
         await bus.publish(event)
+        await bus.flush()
 
         assert publisher.has_event("sync.completed")
         assert publisher.events[0] is event
@@ -74,6 +75,7 @@ class TestEventBusFanout:
             collection_readable_id="new-abc",
         )
         await bus.publish(event)
+        await bus.flush()
 
         assert publisher.has_event("collection.created")
 
@@ -116,6 +118,7 @@ class TestEventBusFanout:
 
         for event in events:
             await bus.publish(event)
+            await bus.flush()
 
         assert len(publisher.events) == 3
         assert publisher.has_event("sync.pending")
@@ -146,6 +149,7 @@ class TestEventBusFanout:
 
         # Should not raise despite one subscriber failing
         await bus.publish(event)
+        await bus.flush()
 
         # The webhook subscriber still received the event
         assert publisher.has_event("sync.completed")
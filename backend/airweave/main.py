@@ -15,21 +15,14 @@ from fastapi.responses import HTMLResponse
 from pydantic import ValidationError
 
 from airweave.api.middleware import (
+    ApiMiddleware,
     DynamicCORSMiddleware,
-    add_request_id,
     airweave_exception_handler,
-    analytics_middleware,
-    exception_logging_middleware,
-    http_metrics_middleware,
     invalid_input_exception_handler,
     invalid_state_exception_handler,
-    log_requests,
     not_found_exception_handler,
     permission_exception_handler,
     rate_limit_exception_handler,
-    rate_limit_headers_middleware,
-    request_body_size_middleware,
-    request_timeout_middleware,
     validation_exception_handler,
 )
 from airweave.api.router import TrailingSlashRouter
@@ -90,6 +83,9 @@ async def lifespan(app: FastAPI):
             f"Failed to initialize system schedules (Temporal may not be available): {e}"
         )
 
+    # Serve repeated context lookups from memory, dropping entries that any pod invalidates
+    await container_mod.container.context_cache.start()
+
     # Start metrics sidecar + DB pool sampler; wire app.state.http_metrics
     from airweave.core.metrics_service import metrics_lifespan
     from airweave.db.session import async_engine
@@ -99,6 +95,18 @@ async def lifespan(app: FastAPI):
 
     container_mod.container.health.shutting_down = True
 
+    # Deliver domain events still queued for subscribers (webhooks, billing, ...)
+    await container_mod.container.event_bus.close()
+
+    # Write the usage recorded so far, including by the events just delivered
+    await container_mod.container.usage_ledger.close()
+
+    # Stop listening for context cache invalidations before pub/sub goes away
+    await container_mod.container.context_cache.close()
+
+    # End open SSE subscriptions and close the shared pub/sub connections
+    await container_mod.container.pubsub.close()
+
     # Clean up health check engine connections
     from airweave.db.session import health_check_engine
 
@@ -116,19 +124,10 @@ app = FastAPI(
 
 app.include_router(api_router)
 
-# Register middleware directly in the correct order.
-# Order matters: first registered = outermost (processes request first).
-# http_metrics_middleware is intentionally early so it captures
-# end-to-end latency and counts 413/408/429 responses generated
-# by inner middlewares (body-size, timeout, rate-limit).
-app.middleware("http")(add_request_id)
-app.middleware("http")(http_metrics_middleware)
-app.middleware("http")(request_body_size_middleware)
-app.middleware("http")(request_timeout_middleware)
-app.middleware("http")(rate_limit_headers_middleware)
-app.middleware("http")(log_requests)
-app.middleware("http")(analytics_middleware)
-app.middleware("http")(exception_logging_middleware)
+# Request IDs, exception logging, analytics, request logging, rate limit headers,
+# timeout, body size limit and HTTP metrics all run in one pure-ASGI middleware;
+# see ApiMiddleware for the order they apply in.
+app.add_middleware(ApiMiddleware)
 
 # Register exception handlers
 app.exception_handler(RequestValidationError)(validation_exception_handler)
@@ -164,7 +163,8 @@ if settings.ADDITIONAL_CORS_ORIGINS:
     else:
         CORS_ORIGINS.extend(additional_origins)
 
-# Add the dynamic CORS middleware that handles both default origins and white label specific origins
+# Add the dynamic CORS middleware that handles both default origins and white label specific
+# origins. Added last, so it is the outermost middleware and answers preflight requests first.
 app.add_middleware(
     DynamicCORSMiddleware,
     default_origins=CORS_ORIGINS,
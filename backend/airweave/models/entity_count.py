@@ -15,7 +15,8 @@ if TYPE_CHECKING:
 class EntityCount(Base):
     """Entity count model.
 
-    Maintained by a PostgreSQL trigger on the entity table.
+    Maintained by statement-level PostgreSQL triggers on the entity table, which
+    apply one aggregated delta per sync and entity definition for each statement.
     """
 
     __tablename__ = "entity_count"
@@ -1,11 +1,13 @@
 """Code chunker using AST-based parsing with TokenChunker safety net."""
 
+import threading
 from typing import Any, Dict, List, Optional
 
 from airweave.core.logging import logger
 from airweave.domains.sync_pipeline.async_helpers import run_in_thread_pool
 from airweave.domains.sync_pipeline.exceptions import SyncFailureError
 from airweave.platform.chunkers._base import BaseChunker
+from airweave.platform.chunkers.code_language import CodeLanguageDetector
 from airweave.platform.chunkers.tiktoken_compat import SafeEncoding
 from airweave.platform.tokenizers import TikTokenTokenizer, get_tokenizer
 
@@ -17,8 +19,11 @@ class CodeChunker(BaseChunker):
     1. CodeChunker: Chunks at logical code boundaries (functions, classes, methods)
     2. TokenChunker fallback: Force-splits any oversized chunks at token boundaries
 
-    The chunker is shared across all syncs in the pod to avoid reloading
-    the Magika language detection model for every sync job.
+    The chunker is shared across all syncs in the pod. Languages come from
+    the pod-wide ``CodeLanguageDetector``, which has usually detected them
+    already when ChunkEmbedProcessor filtered the batch, and each thread keeps
+    one Chonkie chunker (and so one tree-sitter parser) per language, so every
+    file is detected and parsed once and concurrent batches never share a parser.
 
     Note: Even with AST-based splitting, single large AST nodes (massive functions
     without children) can exceed chunk_size, so we use TokenChunker as safety net.
@@ -44,9 +49,12 @@ class CodeChunker(BaseChunker):
         if self._initialized:
             return
 
-        self._code_chunker = None  # Lazy init
+        self._code_chunker_cls = None  # Lazy init
+        self._safe_encoding = None  # Lazy init
         self._token_chunker = None  # Lazy init (emergency fallback)
         self._tiktoken_tokenizer = None  # Lazy init
+        self._detector = CodeLanguageDetector()
+        self._local = threading.local()  # Per-thread {language: Chonkie CodeChunker}
         self._initialized = True
 
         logger.debug(
@@ -57,12 +65,13 @@ class CodeChunker(BaseChunker):
     def _ensure_chunkers(self):
         """Lazy initialization of chunker models.
 
-        Initializes CodeChunker (AST parsing) + TokenChunker (safety net).
+        Loads Chonkie's CodeChunker (AST parsing, instantiated per thread and
+        language) + TokenChunker (safety net).
 
         Raises:
             SyncFailureError: If model loading fails (infrastructure error)
         """
-        if self._code_chunker is not None:
+        if self._code_chunker_cls is not None:
             return
 
         try:
@@ -81,25 +90,19 @@ class CodeChunker(BaseChunker):
             # Wrap the raw encoding to allow special tokens like <|endoftext|>
             # that may appear in code comments/strings. Without this wrapper,
             # Chonkie calls encode() directly without allowed_special='all'.
-            safe_encoding = SafeEncoding(tokenizer.encoding)
-
-            # Initialize Chonkie's CodeChunker with auto language detection
-            self._code_chunker = ChonkieCodeChunker(
-                language="auto",
-                tokenizer=safe_encoding,
-                chunk_size=self.CHUNK_SIZE,
-                include_nodes=False,
-            )
+            self._safe_encoding = SafeEncoding(tokenizer.encoding)
 
             # Initialize TokenChunker for fallback (also needs safe encoding)
             self._token_chunker = TokenChunker(
-                tokenizer=safe_encoding,
+                tokenizer=self._safe_encoding,
                 chunk_size=self.MAX_TOKENS_PER_CHUNK,
                 chunk_overlap=0,
             )
 
+            self._code_chunker_cls = ChonkieCodeChunker
+
             logger.info(
-                f"Loaded CodeChunker (auto-detect, target: {self.CHUNK_SIZE}) + "
+                f"Loaded CodeChunker (target: {self.CHUNK_SIZE}) + "
                 f"TokenChunker fallback (hard_limit: {self.MAX_TOKENS_PER_CHUNK})"
             )
 
@@ -128,7 +131,7 @@ class CodeChunker(BaseChunker):
 
         # Stage 1: AST-based code chunking
         try:
-            code_results = await run_in_thread_pool(self._code_chunker.chunk_batch, texts)
+            code_results = await run_in_thread_pool(self._chunk_code_batch, texts)
         except Exception as e:
             # CodeChunker failure = sync failure (not entity-level)
             raise SyncFailureError(f"CodeChunker batch processing failed: {e}")
@@ -170,6 +173,48 @@ class CodeChunker(BaseChunker):
 
         return filtered_results
 
+    def _chunk_code_batch(self, texts: List[str]) -> List[List[Any]]:
+        """Chunk each text with the parser for its detected language (blocking).
+
+        Text in a language without a tree-sitter grammar (normally filtered
+        out before it gets here) is split by the TokenChunker instead.
+        """
+        token_chunker = self._token_chunker
+        assert token_chunker is not None  # set by _ensure_chunkers()
+
+        results: List[List[Any]] = []
+        for text in texts:
+            if not text.strip():
+                results.append([])
+                continue
+            language = self._detector.detect(text)
+            if language is None:
+                results.append(token_chunker.chunk(text))
+            else:
+                results.append(self._chunker_for(language).chunk(text))
+        return results
+
+    def _chunker_for(self, language: str) -> Any:
+        """This thread's Chonkie CodeChunker for ``language``.
+
+        Chonkie's chunker holds a tree-sitter parser, which must not be used
+        from two threads at once, so each thread builds its own per language.
+        """
+        chunkers = getattr(self._local, "chunkers", None)
+        if chunkers is None:
+            chunkers = self._local.chunkers = {}
+        chunker = chunkers.get(language)
+        if chunker is None:
+            assert self._code_chunker_cls is not None  # set by _ensure_chunkers()
+            chunker = self._code_chunker_cls(
+                language=language,
+                tokenizer=self._safe_encoding,
+                chunk_size=self.CHUNK_SIZE,
+                include_nodes=False,
+            )
+            chunkers[language] = chunker
+        return chunker
+
     def _apply_safety_net_batched(
         self, code_results: List[List[Any]]
     ) -> List[List[Dict[str, Any]]]:
@@ -1,5 +1,7 @@
 """Base cursor class for incremental sync tracking."""
 
+from typing import ClassVar
+
 from pydantic import BaseModel, ConfigDict
 
 
@@ -12,8 +14,15 @@ class BaseCursor(BaseModel):
     - JSON schema generation
 
     All cursor classes should inherit from this base class.
+
+    Set ``supports_checkpoints`` on a cursor class when its source only records
+    progress in the cursor for entities it has already yielded, so that the
+    cursor is a valid resume point at any moment of the sync. The orchestrator
+    then persists it periodically during a sync instead of only at the end.
     """
 
+    supports_checkpoints: ClassVar[bool] = False
+
     model_config = ConfigDict(
         # Allow extra fields for forward compatibility
         extra="allow",
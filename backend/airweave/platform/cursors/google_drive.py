@@ -1,6 +1,6 @@
 """Google Drive cursor schema for incremental sync."""
 
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict
 
 from pydantic import Field
 
@@ -14,8 +14,16 @@ class GoogleDriveCursor(BaseCursor):
     and folders. Each change state is associated with a page token.
 
     Reference: https://developers.google.com/drive/api/guides/manage-changes
+
+    File metadata is stored as each file entity is yielded and the page token
+    only at the end. A retry from a checkpoint taken mid full sync therefore
+    finds no token and runs the full sync again, skipping the files whose
+    stored metadata still matches; a retried incremental sync replays the
+    changes since the old token the same way.
     """
 
+    supports_checkpoints: ClassVar[bool] = True
+
     start_page_token: str = Field(
         default="",
         description="Drive Changes API page token for tracking incremental changes",
@@ -6,7 +6,7 @@ SPO supports incremental change tracking via:
 """
 
 from datetime import datetime
-from typing import Dict
+from typing import ClassVar, Dict, List
 
 from pydantic import Field
 
@@ -19,8 +19,17 @@ class SharePointOnlineCursor(BaseCursor):
     Tracks two independent change streams:
     1. Entity sync via Graph delta queries (per-drive delta tokens)
     2. ACL sync via group membership snapshots
+
+    A drive's delta token is stored once all of its items have been yielded,
+    so a checkpoint taken mid-sync lets a retry resume per drive. During a
+    full sync, finished drives are also listed in ``full_sync_completed_drives``
+    and the full-sync flags are only cleared once every site is done, so a
+    retried full sync resumes (skipping those drives) instead of switching to
+    an incremental sync over the drives that happen to have tokens.
     """
 
+    supports_checkpoints: ClassVar[bool] = True
+
     drive_delta_tokens: Dict[str, str] = Field(
         default_factory=dict,
         description="Map of drive_id -> delta token from Graph delta query.",
@@ -76,6 +85,11 @@ class SharePointOnlineCursor(BaseCursor):
         description="Map of drive_id -> drive name (discovered drives).",
     )
 
+    full_sync_completed_drives: List[str] = Field(
+        default_factory=list,
+        description="Drives finished by the full sync in progress; a retry skips them.",
+    )
+
     def has_delta_tokens(self) -> bool:
         """Return whether any delta tokens have been stored."""
         return bool(self.drive_delta_tokens)
@@ -106,14 +120,23 @@ class SharePointOnlineCursor(BaseCursor):
         changes_count: int,
         is_full_sync: bool = False,
     ) -> None:
-        """Update entity sync state for a given drive."""
+        """Update entity sync state for a given drive.
+
+        During a full sync the drive is only marked done; the full sync itself
+        is recorded by :meth:`complete_full_sync`.
+        """
         self.drive_delta_tokens[drive_id] = delta_token
         self.last_entity_sync_timestamp = datetime.utcnow().isoformat()
         self.last_entity_changes_count = changes_count
-        if is_full_sync:
-            self.last_full_sync_timestamp = datetime.utcnow().isoformat()
-            self.total_entities_synced = changes_count
-            self.full_sync_required = False
+        if is_full_sync and drive_id not in self.full_sync_completed_drives:
+            self.full_sync_completed_drives.append(drive_id)
+
+    def complete_full_sync(self, total_entities: int) -> None:
+        """Record a full sync that went through every site and drive."""
+        self.last_full_sync_timestamp = datetime.utcnow().isoformat()
+        self.total_entities_synced = total_entities
+        self.full_sync_required = False
+        self.full_sync_completed_drives = []
 
     def update_acl_cursor(self, changes_count: int) -> None:
         """Update ACL sync state."""
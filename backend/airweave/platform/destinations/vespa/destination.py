@@ -21,6 +21,7 @@ from uuid import UUID
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
 from airweave.core.logging import logger as default_logger
+from airweave.domains.sync_pipeline.flight_recorder import SyncStage, stage
 from airweave.platform.decorators import destination
 from airweave.platform.destinations._base import VectorDBDestination
 from airweave.platform.destinations.vespa.client import VespaClient
@@ -101,7 +102,8 @@ class VespaDestination(VectorDBDestination):
             vector_size: Vector dimensions (unused - Vespa handles embeddings)
             logger: Logger instance
             soft_fail: If True, errors won't fail the sync (default False - Vespa is primary)
-            **kwargs: Additional keyword arguments (unused)
+            **kwargs: Additional keyword arguments. ``source_supports_acl`` enables ACL
+                fields; ``client`` supplies a pre-built VespaClient instead of connecting.
 
         Returns:
             Configured VespaDestination instance
@@ -113,7 +115,7 @@ class VespaDestination(VectorDBDestination):
 
         # Initialize components
         source_supports_acl = kwargs.get("source_supports_acl", False)
-        instance._client = await VespaClient.connect(logger=instance.logger)
+        instance._client = kwargs.get("client") or await VespaClient.connect(logger=instance.logger)
         instance._transformer = EntityTransformer(
             collection_id=collection_id,
             logger=instance.logger,
@@ -157,7 +159,8 @@ class VespaDestination(VectorDBDestination):
 
         # Transform entities
         transform_start = time.perf_counter()
-        docs_by_schema = self._transformer.transform_batch(entities)
+        with stage(SyncStage.TRANSFORM):
+            docs_by_schema = self._transformer.transform_batch(entities)
 
         # Convert to dict format for client
         docs_dict = dict(docs_by_schema.items())
@@ -175,7 +178,8 @@ class VespaDestination(VectorDBDestination):
 
         # Feed documents
         feed_start = time.perf_counter()
-        result = await self._client.feed_documents(docs_by_schema)
+        with stage(SyncStage.FEED):
+            result = await self._client.feed_documents(docs_by_schema)
         feed_ms = (time.perf_counter() - feed_start) * 1000
 
         total_ms = (time.perf_counter() - total_start) * 1000
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import ClassVar, List, Optional, Type
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from airweave.domains.embedders.types import SparseEmbedding
 
@@ -224,6 +224,19 @@ class FileEntity(BaseEntity):
 
     local_path: Optional[str] = Field(None, description="Local path of the file.")
 
+    # Digest of the file at local_path, recorded by FileService while writing it.
+    # Private so it never collides with source fields, serializes or gets hashed.
+    _local_content_sha256: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def local_content_sha256(self) -> Optional[str]:
+        """SHA-256 of the file at ``local_path``, when recorded while it was written."""
+        return self._local_content_sha256
+
+    @local_content_sha256.setter
+    def local_content_sha256(self, digest: Optional[str]) -> None:
+        self._local_content_sha256 = digest
+
 
 class CodeFileEntity(FileEntity):
     """Code file entity schema."""
@@ -6,6 +6,7 @@ exhausting customer API quotas.
 
 from __future__ import annotations
 
+import time
 from contextlib import asynccontextmanager
 from typing import Optional
 from uuid import UUID
@@ -15,6 +16,7 @@ import httpx
 from airweave.core.logging import ContextualLogger
 from airweave.domains.sources.rate_limiting.exceptions import InternalRateLimitExceeded
 from airweave.domains.sources.rate_limiting.service import SourceRateLimiter
+from airweave.platform.http_client.concurrency import AdaptiveConcurrency
 from airweave.platform.utils.ssrf import SSRFViolation, validate_url
 
 
@@ -23,6 +25,10 @@ class AirweaveHttpClient:
 
     Wraps an httpx.AsyncClient and adds rate limiting before requests.
     Rate limiter is injected at construction — no global singleton access.
+
+    When an ``AdaptiveConcurrency`` limiter is attached, every request holds
+    one of its slots and reports status, ``Retry-After`` and latency back to
+    it, so the connector's concurrency tracks what the upstream tolerates.
     """
 
     def __init__(
@@ -34,6 +40,7 @@ class AirweaveHttpClient:
         source_connection_id: Optional[UUID] = None,
         feature_flag_enabled: bool = True,
         logger: Optional[ContextualLogger] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
     ):
         """Initialize wrapper around an existing HTTP client.
 
@@ -45,6 +52,7 @@ class AirweaveHttpClient:
             source_connection_id: Source connection ID (for connection-level sources).
             feature_flag_enabled: Whether SOURCE_RATE_LIMITING feature is enabled.
             logger: Contextual logger with sync/search metadata.
+            concurrency: Shared AIMD limiter for this source connection.
         """
         self._client = wrapped_client
         self._org_id = org_id
@@ -53,11 +61,17 @@ class AirweaveHttpClient:
         self._source_connection_id = source_connection_id
         self._feature_flag_enabled = feature_flag_enabled
         self._logger = logger
+        self._concurrency = concurrency
 
         # Install SSRF redirect hook on httpx clients
         if isinstance(wrapped_client, httpx.AsyncClient):
             self._install_ssrf_hook(wrapped_client)
 
+    @property
+    def concurrency(self) -> Optional[AdaptiveConcurrency]:
+        """Adaptive concurrency limiter shared by this source connection, if any."""
+        return self._concurrency
+
     def _check_ssrf(self, url: str) -> None:
         """Validate URL against SSRF blocklist before making a request."""
         try:
@@ -114,12 +128,28 @@ class AirweaveHttpClient:
                 response=fake_response,
             )
 
-    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+    async def check_rate_limit(self, method: str, url: str) -> None:
+        """Charge one request against the source rate limit without sending it.
+
+        Used by the batch transport so every sub-request of a batch counts
+        individually, exactly as if it had been sent on its own.
+
+        Raises:
+            httpx.HTTPStatusError: With 429 status if rate limit exceeded
+        """
+        self._check_ssrf(url)
+        await self._check_rate_limit_and_convert_to_429(method, url)
+
+    async def request(
+        self, method: str, url: str, *, rate_limited: bool = True, **kwargs
+    ) -> httpx.Response:
         """Make HTTP request with rate limiting check.
 
         Args:
             method: HTTP method
             url: Request URL
+            rate_limited: Set to False when the request was already charged via
+                ``check_rate_limit`` (e.g. a batch envelope).
             **kwargs: Additional request parameters
 
         Returns:
@@ -132,10 +162,24 @@ class AirweaveHttpClient:
         self._check_ssrf(url)
 
         # Check rate limit BEFORE request
-        await self._check_rate_limit_and_convert_to_429(method, url)
+        if rate_limited:
+            await self._check_rate_limit_and_convert_to_429(method, url)
 
         # Delegate to wrapped client (httpx or Pipedream)
-        response = await self._client.request(method, url, **kwargs)
+        if self._concurrency is None:
+            response = await self._client.request(method, url, **kwargs)
+        else:
+            async with self._concurrency.slot():
+                started = time.monotonic()
+                try:
+                    response = await self._client.request(method, url, **kwargs)
+                except httpx.TimeoutException:
+                    self._concurrency.record(503, None)
+                    raise
+                # Pre-charged requests are batch envelopes whose latency grows
+                # with batch size, so only their status is a useful signal.
+                latency = time.monotonic() - started if rate_limited else None
+                self._record_response(response, latency)
 
         # Log full response details on HTTP errors (4xx/5xx)
         if response.status_code >= 400:
@@ -143,6 +187,18 @@ class AirweaveHttpClient:
 
         return response
 
+    def _record_response(self, response: httpx.Response, latency: Optional[float]) -> None:
+        """Report an upstream response to the adaptive concurrency limiter."""
+        if self._concurrency is None:
+            return
+        retry_after: Optional[float] = None
+        if response.status_code in (429, 503):
+            try:
+                retry_after = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                retry_after = None
+        self._concurrency.record(response.status_code, latency, retry_after)
+
     async def _log_error_response(self, method: str, url: str, response: httpx.Response) -> None:
         """Log full HTTP error response for debugging.
 
@@ -219,8 +275,12 @@ class AirweaveHttpClient:
         # Check rate limit before streaming
         await self._check_rate_limit_and_convert_to_429(method, url)
 
-        # Delegate to wrapped client's stream
+        # Delegate to wrapped client's stream. Streams don't hold a concurrency
+        # slot (callers may issue requests while a stream is open), but the
+        # time-to-headers still feeds the limiter.
+        started = time.monotonic()
         async with self._client.stream(method, url, **kwargs) as response:
+            self._record_response(response, time.monotonic() - started)
             # Log error responses for streaming requests too
             if response.status_code >= 400:
                 await self._log_error_response(method, url, response)
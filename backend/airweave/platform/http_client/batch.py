@@ -0,0 +1,481 @@
+"""HTTP batch transport on top of AirweaveHttpClient.
+
+Coalesces individual GET/POST calls issued concurrently by a source into a
+single upstream batch request:
+
+- Google APIs: ``multipart/mixed`` batches (``/batch/{api}/{version}``)
+- Microsoft Graph: JSON ``$batch`` requests
+
+Callers keep their per-item code: ``await batch.get(url, headers=...)`` returns
+an ``httpx.Response`` for that item, so existing status handling
+(``raise_for_status``, 401 refresh, 404 skip) keeps working unchanged.
+
+Per-item behaviour:
+
+- Each sub-request is charged against the source rate limiter individually,
+  exactly as if it had been sent on its own.
+- Sub-responses with 429 are retried inside the next batch (honouring
+  ``Retry-After``) before being handed back to the caller.
+- If the batch request itself fails, every caller sees the failure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from airweave.core.logging import ContextualLogger
+from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+
+MAX_SUB_REQUEST_RETRIES = 3
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+@dataclass
+class BatchSubRequest:
+    """A single request waiting to be sent as part of a batch."""
+
+    method: str
+    url: httpx.URL
+    headers: Dict[str, str]
+    body: Optional[Any] = None
+    attempts: int = 0
+    future: asyncio.Future = field(default_factory=lambda: _new_future())
+
+    def as_httpx_request(self) -> httpx.Request:
+        """Build the httpx.Request attached to the synthesized sub-response."""
+        return httpx.Request(self.method, self.url, headers=self.headers)
+
+
+@dataclass
+class BatchStats:
+    """Counters describing how well calls are being coalesced."""
+
+    batches_sent: int = 0
+    sub_requests_sent: int = 0
+    sub_request_retries: int = 0
+    batch_failures: int = 0
+
+    @property
+    def avg_batch_size(self) -> float:
+        """Average number of sub-requests per upstream batch."""
+        return self.sub_requests_sent / self.batches_sent if self.batches_sent else 0.0
+
+
+# =============================================================================
+# Wire formats
+# =============================================================================
+
+
+class BatchCodec(ABC):
+    """Encodes sub-requests into one batch request and decodes the batch response."""
+
+    endpoint: str
+    max_batch_size: int
+
+    @abstractmethod
+    def encode(self, requests: List[BatchSubRequest]) -> Tuple[bytes, Dict[str, str]]:
+        """Return the batch request body and its content headers."""
+
+    @abstractmethod
+    def decode(
+        self, response: httpx.Response, requests: List[BatchSubRequest]
+    ) -> List[Optional[httpx.Response]]:
+        """Return one sub-response per sub-request (None when missing)."""
+
+
+class GoogleBatchCodec(BatchCodec):
+    """Google API ``multipart/mixed`` batch format.
+
+    Args:
+        endpoint: Batch endpoint, e.g. ``https://gmail.googleapis.com/batch/gmail/v1``.
+        max_batch_size: Sub-requests per batch (Google allows 100; Gmail
+            recommends at most 50 to avoid per-user rate limiting).
+    """
+
+    def __init__(self, endpoint: str, max_batch_size: int = 50) -> None:
+        """Initialize with the API-specific batch endpoint."""
+        self.endpoint = endpoint
+        self.max_batch_size = max_batch_size
+
+    def encode(self, requests: List[BatchSubRequest]) -> Tuple[bytes, Dict[str, str]]:
+        """Serialize sub-requests as ``application/http`` parts."""
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts: List[bytes] = []
+        for index, req in enumerate(requests):
+            target = req.url.raw_path.decode("ascii")
+            lines = [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                f"Content-ID: <item{index}>",
+                "",
+                f"{req.method} {target} HTTP/1.1",
+            ]
+            body = b""
+            if req.body is not None:
+                body = json.dumps(req.body).encode()
+                lines.append("Content-Type: application/json")
+            for name, value in req.headers.items():
+                if name.lower() != "authorization":
+                    lines.append(f"{name}: {value}")
+            parts.append(("\r\n".join(lines) + "\r\n\r\n").encode() + body + b"\r\n")
+        payload = b"".join(parts) + f"--{boundary}--\r\n".encode()
+        return payload, {"Content-Type": f"multipart/mixed; boundary={boundary}"}
+
+    def decode(
+        self, response: httpx.Response, requests: List[BatchSubRequest]
+    ) -> List[Optional[httpx.Response]]:
+        """Parse the ``multipart/mixed`` response into per-item responses."""
+        boundary = _multipart_boundary(response.headers.get("Content-Type", ""))
+        results: List[Optional[httpx.Response]] = [None] * len(requests)
+        if not boundary:
+            return results
+
+        delimiter = f"--{boundary}".encode()
+        for raw_part in response.content.split(delimiter)[1:]:
+            if raw_part.startswith(b"--"):
+                break
+            part_headers, http_message = _split_head_body(raw_part.lstrip(b"\r\n"))
+            index = _google_content_id_index(part_headers.get("content-id", ""))
+            if index is None or not 0 <= index < len(requests):
+                continue
+            results[index] = _parse_http_message(http_message, requests[index])
+        return results
+
+
+class GraphBatchCodec(BatchCodec):
+    """Microsoft Graph JSON ``$batch`` format (max 20 sub-requests per batch)."""
+
+    def __init__(
+        self,
+        base_url: str = "https://graph.microsoft.com/v1.0",
+        max_batch_size: int = 20,
+    ) -> None:
+        """Initialize with the Graph API version base URL."""
+        self.base_url = base_url.rstrip("/")
+        self.endpoint = f"{self.base_url}/$batch"
+        self.max_batch_size = max_batch_size
+
+    def encode(self, requests: List[BatchSubRequest]) -> Tuple[bytes, Dict[str, str]]:
+        """Serialize sub-requests as a ``{"requests": [...]}`` document."""
+        entries = []
+        for index, req in enumerate(requests):
+            url = str(req.url)
+            relative = url[len(self.base_url) :] if url.startswith(self.base_url) else url
+            entry: Dict[str, Any] = {"id": str(index), "method": req.method, "url": relative}
+            # Auth lives on the envelope; Graph rejects Content-Type on body-less entries
+            headers = {
+                k: v
+                for k, v in req.headers.items()
+                if k.lower() not in ("authorization", "content-type")
+            }
+            if req.body is not None:
+                entry["body"] = req.body
+                headers.setdefault("Content-Type", "application/json")
+            if headers:
+                entry["headers"] = headers
+            entries.append(entry)
+        payload = json.dumps({"requests": entries}).encode()
+        return payload, {"Content-Type": "application/json", "Accept": "application/json"}
+
+    def decode(
+        self, response: httpx.Response, requests: List[BatchSubRequest]
+    ) -> List[Optional[httpx.Response]]:
+        """Map ``responses[]`` entries back onto sub-requests by id."""
+        results: List[Optional[httpx.Response]] = [None] * len(requests)
+        for entry in response.json().get("responses", []):
+            try:
+                index = int(entry.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < len(requests):
+                continue
+            body = entry.get("body")
+            if body is None:
+                content = b""
+            elif isinstance(body, (dict, list)):
+                content = json.dumps(body).encode()
+            else:
+                content = str(body).encode()
+            results[index] = httpx.Response(
+                status_code=int(entry.get("status", 500)),
+                headers=entry.get("headers") or {},
+                content=content,
+                request=requests[index].as_httpx_request(),
+            )
+        return results
+
+
+# =============================================================================
+# Coalescing client
+# =============================================================================
+
+
+class BatchingHttpClient:
+    """Coalesces concurrent calls into upstream batch requests.
+
+    Calls made within ``max_wait_ms`` of each other (or until the codec's
+    ``max_batch_size`` is reached) are sent together. Sub-requests are grouped
+    by ``Authorization`` header, which is applied to the batch envelope.
+
+    Args:
+        http_client: Rate-limited client used to send the batch envelopes.
+        codec: Wire format (Google multipart or Graph JSON).
+        max_wait_ms: How long the first call in a batch waits for company.
+        logger: Optional contextual logger.
+    """
+
+    def __init__(
+        self,
+        http_client: AirweaveHttpClient,
+        codec: BatchCodec,
+        max_wait_ms: float = 10.0,
+        logger: Optional[ContextualLogger] = None,
+    ) -> None:
+        """Initialize an empty batcher."""
+        self._http_client = http_client
+        self._codec = codec
+        self._max_wait = max_wait_ms / 1000.0
+        self._logger = logger
+        self._pending: Dict[str, List[BatchSubRequest]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._inflight: set[asyncio.Task] = set()
+        self.stats = BatchStats()
+
+    # -- Public API (mimics AirweaveHttpClient) --
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        **_: Any,
+    ) -> httpx.Response:
+        """Queue a request for the next batch and wait for its own response."""
+        full_url = httpx.URL(url, params=params) if params else httpx.URL(url)
+        await self._http_client.check_rate_limit(method, str(full_url))
+
+        sub = BatchSubRequest(method=method, url=full_url, headers=dict(headers or {}), body=json)
+        self._enqueue(sub)
+        return await sub.future
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Queue a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Queue a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    async def flush(self) -> None:
+        """Send all pending sub-requests now and wait for in-flight batches."""
+        for auth in list(self._pending):
+            self._flush_group(auth)
+        while self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
+
+    # -- Queueing --
+
+    def _enqueue(self, sub: BatchSubRequest) -> None:
+        auth = next((v for k, v in sub.headers.items() if k.lower() == "authorization"), "")
+        group = self._pending.setdefault(auth, [])
+        group.append(sub)
+
+        if len(group) >= self._codec.max_batch_size:
+            self._flush_group(auth)
+        elif auth not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[auth] = loop.call_later(self._max_wait, self._flush_group, auth)
+
+    def _flush_group(self, auth: str) -> None:
+        timer = self._timers.pop(auth, None)
+        if timer:
+            timer.cancel()
+        group = self._pending.pop(auth, [])
+        while group:
+            chunk, group = group[: self._codec.max_batch_size], group[self._codec.max_batch_size :]
+            task = asyncio.get_running_loop().create_task(self._send(auth, chunk))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    # -- Sending --
+
+    async def _send(self, auth: str, requests: List[BatchSubRequest]) -> None:
+        if len(requests) == 1 and requests[0].attempts == 0:
+            # No point wrapping a lone request in a batch envelope
+            await self._send_single(requests[0])
+            return
+
+        content, headers = self._codec.encode(requests)
+        if auth:
+            headers["Authorization"] = auth
+
+        self.stats.batches_sent += 1
+        self.stats.sub_requests_sent += len(requests)
+        try:
+            response = await self._http_client.request(
+                "POST",
+                self._codec.endpoint,
+                content=content,
+                headers=headers,
+                timeout=60.0,
+                rate_limited=False,
+            )
+        except Exception as exc:
+            self._fail(requests, exc)
+            return
+
+        if response.status_code >= 400:
+            # Envelope-level failure (expired token, throttled, outage): every
+            # caller sees it and applies its usual handling.
+            self.stats.batch_failures += 1
+            for sub in requests:
+                self._resolve(sub, _copy_response(response, sub))
+            return
+
+        try:
+            sub_responses = self._codec.decode(response, requests)
+        except Exception as exc:
+            self._fail(requests, exc)
+            return
+        self._dispatch(requests, sub_responses)
+
+    def _dispatch(
+        self, requests: List[BatchSubRequest], sub_responses: List[Optional[httpx.Response]]
+    ) -> None:
+        for sub, sub_response in zip(requests, sub_responses, strict=True):
+            if sub_response is None:
+                sub_response = httpx.Response(
+                    502,
+                    content=b"Missing sub-response in batch reply",
+                    request=sub.as_httpx_request(),
+                )
+            if sub_response.status_code == 429 and sub.attempts < MAX_SUB_REQUEST_RETRIES:
+                self._schedule_retry(sub, sub_response)
+                continue
+            self._resolve(sub, sub_response)
+
+    async def _send_single(self, sub: BatchSubRequest) -> None:
+        self.stats.sub_requests_sent += 1
+        try:
+            response = await self._http_client.request(
+                sub.method,
+                str(sub.url),
+                headers=sub.headers,
+                json=sub.body,
+                rate_limited=False,
+            )
+        except Exception as exc:
+            if not sub.future.done():
+                sub.future.set_exception(exc)
+            return
+        self._resolve(sub, response)
+
+    def _fail(self, requests: List[BatchSubRequest], exc: Exception) -> None:
+        self.stats.batch_failures += 1
+        for sub in requests:
+            if not sub.future.done():
+                sub.future.set_exception(exc)
+
+    def _schedule_retry(self, sub: BatchSubRequest, response: httpx.Response) -> None:
+        sub.attempts += 1
+        self.stats.sub_request_retries += 1
+        delay = _retry_after_seconds(response, default=2.0**sub.attempts)
+        # Throttled sub-requests are congestion signals for the source's limiter
+        concurrency = getattr(self._http_client, "concurrency", None)
+        if concurrency is not None:
+            concurrency.record(429, None, delay)
+        if self._logger:
+            self._logger.debug(
+                f"[Batch] Sub-request {sub.method} {sub.url} throttled (429), "
+                f"retrying in {delay:.1f}s (attempt {sub.attempts}/{MAX_SUB_REQUEST_RETRIES})"
+            )
+        asyncio.get_running_loop().call_later(delay, self._enqueue, sub)
+
+    @staticmethod
+    def _resolve(sub: BatchSubRequest, response: httpx.Response) -> None:
+        if not sub.future.done():
+            sub.future.set_result(response)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _new_future() -> asyncio.Future:
+    return asyncio.get_running_loop().create_future()
+
+
+def _copy_response(response: httpx.Response, sub: BatchSubRequest) -> httpx.Response:
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=response.headers,
+        content=response.content,
+        request=sub.as_httpx_request(),
+    )
+
+
+def _retry_after_seconds(response: httpx.Response, default: float) -> float:
+    try:
+        value = float(response.headers.get("Retry-After", default))
+    except ValueError:
+        value = default
+    return max(0.0, min(value, MAX_RETRY_AFTER_SECONDS))
+
+
+def _multipart_boundary(content_type: str) -> Optional[str]:
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "boundary":
+            return value.strip('"')
+    return None
+
+
+def _split_head_body(raw: bytes) -> Tuple[Dict[str, str], bytes]:
+    """Split a header block from its body; header names are lower-cased."""
+    normalized = raw.replace(b"\r\n", b"\n")
+    head, _, body = normalized.partition(b"\n\n")
+    headers: Dict[str, str] = {}
+    for line in head.decode("utf-8", errors="replace").split("\n"):
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers, body
+
+
+def _google_content_id_index(content_id: str) -> Optional[int]:
+    # Google answers with "<response-item{N}>" for request "<item{N}>"
+    value = content_id.strip("<> ")
+    if "item" not in value:
+        return None
+    try:
+        return int(value.rsplit("item", 1)[1])
+    except ValueError:
+        return None
+
+
+def _parse_http_message(message: bytes, sub: BatchSubRequest) -> httpx.Response:
+    """Parse an embedded ``HTTP/1.1 <status>`` response."""
+    normalized = message.replace(b"\r\n", b"\n")
+    status_line, _, rest = normalized.partition(b"\n")
+    try:
+        status_code = int(status_line.split()[1])
+    except (IndexError, ValueError):
+        status_code = 502
+    headers, body = _split_head_body(rest)
+    return httpx.Response(
+        status_code=status_code,
+        headers=headers,
+        content=body.rstrip(b"\n"),
+        request=sub.as_httpx_request(),
+    )
@@ -0,0 +1,294 @@
+"""AIMD adaptive concurrency for source HTTP traffic.
+
+Each source connection gets one ``AdaptiveConcurrency`` limiter, shared by its
+``AirweaveHttpClient`` and every worker pool the connector runs. The limiter
+caps in-flight upstream requests and adjusts the cap from what it observes:
+
+- success with healthy latency  -> additive increase (+1 per ``limit`` successes)
+- 429 / 503                      -> multiplicative decrease (x0.5), and all new
+                                    requests wait out ``Retry-After``
+- latency well above baseline    -> gentle decrease (x0.9)
+
+Decreases are applied at most once per cooldown window so a burst of 429s
+from requests that were already in flight counts as a single congestion
+signal.
+
+Per-source state is kept in the module-level ``adaptive_concurrency``
+registry and exported through the worker metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, Optional
+from uuid import UUID
+
+DEFAULT_INITIAL_LIMIT = 10
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 50
+
+_BACKOFF_FACTOR = 0.5
+_LATENCY_BACKOFF_FACTOR = 0.9
+# Latency EWMA this many times the baseline counts as congestion
+_LATENCY_TOLERANCE = 2.0
+_LATENCY_SMOOTHING = 0.2
+_MIN_COOLDOWN_SECONDS = 1.0
+_MAX_PAUSE_SECONDS = 120.0
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class ConcurrencySnapshot:
+    """Point-in-time view of one limiter."""
+
+    source_short_name: str
+    limit: float
+    in_flight: int
+    waiting: int
+    throttle_events: int
+    latency_ewma_ms: float
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limiter for one source connection.
+
+    Args:
+        source_short_name: Connector type, used for metrics aggregation.
+        initial_limit: Starting concurrency.
+        min_limit: Floor the limit never drops below.
+        max_limit: Ceiling the limit never grows above.
+    """
+
+    def __init__(
+        self,
+        source_short_name: str,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+    ) -> None:
+        """Initialize the limiter."""
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("require 1 <= min_limit <= max_limit")
+        self.source_short_name = source_short_name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._throttled = False
+        self._throttle_events = 0
+        self._latency_ewma: Optional[float] = None
+        self._latency_baseline: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency cap."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    def snapshot(self) -> ConcurrencySnapshot:
+        """Return a point-in-time view for metrics."""
+        return ConcurrencySnapshot(
+            source_short_name=self.source_short_name,
+            limit=round(self._limit, 2),
+            in_flight=self._in_flight,
+            waiting=len(self._waiters),
+            throttle_events=self._throttle_events,
+            latency_ewma_ms=round((self._latency_ewma or 0.0) * 1000, 1),
+        )
+
+    def hint(self, concurrency: int) -> None:
+        """Raise the starting point to a connector's known-good concurrency.
+
+        Ignored once the upstream has throttled us: observed behaviour wins
+        over the connector's static default.
+        """
+        if self._throttled:
+            return
+        target = float(min(max(concurrency, self.min_limit), self.max_limit))
+        if target > self._limit:
+            self._limit = target
+            self._wake()
+
+    # ------------------------------------------------------------------
+    # Slots
+    # ------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of a request."""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        while True:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                # _wake hands the slot over before resolving the waiter
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    self._release()
+                raise
+            if self._paused_until > time.monotonic():
+                self._release()
+                continue
+            return
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._in_flight < self.limit and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    # ------------------------------------------------------------------
+    # Signals
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        status_code: int,
+        latency_seconds: Optional[float],
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Feed one upstream response into the controller.
+
+        Args:
+            status_code: HTTP status of the response (503 for timeouts).
+            latency_seconds: Request latency, or None when not comparable
+                (e.g. batch envelopes).
+            retry_after: Parsed ``Retry-After`` in seconds, if any.
+        """
+        now = time.monotonic()
+        if status_code in _THROTTLE_STATUSES:
+            self._throttled = True
+            self._throttle_events += 1
+            if retry_after:
+                self._paused_until = max(
+                    self._paused_until, now + min(retry_after, _MAX_PAUSE_SECONDS)
+                )
+            self._decrease(now, _BACKOFF_FACTOR)
+            return
+
+        if latency_seconds is not None:
+            self._observe_latency(latency_seconds)
+        if (
+            self._latency_baseline
+            and self._latency_ewma
+            and self._latency_ewma > self._latency_baseline * _LATENCY_TOLERANCE
+        ):
+            self._decrease(now, _LATENCY_BACKOFF_FACTOR)
+            return
+
+        if self._limit < self.max_limit:
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._wake()
+
+    def _observe_latency(self, latency: float) -> None:
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma += _LATENCY_SMOOTHING * (latency - self._latency_ewma)
+        # Baseline tracks the best sustained latency, drifting up slowly so a
+        # permanently slower upstream is eventually accepted as normal.
+        if self._latency_baseline is None or self._latency_ewma < self._latency_baseline:
+            self._latency_baseline = self._latency_ewma
+        else:
+            self._latency_baseline *= 1.001
+
+    def _decrease(self, now: float, factor: float) -> None:
+        cooldown = max(_MIN_COOLDOWN_SECONDS, self._latency_ewma or 0.0)
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * factor)
+
+
+class AdaptiveConcurrencyRegistry:
+    """Per-process registry of live limiters, keyed by source connection.
+
+    Entries are held weakly: a limiter disappears once the HTTP client and
+    sources that use it are garbage collected.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._limiters: weakref.WeakValueDictionary[str, AdaptiveConcurrency] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def for_source(
+        self,
+        source_short_name: str,
+        source_connection_id: Optional[UUID] = None,
+        *,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+    ) -> AdaptiveConcurrency:
+        """Return the shared limiter for a source connection, creating it if needed."""
+        key = f"{source_short_name}:{source_connection_id or 'default'}"
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveConcurrency(
+                source_short_name,
+                initial_limit=initial_limit,
+                min_limit=min_limit,
+                max_limit=max_limit,
+            )
+            self._limiters[key] = limiter
+        return limiter
+
+    def snapshots(self) -> list[ConcurrencySnapshot]:
+        """Snapshot every live limiter."""
+        return [limiter.snapshot() for limiter in list(self._limiters.values())]
+
+    def per_connector(self) -> Dict[str, Dict[str, int]]:
+        """Aggregate live limiters by connector type (low-cardinality metrics)."""
+        out: Dict[str, Dict[str, int]] = {}
+        for snap in self.snapshots():
+            stats = out.setdefault(
+                snap.source_short_name,
+                {"concurrency_limit": 0, "requests_in_flight": 0, "throttle_events": 0},
+            )
+            stats["concurrency_limit"] += int(snap.limit)
+            stats["requests_in_flight"] += snap.in_flight
+            stats["throttle_events"] += snap.throttle_events
+        return out
+
+
+adaptive_concurrency = AdaptiveConcurrencyRegistry()
@@ -0,0 +1,98 @@
+"""Registry manifest — source and entity metadata without importing connector code.
+
+Connector modules pull in their SDKs and the entity modules define a few
+hundred Pydantic models, so importing them all costs seconds and well over
+100 MB per process. ``SourceRegistry`` and ``EntityDefinitionRegistry`` are
+built from ``registry_manifest.json`` instead: decorator metadata, config
+class references and entity definitions, generated from the code. Source
+and entity classes are imported from their ``"module:QualName"`` reference
+the first time a registry entry is looked up; entity schemas are computed
+from the imported class then.
+
+Regenerate the manifest after adding or changing a source or entity::
+
+    python -m airweave.platform.manifest
+
+``--check`` exits non-zero when the committed manifest is out of date.
+"""
+
+import argparse
+import functools
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+MANIFEST_PATH = Path(__file__).with_name("registry_manifest.json")
+
+
+def class_ref(cls: type) -> str:
+    """Return the importable ``"module:QualName"`` reference of a class."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def import_ref(ref: str) -> Any:
+    """Import the object a ``"module:QualName"`` reference points to."""
+    module_name, _, qualname = ref.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+@functools.cache
+def load_manifest() -> dict:
+    """Load the committed manifest (cached for the life of the process)."""
+    with MANIFEST_PATH.open() as f:
+        manifest: dict = json.load(f)
+    return manifest
+
+
+def generate_manifest() -> dict:
+    """Import every source and entity class and describe them.
+
+    Runs the checks that need the classes themselves (entity field
+    descriptions, source method contracts) along the way.
+    """
+    from airweave.domains.entities.registry import EntityDefinitionRegistry
+    from airweave.domains.sources.registry import SourceRegistry
+    from airweave.platform.entities import ENTITIES_BY_SOURCE
+    from airweave.platform.sources import ALL_SOURCES
+
+    return {
+        "sources": SourceRegistry.manifest_entries(ALL_SOURCES),
+        "entities": EntityDefinitionRegistry.manifest_entries(ENTITIES_BY_SOURCE),
+    }
+
+
+def dumps(manifest: dict) -> str:
+    """Serialize a manifest the way it is committed."""
+    return json.dumps(manifest, indent=1, sort_keys=True) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Write the manifest, or with ``--check`` verify the committed one is current."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="fail if the committed manifest is out of date"
+    )
+    args = parser.parse_args(argv)
+
+    content = dumps(generate_manifest())
+    if args.check:
+        if not MANIFEST_PATH.exists() or MANIFEST_PATH.read_text() != content:
+            print(
+                f"{MANIFEST_PATH} is out of date; run `python -m airweave.platform.manifest`",
+                file=sys.stderr,
+            )
+            return 1
+        return 0
+
+    MANIFEST_PATH.write_text(content)
+    print(f"Wrote {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
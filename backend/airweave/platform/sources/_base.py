@@ -11,7 +11,6 @@ from typing import (
     AsyncIterable,
     Callable,
     ClassVar,
-    Dict,
     Iterable,
     Optional,
     Union,
@@ -30,6 +29,8 @@ from airweave.domains.storage.file_service import FileService
 from airweave.domains.syncs.cursors.cursor import SyncCursor
 from airweave.platform.entities._base import BaseEntity
 from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+from airweave.platform.http_client.concurrency import AdaptiveConcurrency
+from airweave.platform.sources.worker_pool import WorkerPool
 from airweave.schemas.source_connection import AuthenticationMethod, OAuthType
 
 
@@ -307,186 +308,24 @@ class BaseSource:
         stop_on_error: bool = False,
         max_queue_size: int = 100,
     ) -> AsyncGenerator[BaseEntity, None]:
-        """Generic bounded-concurrency driver."""
-        import asyncio as _asyncio
+        """Generic bounded-concurrency driver.
 
-        pool = self._create_bounded_pool(
-            items, worker, batch_size=batch_size, max_queue_size=max_queue_size
+        Runs through the shared ``WorkerPool``. When the HTTP client carries
+        an adaptive concurrency limiter, ``batch_size`` is only the starting
+        point: the number of items in flight follows the limiter, growing
+        while the upstream is healthy and shrinking on 429s / slow responses.
+        """
+        concurrency = getattr(self._http_client, "concurrency", None)
+        pool = WorkerPool(
+            max_workers=batch_size,
+            max_queue_size=max_queue_size,
+            logger=self.logger,
+            concurrency=concurrency if isinstance(concurrency, AdaptiveConcurrency) else None,
         )
-
-        try:
-            if preserve_order:
-                async for ent in self._drain_results_preserve_order(
-                    pool["results"],
-                    pool["all_tasks"],
-                    pool["producer_finished"],
-                    pool["get_total_items"],
-                    stop_on_error,
-                    pool["sentinel"],
-                ):
-                    yield ent
-            else:
-                async for ent in self._drain_results_unordered(
-                    pool["results"],
-                    pool["all_tasks"],
-                    pool["producer_finished"],
-                    pool["get_total_items"],
-                    stop_on_error,
-                    pool["sentinel"],
-                ):
-                    yield ent
-        finally:
-            for t in pool["all_tasks"]:
-                t.cancel()
-            await _asyncio.gather(*pool["all_tasks"], return_exceptions=True)
-
-    def _create_bounded_pool(  # noqa: C901
-        self,
-        items: Union[Iterable[Any], AsyncIterable[Any]],
-        worker: Callable[[Any], AsyncIterable[BaseEntity]],
-        *,
-        batch_size: int,
-        max_queue_size: int,
-    ) -> Dict[str, Any]:
-        """Create a bounded producer + fixed worker pool."""
-        import asyncio as _asyncio
-
-        results: _asyncio.Queue = _asyncio.Queue(maxsize=max_queue_size)
-        items_queue: _asyncio.Queue = _asyncio.Queue(maxsize=batch_size)
-        sentinel = object()
-        items_done = object()
-        producer_finished = _asyncio.Event()
-        total_items_cell: list[int] = [0]
-
-        async def _producer() -> None:
-            import time as _time
-
-            try:
-                idx = 0
-                last_yield_time = _time.monotonic()
-
-                if hasattr(items, "__aiter__"):
-                    async for item in items:  # type: ignore[union-attr]
-                        now = _time.monotonic()
-                        gap = now - last_yield_time
-                        if gap > 60:
-                            self.logger.warning(
-                                f"Source producer resumed after {int(gap)}s gap "
-                                f"(item {idx}, {total_items_cell[0]} total)"
-                            )
-                        await items_queue.put((idx, item))
-                        idx += 1
-                        total_items_cell[0] = idx
-                        last_yield_time = _time.monotonic()
-                else:
-                    for item in items:  # type: ignore[union-attr]
-                        await items_queue.put((idx, item))
-                        idx += 1
-                        total_items_cell[0] = idx
-            finally:
-                await items_queue.put(items_done)
-                producer_finished.set()
-                await results.put(None)
-
-        async def _pool_worker() -> None:
-            while True:
-                msg = await items_queue.get()
-                if msg is items_done:
-                    await items_queue.put(items_done)
-                    return
-                idx, item = msg
-                try:
-                    agen = worker(item)
-                    if not hasattr(agen, "__aiter__"):
-                        raise TypeError(
-                            "worker(item) must return an async iterator (async generator)."
-                        )
-                    async for entity in agen:
-                        await results.put((idx, entity, None))
-                except BaseException as e:
-                    await results.put((idx, None, e))
-                finally:
-                    await results.put((idx, sentinel, None))
-
-        producer_task = _asyncio.create_task(_producer())
-        pool_tasks = [_asyncio.create_task(_pool_worker()) for _ in range(batch_size)]
-
-        return {
-            "results": results,
-            "all_tasks": [producer_task] + pool_tasks,
-            "producer_finished": producer_finished,
-            "get_total_items": lambda: total_items_cell[0],
-            "sentinel": sentinel,
-        }
-
-    async def _drain_results_unordered(
-        self,
-        results,
-        tasks,
-        producer_finished,
-        get_total_items: Callable[[], int],
-        stop_on_error: bool,
-        sentinel: object,
-    ) -> AsyncGenerator[BaseEntity, None]:
-        """Yield results as they arrive; stop early on error if requested."""
-        done_items = 0
-        while True:
-            if producer_finished.is_set() and done_items >= get_total_items():
-                break
-            msg = await results.get()
-            if msg is None:
-                continue
-            i, payload, err = msg
-            if payload is sentinel:
-                done_items += 1
-                continue
-            if err:
-                self.logger.warning(f"Worker {i} error: {err}", exc_info=True)
-                if stop_on_error:
-                    for t in tasks:
-                        t.cancel()
-                    raise err
-                continue
-            yield payload  # type: ignore[misc]
-
-    async def _drain_results_preserve_order(
-        self,
-        results,
-        tasks,
-        producer_finished,
-        get_total_items: Callable[[], int],
-        stop_on_error: bool,
-        sentinel: object,
-    ) -> AsyncGenerator[BaseEntity, None]:
-        """Buffer per-item results and yield in input order."""
-        buffers: Dict[int, list[BaseEntity]] = {}
-        finished: set[int] = set()
-        next_idx = 0
-        done_items = 0
-
-        while True:
-            if producer_finished.is_set() and done_items >= get_total_items():
-                break
-            msg = await results.get()
-            if msg is None:
-                continue
-            i, payload, err = msg
-            if payload is sentinel:
-                finished.add(i)
-                done_items += 1
-            elif err:
-                self.logger.warning(f"Worker {i} error: {err}", exc_info=True)
-                if stop_on_error:
-                    for t in tasks:
-                        t.cancel()
-                    raise err
-            else:
-                buffers.setdefault(i, []).append(payload)  # type: ignore[arg-type]
-
-            while next_idx in finished:
-                for ent in buffers.pop(next_idx, []):
-                    yield ent
-                next_idx += 1
+        async for entity in pool.map(
+            items, worker, preserve_order=preserve_order, stop_on_error=stop_on_error
+        ):
+            yield entity
 
 
 class Relation(BaseModel):
@@ -36,6 +36,7 @@ from airweave.platform.entities.gmail import (
     GmailThreadEntity,
 )
 from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+from airweave.platform.http_client.batch import BatchingHttpClient, GoogleBatchCodec
 from airweave.platform.sources._base import BaseSource
 from airweave.platform.sources.http_helpers import raise_for_status
 from airweave.platform.sources.retry_helpers import (
@@ -44,6 +45,8 @@ from airweave.platform.sources.retry_helpers import (
 from airweave.platform.utils.filename_utils import safe_filename
 from airweave.schemas.source_connection import AuthenticationMethod, OAuthType
 
+GMAIL_BATCH_ENDPOINT = "https://gmail.googleapis.com/batch/gmail/v1"
+
 
 def _should_retry_gmail_request(exception: Exception) -> bool:
     """Custom retry condition that excludes 404 errors but includes 429 and timeouts."""
@@ -97,6 +100,11 @@ class GmailSource(BaseSource):
     ) -> GmailSource:
         """Create a new Gmail source instance."""
         instance = cls(auth=auth, logger=logger, http_client=http_client)
+        # Thread/message detail fetches issued concurrently by the workers are
+        # coalesced into Gmail batch requests.
+        instance._batch_client = BatchingHttpClient(
+            http_client, GoogleBatchCodec(GMAIL_BATCH_ENDPOINT), logger=logger
+        )
 
         config_dict = config.model_dump() if config else {}
         instance.batch_size = int(config_dict.get("batch_size", 30))
@@ -244,19 +252,26 @@ class GmailSource(BaseSource):
         wait=wait_rate_limit_with_backoff,
         reraise=True,
     )
-    async def _get(self, url: str, params: Optional[dict] = None) -> dict:
-        """Make an authenticated GET request to the Gmail API with proper 429 handling."""
+    async def _get(self, url: str, params: Optional[dict] = None, *, batched: bool = False) -> dict:
+        """Make an authenticated GET request to the Gmail API with proper 429 handling.
+
+        With ``batched=True`` the request is sent through the batch client, so
+        concurrent calls share one HTTP round trip.
+        """
         self.logger.debug(f"Making authenticated GET request to: {url} with params: {params}")
 
+        batch_client = getattr(self, "_batch_client", None)
+        client = batch_client if batched and batch_client else self.http_client
+
         headers = await self._authed_headers()
-        response = await self.http_client.get(url, headers=headers, params=params)
+        response = await client.get(url, headers=headers, params=params)
 
         if response.status_code == 401 and self.auth.supports_refresh:
             self.logger.warning(
                 f"Got 401 Unauthorized from Gmail API at {url}, refreshing token..."
             )
             headers = await self._refresh_and_get_headers()
-            response = await self.http_client.get(url, headers=headers, params=params)
+            response = await client.get(url, headers=headers, params=params)
 
         if response.status_code == 429:
             self.logger.warning(
@@ -319,7 +334,7 @@ class GmailSource(BaseSource):
         detail_url = f"{base_url}/{thread_id}"
         self.logger.debug(f"Fetching full thread details from: {detail_url}")
         try:
-            thread_data = await self._get(detail_url)
+            thread_data = await self._get(detail_url, batched=True)
             return thread_data
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -463,7 +478,7 @@ class GmailSource(BaseSource):
             )
             message_url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}"
             try:
-                message_data = await self._get(message_url)
+                message_data = await self._get(message_url, batched=True)
                 self.logger.debug(
                     f"Fetched full message data with keys: {list(message_data.keys())}"
                 )
@@ -805,7 +820,7 @@ class GmailSource(BaseSource):
 
                 detail_url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{msg_id}"
                 try:
-                    message_data = await self._get(detail_url)
+                    message_data = await self._get(detail_url, batched=True)
                 except httpx.HTTPStatusError as e:
                     if e.response.status_code == 404:
                         self.logger.warning(f"Message {msg_id} not found (404) - skipping")
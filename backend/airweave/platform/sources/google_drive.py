@@ -16,6 +16,7 @@ References:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
@@ -41,6 +42,7 @@ from airweave.platform.entities.google_drive import (
     _parse_drive_dt,
 )
 from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+from airweave.platform.http_client.batch import BatchingHttpClient, GoogleBatchCodec
 from airweave.platform.sources._base import BaseSource
 from airweave.platform.sources.http_helpers import raise_for_status
 from airweave.platform.sources.retry_helpers import (
@@ -49,6 +51,8 @@ from airweave.platform.sources.retry_helpers import (
 )
 from airweave.schemas.source_connection import AuthenticationMethod, OAuthType
 
+DRIVE_BATCH_ENDPOINT = "https://www.googleapis.com/batch/drive/v3"
+
 
 @source(
     name="Google Drive",
@@ -88,6 +92,9 @@ class GoogleDriveSource(BaseSource):
     ) -> GoogleDriveSource:
         """Create a new Google Drive source instance."""
         instance = cls(auth=auth, logger=logger, http_client=http_client)
+        instance._batch_client = BatchingHttpClient(
+            http_client, GoogleBatchCodec(DRIVE_BATCH_ENDPOINT), logger=logger
+        )
         instance.include_patterns = config.include_patterns if config else []
         instance.batch_size = 30
         instance.batch_generation = True
@@ -114,23 +121,27 @@ class GoogleDriveSource(BaseSource):
         wait=wait_rate_limit_with_backoff,
         reraise=True,
     )
-    async def _get(self, url: str, params: Optional[Dict] = None) -> Dict:
+    async def _get(self, url: str, params: Optional[Dict] = None, *, batched: bool = False) -> Dict:
         """Make an authenticated GET request to the Google Drive API with retry logic.
 
         Retries on:
         - 429 rate limits (respects Retry-After header from both real API and AirweaveHttpClient)
         - Timeout errors (exponential backoff)
 
-        Max 5 attempts with intelligent wait strategy.
+        Max 5 attempts with intelligent wait strategy. With ``batched=True``
+        concurrent calls are coalesced into Drive batch requests.
         """
+        batch_client = getattr(self, "_batch_client", None)
+        client = batch_client if batched and batch_client else self.http_client
+
         token = await self.auth.get_token()
         headers = {"Authorization": f"Bearer {token}"}
-        response = await self.http_client.get(url, headers=headers, params=params, timeout=30.0)
+        response = await client.get(url, headers=headers, params=params, timeout=30.0)
 
         if response.status_code == 401 and self.auth.supports_refresh:
             new_token = await self.auth.force_refresh()
             headers = {"Authorization": f"Bearer {new_token}"}
-            response = await self.http_client.get(url, headers=headers, params=params, timeout=30.0)
+            response = await client.get(url, headers=headers, params=params, timeout=30.0)
 
         raise_for_status(
             response,
@@ -311,6 +322,12 @@ class GoogleDriveSource(BaseSource):
 
         self._cursor.update(file_metadata=file_metadata)
 
+    def _store_yielded_file_metadata(self, entity: BaseEntity) -> None:
+        """Store the metadata of a file processed by ``_process_file_batch`` as it is yielded."""
+        file_obj = self._unyielded_file_metadata.pop(id(entity), None)
+        if file_obj is not None:
+            self._store_file_metadata(file_obj)
+
     async def _emit_changes_since_token(
         self,
         start_token: str,
@@ -659,7 +676,8 @@ class GoogleDriveSource(BaseSource):
             safe_name = name.replace("'", "\\'")
 
             if parent_ids:
-                for pid in parent_ids:
+
+                async def find_under_parent(pid: str) -> List[str]:
                     url = "https://www.googleapis.com/drive/v3/files"
                     q = (
                         f"'{pid}' in parents and mimeType = 'application/vnd.google-apps.folder' "
@@ -676,14 +694,20 @@ class GoogleDriveSource(BaseSource):
                     if drive_id:
                         params["driveId"] = drive_id
 
+                    ids: List[str] = []
                     while url:
-                        data = await self._get(url, params=params)
+                        data = await self._get(url, params=params, batched=True)
                         for f in data.get("files", []):
-                            found.append(f["id"])
+                            ids.append(f["id"])
                         npt = data.get("nextPageToken")
                         if not npt:
                             break
                         params["pageToken"] = npt
+                    return ids
+
+                # One lookup per parent, issued together so they share batch requests
+                for ids in await asyncio.gather(*(find_under_parent(p) for p in parent_ids)):
+                    found.extend(ids)
 
                 self.logger.debug(
                     f"find_folders_by_name: name='{name}' under {len(parent_ids)} "
@@ -862,15 +886,23 @@ class GoogleDriveSource(BaseSource):
         parent_breadcrumb: Optional[Breadcrumb],
         files: FileService | None = None,
     ) -> Optional[GoogleDriveFileEntity]:
-        """Build & process a single file (used by concurrent driver)."""
+        """Build & process a single file (used by concurrent driver).
+
+        The file's metadata is only stored once the caller yields the entity
+        (``_store_yielded_file_metadata``): batches run concurrently, so a
+        cursor checkpoint taken meanwhile must not cover files not yet yielded.
+        """
         try:
+            if not self._has_file_changed(file_obj):
+                self.logger.debug(f"File {file_obj.get('name')} unchanged - skipping")
+                return None
             file_entity = self._build_file_entity(file_obj, parent_breadcrumb)
             if not file_entity:
                 return None
             self.logger.debug(f"Processing file entity: {file_entity.file_id} '{file_entity.name}'")
 
             if await self._download_file(file_entity, files):
-                self._store_file_metadata(file_obj)
+                self._unyielded_file_metadata[id(file_entity)] = file_obj
                 self.logger.debug(f"Successfully downloaded file: {file_entity.name}")
                 return file_entity
 
@@ -963,12 +995,15 @@ class GoogleDriveSource(BaseSource):
                     stop_on_error=getattr(self, "stop_on_error", False),
                     max_queue_size=getattr(self, "max_queue_size", 200),
                 ):
+                    self._store_yielded_file_metadata(processed)
                     yield processed
             else:
                 async for file_obj in self._list_files(
                     corpora, include_all_drives, drive_id, context
                 ):
                     try:
+                        if not self._has_file_changed(file_obj):
+                            continue
                         file_entity = self._build_file_entity(file_obj, parent_breadcrumb)
                         if not file_entity:
                             continue
@@ -1008,6 +1043,8 @@ class GoogleDriveSource(BaseSource):
           deletion entities for removed files and upsert entities for changed files.
         """
         self._cursor = cursor
+        # File metadata of downloaded entities, by object id, until they are yielded
+        self._unyielded_file_metadata: Dict[int, Dict] = {}
 
         try:
             start_page_token = self._get_cursor_start_page_token()
@@ -1125,6 +1162,7 @@ class GoogleDriveSource(BaseSource):
                                         stop_on_error=getattr(self, "stop_on_error", False),
                                         max_queue_size=getattr(self, "max_queue_size", 200),
                                     ):
+                                        self._store_yielded_file_metadata(processed)
                                         yield processed
                                 else:
                                     async for file_obj in self._traverse_and_yield_files(
@@ -1135,6 +1173,8 @@ class GoogleDriveSource(BaseSource):
                                         filename_glob=fname_glob,
                                         context=f"drive {drive_id}",
                                     ):
+                                        if not self._has_file_changed(file_obj):
+                                            continue
                                         file_entity = self._build_file_entity(
                                             file_obj, drive_breadcrumb
                                         )
@@ -1143,6 +1183,7 @@ class GoogleDriveSource(BaseSource):
 
                                         try:
                                             if await self._download_file(file_entity, files):
+                                                self._store_file_metadata(file_obj)
                                                 yield file_entity
                                         except SourceAuthError:
                                             raise
@@ -1184,6 +1225,7 @@ class GoogleDriveSource(BaseSource):
                                     stop_on_error=getattr(self, "stop_on_error", False),
                                     max_queue_size=getattr(self, "max_queue_size", 200),
                                 ):
+                                    self._store_yielded_file_metadata(processed)
                                     yield processed
                             else:
                                 async for file_obj in self._list_files(
@@ -1194,6 +1236,8 @@ class GoogleDriveSource(BaseSource):
                                 ):
                                     name = file_obj.get("name", "")
                                     if _fn.fnmatch(name, pat):
+                                        if not self._has_file_changed(file_obj):
+                                            continue
                                         file_entity = self._build_file_entity(
                                             file_obj, drive_breadcrumb
                                         )
@@ -1202,6 +1246,7 @@ class GoogleDriveSource(BaseSource):
 
                                         try:
                                             if await self._download_file(file_entity, files):
+                                                self._store_file_metadata(file_obj)
                                                 yield file_entity
                                         except SourceAuthError:
                                             raise
@@ -1254,6 +1299,7 @@ class GoogleDriveSource(BaseSource):
                                     stop_on_error=getattr(self, "stop_on_error", False),
                                     max_queue_size=getattr(self, "max_queue_size", 200),
                                 ):
+                                    self._store_yielded_file_metadata(processed)
                                     yield processed
                             else:
                                 async for file_obj in self._traverse_and_yield_files(
@@ -1264,6 +1310,8 @@ class GoogleDriveSource(BaseSource):
                                     filename_glob=fname_glob,
                                     context="MY DRIVE",
                                 ):
+                                    if not self._has_file_changed(file_obj):
+                                        continue
                                     file_entity = self._build_file_entity(
                                         file_obj, self._my_drive_breadcrumb
                                     )
@@ -1272,6 +1320,7 @@ class GoogleDriveSource(BaseSource):
 
                                     try:
                                         if await self._download_file(file_entity, files):
+                                            self._store_file_metadata(file_obj)
                                             yield file_entity
                                     except SourceAuthError:
                                         raise
@@ -1313,6 +1362,7 @@ class GoogleDriveSource(BaseSource):
                                 stop_on_error=getattr(self, "stop_on_error", False),
                                 max_queue_size=getattr(self, "max_queue_size", 200),
                             ):
+                                self._store_yielded_file_metadata(processed)
                                 yield processed
                         else:
                             async for file_obj in self._list_files(
@@ -1323,6 +1373,8 @@ class GoogleDriveSource(BaseSource):
                             ):
                                 name = file_obj.get("name", "")
                                 if _fn.fnmatch(name, pat):
+                                    if not self._has_file_changed(file_obj):
+                                        continue
                                     file_entity = self._build_file_entity(
                                         file_obj, self._my_drive_breadcrumb
                                     )
@@ -1331,6 +1383,7 @@ class GoogleDriveSource(BaseSource):
 
                                     try:
                                         if await self._download_file(file_entity, files):
+                                            self._store_file_metadata(file_obj)
                                             yield file_entity
                                     except SourceAuthError:
                                         raise
@@ -16,6 +16,7 @@ from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple
 import httpx
 from tenacity import retry, stop_after_attempt
 
+from airweave.platform.http_client.batch import BatchingHttpClient, GraphBatchCodec
 from airweave.platform.sources.retry_helpers import (
     retry_if_rate_limit_or_timeout,
     wait_rate_limit_with_backoff,
@@ -31,6 +32,9 @@ class GraphClient:
         access_token_provider: Async callable that returns a valid access token.
         http_client: Pre-built AirweaveHttpClient with rate limiting.
         logger: Logger instance.
+
+    Per-item lookups (permissions, user resolution) go through a ``$batch``
+    client, so concurrent calls are sent to Graph 20 at a time.
     """
 
     def __init__(
@@ -42,6 +46,9 @@ class GraphClient:
         """Initialize the Graph client with an OAuth2 token provider."""
         self._get_token = access_token_provider
         self._http_client = http_client
+        self._batch_client = BatchingHttpClient(
+            http_client, GraphBatchCodec(GRAPH_BASE_URL), logger=logger
+        )
         self.logger = logger
 
     async def _headers(self) -> Dict[str, str]:
@@ -62,11 +69,17 @@ class GraphClient:
         self,
         url: str,
         params: Optional[Dict] = None,
+        *,
+        batched: bool = False,
     ) -> Dict[str, Any]:
-        """Execute a GET request against the Graph API with retry logic."""
+        """Execute a GET request against the Graph API with retry logic.
+
+        With ``batched=True`` concurrent calls are coalesced into ``$batch`` requests.
+        """
         headers = await self._headers()
         self.logger.debug(f"GET {url}")
-        response = await self._http_client.get(url, headers=headers, params=params, timeout=30.0)
+        client = self._batch_client if batched else self._http_client
+        response = await client.get(url, headers=headers, params=params, timeout=30.0)
 
         if response.status_code == 401:
             self.logger.warning("Got 401, token may need refresh")
@@ -296,7 +309,7 @@ class GraphClient:
         """Get permissions for a drive item."""
         url = f"{GRAPH_BASE_URL}/drives/{drive_id}/items/{item_id}/permissions"
         try:
-            data = await self.get(url)
+            data = await self.get(url, batched=True)
             return data.get("value", [])
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -449,7 +462,8 @@ class GraphClient:
         """
         import asyncio
 
-        CONCURRENCY = 10
+        # One full $batch request per round trip
+        CONCURRENCY = 20
         semaphore = asyncio.Semaphore(CONCURRENCY)
         result: Dict[str, str] = {}
 
@@ -457,7 +471,7 @@ class GraphClient:
             async with semaphore:
                 try:
                     url = f"{GRAPH_BASE_URL}/users/{uid}"
-                    data = await self.get(url, {"$select": "userPrincipalName,mail"})
+                    data = await self.get(url, {"$select": "userPrincipalName,mail"}, batched=True)
                     email = data.get("mail") or data.get("userPrincipalName", "")
                     if email and "@" in email:
                         result[uid] = email.lower()
@@ -649,6 +649,15 @@ class SharePointOnlineBase(BaseSource):
         entity_count = 0
         graph_client = self._create_graph_client()
 
+        # Drives a previous attempt of this full sync finished (from its checkpoint)
+        completed_drives = set(
+            SharePointOnlineCursor(**cursor.data).full_sync_completed_drives if cursor else ()
+        )
+        if completed_drives:
+            self.logger.info(
+                f"Resuming full sync: skipping {len(completed_drives)} completed drives"
+            )
+
         sites = await self._discover_sites(graph_client)
 
         for site_data in sites:
@@ -691,6 +700,8 @@ class SharePointOnlineBase(BaseSource):
 
             for drive_data in all_drives:
                 drive_id = drive_data.get("id", "")
+                if drive_id in completed_drives:
+                    continue
                 try:
                     # Each drive gets its own root permissions
                     drive_access = site_access
@@ -719,16 +730,17 @@ class SharePointOnlineBase(BaseSource):
 
                     pending_files: List[PendingFileDownload] = []
 
-                    async for item_data in graph_client.get_drive_items_recursive(drive_id):
+                    async for item_data, permissions_task in self._with_prefetched_permissions(
+                        graph_client,
+                        drive_id,
+                        graph_client.get_drive_items_recursive(drive_id),
+                    ):
                         if item_data.get("folder"):
                             continue
 
                         if item_data.get("file"):
                             try:
-                                permissions = await graph_client.get_item_permissions(
-                                    drive_id,
-                                    item_data["id"],
-                                )
+                                permissions = await permissions_task
 
                                 file_entity = await build_file_entity(
                                     item_data,
@@ -791,7 +803,13 @@ class SharePointOnlineBase(BaseSource):
                                     changes_count=entity_count,
                                     is_full_sync=True,
                                 )
-                                cursor.update(**cursor_schema.model_dump())
+                                # Groups seen so far, for a retry that skips this drive
+                                cursor.update(
+                                    **{
+                                        **cursor_schema.model_dump(),
+                                        **self._tracked_groups_cursor_fields(),
+                                    }
+                                )
                         except SourceAuthError:
                             raise
                         except Exception as e:
@@ -827,17 +845,21 @@ class SharePointOnlineBase(BaseSource):
                 cursor.update(synced_site_ids=synced_sites)
 
         if cursor:
-            cursor.update(
-                full_sync_required=False,
-                total_entities_synced=entity_count,
-                tracked_entra_groups=list(self._item_level_entra_groups),
-                tracked_sp_groups={
-                    site: sorted(names) for site, names in self._item_level_sp_groups.items()
-                },
-            )
+            cursor_schema = SharePointOnlineCursor(**cursor.data)
+            cursor_schema.complete_full_sync(entity_count)
+            cursor.update(**{**cursor_schema.model_dump(), **self._tracked_groups_cursor_fields()})
 
         self.logger.info(f"Full sync complete: {entity_count} entities")
 
+    def _tracked_groups_cursor_fields(self) -> Dict[str, Any]:
+        """Cursor fields for the groups seen in entity permissions so far."""
+        return {
+            "tracked_entra_groups": list(self._item_level_entra_groups),
+            "tracked_sp_groups": {
+                site: sorted(names) for site, names in self._item_level_sp_groups.items()
+            },
+        }
+
     async def _incremental_sync(  # noqa: C901
         self,
         cursor: SyncCursor | None,
@@ -1117,6 +1139,53 @@ class SharePointOnlineBase(BaseSource):
         ):
             yield entity
 
+    async def _with_prefetched_permissions(
+        self,
+        graph_client: GraphClient,
+        drive_id: str,
+        item_stream: AsyncGenerator[Dict[str, Any], None],
+    ) -> AsyncGenerator[Tuple[Dict[str, Any], Optional[asyncio.Task]], None]:
+        """Yield drive items with their permission lookups already in flight.
+
+        Items are read ahead in chunks of ITEM_BATCH_SIZE and the permission
+        lookups for all files in a chunk are started together, so the Graph
+        client coalesces them into ``$batch`` requests instead of one round
+        trip per file. Folders and other non-file items get ``None``.
+        """
+
+        def start_chunk(
+            chunk: List[Dict[str, Any]],
+        ) -> List[Tuple[Dict[str, Any], Optional[asyncio.Task]]]:
+            return [
+                (
+                    item,
+                    asyncio.create_task(graph_client.get_item_permissions(drive_id, item["id"]))
+                    if item.get("file") and not item.get("folder")
+                    else None,
+                )
+                for item in chunk
+            ]
+
+        pending: List[Tuple[Dict[str, Any], Optional[asyncio.Task]]] = []
+        chunk: List[Dict[str, Any]] = []
+        try:
+            async for item_data in item_stream:
+                chunk.append(item_data)
+                if len(chunk) < ITEM_BATCH_SIZE:
+                    continue
+                pending = start_chunk(chunk)
+                chunk = []
+                while pending:
+                    yield pending.pop(0)
+            pending = start_chunk(chunk)
+            while pending:
+                yield pending.pop(0)
+        finally:
+            # Consumer stopped early: don't leave lookups running unobserved
+            for _, task in pending:
+                if task:
+                    task.cancel()
+
     async def _process_file_items(
         self,
         graph_client: GraphClient,
@@ -1131,11 +1200,13 @@ class SharePointOnlineBase(BaseSource):
         """Iterate drive items, build file entities, and yield with batched downloads."""
         pending_files: List[PendingFileDownload] = []
 
-        async for item_data in item_stream:
+        async for item_data, permissions_task in self._with_prefetched_permissions(
+            graph_client, drive_id, item_stream
+        ):
             if item_data.get("folder") or not item_data.get("file"):
                 continue
             try:
-                permissions = await graph_client.get_item_permissions(drive_id, item_data["id"])
+                permissions = await permissions_task
                 file_entity = await build_file_entity(
                     item_data, drive_id, site_id, breadcrumbs, permissions
                 )
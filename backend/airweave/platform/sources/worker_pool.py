@@ -9,6 +9,10 @@ Provides two APIs:
 Designed to replace the ad-hoc concurrency patterns scattered across source
 connectors (raw semaphores, inline producer/consumer pools, fully sequential
 loops) with one reusable, injectable primitive.
+
+``BaseSource.process_entities_concurrent`` runs through this pool. When given
+the source connection's ``AdaptiveConcurrency`` limiter, the number of items
+in flight follows the limiter's AIMD limit instead of a fixed ``max_workers``.
 """
 
 import asyncio
@@ -27,6 +31,12 @@ from typing import (
 
 from airweave.core.logging import logger as _default_logger
 from airweave.platform.entities._base import BaseEntity
+from airweave.platform.http_client.concurrency import AdaptiveConcurrency
+
+# How often blocked pool workers re-check a grown adaptive limit
+_ADMISSION_RECHECK_SECONDS = 0.5
+# Log when an async item source stalls for longer than this
+_PRODUCER_GAP_WARNING_SECONDS = 60
 
 
 class _TokenBucket:
@@ -75,6 +85,9 @@ class WorkerPool:
         under the target requests-per-second.
       - **Backpressure** (``max_queue_size``): bounded result queue prevents
         unbounded memory growth when workers outpace consumers.
+      - **Adaptive concurrency** (``concurrency``): with a source's AIMD
+        limiter, ``map`` keeps ``concurrency.limit`` items in flight;
+        ``max_workers`` then only seeds the limiter's starting point.
 
     Examples::
 
@@ -96,7 +109,9 @@ class WorkerPool:
         burst: Optional[int] = None,
         max_queue_size: int = 100,
         logger: Any = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
     ) -> None:
+        """Initialize the pool (see class docstring for the knobs)."""
         if max_workers < 1:
             raise ValueError("max_workers must be >= 1")
 
@@ -104,6 +119,9 @@ class WorkerPool:
         self._max_queue_size = max_queue_size
         self._semaphore = asyncio.Semaphore(max_workers)
         self._logger = logger or _default_logger
+        self._concurrency = concurrency
+        if concurrency is not None:
+            concurrency.hint(max_workers)
 
         self._bucket: Optional[_TokenBucket] = None
         if max_rps is not None and max_rps > 0:
@@ -112,12 +130,24 @@ class WorkerPool:
 
     @property
     def max_workers(self) -> int:
+        """Configured worker count (the starting point when adaptive)."""
         return self._max_workers
 
     @property
     def max_rps(self) -> Optional[float]:
+        """Token-bucket rate, if rate limiting is enabled."""
         return self._bucket._rate if self._bucket else None
 
+    def _target_in_flight(self) -> int:
+        if self._concurrency is None:
+            return self._max_workers
+        return max(1, self._concurrency.limit)
+
+    def _pool_size(self) -> int:
+        if self._concurrency is None:
+            return self._max_workers
+        return max(self._max_workers, self._concurrency.max_limit)
+
     # ------------------------------------------------------------------
     # Low-level API
     # ------------------------------------------------------------------
@@ -143,7 +173,7 @@ class WorkerPool:
     # High-level API
     # ------------------------------------------------------------------
 
-    async def map(
+    async def map(  # noqa: C901
         self,
         items: Union[Iterable[Any], AsyncIterable[Any]],
         worker: Callable[[Any], AsyncIterable[BaseEntity]],
@@ -153,10 +183,11 @@ class WorkerPool:
     ) -> AsyncGenerator[BaseEntity, None]:
         """Process *items* through a bounded worker pool, yielding entities.
 
-        Spawns ``max_workers`` pool tasks fed by a producer via a bounded
-        queue. Each worker acquires a rate-limit token (if configured)
-        before invoking the caller-supplied ``worker(item)`` async
-        generator.
+        Spawns pool tasks fed by a producer via a bounded queue. Each
+        worker is admitted only while fewer than the target number of items
+        are in flight (``max_workers``, or the adaptive limit), then acquires
+        a rate-limit token (if configured) before invoking the
+        caller-supplied ``worker(item)`` async generator.
 
         Args:
             items: Sync or async iterable of work units.
@@ -170,15 +201,25 @@ class WorkerPool:
         items_done = object()
         producer_finished = asyncio.Event()
         total_items: list[int] = [0]
+        in_flight: list[int] = [0]
+        admission = asyncio.Condition()
 
         async def _producer() -> None:
             try:
                 idx = 0
                 if hasattr(items, "__aiter__"):
+                    last_item_at = time.monotonic()
                     async for item in items:
+                        gap = time.monotonic() - last_item_at
+                        if gap > _PRODUCER_GAP_WARNING_SECONDS:
+                            self._logger.warning(
+                                f"Source producer resumed after {int(gap)}s gap "
+                                f"(item {idx}, {total_items[0]} total)"
+                            )
                         await items_q.put((idx, item))
                         idx += 1
                         total_items[0] = idx
+                        last_item_at = time.monotonic()
                 else:
                     for item in items:
                         await items_q.put((idx, item))
@@ -189,11 +230,28 @@ class WorkerPool:
                 producer_finished.set()
                 await results_q.put(None)
 
+        async def _admit() -> None:
+            async with admission:
+                while in_flight[0] >= self._target_in_flight():
+                    try:
+                        # Timeout picks up a limit that grew without a release
+                        await asyncio.wait_for(admission.wait(), _ADMISSION_RECHECK_SECONDS)
+                    except asyncio.TimeoutError:
+                        pass
+                in_flight[0] += 1
+
+        async def _release() -> None:
+            async with admission:
+                in_flight[0] -= 1
+                admission.notify()
+
         async def _pool_worker() -> None:
             while True:
+                await _admit()
                 msg = await items_q.get()
                 if msg is items_done:
                     await items_q.put(items_done)
+                    await _release()
                     return
                 idx, item = msg
                 try:
@@ -210,10 +268,11 @@ class WorkerPool:
                 except BaseException as exc:
                     await results_q.put((idx, None, exc))
                 finally:
+                    await _release()
                     await results_q.put((idx, sentinel, None))
 
         producer_task = asyncio.create_task(_producer())
-        worker_tasks = [asyncio.create_task(_pool_worker()) for _ in range(self._max_workers)]
+        worker_tasks = [asyncio.create_task(_pool_worker()) for _ in range(self._pool_size())]
         all_tasks = [producer_task, *worker_tasks]
 
         try:
@@ -257,7 +316,7 @@ class WorkerPool:
                 done_items += 1
                 continue
             if err is not None:
-                self._logger.error(f"Worker error (item {idx}): {err}", exc_info=True)
+                self._logger.warning(f"Worker error (item {idx}): {err}", exc_info=True)
                 if stop_on_error:
                     for t in tasks:
                         t.cancel()
@@ -290,7 +349,7 @@ class WorkerPool:
                 finished.add(idx)
                 done_items += 1
             elif err is not None:
-                self._logger.error(f"Worker error (item {idx}): {err}", exc_info=True)
+                self._logger.warning(f"Worker error (item {idx}): {err}", exc_info=True)
                 if stop_on_error:
                     for t in tasks:
                         t.cancel()
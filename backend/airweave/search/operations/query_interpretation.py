@@ -203,8 +203,10 @@ class QueryInterpretation(SearchOperation):
         filter_dict = self._build_qdrant_filter(validated_filters)
         ctx.logger.debug(f"[QueryInterpretation] Filter dict: {filter_dict}")
 
-        # Write to state (UserFilter will merge with this if it runs)
-        state.filter = filter_dict
+        # Merge into state: AccessControlFilter runs concurrently and may have
+        # written its filter already (UserFilter will merge with this if it runs)
+        existing_filter = state.filter
+        state.filter = {"must": [existing_filter, filter_dict]} if existing_filter else filter_dict
 
         # Report metrics for analytics
         self._report_metrics(
@@ -277,7 +279,8 @@ class QueryInterpretation(SearchOperation):
         # [code blue] todo: remove container import
         from airweave.core.container import container as app_container
 
-        entries = app_container.entity_definition_registry.list_for_source(source_entry.short_name)
+        registry = app_container.entity_definition_registry
+        entries = registry.list_for_source(source_entry.short_name)
 
         if not entries:
             return {}
@@ -285,7 +288,7 @@ class QueryInterpretation(SearchOperation):
         all_fields = {}
 
         for entry in entries:
-            entity_class = entry.entity_class_ref
+            entity_class = registry.get(entry.short_name).entity_class_ref
 
             for field_name, field_info in entity_class.model_fields.items():
                 if field_name.startswith("_") or field_name == "airweave_system_metadata":
@@ -3,11 +3,18 @@
 The orchestrator is responsible for:
 1. Extracting enabled operations from the search context
 2. Determining execution order based on dependencies
-3. Executing operations sequentially, passing state between them
+3. Executing operations as a DAG: each operation starts as soon as the
+   operations it depends on have completed, so independent LLM and DB calls
+   (e.g. AccessControlFilter and QueryExpansion) overlap
 4. Using the emitter from context for streaming updates
 5. Automatically capturing timing metrics for each operation
+
+Operations share one SearchState. Operations that are not ordered by
+``depends_on`` must not rely on seeing each other's writes; the ones that
+write the same field (``filter``) merge into it without awaiting in between.
 """
 
+import asyncio
 import time
 from typing import Any, Dict, List, Set
 
@@ -21,8 +28,10 @@ from airweave.search.state import SearchState
 class SearchOrchestrator:
     """Orchestrates search operation execution.
 
-    The orchestrator uses topological sort to determine execution order
-    based on declared dependencies, then executes operations sequentially.
+    The orchestrator uses topological sort to validate and order the declared
+    dependencies, then runs every operation as a task that awaits only its own
+    dependencies. Search latency follows the critical path rather than the sum
+    of all operations.
     """
 
     async def run(
@@ -56,37 +65,23 @@ class SearchOrchestrator:
         # Resolve execution order
         execution_order = self._resolve_execution_order(context, ctx)
 
-        # Execute operations in order with automatic timing
+        # Start every operation; each waits for its own dependencies
+        # (topological order guarantees dependency tasks already exist)
+        tasks: Dict[str, asyncio.Task] = {}
         for operation in execution_order:
-            op_name = operation.__class__.__name__
-
-            # Emit operator_start
-            await emitter.emit("operator_start", {"name": op_name}, op_name=op_name)
-
-            try:
-                # Capture start time
-                start_time = time.monotonic()
-
-                # Execute operation (emitter is now in context)
-                await operation.execute(context, state, ctx)
-
-                # Capture end time and calculate duration
-                duration_ms = (time.monotonic() - start_time) * 1000
-
-                # Store timing metric automatically
-                if op_name not in state.operation_metrics:
-                    state.operation_metrics[op_name] = {}
-                state.operation_metrics[op_name]["duration_ms"] = duration_ms
-
-                # Emit operator_end
-                await emitter.emit("operator_end", {"name": op_name}, op_name=op_name)
-
-            except Exception as e:
-                # Emit error event
-                await emitter.emit(
-                    "error", {"operation": op_name, "message": str(e)}, op_name=op_name
-                )
-                raise
+            dependencies = [tasks[dep] for dep in operation.depends_on() if dep in tasks]
+            tasks[operation.__class__.__name__] = asyncio.create_task(
+                self._run_operation(operation, dependencies, context, state, ctx)
+            )
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            # First failure (or caller cancellation) stops everything still running
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
 
         # Emit results event
         await emitter.emit("results", {"results": state.results})
@@ -99,6 +94,48 @@ class SearchOrchestrator:
         state_dict = state.model_dump()
         return response, state_dict
 
+    async def _run_operation(
+        self,
+        operation: SearchOperation,
+        dependencies: List[asyncio.Task],
+        context: SearchContext,
+        state: SearchState,
+        ctx: ApiContext,
+    ) -> None:
+        """Wait for dependencies, then execute one operation with timing and events."""
+        if dependencies:
+            # A failed dependency propagates here; it already emitted its error
+            await asyncio.gather(*dependencies)
+
+        op_name = operation.__class__.__name__
+        emitter = context.emitter
+
+        # Emit operator_start
+        await emitter.emit("operator_start", {"name": op_name}, op_name=op_name)
+
+        try:
+            # Capture start time
+            start_time = time.monotonic()
+
+            # Execute operation (emitter is now in context)
+            await operation.execute(context, state, ctx)
+
+            # Capture end time and calculate duration
+            duration_ms = (time.monotonic() - start_time) * 1000
+
+            # Store timing metric automatically
+            if op_name not in state.operation_metrics:
+                state.operation_metrics[op_name] = {}
+            state.operation_metrics[op_name]["duration_ms"] = duration_ms
+
+            # Emit operator_end
+            await emitter.emit("operator_end", {"name": op_name}, op_name=op_name)
+
+        except Exception as e:
+            # Emit error event
+            await emitter.emit("error", {"operation": op_name, "message": str(e)}, op_name=op_name)
+            raise
+
     def _resolve_execution_order(
         self, context: SearchContext, ctx: ApiContext
     ) -> List[SearchOperation]:
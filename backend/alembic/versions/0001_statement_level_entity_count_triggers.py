@@ -0,0 +1,245 @@
+"""statement-level entity count triggers
+
+Replaces the row-level entity_count trigger with statement-level triggers
+that read the rows changed by a statement from transition tables and apply
+one aggregated delta per (sync_id, entity_definition_short_name).
+
+The row-level trigger updated the shared counter row once per entity row, so
+concurrent batches of one sync serialized on it from their first inserted row
+until commit, and a large delete did one counter update per deleted row.
+Counter rows are now locked once per statement, in key order.
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-19 09:12:41.208315
+
+"""
+from alembic import op
+
+revision = '0001'
+down_revision = '0000'
+branch_labels = None
+depends_on = None
+
+
+STATEMENT_LEVEL_FUNCTION = """
+    CREATE OR REPLACE FUNCTION update_entity_count_per_statement()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO entity_count (
+                sync_id, entity_definition_short_name, count,
+                created_at, modified_at
+            )
+            SELECT sync_id, entity_definition_short_name, COUNT(*),
+                   CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            FROM new_rows
+            WHERE entity_definition_short_name IS NOT NULL
+            GROUP BY sync_id, entity_definition_short_name
+            ORDER BY sync_id, entity_definition_short_name
+            ON CONFLICT (sync_id, entity_definition_short_name)
+            DO UPDATE SET
+                count = entity_count.count + EXCLUDED.count,
+                modified_at = CURRENT_TIMESTAMP;
+
+        ELSIF TG_OP = 'DELETE' THEN
+            -- Lock the affected counters in key order, like the insert path
+            PERFORM 1
+            FROM entity_count c
+            JOIN (
+                SELECT DISTINCT sync_id, entity_definition_short_name FROM old_rows
+            ) r USING (sync_id, entity_definition_short_name)
+            ORDER BY c.sync_id, c.entity_definition_short_name
+            FOR UPDATE OF c;
+
+            UPDATE entity_count c
+            SET count = GREATEST(0, c.count - r.removed),
+                modified_at = CURRENT_TIMESTAMP
+            FROM (
+                SELECT sync_id, entity_definition_short_name, COUNT(*) AS removed
+                FROM old_rows
+                WHERE entity_definition_short_name IS NOT NULL
+                GROUP BY sync_id, entity_definition_short_name
+            ) r
+            WHERE c.sync_id = r.sync_id
+              AND c.entity_definition_short_name = r.entity_definition_short_name;
+
+            DELETE FROM entity_count c
+            USING (
+                SELECT DISTINCT sync_id, entity_definition_short_name FROM old_rows
+            ) r
+            WHERE c.sync_id = r.sync_id
+              AND c.entity_definition_short_name = r.entity_definition_short_name
+              AND c.count = 0;
+
+        ELSIF TG_OP = 'UPDATE' THEN
+            -- Only rows moved to another sync or definition change the counts
+            UPDATE entity_count c
+            SET count = GREATEST(0, c.count - r.moved),
+                modified_at = CURRENT_TIMESTAMP
+            FROM (
+                SELECT o.sync_id, o.entity_definition_short_name, COUNT(*) AS moved
+                FROM old_rows o
+                JOIN new_rows n ON n.id = o.id
+                WHERE o.entity_definition_short_name IS NOT NULL
+                  AND n.entity_definition_short_name IS NOT NULL
+                  AND (o.sync_id, o.entity_definition_short_name)
+                      IS DISTINCT FROM (n.sync_id, n.entity_definition_short_name)
+                GROUP BY o.sync_id, o.entity_definition_short_name
+            ) r
+            WHERE c.sync_id = r.sync_id
+              AND c.entity_definition_short_name = r.entity_definition_short_name;
+
+            INSERT INTO entity_count (
+                sync_id, entity_definition_short_name, count,
+                created_at, modified_at
+            )
+            SELECT n.sync_id, n.entity_definition_short_name, COUNT(*),
+                   CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            FROM old_rows o
+            JOIN new_rows n ON n.id = o.id
+            WHERE o.entity_definition_short_name IS NOT NULL
+              AND n.entity_definition_short_name IS NOT NULL
+              AND (o.sync_id, o.entity_definition_short_name)
+                  IS DISTINCT FROM (n.sync_id, n.entity_definition_short_name)
+            GROUP BY n.sync_id, n.entity_definition_short_name
+            ORDER BY n.sync_id, n.entity_definition_short_name
+            ON CONFLICT (sync_id, entity_definition_short_name)
+            DO UPDATE SET
+                count = entity_count.count + EXCLUDED.count,
+                modified_at = CURRENT_TIMESTAMP;
+        END IF;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+# Transition tables can't be declared on a trigger for more than one event
+STATEMENT_LEVEL_TRIGGERS = [
+    """
+    CREATE TRIGGER entity_count_insert_trigger
+    AFTER INSERT ON entity
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_entity_count_per_statement();
+    """,
+    """
+    CREATE TRIGGER entity_count_update_trigger
+    AFTER UPDATE ON entity
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_entity_count_per_statement();
+    """,
+    """
+    CREATE TRIGGER entity_count_delete_trigger
+    AFTER DELETE ON entity
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_entity_count_per_statement();
+    """,
+]
+
+# Row-level trigger from 0000_baseline, restored on downgrade
+ROW_LEVEL_FUNCTION = """
+    CREATE OR REPLACE FUNCTION update_entity_count()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' AND NEW.entity_definition_short_name IS NULL THEN
+            RETURN NEW;
+        END IF;
+        IF TG_OP = 'DELETE' AND OLD.entity_definition_short_name IS NULL THEN
+            RETURN OLD;
+        END IF;
+        IF TG_OP = 'UPDATE' AND (
+            NEW.entity_definition_short_name IS NULL
+            OR OLD.entity_definition_short_name IS NULL
+        ) THEN
+            RETURN NEW;
+        END IF;
+
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO entity_count (
+                sync_id, entity_definition_short_name, count,
+                created_at, modified_at
+            )
+            VALUES (
+                NEW.sync_id, NEW.entity_definition_short_name, 1,
+                CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            )
+            ON CONFLICT (sync_id, entity_definition_short_name)
+            DO UPDATE SET
+                count = entity_count.count + 1,
+                modified_at = CURRENT_TIMESTAMP;
+
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE entity_count
+            SET count = GREATEST(0, count - 1),
+                modified_at = CURRENT_TIMESTAMP
+            WHERE sync_id = OLD.sync_id
+              AND entity_definition_short_name = OLD.entity_definition_short_name;
+
+            DELETE FROM entity_count
+            WHERE sync_id = OLD.sync_id
+              AND entity_definition_short_name = OLD.entity_definition_short_name
+              AND count = 0;
+
+        ELSIF TG_OP = 'UPDATE' THEN
+            IF OLD.sync_id != NEW.sync_id
+               OR OLD.entity_definition_short_name != NEW.entity_definition_short_name
+            THEN
+                UPDATE entity_count
+                SET count = GREATEST(0, count - 1),
+                    modified_at = CURRENT_TIMESTAMP
+                WHERE sync_id = OLD.sync_id
+                  AND entity_definition_short_name = OLD.entity_definition_short_name;
+
+                INSERT INTO entity_count (
+                    sync_id, entity_definition_short_name, count,
+                    created_at, modified_at
+                )
+                VALUES (
+                    NEW.sync_id, NEW.entity_definition_short_name, 1,
+                    CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                )
+                ON CONFLICT (sync_id, entity_definition_short_name)
+                DO UPDATE SET
+                    count = entity_count.count + 1,
+                    modified_at = CURRENT_TIMESTAMP;
+            END IF;
+        END IF;
+
+        IF TG_OP = 'DELETE' THEN
+            RETURN OLD;
+        ELSE
+            RETURN NEW;
+        END IF;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+ROW_LEVEL_TRIGGER = """
+    CREATE TRIGGER entity_count_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON entity
+    FOR EACH ROW
+    EXECUTE FUNCTION update_entity_count();
+"""
+
+
+def upgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS entity_count_trigger ON entity")
+    op.execute("DROP FUNCTION IF EXISTS update_entity_count()")
+
+    op.execute(STATEMENT_LEVEL_FUNCTION)
+    for trigger in STATEMENT_LEVEL_TRIGGERS:
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS entity_count_delete_trigger ON entity")
+    op.execute("DROP TRIGGER IF EXISTS entity_count_update_trigger ON entity")
+    op.execute("DROP TRIGGER IF EXISTS entity_count_insert_trigger ON entity")
+    op.execute("DROP FUNCTION IF EXISTS update_entity_count_per_statement()")
+
+    op.execute(ROW_LEVEL_FUNCTION)
+    op.execute(ROW_LEVEL_TRIGGER)
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
         FakeAgenticSearchMetrics,
         FakeDbPoolMetrics,
         FakeHttpMetrics,
+        FakePubSubMetrics,
+        FakeUsageLedgerMetrics,
     )
     from airweave.core.fakes.metrics_service import FakeMetricsService
     from airweave.core.health.fakes import FakeHealthService
@@ -140,6 +142,22 @@ def fake_db_pool_metrics() -> FakeDbPoolMetrics:
     return FakeDbPoolMetrics()
 
 
+@pytest.fixture
+def fake_pubsub_metrics() -> FakePubSubMetrics:
+    """Fake PubSubMetrics that records the latest gauges in memory."""
+    from airweave.adapters.metrics import FakePubSubMetrics
+
+    return FakePubSubMetrics()
+
+
+@pytest.fixture
+def fake_usage_ledger_metrics() -> FakeUsageLedgerMetrics:
+    """Fake UsageLedgerMetrics that records pending gauges and flushes in memory."""
+    from airweave.adapters.metrics import FakeUsageLedgerMetrics
+
+    return FakeUsageLedgerMetrics()
+
+
 @pytest.fixture
 def fake_source_service():
     """Fake SourceService that returns canned source schemas."""
@@ -185,6 +203,8 @@ def fake_metrics_service(
     fake_http_metrics,
     fake_agentic_search_metrics,
     fake_db_pool_metrics,
+    fake_pubsub_metrics,
+    fake_usage_ledger_metrics,
 ) -> FakeMetricsService:
     """FakeMetricsService wrapping individual metric fakes."""
     from airweave.core.fakes.metrics_service import FakeMetricsService
@@ -193,6 +213,8 @@ def fake_metrics_service(
         http=fake_http_metrics,
         agentic_search=fake_agentic_search_metrics,
         db_pool=fake_db_pool_metrics,
+        pubsub=fake_pubsub_metrics,
+        usage=fake_usage_ledger_metrics,
     )
 
 
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+r"""Offline sync throughput benchmark.
+
+Runs syncs of the stub sources through the real sync pipeline with fake
+embedders, an in-memory entity repository and an in-process Vespa feed
+target, across a matrix of entity profiles, entity counts and batch sizes.
+Prints one line per case and writes a JSON report with entities/sec,
+chunks/sec, peak RSS and per-stage timings.
+
+No Postgres, Redis, Vespa or embedding provider is contacted, so placeholder
+settings are used for anything not already set in the environment.
+
+Usage:
+    python -m scripts.benchmark_sync
+
+    # Wider matrix, saved for later comparison
+    python -m scripts.benchmark_sync --entity-counts 500,2000 --batch-sizes 16,64,256 \
+        --output sync-bench.json
+
+    # The file, incremental and timed stub sources
+    python -m scripts.benchmark_sync --profiles file_stub,incremental,timed
+
+    # Fail (exit 1) if any case lost more than 20% entities/sec vs. a baseline
+    python -m scripts.benchmark_sync --baseline sync-bench.json --max-regression 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+_PLACEHOLDER_ENV = {
+    "FIRST_SUPERUSER": "benchmark@example.com",
+    "FIRST_SUPERUSER_PASSWORD": "benchmark-password",
+    "ENCRYPTION_KEY": "SpgLrrEEgJ/7QdhSMSvagL1juEY5eoyCG0tZN7OSQV0=",
+    "STATE_SECRET": "benchmark-state-secret-minimum-32-characters",
+    "SVIX_JWT_SECRET": "benchmark-svix-jwt-secret-minimum-32-characters",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_USER": "benchmark",
+    "POSTGRES_PASSWORD": "benchmark",
+    "POSTGRES_DB": "benchmark",
+    "AUTH_ENABLED": "false",
+    "DENSE_EMBEDDER": "openai_text_embedding_3_small",
+    "EMBEDDING_DIMENSIONS": "1536",
+    "SPARSE_EMBEDDER": "fastembed_bm25",
+    "LOG_LEVEL": "WARNING",
+}
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def _str_list(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _print_result(result) -> None:
+    top_stages = ", ".join(
+        f"{name}={share:.0%}"
+        for name, share in sorted(result.stage_share.items(), key=lambda kv: -kv[1])[:3]
+    )
+    print(
+        f"{result.case:<32} {result.entities_per_second:>9.1f} ent/s "
+        f"{result.chunks_per_second:>9.1f} chunks/s "
+        f"peak {result.peak_rss_mb:>7.1f} MB  [{top_stages}]"
+    )
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run the matrix, write the report and compare against a baseline."""
+    from scripts.benchmark_sync_harness import build_matrix, compare_reports, run_matrix
+
+    cases = build_matrix(args.profiles, args.entity_counts, args.batch_sizes, seed=args.seed)
+    print(f"Running {len(cases)} case(s) with the {args.chunker} chunker")
+    report = await run_matrix(
+        cases,
+        chunker=args.chunker,
+        feed_latency_ms=args.feed_latency_ms,
+        dense_dimensions=args.dense_dimensions,
+        on_result=_print_result,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.max_regression)
+        if regressions:
+            print("Throughput regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No case regressed by more than {args.max_regression:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline sync throughput benchmark")
+    parser.add_argument(
+        "--profiles",
+        type=_str_list,
+        default=["small", "large", "mixed"],
+        help="Stub source profiles (small, medium, large, files, mixed) and the "
+        "file_stub, incremental and timed sources",
+    )
+    parser.add_argument("--entity-counts", type=_int_list, default=[500])
+    parser.add_argument("--batch-sizes", type=_int_list, default=[16, 64])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--chunker",
+        choices=["window", "semantic"],
+        default="window",
+        help="window needs no models; semantic uses the production chunkers",
+    )
+    parser.add_argument(
+        "--feed-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated Vespa round trip per feed call",
+    )
+    parser.add_argument("--dense-dimensions", type=int, default=1536)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    parser.add_argument("--baseline", help="JSON report to compare entities/sec against")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+
+    for key, value in _PLACEHOLDER_ENV.items():
+        os.environ.setdefault(key, value)
+
+    sys.exit(asyncio.run(main(args)))
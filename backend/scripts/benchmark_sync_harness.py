@@ -0,0 +1,588 @@
+"""Offline end-to-end sync throughput benchmark.
+
+Drives the real ``SyncOrchestrator`` — stream, worker pool, entity pipeline,
+action resolver, dispatcher, postgres and destination handlers, text building,
+chunking, embedding and the Vespa transform — against the deterministic stub
+sources. Anything that would leave the process is replaced by an in-memory
+stand-in:
+
+- Postgres: ``FakeEntityRepository`` (sessions are opened but never used)
+- Embedders: ``FakeDenseEmbedder`` / ``FakeSparseEmbedder``
+- Vespa: the real ``VespaDestination`` and ``VespaClient`` feeding a
+  ``LocalVespaApp`` that JSON-encodes and acknowledges every document
+- Job state, usage and events: the domain fakes
+
+Text is chunked by a fixed-size window chunker by default because the
+semantic chunker downloads its models on first use; ``chunker="semantic"``
+measures the production chunkers where the models are cached.
+
+Profiles pick the source and its shape:
+
+- ``small``, ``medium``, ``large``, ``files``, ``mixed``: ``StubSource`` with
+  the given entity-size weights;
+- ``file_stub``: ``FileStubSource``'s real PDF, PPTX and DOCX files through the
+  converters (a fixed set of files, so one case per batch size and no entity
+  count; the scanned PDF yields no text without an OCR provider);
+- ``incremental``: ``IncrementalStubSource`` resuming from a stored cursor that
+  covers the first half of the entities, so only the second half is synced
+  and orphan cleanup is skipped, like a follow-up sync;
+- ``timed``: ``TimedSource`` pacing its entities at up to
+  ``TIMED_ENTITIES_PER_SECOND``, so entities/sec is capped near the source's
+  rate and a drop shows the pipeline falling behind a paced source.
+
+Each case reports entities/sec, chunks/sec, peak RSS and the per-stage time
+from the sync flight recorder. Used by ``scripts/benchmark_sync.py`` and
+``tests/benchmarks/test_sync_throughput_benchmark.py``; it lives next to the
+CLI so the production package does not ship it.
+"""
+
+import asyncio
+import json
+import os
+import platform
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from uuid import UUID, uuid4
+
+import httpx
+import psutil
+
+from airweave import schemas
+from airweave.adapters.event_bus.fake import FakeEventBus
+from airweave.core.logging import LoggerConfigurator
+from airweave.core.shared_models import ConnectionStatus, IntegrationType
+from airweave.domains.access_control.dispatcher import ACActionDispatcher
+from airweave.domains.access_control.fakes.repository import FakeAccessControlMembershipRepository
+from airweave.domains.access_control.membership_tracker import ACLMembershipTracker
+from airweave.domains.access_control.pipeline import AccessControlPipeline
+from airweave.domains.access_control.postgres_handler import ACPostgresHandler
+from airweave.domains.access_control.resolver import ACActionResolver
+from airweave.domains.converters.registry import ConverterRegistry
+from airweave.domains.embedders.fakes.embedder import FakeDenseEmbedder, FakeSparseEmbedder
+from airweave.domains.entities.registry import EntityDefinitionRegistry
+from airweave.domains.sources.token_providers.credential import DirectCredentialProvider
+from airweave.domains.sync_pipeline.config import SyncConfig
+from airweave.domains.sync_pipeline.config.base import BehaviorConfig, CursorConfig, HandlerConfig
+from airweave.domains.sync_pipeline.contexts import SyncContext
+from airweave.domains.sync_pipeline.contexts.runtime import SyncRuntime
+from airweave.domains.sync_pipeline.entity.dispatcher_builder import EntityDispatcherBuilder
+from airweave.domains.sync_pipeline.entity.pipeline import EntityPipeline
+from airweave.domains.sync_pipeline.entity.resolver import EntityActionResolver
+from airweave.domains.sync_pipeline.fakes.entity_repository import FakeEntityRepository
+from airweave.domains.sync_pipeline.flight_recorder import sync_flight_recorder
+from airweave.domains.sync_pipeline.orchestrator import SyncOrchestrator
+from airweave.domains.sync_pipeline.pipeline.entity_tracker import EntityTracker
+from airweave.domains.sync_pipeline.processors.chunk_embed import ChunkEmbedProcessor
+from airweave.domains.sync_pipeline.stream import AsyncSourceStream
+from airweave.domains.sync_pipeline.worker_pool import AsyncWorkerPool
+from airweave.domains.syncs.cursors.cursor import SyncCursor
+from airweave.domains.syncs.cursors.service import SyncCursorService
+from airweave.domains.syncs.fakes.state_machine import FakeSyncStateMachine
+from airweave.domains.syncs.jobs.fakes.state_machine import FakeSyncJobStateMachine
+from airweave.domains.usage.fakes.ledger import FakeUsageLedger
+from airweave.domains.usage.fakes.limit_checker import FakeUsageLimitChecker
+from airweave.platform.chunkers._base import BaseChunker
+from airweave.platform.configs.auth import FileStubAuthConfig, StubAuthConfig, TimedAuthConfig
+from airweave.platform.configs.config import (
+    FileStubConfig,
+    IncrementalStubConfig,
+    StubConfig,
+    TimedConfig,
+)
+from airweave.platform.cursors import IncrementalStubCursor
+from airweave.platform.destinations.vespa.client import VespaClient
+from airweave.platform.destinations.vespa.destination import VespaDestination
+from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+from airweave.platform.sources._base import BaseSource
+from airweave.platform.sources.file_stub import FileStubSource
+from airweave.platform.sources.incremental_stub import IncrementalStubSource
+from airweave.platform.sources.stub import StubSource
+from airweave.platform.sources.timed import TimedSource
+
+REPORT_VERSION = 1
+
+# StubConfig weights per profile; "mixed" is the stub's default distribution
+PROFILES: Dict[str, Dict[str, int]] = {
+    "small": {"small_entity_weight": 1},
+    "medium": {"medium_entity_weight": 1},
+    "large": {"large_entity_weight": 1},
+    "files": {"small_file_weight": 3, "large_file_weight": 1},
+    "mixed": {
+        "small_entity_weight": 30,
+        "medium_entity_weight": 30,
+        "large_entity_weight": 10,
+        "small_file_weight": 15,
+        "large_file_weight": 5,
+        "code_file_weight": 10,
+    },
+}
+
+# Profiles served by the other stub sources (see the module docstring)
+SOURCE_PROFILES = ("file_stub", "incremental", "timed")
+
+# Emission rate of the timed profile (an upper bound, the source sleeps between entities)
+TIMED_ENTITIES_PER_SECOND = 500
+
+_WEIGHT_FIELDS = (
+    "small_entity_weight",
+    "medium_entity_weight",
+    "large_entity_weight",
+    "small_file_weight",
+    "large_file_weight",
+    "code_file_weight",
+)
+
+RSS_SAMPLE_INTERVAL = 0.02
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One point of the benchmark matrix."""
+
+    profile: str
+    entity_count: int
+    batch_size: int
+    seed: int = 42
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to compare reports."""
+        if self.profile == "file_stub":
+            return f"{self.profile}/batch={self.batch_size}"
+        return f"{self.profile}/n={self.entity_count}/batch={self.batch_size}"
+
+
+@dataclass
+class CaseResult:
+    """Measurements for one benchmark case."""
+
+    case: str
+    profile: str
+    entity_count: int
+    batch_size: int
+    entities: int
+    chunks: int
+    seconds: float
+    entities_per_second: float
+    chunks_per_second: float
+    peak_rss_mb: float
+    rss_growth_mb: float
+    fed_mb: float
+    stage_ms: Dict[str, float] = field(default_factory=dict)
+    stage_share: Dict[str, float] = field(default_factory=dict)
+
+
+def build_matrix(
+    profiles: Iterable[str],
+    entity_counts: Iterable[int],
+    batch_sizes: Iterable[int],
+    seed: int = 42,
+) -> List[BenchmarkCase]:
+    """Cartesian product of profiles, entity counts and batch sizes.
+
+    ``file_stub`` always yields the same files, so it gets one case per batch size.
+    """
+    entity_counts = list(entity_counts)
+    batch_sizes = list(batch_sizes)
+    cases = []
+    for profile in profiles:
+        if profile not in PROFILES and profile not in SOURCE_PROFILES:
+            choices = sorted([*PROFILES, *SOURCE_PROFILES])
+            raise ValueError(f"Unknown profile '{profile}' (choose from {choices})")
+        for entity_count in [0] if profile == "file_stub" else entity_counts:
+            for batch_size in batch_sizes:
+                cases.append(BenchmarkCase(profile, entity_count, batch_size, seed))
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# In-process stand-ins
+# ---------------------------------------------------------------------------
+
+
+class WindowChunker(BaseChunker):
+    """Splits text into fixed-size word windows; needs no models or encodings."""
+
+    def __init__(self, words_per_chunk: int = 400) -> None:
+        """Initialize with the window size in words."""
+        self._words_per_chunk = words_per_chunk
+
+    async def chunk_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Chunk each text into consecutive windows."""
+        results = []
+        for text in texts:
+            words = (text or "").split()
+            results.append(
+                [
+                    {
+                        "text": " ".join(words[i : i + self._words_per_chunk]),
+                        "token_count": len(words[i : i + self._words_per_chunk]),
+                    }
+                    for i in range(0, len(words), self._words_per_chunk)
+                ]
+            )
+        return results
+
+
+class _FeedResponse:
+    status_code = 200
+    json: Dict[str, Any] = {}
+
+    def is_successful(self) -> bool:
+        return True
+
+
+class LocalVespaApp:
+    """Stands in for pyvespa's ``Vespa`` application inside ``VespaClient``.
+
+    ``feed_iterable`` serializes every document like the HTTP feed would and
+    acknowledges it, optionally after a simulated round trip per call. Feeds
+    from concurrent batches run in parallel threads, hence the lock.
+    """
+
+    def __init__(self, feed_latency_ms: float = 0.0) -> None:
+        """Initialize with nothing fed."""
+        self._feed_latency = feed_latency_ms / 1000.0
+        self._lock = threading.Lock()
+        self.documents = 0
+        self.bytes_fed = 0
+
+    def feed_iterable(self, iter, schema, namespace, callback, **kwargs) -> None:  # noqa: A002
+        """Accept every document (runs in a worker thread, like pyvespa)."""
+        if self._feed_latency:
+            time.sleep(self._feed_latency)
+        response = _FeedResponse()
+        for doc in iter:
+            size = len(json.dumps(doc["fields"], default=str))
+            with self._lock:
+                self.bytes_fed += size
+                self.documents += 1
+                callback(response, doc["id"])
+
+
+@lru_cache(maxsize=1)
+def _entity_definition_registry() -> EntityDefinitionRegistry:
+    registry = EntityDefinitionRegistry()
+    registry.build()
+    return registry
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+
+def _schemas(org_id: UUID, sync_id: UUID, job_id: UUID) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    connection_id = uuid4()
+    return {
+        "organization": schemas.Organization(
+            id=org_id, name="benchmark", created_at=now, modified_at=now
+        ),
+        "sync": schemas.Sync(
+            id=sync_id,
+            name="benchmark",
+            status="active",
+            source_connection_id=connection_id,
+            destination_connection_ids=[],
+            organization_id=org_id,
+            created_at=now,
+            modified_at=now,
+        ),
+        "sync_job": schemas.SyncJob(
+            id=job_id,
+            sync_id=sync_id,
+            status="pending",
+            organization_id=org_id,
+            created_at=now,
+            modified_at=now,
+        ),
+        "collection": schemas.CollectionRecord(
+            id=uuid4(),
+            name="benchmark",
+            readable_id="benchmark",
+            vector_db_deployment_metadata_id=uuid4(),
+            organization_id=org_id,
+            created_at=now,
+            modified_at=now,
+        ),
+        "connection": schemas.Connection(
+            id=connection_id,
+            name="benchmark-stub",
+            readable_id="benchmark-stub",
+            short_name="stub",
+            integration_type=IntegrationType.SOURCE,
+            status=ConnectionStatus.ACTIVE,
+            organization_id=org_id,
+            created_at=now,
+            modified_at=now,
+        ),
+    }
+
+
+async def _create_source(
+    case: BenchmarkCase, logger: Any, http_client: AirweaveHttpClient, sync_id: UUID
+) -> "tuple[BaseSource, Optional[SyncCursor]]":
+    """Source for the case's profile, and the cursor it resumes from (if any)."""
+    common = {"logger": logger, "http_client": http_client}
+    if case.profile == "file_stub":
+        source = await FileStubSource.create(
+            auth=DirectCredentialProvider(FileStubAuthConfig(), source_short_name="file_stub"),
+            config=FileStubConfig(seed=case.seed),
+            **common,
+        )
+        return source, None
+    if case.profile == "incremental":
+        source = await IncrementalStubSource.create(
+            auth=DirectCredentialProvider(StubAuthConfig(), source_short_name="incremental_stub"),
+            config=IncrementalStubConfig(entity_count=case.entity_count, seed=case.seed),
+            **common,
+        )
+        synced = case.entity_count // 2
+        cursor = SyncCursor(
+            sync_id=sync_id,
+            cursor_schema=IncrementalStubCursor,
+            cursor_data={"last_entity_index": synced - 1, "entity_count": synced},
+        )
+        return source, cursor
+    if case.profile == "timed":
+        source = await TimedSource.create(
+            auth=DirectCredentialProvider(TimedAuthConfig(), source_short_name="timed"),
+            config=TimedConfig(
+                entity_count=case.entity_count,
+                duration_seconds=max(0.1, case.entity_count / TIMED_ENTITIES_PER_SECOND),
+                seed=case.seed,
+            ),
+            **common,
+        )
+        return source, None
+
+    weights = {name: PROFILES[case.profile].get(name, 0) for name in _WEIGHT_FIELDS}
+    source = await StubSource.create(
+        auth=DirectCredentialProvider(StubAuthConfig(), source_short_name="stub"),
+        config=StubConfig(entity_count=case.entity_count, seed=case.seed, **weights),
+        **common,
+    )
+    return source, None
+
+
+def _chunkers(chunker: str) -> Dict[str, Optional[BaseChunker]]:
+    if chunker == "window":
+        window = WindowChunker()
+        return {"text_chunker": window, "code_chunker": window}
+    if chunker == "semantic":
+        return {"text_chunker": None, "code_chunker": None}
+    raise ValueError(f"Unknown chunker '{chunker}' (choose 'window' or 'semantic')")
+
+
+async def _sample_peak_rss(process: psutil.Process, peak: List[int]) -> None:
+    while True:
+        peak[0] = max(peak[0], process.memory_info().rss)
+        await asyncio.sleep(RSS_SAMPLE_INTERVAL)
+
+
+async def run_case(
+    case: BenchmarkCase,
+    *,
+    chunker: str = "window",
+    feed_latency_ms: float = 0.0,
+    dense_dimensions: int = 1536,
+) -> CaseResult:
+    """Run one sync of the case's stub source and measure it."""
+    org_id, sync_id, job_id = uuid4(), uuid4(), uuid4()
+    objs = _schemas(org_id, sync_id, job_id)
+    logger = LoggerConfigurator.configure_logger(
+        "airweave.benchmarks.sync",
+        dimensions={"sync_job_id": str(job_id), "benchmark_case": case.key},
+    )
+    config = SyncConfig(
+        handlers=HandlerConfig(enable_raw_data_handler=False),
+        cursor=CursorConfig(skip_load=True, skip_updates=True),
+        behavior=BehaviorConfig(skip_guardrails=True),
+    )
+
+    async with httpx.AsyncClient() as wrapped_client:
+        source, cursor = await _create_source(
+            case,
+            logger,
+            AirweaveHttpClient(
+                wrapped_client=wrapped_client,
+                org_id=org_id,
+                source_short_name="stub",
+                feature_flag_enabled=False,
+                logger=logger,
+            ),
+            sync_id,
+        )
+        app = LocalVespaApp(feed_latency_ms=feed_latency_ms)
+        destination = await VespaDestination.create(
+            collection_id=objs["collection"].id,
+            organization_id=org_id,
+            logger=logger,
+            client=VespaClient(app=app, logger=logger),
+        )
+
+        sync_context = SyncContext(
+            organization=objs["organization"],
+            sync_id=sync_id,
+            sync_job_id=job_id,
+            collection_id=objs["collection"].id,
+            source_connection_id=uuid4(),
+            sync=objs["sync"],
+            sync_job=objs["sync_job"],
+            collection=objs["collection"],
+            connection=objs["connection"],
+            execution_config=config,
+            batch_size=case.batch_size,
+            source_short_name="stub",
+            logger=logger,
+        )
+        tracker = EntityTracker(job_id=job_id, sync_id=sync_id, logger=logger)
+        runtime = SyncRuntime(
+            source=source, cursor=cursor, entity_tracker=tracker, destinations=[destination]
+        )
+
+        entity_repo = FakeEntityRepository()
+        event_bus = FakeEventBus()
+        processor = ChunkEmbedProcessor(
+            converter_registry=ConverterRegistry(),
+            dense_embedder=FakeDenseEmbedder(dimensions=dense_dimensions),
+            sparse_embedder=FakeSparseEmbedder(),
+            **_chunkers(chunker),
+        )
+        dispatcher = EntityDispatcherBuilder(processor=processor, entity_repo=entity_repo).build(
+            destinations=[destination], execution_config=config, logger=logger
+        )
+        acl_repo = FakeAccessControlMembershipRepository()
+        orchestrator = SyncOrchestrator(
+            entity_pipeline=EntityPipeline(
+                entity_tracker=tracker,
+                event_bus=event_bus,
+                action_resolver=EntityActionResolver(
+                    entity_registry=_entity_definition_registry(), entity_repo=entity_repo
+                ),
+                action_dispatcher=dispatcher,
+                entity_repo=entity_repo,
+            ),
+            worker_pool=AsyncWorkerPool(logger=logger),
+            stream=AsyncSourceStream(
+                source_generator=source.generate_entities(cursor=cursor),
+                queue_size=10000,
+                logger=logger,
+            ),
+            sync_context=sync_context,
+            runtime=runtime,
+            access_control_pipeline=AccessControlPipeline(
+                resolver=ACActionResolver(),
+                dispatcher=ACActionDispatcher(handlers=[ACPostgresHandler(acl_repo=acl_repo)]),
+                tracker=ACLMembershipTracker(
+                    source_connection_id=sync_context.source_connection_id,
+                    organization_id=org_id,
+                    logger=logger,
+                ),
+                acl_repo=acl_repo,
+            ),
+            event_bus=event_bus,
+            usage_checker=FakeUsageLimitChecker(),
+            usage_ledger=FakeUsageLedger(),
+            sync_cursor_service=SyncCursorService(),
+            state_machine=FakeSyncJobStateMachine(),
+            lifecycle_data=sync_context.lifecycle_data,
+            sync_state_machine=FakeSyncStateMachine(),
+        )
+
+        process = psutil.Process()
+        start_rss = process.memory_info().rss
+        peak = [start_rss]
+        sampler = asyncio.create_task(_sample_peak_rss(process, peak))
+        start = time.perf_counter()
+        try:
+            await orchestrator.run()
+        finally:
+            seconds = time.perf_counter() - start
+            sampler.cancel()
+            await asyncio.gather(sampler, return_exceptions=True)
+        peak[0] = max(peak[0], process.memory_info().rss)
+
+    stats = tracker.get_stats()
+    entities = stats.inserted + stats.updated + stats.kept + stats.skipped
+    summary = sync_flight_recorder.summary(job_id) or {}
+    return CaseResult(
+        case=case.key,
+        profile=case.profile,
+        entity_count=case.entity_count,
+        batch_size=case.batch_size,
+        entities=entities,
+        chunks=app.documents,
+        seconds=round(seconds, 4),
+        entities_per_second=round(entities / seconds, 2) if seconds else 0.0,
+        chunks_per_second=round(app.documents / seconds, 2) if seconds else 0.0,
+        peak_rss_mb=round(peak[0] / 2**20, 1),
+        rss_growth_mb=round((peak[0] - start_rss) / 2**20, 1),
+        fed_mb=round(app.bytes_fed / 2**20, 2),
+        stage_ms=summary.get("stage_ms_total", {}),
+        stage_share=summary.get("stage_share", {}),
+    )
+
+
+async def run_matrix(
+    cases: Iterable[BenchmarkCase],
+    *,
+    chunker: str = "window",
+    feed_latency_ms: float = 0.0,
+    dense_dimensions: int = 1536,
+    on_result: Optional[Callable[[CaseResult], None]] = None,
+) -> Dict[str, Any]:
+    """Run every case in order and return a machine-readable report."""
+    results = []
+    for case in cases:
+        result = await run_case(
+            case,
+            chunker=chunker,
+            feed_latency_ms=feed_latency_ms,
+            dense_dimensions=dense_dimensions,
+        )
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    return {
+        "version": REPORT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "settings": {
+            "chunker": chunker,
+            "feed_latency_ms": feed_latency_ms,
+            "dense_dimensions": dense_dimensions,
+        },
+        "results": [asdict(r) for r in results],
+    }
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    max_regression: float = 0.2,
+) -> List[str]:
+    """Cases whose entities/sec dropped by more than ``max_regression`` vs. baseline."""
+    previous = {r["case"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for result in current.get("results", []):
+        before = previous.get(result["case"])
+        if not before or not before["entities_per_second"]:
+            continue
+        change = result["entities_per_second"] / before["entities_per_second"] - 1
+        if change < -max_regression:
+            regressions.append(
+                f"{result['case']}: {before['entities_per_second']:.1f} -> "
+                f"{result['entities_per_second']:.1f} entities/s ({change:+.0%})"
+            )
+    return regressions
@@ -0,0 +1,143 @@
+"""Benchmark: token accounting over a 25-iteration agentic search run.
+
+Replays the ContextManager calls the agent loop makes per iteration (budget
+checks before the LLM call, history compression, budget split for tool
+results, fitting results) against a growing conversation, once with the
+running token total and once re-tokenizing the whole history on every call
+as before.
+
+The tokenizer does regex word splitting so tokenization has a realistic CPU
+cost without needing tiktoken's downloaded encodings.
+
+Run with ``pytest tests/benchmarks -m benchmark -s`` to see timings.
+"""
+
+import json
+import re
+import time
+
+import pytest
+
+from airweave.domains.search.agentic.context_manager import ContextManager
+from airweave.domains.search.agentic.state import AgentState
+from airweave.domains.search.agentic.tests.conftest import make_result
+from airweave.domains.search.agentic.tools.types import RenderedResult, SearchToolResult
+
+pytestmark = pytest.mark.benchmark
+
+ITERATIONS = 25
+TOOL_CALLS_PER_ITERATION = 3
+SUMMARIES_PER_SEARCH = 25
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+class _RegexTokenizer:
+    """Word/punctuation tokenizer that records how many characters it processed."""
+
+    def __init__(self) -> None:
+        self.chars_tokenized = 0
+
+    def count_tokens(self, text: str) -> int:
+        self.chars_tokenized += len(text)
+        return len(_TOKEN_RE.findall(text))
+
+
+class _UncachedContextManager(ContextManager):
+    """Previous behaviour: re-tokenize every message on every count."""
+
+    def _sync_running_total(self, messages: list[dict]) -> bool:
+        return False
+
+    def _count_messages_tokens(self, messages: list[dict]) -> int:
+        total = 0
+        for msg in messages:
+            content = msg.get("content") or ""
+            if isinstance(content, list):
+                content = json.dumps(content)
+            total += self._tokenizer.count_tokens(str(content))
+            if msg.get("tool_calls"):
+                total += self._tokenizer.count_tokens(json.dumps(msg["tool_calls"]))
+            if msg.get("_thinking"):
+                total += self._tokenizer.count_tokens(msg["_thinking"])
+        return total
+
+
+def _simulate(cm_class: type[ContextManager]) -> tuple[_RegexTokenizer, list[int], float]:
+    tokenizer = _RegexTokenizer()
+    cm = cm_class(
+        tokenizer=tokenizer,
+        context_window=400_000,
+        max_output_tokens=32_000,
+        thinking_enabled=True,
+        system_prompt="You are a search agent. " * 200,
+        tools=[{"type": "function", "function": {"name": "search"}}],
+    )
+    state = AgentState()
+    messages: list[dict] = [{"role": "user", "content": "Find the Q3 planning documents."}]
+    budgets: list[int] = []
+    prev_ids: set[str] = set()
+
+    start = time.perf_counter()
+    for iteration in range(ITERATIONS):
+        cm.max_output_tokens(messages)
+
+        tc_ids = [f"tc-{iteration}-{i}" for i in range(TOOL_CALLS_PER_ITERATION)]
+        messages.append(
+            {
+                "role": "assistant",
+                "content": "Searching with different phrasings.",
+                "_thinking": "Let me reason about which queries to try next. " * 40,
+                "tool_calls": [
+                    {
+                        "id": tc_id,
+                        "type": "function",
+                        "function": {"name": "search", "arguments": {"query": "q3 plan " * 10}},
+                    }
+                    for tc_id in tc_ids
+                ],
+            }
+        )
+
+        messages = cm.compress_history(messages, state, set(tc_ids), set(), prev_ids, set())
+        cm.check_budget(messages)
+        per_call = cm.available_budget(messages) // TOOL_CALLS_PER_ITERATION
+
+        for tc_id in tc_ids:
+            results = [
+                make_result(entity_id=f"{tc_id}-e{j}", content="Quarterly plan details. " * 30)
+                for j in range(SUMMARIES_PER_SEARCH)
+            ]
+            state.results_by_tool_call_id[tc_id] = results
+            summaries = [
+                RenderedResult(entity_id=r.entity_id, text=r.to_snippet_summary_md())
+                for r in results
+            ]
+            content = cm.fit_tool_result(
+                SearchToolResult(summaries=summaries, new_count=len(summaries)), per_call
+            )
+            messages.append(
+                {"role": "tool", "tool_call_id": tc_id, "_tool_name": "search", "content": content}
+            )
+
+        messages.append({"role": "user", "content": f"[Progress] Iteration {iteration + 1}"})
+        budgets.append(cm.available_budget(messages))
+        prev_ids = set(tc_ids)
+
+    return tokenizer, budgets, time.perf_counter() - start
+
+
+def test_running_token_total_is_linear():
+    cached_tok, cached_budgets, cached_seconds = _simulate(ContextManager)
+    full_tok, full_budgets, full_seconds = _simulate(_UncachedContextManager)
+
+    print(
+        f"\n{ITERATIONS} iterations x {TOOL_CALLS_PER_ITERATION} tool calls\n"
+        f"  re-tokenize: {full_tok.chars_tokenized / 1e6:7.1f}M chars, {full_seconds:.2f}s\n"
+        f"  running    : {cached_tok.chars_tokenized / 1e6:7.1f}M chars, {cached_seconds:.2f}s"
+    )
+
+    # Same budgets, i.e. identical accounting
+    assert cached_budgets == full_budgets
+    # What remains is fitting new tool results, which is linear in the run
+    assert cached_tok.chars_tokenized * 2 < full_tok.chars_tokenized
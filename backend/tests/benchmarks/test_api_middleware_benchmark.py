@@ -0,0 +1,265 @@
+"""Benchmark: per-request middleware overhead on search and list endpoints.
+
+Sends requests, one at a time and 16 at once, through httpx's ASGI transport
+to a FastAPI app with a search-shaped and a list-shaped endpoint, wrapped in
+three ways:
+
+- ``bare``: no middleware, the baseline the overhead is measured against;
+- ``legacy``: the previous stack, eight ``@app.middleware("http")`` functions
+  plus a ``BaseHTTPMiddleware`` CORS layer doing the same work;
+- ``asgi``: ``ApiMiddleware`` and ``DynamicCORSMiddleware`` as used by the API.
+
+Reports mean and p99 latency per stack and the mean overhead over ``bare``.
+Sequential requests show the per-request cost of the layers; concurrent ones
+show how the extra tasks and event-loop hops of ``BaseHTTPMiddleware`` add
+queueing delay, which is what moves p99 under load.
+
+Run with ``pytest tests/benchmarks -m benchmark -s`` to see timings.
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from airweave.adapters.metrics import FakeHttpMetrics
+from airweave.api.middleware import (
+    TIMEOUT_EXEMPT_PATHS,
+    ApiMiddleware,
+    DynamicCORSMiddleware,
+    _build_endpoint_name,
+    _should_skip_analytics,
+)
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = 1000
+ORIGIN = "https://app.airweave.ai"
+
+SEARCH_RESULTS = [
+    {
+        "entity_id": f"doc-{i}",
+        "score": 1.0 / (i + 1),
+        "source_name": "notion",
+        "md_content": "lorem ipsum dolor sit amet " * 20,
+        "breadcrumbs": [{"entity_id": "root", "name": "Workspace"}],
+    }
+    for i in range(20)
+]
+COLLECTIONS = [
+    {
+        "id": str(uuid.UUID(int=i)),
+        "name": f"Collection {i}",
+        "readable_id": f"collection-{i}",
+        "status": "ACTIVE",
+    }
+    for i in range(50)
+]
+
+
+def _api() -> FastAPI:
+    app = FastAPI()
+    app.state.http_metrics = FakeHttpMetrics()
+
+    def set_rate_limit(request: Request) -> None:
+        request.state.rate_limit_result = SimpleNamespace(limit=100, remaining=99, retry_after=30)
+
+    @app.post("/collections/{readable_id}/search")
+    async def search(readable_id: str, request: Request):
+        set_rate_limit(request)
+        return {"results": SEARCH_RESULTS}
+
+    @app.get("/collections")
+    async def list_collections(request: Request):
+        set_rate_limit(request)
+        return COLLECTIONS
+
+    return app
+
+
+# Previous behaviour: one BaseHTTPMiddleware layer per concern.
+
+
+async def _legacy_add_request_id(request, call_next):
+    request.state.request_id = str(uuid.uuid4())
+    return await call_next(request)
+
+
+async def _legacy_http_metrics(request, call_next):
+    if _should_skip_analytics(request):  # same skip list as metrics
+        return await call_next(request)
+    metrics = request.app.state.http_metrics
+    metrics.inc_in_progress(request.method)
+    start = time.perf_counter()
+    response = await call_next(request)
+    metrics.dec_in_progress(request.method)
+    endpoint = _build_endpoint_name(request, fallback="unmatched")
+    metrics.observe_request(
+        request.method, endpoint, str(response.status_code), time.perf_counter() - start
+    )
+    size = int(response.headers.get("content-length", 0))
+    metrics.observe_response_size(request.method, endpoint, size)
+    return response
+
+
+async def _legacy_body_size(request, call_next):
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > settings.API_REQUEST_BODY_SIZE_LIMIT:
+        return JSONResponse(status_code=413, content={"detail": "too large"})
+    return await call_next(request)
+
+
+async def _legacy_request_timeout(request, call_next):
+    if any(p in request.url.path for p in TIMEOUT_EXEMPT_PATHS):
+        return await call_next(request)
+    return await asyncio.wait_for(call_next(request), timeout=settings.API_REQUEST_TIMEOUT_SECONDS)
+
+
+async def _legacy_rate_limit_headers(request, call_next):
+    response = await call_next(request)
+    result = getattr(request.state, "rate_limit_result", None)
+    if result:
+        response.headers["RateLimit-Limit"] = str(result.limit)
+        response.headers["RateLimit-Remaining"] = str(result.remaining)
+        response.headers["RateLimit-Reset"] = str(int(time.time() + result.retry_after))
+    return response
+
+
+async def _legacy_log_requests(request, call_next):
+    start = time.time()
+    response = await call_next(request)
+    logger.info(
+        f"Handled request {request.method} {request.url} in {time.time() - start:.2f} "
+        f"seconds.Response code: {response.status_code}"
+    )
+    return response
+
+
+async def _legacy_analytics(request, call_next):
+    if _should_skip_analytics(request):
+        return await call_next(request)
+    response = await call_next(request)
+    getattr(request.state, "api_context", None)
+    return response
+
+
+async def _legacy_exception_logging(request, call_next):
+    try:
+        return await call_next(request)
+    except Exception as exc:
+        return JSONResponse(status_code=500, content={"detail": str(exc)})
+
+
+class _LegacyCORSMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        origin = request.headers.get("origin")
+        if not origin:
+            return await call_next(request)
+        if request.method == "OPTIONS":
+            return Response(headers={"Access-Control-Allow-Origin": origin})
+        response = await call_next(request)
+        if origin == ORIGIN:
+            response.headers["Access-Control-Allow-Origin"] = origin
+            response.headers["Access-Control-Allow-Credentials"] = "true"
+        return response
+
+
+_LEGACY_MIDDLEWARE = (
+    _legacy_add_request_id,
+    _legacy_http_metrics,
+    _legacy_body_size,
+    _legacy_request_timeout,
+    _legacy_rate_limit_headers,
+    _legacy_log_requests,
+    _legacy_analytics,
+    _legacy_exception_logging,
+)
+
+
+def _build(stack: str) -> FastAPI:
+    app = _api()
+    if stack == "legacy":
+        for middleware in _LEGACY_MIDDLEWARE:
+            app.middleware("http")(middleware)
+        app.add_middleware(_LegacyCORSMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(ApiMiddleware)
+        app.add_middleware(DynamicCORSMiddleware, default_origins=[ORIGIN])
+    return app
+
+
+async def _latencies(app: FastAPI, endpoint: str, concurrency: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def call() -> httpx.Response:
+            if endpoint == "search":
+                return await client.post(
+                    "/collections/docs/search",
+                    json={"query": "quarterly revenue", "limit": 20},
+                    headers={"origin": ORIGIN},
+                )
+            return await client.get("/collections", headers={"origin": ORIGIN})
+
+        for _ in range(50):  # warm up routing, pydantic and JSON encoders
+            await call()
+
+        latencies: list[float] = []
+        remaining = REQUESTS
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                response = await call()
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return latencies
+
+
+def _p99(values: list[float]) -> float:
+    return statistics.quantiles(values, n=100)[98]
+
+
+@pytest.fixture(autouse=True)
+def _quiet_request_logs():
+    previous = logger.logger.level
+    logger.logger.setLevel(logging.WARNING)
+    yield
+    logger.logger.setLevel(previous)
+
+
+@pytest.mark.parametrize("concurrency", [1, 16])
+@pytest.mark.parametrize("endpoint", ["search", "list"])
+@pytest.mark.asyncio
+async def test_asgi_stack_has_less_overhead_than_legacy(endpoint, concurrency):
+    results = {}
+    for stack in ("bare", "legacy", "asgi"):
+        latencies = await _latencies(_build(stack), endpoint, concurrency)
+        results[stack] = (statistics.fmean(latencies), _p99(latencies))
+
+    bare_mean = results["bare"][0]
+    print(f"\n{endpoint}: {REQUESTS} requests, concurrency {concurrency}")
+    for stack, (mean, p99) in results.items():
+        overhead = (mean - bare_mean) * 1e6
+        print(
+            f"  {stack:<7} mean {mean * 1e3:6.2f}ms  p99 {p99 * 1e3:6.2f}ms  "
+            f"overhead {overhead:+8.0f}us/request"
+        )
+
+    legacy_overhead = results["legacy"][0] - bare_mean
+    asgi_overhead = results["asgi"][0] - bare_mean
+    assert asgi_overhead < legacy_overhead
@@ -0,0 +1,240 @@
+"""Benchmark: entity batch writes of one sync, row-level vs. statement-level count triggers.
+
+Needs PostgreSQL (the ``POSTGRES_*`` settings) and is skipped when it isn't
+reachable. Each run works in a scratch schema holding an ``entity`` table, an
+``entity_count`` table and the trigger SQL of migration 0001, so the
+application tables are never touched.
+
+20 workers, each on its own connection, write batches into the same sync the
+way ``EntityPostgresHandler`` does: an upsert of 100 rows across three entity
+definitions plus 10 single-row hash updates, in one transaction.
+
+- ``row``: the previous ``entity_count_trigger`` (one counter upsert per row)
+  with the previous order, inserts before updates, so a batch holds the
+  counter rows from its first inserted row until commit;
+- ``statement``: the statement-level triggers (one aggregated delta per
+  definition and statement) with inserts last.
+
+Reports batch-insert throughput, then the time to delete one definition's rows
+in a single statement. Checks that ``entity_count`` matches the rows and
+counts the writes to it, which a sequence bumped by a trigger on
+``entity_count`` records in both variants.
+
+Run with ``pytest tests/benchmarks -m benchmark -s`` to see timings.
+"""
+
+import asyncio
+import importlib.util
+import time
+import uuid
+from pathlib import Path
+
+import asyncpg
+import pytest
+
+from airweave.core.config import settings
+
+pytestmark = pytest.mark.benchmark
+
+WORKERS = 20
+BATCHES_PER_WORKER = 25
+BATCH_SIZE = 100
+UPDATES_PER_BATCH = 10
+DEFINITIONS = ("bench_file_entity", "bench_page_entity", "bench_task_entity")
+
+MIGRATION = (
+    Path(__file__).resolve().parents[2]
+    / "alembic"
+    / "versions"
+    / "0001_statement_level_entity_count_triggers.py"
+)
+
+TABLES = """
+    CREATE TABLE entity (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        sync_id uuid NOT NULL,
+        entity_id text NOT NULL,
+        entity_definition_short_name text,
+        hash text,
+        modified_at timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (sync_id, entity_id, entity_definition_short_name)
+    );
+    CREATE TABLE entity_count (
+        id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+        sync_id uuid NOT NULL,
+        entity_definition_short_name text NOT NULL,
+        count integer NOT NULL,
+        created_at timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        modified_at timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (sync_id, entity_definition_short_name)
+    );
+    CREATE SEQUENCE entity_count_writes;
+    CREATE FUNCTION count_entity_count_write() RETURNS trigger AS $$
+    BEGIN
+        PERFORM nextval('entity_count_writes');
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    CREATE TRIGGER entity_count_write_counter
+    AFTER INSERT OR UPDATE ON entity_count
+    FOR EACH ROW EXECUTE FUNCTION count_entity_count_write();
+"""
+
+UPSERT = """
+    INSERT INTO entity (sync_id, entity_id, entity_definition_short_name, hash)
+    SELECT $1, e, d, h FROM unnest($2::text[], $3::text[], $4::text[]) AS t(e, d, h)
+    ON CONFLICT (sync_id, entity_id, entity_definition_short_name)
+    DO UPDATE SET hash = EXCLUDED.hash, modified_at = CURRENT_TIMESTAMP
+"""
+
+UPDATE_HASH = """
+    UPDATE entity SET hash = $3, modified_at = CURRENT_TIMESTAMP
+    WHERE sync_id = $1 AND entity_id = $2
+"""
+
+
+def _migration():
+    spec = importlib.util.spec_from_file_location("entity_count_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _dsn() -> str:
+    return str(settings.SQLALCHEMY_ASYNC_DATABASE_URI).replace("+asyncpg", "")
+
+
+async def _connect(schema: str | None = None) -> asyncpg.Connection:
+    server_settings = {"search_path": schema} if schema else None
+    return await asyncpg.connect(_dsn(), timeout=3, server_settings=server_settings)
+
+
+@pytest.fixture
+async def admin():
+    try:
+        conn = await _connect()
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+    yield conn
+    await conn.close()
+
+
+async def _create_schema(admin: asyncpg.Connection, triggers: str) -> str:
+    migration = _migration()
+    schema = f"entity_count_bench_{uuid.uuid4().hex[:8]}"
+    await admin.execute(f"CREATE SCHEMA {schema}")
+
+    conn = await _connect(schema)
+    try:
+        await conn.execute(TABLES)
+        if triggers == "row":
+            await conn.execute(migration.ROW_LEVEL_FUNCTION)
+            await conn.execute(migration.ROW_LEVEL_TRIGGER)
+        else:
+            await conn.execute(migration.STATEMENT_LEVEL_FUNCTION)
+            for trigger in migration.STATEMENT_LEVEL_TRIGGERS:
+                await conn.execute(trigger)
+    finally:
+        await conn.close()
+    return schema
+
+
+async def _write_batches(schema: str, sync_id: uuid.UUID, worker: int, inserts_last: bool):
+    conn = await _connect(schema)
+    try:
+        for batch in range(BATCHES_PER_WORKER):
+            rows = sorted(
+                (DEFINITIONS[i % len(DEFINITIONS)], f"w{worker}-b{batch}-{i}")
+                for i in range(BATCH_SIZE)
+            )
+            entity_ids = [e for _, e in rows]
+            definitions = [d for d, _ in rows]
+            hashes = [uuid.uuid4().hex for _ in rows]
+            # Hash updates hit rows this worker wrote in its previous batch
+            updates = [f"w{worker}-b{batch - 1}-{i}" for i in range(UPDATES_PER_BATCH)]
+
+            async with conn.transaction():
+                if not inserts_last:
+                    await conn.execute(UPSERT, sync_id, entity_ids, definitions, hashes)
+                if batch:
+                    for entity_id in updates:
+                        await conn.execute(UPDATE_HASH, sync_id, entity_id, uuid.uuid4().hex)
+                if inserts_last:
+                    await conn.execute(UPSERT, sync_id, entity_ids, definitions, hashes)
+    finally:
+        await conn.close()
+
+
+async def _counts_match(conn: asyncpg.Connection) -> bool:
+    counted = await conn.fetch(
+        "SELECT sync_id, entity_definition_short_name, count FROM entity_count ORDER BY 1, 2"
+    )
+    actual = await conn.fetch(
+        "SELECT sync_id, entity_definition_short_name, COUNT(*) FROM entity "
+        "GROUP BY 1, 2 ORDER BY 1, 2"
+    )
+    return [tuple(r) for r in counted] == [tuple(r) for r in actual]
+
+
+async def _run(admin: asyncpg.Connection, triggers: str) -> dict:
+    schema = await _create_schema(admin, triggers)
+    try:
+        sync_id = uuid.uuid4()
+        inserts_last = triggers == "statement"
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(_write_batches(schema, sync_id, w, inserts_last) for w in range(WORKERS))
+        )
+        insert_seconds = time.perf_counter() - start
+
+        conn = await _connect(schema)
+        try:
+            inserted_ok = await _counts_match(conn)
+            start = time.perf_counter()
+            deleted = await conn.execute(
+                "DELETE FROM entity WHERE sync_id = $1 AND entity_definition_short_name = $2",
+                sync_id,
+                DEFINITIONS[0],
+            )
+            delete_seconds = time.perf_counter() - start
+            deleted_ok = await _counts_match(conn)
+            count_writes = await conn.fetchval(
+                "SELECT CASE WHEN is_called THEN last_value ELSE 0 END FROM entity_count_writes"
+            )
+        finally:
+            await conn.close()
+    finally:
+        await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+
+    rows = WORKERS * BATCHES_PER_WORKER * BATCH_SIZE
+    return {
+        "rows_per_second": rows / insert_seconds,
+        "batches_per_second": WORKERS * BATCHES_PER_WORKER / insert_seconds,
+        "deleted": int(deleted.split()[-1]),
+        "delete_seconds": delete_seconds,
+        "count_writes": count_writes,
+        "counts_ok": inserted_ok and deleted_ok,
+    }
+
+
+async def test_statement_level_counting_writes_the_counter_once_per_statement(admin):
+    results = {triggers: await _run(admin, triggers) for triggers in ("row", "statement")}
+
+    print(
+        f"\n{WORKERS} workers x {BATCHES_PER_WORKER} batches of {BATCH_SIZE} rows "
+        f"(+{UPDATES_PER_BATCH} hash updates) into one sync"
+    )
+    for triggers, r in results.items():
+        print(
+            f"  {triggers:<9} {r['batches_per_second']:7.1f} batches/s "
+            f"{r['rows_per_second']:9.0f} rows/s  "
+            f"delete {r['deleted']} rows in {r['delete_seconds'] * 1e3:7.1f}ms  "
+            f"{r['count_writes']:6d} entity_count writes"
+        )
+
+    assert all(r["counts_ok"] for r in results.values())
+    # One counter write per entity row vs. one per definition and statement
+    statements = WORKERS * BATCHES_PER_WORKER + 1
+    assert results["row"]["count_writes"] >= WORKERS * BATCHES_PER_WORKER * BATCH_SIZE
+    assert results["statement"]["count_writes"] <= statements * len(DEFINITIONS)
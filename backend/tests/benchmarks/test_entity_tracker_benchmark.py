@@ -0,0 +1,135 @@
+"""Benchmark: entity dedupe of one sync, per-entity vs. batched tracker updates.
+
+100k entities arrive in micro-batches of 100, one in ten of them an entity
+the sync has already seen, and 20 workers run ``_track_and_dedupe`` on the
+batches concurrently, yielding to the event loop between batches like the
+other pipeline stages do.
+
+- ``per-entity``: the previous dedupe, one ``track_entity`` call (and lock
+  acquisition) per entity plus a ``record_skipped`` call for the duplicates;
+- ``batched``: ``EntityPipeline._track_and_dedupe``, one
+  ``track_entities_batch`` call per batch that also counts the duplicates.
+
+Filling in the flagged base fields is the same for both and left out.
+Reports tracker time per entity and tracker calls. Checks that both keep the
+same entities and end with the same encounter and skip counts, and that the
+batched dedupe makes one tracker call per batch instead of one per entity.
+
+Run with ``pytest tests/benchmarks -m benchmark -s`` to see timings.
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from airweave.domains.sync_pipeline.entity.pipeline import EntityPipeline
+from airweave.domains.sync_pipeline.pipeline.entity_tracker import EntityTracker
+
+pytestmark = pytest.mark.benchmark
+
+ENTITIES = 100_000
+BATCH_SIZE = 100
+WORKERS = 20
+DUPLICATE_EVERY = 10
+ROUNDS = 3
+
+
+class _BenchEntity:
+    def __init__(self, entity_id: str) -> None:
+        self.entity_id = entity_id
+
+
+def _batches() -> list:
+    # Every tenth entity repeats one from about a batch earlier
+    entities = [
+        _BenchEntity(f"e{(i - BATCH_SIZE - 1) % ENTITIES}" if i % DUPLICATE_EVERY == 9 else f"e{i}")
+        for i in range(ENTITIES)
+    ]
+    return [entities[i : i + BATCH_SIZE] for i in range(0, ENTITIES, BATCH_SIZE)]
+
+
+class _CountingTracker(EntityTracker):
+    """EntityTracker that counts the calls the pipeline makes into it."""
+
+    def __init__(self) -> None:
+        super().__init__(job_id=uuid4(), sync_id=uuid4(), logger=MagicMock())
+        self.calls = 0
+
+    async def track_entity(self, entity_type: str, entity_id: str) -> bool:
+        self.calls += 1
+        return await super().track_entity(entity_type, entity_id)
+
+    async def track_entities_batch(self, entities, record_duplicates_as_skipped=False):
+        self.calls += 1
+        return await super().track_entities_batch(entities, record_duplicates_as_skipped)
+
+    async def record_skipped(self, count: int = 1) -> None:
+        self.calls += 1
+        await super().record_skipped(count)
+
+
+async def _per_entity(pipeline: EntityPipeline, entities: list, sync_context) -> list:
+    """Previous behaviour: one tracker call per entity, then one for the skips."""
+    tracker = pipeline._tracker
+    unique = []
+    for entity in entities:
+        if await tracker.track_entity(entity.__class__.__name__, entity.entity_id):
+            unique.append(entity)
+    if len(unique) < len(entities):
+        await tracker.record_skipped(len(entities) - len(unique))
+    return unique
+
+
+async def _run(dedupe) -> tuple:
+    tracker = _CountingTracker()
+    pipeline = EntityPipeline(
+        entity_tracker=tracker,
+        event_bus=MagicMock(),
+        action_resolver=MagicMock(),
+        action_dispatcher=MagicMock(),
+        entity_repo=MagicMock(),
+    )
+    pipeline._populate_base_entity_fields_from_flags = lambda entity: None
+    sync_context = MagicMock()
+    queue = _batches()
+    kept: list = []
+
+    async def worker() -> None:
+        while queue:
+            batch = queue.pop()
+            kept.extend(e.entity_id for e in await dedupe(pipeline, batch, sync_context))
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(WORKERS)))
+    return time.perf_counter() - start, tracker, sorted(kept)
+
+
+def _best(dedupe) -> tuple:
+    runs = [asyncio.run(_run(dedupe)) for _ in range(ROUNDS)]
+    return min(runs, key=lambda run: run[0])
+
+
+def test_batched_dedupe_makes_one_tracker_call_per_batch():
+    old_seconds, old_tracker, old_kept = _best(_per_entity)
+    new_seconds, new_tracker, new_kept = _best(
+        lambda pipeline, entities, ctx: pipeline._track_and_dedupe(entities, ctx)
+    )
+
+    print(
+        f"\n{ENTITIES} entities, {BATCH_SIZE}/batch, {WORKERS} workers, "
+        f"1 in {DUPLICATE_EVERY} a duplicate\n"
+        f"  per-entity: {old_seconds / ENTITIES * 1e6:6.2f}us/entity  "
+        f"{old_tracker.calls:7d} tracker calls\n"
+        f"  batched   : {new_seconds / ENTITIES * 1e6:6.2f}us/entity  "
+        f"{new_tracker.calls:7d} tracker calls"
+    )
+
+    assert new_kept == old_kept
+    assert new_tracker.get_encountered_count() == old_tracker.get_encountered_count()
+    assert new_tracker.stats.skipped == old_tracker.stats.skipped == ENTITIES // DUPLICATE_EVERY
+    assert old_tracker.calls >= ENTITIES
+    assert new_tracker.calls == ENTITIES // BATCH_SIZE
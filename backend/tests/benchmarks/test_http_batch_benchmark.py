@@ -0,0 +1,139 @@
+"""Benchmark: per-item GETs vs. coalesced batch requests against a fake server.
+
+The fake server charges a fixed round-trip latency per HTTP request and, like
+Google and Graph, caps concurrent requests per user. That is what dominates
+Gmail thread fetches and SharePoint permission lookups in practice.
+
+Run with ``pytest tests/benchmarks -m benchmark -s`` to see timings.
+"""
+
+import asyncio
+import json
+import re
+import time
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+from airweave.platform.http_client.batch import (
+    BatchingHttpClient,
+    GoogleBatchCodec,
+    GraphBatchCodec,
+)
+
+pytestmark = pytest.mark.benchmark
+
+ROUND_TRIP_SECONDS = 0.02
+UPSTREAM_CONCURRENCY = 10
+ITEMS = 300
+WORKERS = 30  # matches the sources' default process_entities_concurrent batch_size
+
+GMAIL = "https://gmail.googleapis.com"
+GRAPH = "https://graph.microsoft.com/v1.0"
+
+
+@pytest.fixture(autouse=True)
+def _pin_ssrf_private_networks(monkeypatch):
+    monkeypatch.setattr(
+        "airweave.platform.utils.ssrf._get_allow_private_default",
+        lambda: False,
+    )
+
+
+class SlowServer:
+    """Answers every sub-request with 200 after one simulated round trip."""
+
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self._slots = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.round_trips += 1
+        async with self._slots:
+            await asyncio.sleep(ROUND_TRIP_SECONDS)
+
+        if request.url.path.startswith("/batch/"):
+            boundary = re.search(r"boundary=(\S+)", request.headers["Content-Type"]).group(1)
+            parts = request.content.decode().split(f"--{boundary}")[1:-1]
+            body = "".join(
+                f"--r\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-item{i}>\r\n\r\n"
+                f'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n{{"i": {i}}}\r\n'
+                for i in range(len(parts))
+            )
+            return httpx.Response(
+                200,
+                content=(body + "--r--\r\n").encode(),
+                headers={"Content-Type": "multipart/mixed; boundary=r"},
+            )
+        if request.url.path.endswith("/$batch"):
+            entries = json.loads(request.content)["requests"]
+            return httpx.Response(
+                200,
+                json={
+                    "responses": [
+                        {"id": e["id"], "status": 200, "body": {"value": []}} for e in entries
+                    ]
+                },
+            )
+        return httpx.Response(200, json={"value": []})
+
+
+async def _run(client, urls) -> float:
+    queue: asyncio.Queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+
+    async def worker():
+        while not queue.empty():
+            url = queue.get_nowait()
+            response = await client.get(url, headers={"Authorization": "Bearer t"})
+            assert response.status_code == 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(WORKERS)))
+    return time.perf_counter() - start
+
+
+def _http_client(server: SlowServer) -> AirweaveHttpClient:
+    return AirweaveHttpClient(
+        wrapped_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+        org_id=uuid4(),
+        source_short_name="benchmark",
+        feature_flag_enabled=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "codec, urls",
+    [
+        (
+            GoogleBatchCodec(f"{GMAIL}/batch/gmail/v1"),
+            [f"{GMAIL}/gmail/v1/users/me/threads/t{i}" for i in range(ITEMS)],
+        ),
+        (
+            GraphBatchCodec(GRAPH),
+            [f"{GRAPH}/drives/d/items/i{i}/permissions" for i in range(ITEMS)],
+        ),
+    ],
+    ids=["google-multipart", "graph-batch"],
+)
+@pytest.mark.asyncio
+async def test_batching_reduces_round_trips(codec, urls):
+    direct_server = SlowServer()
+    direct_seconds = await _run(_http_client(direct_server), urls)
+
+    batched_server = SlowServer()
+    batched_seconds = await _run(BatchingHttpClient(_http_client(batched_server), codec), urls)
+
+    print(
+        f"\n{type(codec).__name__}: {ITEMS} GETs, {WORKERS} workers, "
+        f"{ROUND_TRIP_SECONDS * 1000:.0f}ms RTT\n"
+        f"  direct : {direct_server.round_trips:4d} round trips, {direct_seconds:.2f}s\n"
+        f"  batched: {batched_server.round_trips:4d} round trips, {batched_seconds:.2f}s"
+    )
+
+    assert direct_server.round_trips == ITEMS
+    assert batched_server.round_trips <= ITEMS // 10
@@ -0,0 +1,173 @@
+"""Benchmark: sparse (BM25) input text per chunk, JSON dump vs. keyword block.
+
+Chunks stub source entities (small, medium and large) into ~100-word windows
+and builds each chunk's sparse text twice: as before, a sorted JSON dump of
+the whole chunk entity, and with ``SparseTextBuilder`` (chunk text plus a
+keyword block built once per parent). Each text is then tokenized the way
+BM25 sees it, lowercased word tokens.
+
+Reports sparse-stage CPU per chunk (text building plus tokenization) and
+distinct terms per chunk, and checks that keyword recall does not regress:
+
+- per chunk: the terms of its text, its parent's name and breadcrumbs, and
+  its parent's short embeddable field values are in its sparse text;
+- per parent: every term of every embeddable field value is in the sparse
+  text of at least one of its chunks.
+
+Run with ``pytest tests/benchmarks -m benchmark -s`` to see timings.
+"""
+
+import asyncio
+import json
+import re
+import time
+
+import pytest
+
+from airweave.core.logging import logger
+from airweave.core.shared_models import AirweaveFieldFlag
+from airweave.domains.sync_pipeline.pipeline.sparse_text_builder import (
+    MAX_EMBEDDED_VALUE_CHARS,
+    SparseTextBuilder,
+)
+from airweave.domains.sync_pipeline.pipeline.text_builder import TextualRepresentationBuilder
+from airweave.platform.configs.config import StubConfig
+from airweave.platform.entities._base import AirweaveSystemMetadata
+from airweave.platform.sources.stub import StubSource
+from scripts.benchmark_sync_harness import WindowChunker
+
+pytestmark = pytest.mark.benchmark
+
+ENTITIES = 300
+WORDS_PER_CHUNK = 100
+ROUNDS = 3
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _terms(text: str) -> set:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+async def _chunk_entities():
+    source = await StubSource.create(
+        auth=None,
+        logger=logger,
+        http_client=None,
+        config=StubConfig(
+            entity_count=ENTITIES,
+            seed=11,
+            small_entity_weight=1,
+            medium_entity_weight=1,
+            large_entity_weight=1,
+            small_file_weight=0,
+            large_file_weight=0,
+            code_file_weight=0,
+        ),
+    )
+    parents = [e async for e in source.generate_entities()][1:]  # drop the container
+    for parent in parents:
+        parent.entity_id = parent.stub_id  # set from the is_entity_id field by the pipeline
+
+    text_builder = TextualRepresentationBuilder()
+    texts = [text_builder.build_metadata_section(e, "stub") for e in parents]
+    chunk_lists = await WindowChunker(WORDS_PER_CHUNK).chunk_batch(texts)
+
+    chunks = []
+    for parent, chunk_list in zip(parents, chunk_lists, strict=True):
+        parent.airweave_system_metadata = AirweaveSystemMetadata(source_name="stub")
+        for idx, chunk in enumerate(chunk_list):
+            chunk_entity = parent.model_copy(deep=True)
+            chunk_entity.textual_representation = chunk["text"]
+            chunk_entity.entity_id = f"{parent.entity_id}__chunk_{idx}"
+            chunk_entity.airweave_system_metadata.chunk_index = idx
+            chunk_entity.airweave_system_metadata.original_entity_id = parent.entity_id
+            chunks.append((parent, chunk_entity))
+    return chunks
+
+
+def _json_dump_texts(chunks):
+    """Previous behaviour: the whole chunk entity as sorted JSON."""
+    return [
+        json.dumps(e.model_dump(mode="json", exclude={"airweave_system_metadata"}), sort_keys=True)
+        for e in chunks
+    ]
+
+
+def _embeddable_values(parent) -> list:
+    values = []
+    for field_name, field_info in type(parent).model_fields.items():
+        extra = field_info.json_schema_extra
+        if isinstance(extra, dict) and extra.get(AirweaveFieldFlag.EMBEDDABLE.value):
+            value = getattr(parent, field_name)
+            if value is not None and not isinstance(value, bool):
+                values.append(value.isoformat() if hasattr(value, "isoformat") else str(value))
+    return values
+
+
+def _chunk_queries(parent, chunk) -> set:
+    terms = _terms(chunk.textual_representation) | _terms(parent.name or "")
+    for breadcrumb in parent.breadcrumbs or []:
+        terms |= _terms(breadcrumb.name)
+    for value in _embeddable_values(parent):
+        if len(value) <= MAX_EMBEDDED_VALUE_CHARS:
+            terms |= _terms(value)
+    return terms
+
+
+def _recall(chunks, term_sets) -> tuple:
+    """Share of chunk-level and parent-level query terms found."""
+    chunk_hits = chunk_total = 0
+    parent_terms: dict = {}
+    for (parent, chunk), terms in zip(chunks, term_sets, strict=True):
+        queries = _chunk_queries(parent, chunk)
+        chunk_hits += len(queries & terms)
+        chunk_total += len(queries)
+        parent_terms.setdefault(id(parent), (parent, set()))[1].update(terms)
+
+    parent_hits = parent_total = 0
+    for parent, terms in parent_terms.values():
+        queries = set().union(*(_terms(v) for v in _embeddable_values(parent)))
+        parent_hits += len(queries & terms)
+        parent_total += len(queries)
+    return chunk_hits / chunk_total, parent_hits / parent_total
+
+
+def _sparse_stage(build, chunk_entities):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.process_time()
+        texts = build(chunk_entities)
+        term_sets = [_terms(t) for t in texts]
+        best = min(best, time.process_time() - start)
+    return best, texts, term_sets
+
+
+def test_keyword_block_is_smaller_and_keeps_recall():
+    chunks = asyncio.run(_chunk_entities())
+    chunk_entities = [c for _, c in chunks]
+
+    old_seconds, old_texts, old_terms = _sparse_stage(_json_dump_texts, chunk_entities)
+    new_seconds, new_texts, new_terms = _sparse_stage(
+        SparseTextBuilder().build_for_batch, chunk_entities
+    )
+
+    old_recall = _recall(chunks, old_terms)
+    new_recall = _recall(chunks, new_terms)
+
+    n = len(chunk_entities)
+    old_chars = sum(len(t) for t in old_texts) / n
+    new_chars = sum(len(t) for t in new_texts) / n
+    old_size = sum(len(t) for t in old_terms) / n
+    new_size = sum(len(t) for t in new_terms) / n
+    print(
+        f"\n{ENTITIES} entities -> {n} chunks, {WORDS_PER_CHUNK} words/chunk\n"
+        f"  json dump    : {old_seconds / n * 1e6:7.1f}us/chunk  {old_chars:7.0f} chars  "
+        f"{old_size:5.0f} terms  recall chunk {old_recall[0]:.4f} parent {old_recall[1]:.4f}\n"
+        f"  keyword block: {new_seconds / n * 1e6:7.1f}us/chunk  {new_chars:7.0f} chars  "
+        f"{new_size:5.0f} terms  recall chunk {new_recall[0]:.4f} parent {new_recall[1]:.4f}"
+    )
+
+    assert new_recall == (1.0, 1.0)
+    assert new_recall >= old_recall
+    assert new_size < old_size
@@ -0,0 +1,95 @@
+"""Benchmark: end-to-end sync throughput on the stub sources, fully offline.
+
+Runs a small profile x batch-size matrix of the stub source, plus one case
+each for the file, incremental and timed stub sources, through the real
+SyncOrchestrator with the in-process stand-ins from
+``scripts/benchmark_sync_harness.py`` and checks the report is complete.
+``python -m scripts.benchmark_sync`` runs larger matrices and compares
+against a saved baseline.
+
+Run with ``pytest tests/benchmarks -m benchmark -s`` to see timings.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from scripts.benchmark_sync_harness import (
+    TIMED_ENTITIES_PER_SECOND,
+    build_matrix,
+    compare_reports,
+    run_matrix,
+)
+
+pytestmark = pytest.mark.benchmark
+
+ENTITIES = 150
+PIPELINE_STAGES = {"track", "hash", "resolve", "text_build", "chunk", "embed", "feed", "postgres"}
+
+
+@pytest.fixture(scope="module")
+def report():
+    cases = build_matrix(["small", "mixed"], [ENTITIES], [16, 64])
+    return asyncio.run(run_matrix(cases))
+
+
+@pytest.fixture(scope="module")
+def source_report():
+    cases = build_matrix(["file_stub", "incremental", "timed"], [ENTITIES], [16])
+    return {r["profile"]: r for r in asyncio.run(run_matrix(cases))["results"]}
+
+
+def _print(results) -> None:
+    print()
+    for result in results:
+        print(
+            f"{result['case']:<28} {result['entities_per_second']:>8.1f} ent/s "
+            f"{result['chunks_per_second']:>8.1f} chunks/s peak {result['peak_rss_mb']} MB"
+        )
+
+
+def test_every_case_syncs_all_entities(report):
+    _print(report["results"])
+    for result in report["results"]:
+        assert result["entities"] == ENTITIES
+        assert result["chunks"] >= ENTITIES - 1  # the container entity has no content
+        assert PIPELINE_STAGES <= set(result["stage_ms"])
+        assert result["peak_rss_mb"] > 0
+
+
+def test_report_is_machine_readable(report):
+    decoded = json.loads(json.dumps(report))
+
+    assert decoded["settings"]["chunker"] == "window"
+    assert [r["case"] for r in decoded["results"]] == [
+        f"small/n={ENTITIES}/batch=16",
+        f"small/n={ENTITIES}/batch=64",
+        f"mixed/n={ENTITIES}/batch=16",
+        f"mixed/n={ENTITIES}/batch=64",
+    ]
+
+
+def test_compare_reports_flags_throughput_drops(report):
+    slower = json.loads(json.dumps(report))
+    slower["results"][0]["entities_per_second"] *= 0.5
+
+    assert compare_reports(report, report) == []
+    [regression] = compare_reports(report, slower, max_regression=0.2)
+    assert regression.startswith(f"small/n={ENTITIES}/batch=16")
+
+
+def test_other_stub_sources(source_report):
+    _print(source_report.values())
+    files, incremental, timed = (source_report[p] for p in ("file_stub", "incremental", "timed"))
+
+    # Real documents go through the converters
+    assert files["case"] == "file_stub/batch=16"
+    assert files["chunks"] > 0 and files["stage_ms"]["convert"] > 0
+
+    # Resuming from a cursor over the first half syncs the container and the second half
+    assert incremental["entities"] == ENTITIES - ENTITIES // 2 + 1
+
+    # The container plus every timed entity, no faster than the source emits them
+    assert timed["entities"] == ENTITIES + 1
+    assert timed["seconds"] >= 0.9 * ENTITIES / TIMED_ENTITIES_PER_SECOND
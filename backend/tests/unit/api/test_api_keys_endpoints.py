@@ -12,6 +12,7 @@ from uuid import uuid4
 import pytest
 from fastapi import HTTPException
 
+from airweave.adapters.cache.fake import FakeContextCache
 from airweave.api.context import ApiContext
 from airweave.api.v1.endpoints.api_keys import (
     delete_api_key,
@@ -119,3 +120,22 @@ class TestDeleteApiKey:
             with pytest.raises(HTTPException) as exc_info:
                 await delete_api_key(db=db, id=uuid4(), ctx=ctx)
             assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_deleted_key_is_invalidated_in_context_cache(self):
+        ctx = _ctx()
+        db = AsyncMock()
+        fake_key = _make_fake_api_key_obj()
+        cache = FakeContextCache()
+        cache._api_keys["ak_test1234"] = TEST_ORG_ID
+        with (
+            patch("airweave.crud.api_key.get", new_callable=AsyncMock, return_value=fake_key),
+            patch("airweave.crud.api_key.remove", new_callable=AsyncMock) as remove,
+            patch("airweave.core.credentials.decrypt", return_value={"key": "ak_test1234"}),
+        ):
+            result = await delete_api_key(db=db, id=fake_key.id, ctx=ctx, context_cache=cache)
+
+        remove.assert_awaited_once()
+        assert result.id == fake_key.id
+        cache.assert_invalidated("api_key", "ak_test1234")
+        assert await cache.get_api_key_org_id("ak_test1234") is None
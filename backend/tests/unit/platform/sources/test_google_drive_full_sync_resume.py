@@ -0,0 +1,83 @@
+"""Unit tests for Google Drive file metadata and mid-full-sync checkpoints."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from airweave.domains.syncs.cursors.cursor import SyncCursor
+from airweave.platform.cursors import GoogleDriveCursor
+from airweave.platform.sources.google_drive import GoogleDriveSource
+
+FILES = [
+    {"id": f"file-{i}", "name": f"f{i}.txt", "modifiedTime": "2026-01-01T00:00:00Z", "size": "1"}
+    for i in range(1, 4)
+]
+
+
+def _make_source(batch_generation: bool) -> GoogleDriveSource:
+    source = GoogleDriveSource.__new__(GoogleDriveSource)
+    source._logger = MagicMock()
+    source._http_client = None
+    source.batch_generation = batch_generation
+    source.include_patterns = []
+
+    async def list_drives():
+        return
+        yield
+
+    async def list_files(corpora, include_all_drives, drive_id=None, context=""):
+        for file_obj in FILES:
+            yield file_obj
+
+    source._list_drives = list_drives
+    source._list_files = list_files
+    source._build_file_entity = lambda file_obj, breadcrumb: SimpleNamespace(
+        file_id=file_obj["id"], name=file_obj["name"]
+    )
+    source._download_file = AsyncMock(return_value=True)
+    source._store_next_start_page_token = AsyncMock(
+        side_effect=lambda: source._cursor.update(start_page_token="token")
+    )
+    return source
+
+
+def _cursor(cursor_data=None) -> SyncCursor:
+    return SyncCursor(sync_id=uuid4(), cursor_schema=GoogleDriveCursor, cursor_data=cursor_data)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_generation", [True, False])
+async def test_metadata_is_only_stored_for_yielded_files(batch_generation):
+    cursor = _cursor()
+    yielded = []
+
+    async for entity in _make_source(batch_generation).generate_entities(cursor=cursor):
+        yielded.append(entity.file_id)
+        # What a checkpoint taken at this yield would record
+        assert set(cursor.data.get("file_metadata", {})) == set(yielded)
+
+    assert sorted(yielded) == ["file-1", "file-2", "file-3"]
+    assert cursor.data["start_page_token"] == "token"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_generation", [True, False])
+async def test_retry_from_mid_full_sync_checkpoint_skips_yielded_files(batch_generation):
+    # Checkpoint the first attempt at its first yield, as if it died right after
+    first = _cursor()
+    checkpoint = None
+    async for _ in _make_source(batch_generation).generate_entities(cursor=first):
+        checkpoint = checkpoint or first.get()
+
+    retry_cursor = _cursor(checkpoint)
+    retried = [
+        e.file_id
+        async for e in _make_source(batch_generation).generate_entities(cursor=retry_cursor)
+    ]
+
+    assert not checkpoint["start_page_token"]
+    assert len(checkpoint["file_metadata"]) == 1
+    assert sorted(retried + list(checkpoint["file_metadata"])) == ["file-1", "file-2", "file-3"]
+    assert set(retry_cursor.data["file_metadata"]) == {"file-1", "file-2", "file-3"}
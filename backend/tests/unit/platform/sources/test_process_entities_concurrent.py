@@ -275,3 +275,39 @@ async def test_producer_iterator_failure_still_drains():
     )
     ids = sorted(r.stub_id for r in results)
     assert ids == sorted(f"test-{i}" for i in range(5))
+
+
+@pytest.mark.asyncio
+async def test_items_in_flight_follow_adaptive_limit():
+    """With a source limiter attached, in-flight items track its AIMD limit."""
+    from airweave.platform.http_client.concurrency import AdaptiveConcurrency
+
+    limiter = AdaptiveConcurrency("test", initial_limit=2, max_limit=8)
+    http_client = _mock_http_client()
+    http_client.concurrency = limiter
+    src = await _TestSource.create(
+        auth=_mock_auth(), logger=_mock_logger(), http_client=http_client
+    )
+    # batch_size seeds the limiter; a throttle then halves it
+    limiter_hint_applied = False
+    in_flight = 0
+    peaks: list[int] = []
+
+    async def _worker(item):
+        nonlocal in_flight, limiter_hint_applied
+        if not limiter_hint_applied:
+            limiter_hint_applied = True
+            assert limiter.limit == 6
+            limiter.record(429, None)
+        in_flight += 1
+        peaks.append(in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        yield _make_entity(item)
+
+    results = await _collect(src.process_entities_concurrent(range(40), _worker, batch_size=6))
+
+    assert len(results) == 40
+    assert max(peaks) <= 6
+    # Once the throttle lands, admissions settle at the reduced limit
+    assert max(peaks[-20:]) <= 3
@@ -0,0 +1,103 @@
+"""Unit tests for resuming a SharePoint Online full sync from a mid-sync checkpoint."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from airweave.domains.syncs.cursors.cursor import SyncCursor
+from airweave.platform.cursors.sharepoint_online import SharePointOnlineCursor
+from airweave.platform.sources.sharepoint_online.source import SharePointOnlineBase
+
+SITE = {"id": "site-1", "displayName": "Team", "webUrl": "https://contoso.sharepoint.com/sites/t"}
+DRIVES = {"drive-1": ["a.txt", "b.txt"], "drive-2": ["c.txt", "d.txt"]}
+
+
+class _FakeGraphClient:
+    """Serves one site with two drives of plain files, optionally failing on one drive."""
+
+    def __init__(self, failing_drive: str = "") -> None:
+        self.failing_drive = failing_drive
+
+    async def get_drives(self, site_id):
+        for drive_id in DRIVES:
+            yield {"id": drive_id, "name": drive_id}
+
+    async def get_drive_root_permissions(self, drive_id):
+        return []
+
+    async def get_item_permissions(self, drive_id, item_id):
+        return []
+
+    async def get_drive_items_recursive(self, drive_id):
+        for name in DRIVES[drive_id]:
+            yield {"id": name, "name": name, "file": {"mimeType": "text/plain"}, "size": 1}
+        if drive_id == self.failing_drive:
+            raise RuntimeError("connection reset")
+
+    async def get_drive_delta(self, drive_id, prefer_headers=None):
+        return [], f"token-{drive_id}"
+
+
+def _make_source(failing_drive: str = "") -> SharePointOnlineBase:
+    source = SharePointOnlineBase.__new__(SharePointOnlineBase)
+    source._logger = MagicMock()
+    source._site_url = SITE["webUrl"]
+    source._include_personal_sites = False
+    source._include_pages = False
+    source._item_level_entra_groups = set()
+    source._item_level_sp_groups = {}
+    source._create_graph_client = lambda: _FakeGraphClient(failing_drive)
+    source._discover_sites = AsyncMock(return_value=[SITE])
+    source._fetch_sp_group_viewers = AsyncMock(return_value=[])
+    source._resolve_unresolved_viewers = AsyncMock()
+    return source
+
+
+def _file_names(entities) -> list:
+    return [e.file_name for e in entities if hasattr(e, "file_name")]
+
+
+@pytest.mark.asyncio
+async def test_retry_from_mid_full_sync_checkpoint_resumes_the_full_sync():
+    sync_id = uuid4()
+    cursor = SyncCursor(sync_id=sync_id, cursor_schema=SharePointOnlineCursor)
+
+    # First attempt dies while listing drive-2, after drive-1 was finished
+    first_attempt = []
+    with pytest.raises(RuntimeError):
+        async for entity in _make_source(failing_drive="drive-2").generate_entities(cursor=cursor):
+            first_attempt.append(entity)
+    checkpoint = cursor.data
+
+    assert checkpoint["full_sync_required"] is True
+    assert checkpoint["full_sync_completed_drives"] == ["drive-1"]
+    assert checkpoint["drive_delta_tokens"] == {"drive-1": "token-drive-1"}
+
+    retry_cursor = SyncCursor(
+        sync_id=sync_id, cursor_schema=SharePointOnlineCursor, cursor_data=checkpoint
+    )
+    retried = [e async for e in _make_source().generate_entities(cursor=retry_cursor)]
+
+    # Still a full sync: drive-2 is synced in full, drive-1 is not re-listed
+    assert _file_names(first_attempt) == ["a.txt", "b.txt"]
+    assert _file_names(retried) == ["c.txt", "d.txt"]
+
+    final = SharePointOnlineCursor(**retry_cursor.data)
+    assert final.full_sync_required is False
+    assert final.full_sync_completed_drives == []
+    assert final.last_full_sync_timestamp
+    assert final.drive_delta_tokens == {"drive-1": "token-drive-1", "drive-2": "token-drive-2"}
+
+
+@pytest.mark.asyncio
+async def test_full_sync_without_checkpoint_syncs_every_drive():
+    cursor = SyncCursor(
+        sync_id=uuid4(),
+        cursor_schema=SharePointOnlineCursor,
+        cursor_data={"drive_delta_tokens": {"drive-1": "old"}, "full_sync_required": True},
+    )
+
+    entities = [e async for e in _make_source().generate_entities(cursor=cursor)]
+
+    assert _file_names(entities) == ["a.txt", "b.txt", "c.txt", "d.txt"]
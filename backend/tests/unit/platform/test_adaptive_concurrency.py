@@ -0,0 +1,163 @@
+"""Tests for AIMD adaptive concurrency and its AirweaveHttpClient integration."""
+
+import asyncio
+import gc
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+from airweave.platform.http_client.concurrency import (
+    AdaptiveConcurrency,
+    AdaptiveConcurrencyRegistry,
+)
+
+
+@pytest.fixture(autouse=True)
+def _pin_ssrf_private_networks(monkeypatch):
+    monkeypatch.setattr(
+        "airweave.platform.utils.ssrf._get_allow_private_default",
+        lambda: False,
+    )
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = _Clock()
+    with patch("airweave.platform.http_client.concurrency.time.monotonic", clock):
+        yield clock
+
+
+class TestAimd:
+    def test_successes_grow_limit_additively(self, clock):
+        limiter = AdaptiveConcurrency("gmail", initial_limit=4, max_limit=6)
+
+        # +1/limit per success: roughly one step per window of successes
+        for _ in range(5):
+            limiter.record(200, 0.1)
+        assert limiter.limit == 5
+
+        for _ in range(100):
+            limiter.record(200, 0.1)
+        assert limiter.limit == 6
+
+    def test_throttle_halves_limit_once_per_cooldown(self, clock):
+        limiter = AdaptiveConcurrency("gmail", initial_limit=16)
+
+        # A burst of 429s from requests already in flight is one signal
+        for _ in range(5):
+            limiter.record(429, None)
+        assert limiter.limit == 8
+
+        clock.now += 2
+        limiter.record(429, None)
+        assert limiter.limit == 4
+        assert limiter.snapshot().throttle_events == 6
+
+    def test_limit_never_drops_below_min(self, clock):
+        limiter = AdaptiveConcurrency("gmail", initial_limit=2, min_limit=2)
+        limiter.record(503, None)
+        assert limiter.limit == 2
+
+    def test_latency_degradation_backs_off(self, clock):
+        limiter = AdaptiveConcurrency("gmail", initial_limit=20)
+        for _ in range(10):
+            limiter.record(200, 0.1)
+        before = limiter.limit
+
+        for _ in range(10):
+            limiter.record(200, 1.0)
+
+        assert limiter.limit < before
+
+    def test_hint_is_ignored_after_throttling(self, clock):
+        limiter = AdaptiveConcurrency("gmail", initial_limit=5)
+        limiter.hint(30)
+        assert limiter.limit == 30
+
+        limiter.record(429, None)
+        limiter.hint(30)
+        assert limiter.limit == 15
+
+
+class TestSlots:
+    @pytest.mark.asyncio
+    async def test_slots_cap_in_flight(self):
+        limiter = AdaptiveConcurrency("gmail", initial_limit=3)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(12)))
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_new_requests(self):
+        limiter = AdaptiveConcurrency("gmail", initial_limit=3)
+        limiter.record(429, None, retry_after=0.05)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with limiter.slot():
+            pass
+
+        assert loop.time() - start >= 0.04
+
+
+class TestRegistry:
+    def test_one_limiter_per_connection(self):
+        registry = AdaptiveConcurrencyRegistry()
+        conn = uuid4()
+
+        first = registry.for_source("slack", conn)
+        assert registry.for_source("slack", conn) is first
+        assert registry.for_source("slack", uuid4()) is not first
+
+    def test_unused_limiters_are_dropped(self):
+        registry = AdaptiveConcurrencyRegistry()
+        limiter = registry.for_source("slack", uuid4(), initial_limit=7)
+        assert registry.per_connector()["slack"]["concurrency_limit"] == 7
+
+        del limiter
+        gc.collect()
+        assert registry.per_connector() == {}
+
+
+class TestHttpClientIntegration:
+    @pytest.mark.asyncio
+    async def test_responses_feed_the_limiter(self):
+        statuses = iter([200, 429])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), headers={"Retry-After": "0"})
+
+        limiter = AdaptiveConcurrency("gmail", initial_limit=10)
+        client = AirweaveHttpClient(
+            wrapped_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            org_id=uuid4(),
+            source_short_name="gmail",
+            concurrency=limiter,
+        )
+
+        await client.get("https://gmail.googleapis.com/a")
+        await client.get("https://gmail.googleapis.com/b")
+
+        assert limiter.limit == 5
+        assert limiter.snapshot().throttle_events == 1
+        assert limiter.in_flight == 0
@@ -0,0 +1,82 @@
+"""Tests for the pod-wide code language detector."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from airweave.platform.chunkers.code_language import CodeLanguageDetector, is_parsable
+
+
+class _FakeMagika:
+    """Labels text by its first word and counts the files it identified."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def identify_bytes(self, data: bytes):
+        self.calls += 1
+        label = data.split()[0].decode()
+        if label == "boom":
+            raise ValueError("model error")
+        return SimpleNamespace(output=SimpleNamespace(label=label.upper()))
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    monkeypatch.setattr(CodeLanguageDetector, "_instance", None)
+    detector = CodeLanguageDetector()
+    detector._magika = _FakeMagika()
+    return detector
+
+
+def test_is_a_singleton(detector):
+    assert CodeLanguageDetector() is detector
+
+
+def test_detects_languages_with_a_grammar(detector):
+    assert detector.detect_batch(["python x = 1", "txt hello", "boom"]) == ["python", None, None]
+
+
+def test_each_text_is_identified_once(detector):
+    texts = ["python a = 1", "go package main"]
+    first = detector.detect_batch(texts)
+
+    assert detector.detect_batch(texts) == first
+    assert detector._magika.calls == 2
+
+
+def test_cache_is_bounded(detector, monkeypatch):
+    monkeypatch.setattr(CodeLanguageDetector, "CACHE_SIZE", 2)
+    detector.detect_batch(["python 1", "python 2", "python 3"])
+
+    detector.detect("python 1")
+
+    assert detector._magika.calls == 4
+
+
+def test_concurrent_threads_share_one_model(monkeypatch):
+    monkeypatch.setattr(CodeLanguageDetector, "_instance", None)
+    created = []
+
+    class _Magika(_FakeMagika):
+        def __init__(self) -> None:
+            super().__init__()
+            created.append(self)
+
+    monkeypatch.setattr("magika.Magika", _Magika)
+    detector = CodeLanguageDetector()
+
+    threads = [threading.Thread(target=detector.detect, args=(f"rust {i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert created[0].calls == 8
+
+
+def test_is_parsable():
+    assert is_parsable("python")
+    assert not is_parsable("not-a-language")
@@ -0,0 +1,285 @@
+"""Tests for the HTTP batch transport (Google multipart and Graph $batch)."""
+
+import asyncio
+import json
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from airweave.domains.sources.rate_limiting.exceptions import InternalRateLimitExceeded
+from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+from airweave.platform.http_client.batch import (
+    BatchingHttpClient,
+    GoogleBatchCodec,
+    GraphBatchCodec,
+)
+
+GMAIL_BATCH = "https://gmail.googleapis.com/batch/gmail/v1"
+GMAIL_THREADS = "https://gmail.googleapis.com/gmail/v1/users/me/threads"
+GRAPH = "https://graph.microsoft.com/v1.0"
+
+# (method, path) -> (status, body, headers)
+SubHandler = Callable[[str, str], Tuple[int, dict, Dict[str, str]]]
+
+
+@pytest.fixture(autouse=True)
+def _pin_ssrf_private_networks(monkeypatch):
+    monkeypatch.setattr(
+        "airweave.platform.utils.ssrf._get_allow_private_default",
+        lambda: False,
+    )
+
+
+def _ok(method: str, path: str) -> Tuple[int, dict, Dict[str, str]]:
+    return 200, {"method": method, "path": path}, {}
+
+
+class FakeBatchServer:
+    """Minimal Google/Graph batch endpoint that answers each sub-request."""
+
+    def __init__(self, sub_handler: SubHandler = _ok) -> None:
+        self.sub_handler = sub_handler
+        self.envelopes: List[httpx.Request] = []
+        self.batch_sizes: List[int] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.envelopes.append(request)
+        if request.url.path.startswith("/batch/"):
+            return self._google(request)
+        if request.url.path.endswith("/$batch"):
+            return self._graph(request)
+        status, body, headers = self.sub_handler(request.method, request.url.raw_path.decode())
+        return httpx.Response(status, json=body, headers=headers)
+
+    def _google(self, request: httpx.Request) -> httpx.Response:
+        boundary = re.search(r"boundary=(\S+)", request.headers["Content-Type"]).group(1)
+        parts = request.content.decode().split(f"--{boundary}")[1:-1]
+        self.batch_sizes.append(len(parts))
+
+        out = []
+        # Google may answer in any order
+        for part in reversed(parts):
+            content_id = re.search(r"Content-ID: <(\S+)>", part).group(1)
+            method, target, _ = part.split("\r\n\r\n", 1)[1].split("\r\n", 1)[0].split(" ")
+            status, body, headers = self.sub_handler(method, target)
+            header_lines = "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+            out.append(
+                f"--resp\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n{header_lines}\r\n"
+                f"{json.dumps(body)}\r\n"
+            )
+        payload = "".join(out) + "--resp--\r\n"
+        return httpx.Response(
+            200,
+            content=payload.encode(),
+            headers={"Content-Type": "multipart/mixed; boundary=resp"},
+        )
+
+    def _graph(self, request: httpx.Request) -> httpx.Response:
+        entries = json.loads(request.content)["requests"]
+        self.batch_sizes.append(len(entries))
+        responses = []
+        for entry in entries:
+            assert "authorization" not in {k.lower() for k in entry.get("headers", {})}
+            status, body, headers = self.sub_handler(entry["method"], "/v1.0" + entry["url"])
+            responses.append(
+                {"id": entry["id"], "status": status, "body": body, "headers": headers}
+            )
+        return httpx.Response(200, json={"responses": responses})
+
+
+def _client(
+    server, rate_limiter: Optional[AsyncMock] = None
+) -> Tuple[AirweaveHttpClient, AsyncMock]:
+    rate_limiter = rate_limiter or AsyncMock()
+    client = AirweaveHttpClient(
+        wrapped_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+        org_id=uuid4(),
+        source_short_name="gmail",
+        rate_limiter=rate_limiter,
+    )
+    return client, rate_limiter
+
+
+class TestGoogleBatch:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_envelope(self):
+        server = FakeBatchServer()
+        http, limiter = _client(server)
+        batch = BatchingHttpClient(http, GoogleBatchCodec(GMAIL_BATCH))
+
+        responses = await asyncio.gather(
+            *(
+                batch.get(
+                    f"{GMAIL_THREADS}/t{i}",
+                    headers={"Authorization": "Bearer x"},
+                    params={"format": "full"},
+                )
+                for i in range(5)
+            )
+        )
+
+        assert len(server.envelopes) == 1
+        assert server.envelopes[0].headers["Authorization"] == "Bearer x"
+        assert [r.json()["path"] for r in responses] == [
+            f"/gmail/v1/users/me/threads/t{i}?format=full" for i in range(5)
+        ]
+        # Every sub-request is charged individually
+        assert limiter.check_and_increment.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_size(self):
+        server = FakeBatchServer()
+        http, _ = _client(server)
+        batch = BatchingHttpClient(http, GoogleBatchCodec(GMAIL_BATCH, max_batch_size=3))
+
+        await asyncio.gather(*(batch.get(f"{GMAIL_THREADS}/t{i}") for i in range(7)))
+
+        # The straggler goes out on its own, without an envelope
+        assert server.batch_sizes == [3, 3]
+        assert len(server.envelopes) == 3
+
+    @pytest.mark.asyncio
+    async def test_single_call_is_sent_without_envelope(self):
+        server = FakeBatchServer()
+        http, _ = _client(server)
+        batch = BatchingHttpClient(http, GoogleBatchCodec(GMAIL_BATCH))
+
+        response = await batch.get(f"{GMAIL_THREADS}/only")
+
+        assert response.json()["path"] == "/gmail/v1/users/me/threads/only"
+        assert server.envelopes[0].url.path == "/gmail/v1/users/me/threads/only"
+
+    @pytest.mark.asyncio
+    async def test_sub_request_errors_are_returned_per_item(self):
+        def handler(method: str, path: str):
+            if path.endswith("/missing"):
+                return 404, {"error": "not found"}, {}
+            return _ok(method, path)
+
+        server = FakeBatchServer(handler)
+        http, _ = _client(server)
+        batch = BatchingHttpClient(http, GoogleBatchCodec(GMAIL_BATCH))
+
+        ok, missing = await asyncio.gather(
+            batch.get(f"{GMAIL_THREADS}/present"), batch.get(f"{GMAIL_THREADS}/missing")
+        )
+
+        assert ok.status_code == 200
+        assert missing.status_code == 404
+        with pytest.raises(httpx.HTTPStatusError):
+            missing.raise_for_status()
+
+    @pytest.mark.asyncio
+    async def test_throttled_sub_requests_are_retried(self):
+        attempts: Dict[str, int] = {}
+
+        def handler(method: str, path: str):
+            attempts[path] = attempts.get(path, 0) + 1
+            if path.endswith("/hot") and attempts[path] == 1:
+                return 429, {"error": "slow down"}, {"Retry-After": "0"}
+            return _ok(method, path)
+
+        server = FakeBatchServer(handler)
+        http, _ = _client(server)
+        batch = BatchingHttpClient(http, GoogleBatchCodec(GMAIL_BATCH))
+
+        hot, cold = await asyncio.gather(
+            batch.get(f"{GMAIL_THREADS}/hot"), batch.get(f"{GMAIL_THREADS}/cold")
+        )
+
+        assert (hot.status_code, cold.status_code) == (200, 200)
+        assert attempts["/gmail/v1/users/me/threads/hot"] == 2
+        assert batch.stats.sub_request_retries == 1
+
+    @pytest.mark.asyncio
+    async def test_envelope_failure_reaches_every_caller(self):
+        def server(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(401, json={"error": "expired"})
+
+        http, _ = _client(server)
+        batch = BatchingHttpClient(http, GoogleBatchCodec(GMAIL_BATCH))
+
+        responses = await asyncio.gather(*(batch.get(f"{GMAIL_THREADS}/t{i}") for i in range(3)))
+
+        assert [r.status_code for r in responses] == [401, 401, 401]
+        assert str(responses[1].request.url) == f"{GMAIL_THREADS}/t1"
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_raised_before_queueing(self):
+        server = FakeBatchServer()
+        limiter = AsyncMock()
+        limiter.check_and_increment = AsyncMock(
+            side_effect=InternalRateLimitExceeded(retry_after=3.0, source_short_name="gmail")
+        )
+        http, _ = _client(server, limiter)
+        batch = BatchingHttpClient(http, GoogleBatchCodec(GMAIL_BATCH))
+
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await batch.get(f"{GMAIL_THREADS}/t1")
+
+        assert exc_info.value.response.status_code == 429
+        assert server.envelopes == []
+
+    @pytest.mark.asyncio
+    async def test_different_credentials_are_not_mixed(self):
+        server = FakeBatchServer()
+        http, _ = _client(server)
+        batch = BatchingHttpClient(http, GoogleBatchCodec(GMAIL_BATCH))
+
+        await asyncio.gather(
+            *(
+                batch.get(f"{GMAIL_THREADS}/t{i}", headers={"Authorization": f"Bearer {i % 2}"})
+                for i in range(4)
+            )
+        )
+
+        assert sorted(e.headers["Authorization"] for e in server.envelopes) == [
+            "Bearer 0",
+            "Bearer 1",
+        ]
+
+
+class TestGraphBatch:
+    @pytest.mark.asyncio
+    async def test_sub_requests_use_relative_urls(self):
+        server = FakeBatchServer()
+        http, _ = _client(server)
+        batch = BatchingHttpClient(http, GraphBatchCodec(GRAPH))
+
+        responses = await asyncio.gather(
+            *(
+                batch.get(
+                    f"{GRAPH}/drives/d/items/i{i}/permissions",
+                    headers={"Authorization": "Bearer g", "Content-Type": "application/json"},
+                )
+                for i in range(25)
+            )
+        )
+
+        assert sorted(server.batch_sizes) == [5, 20]
+        assert str(server.envelopes[0].url) == f"{GRAPH}/$batch"
+        body = json.loads(server.envelopes[0].content)
+        assert body["requests"][0]["url"].startswith("/drives/d/items/")
+        assert "headers" not in body["requests"][0]
+        assert responses[3].json()["path"] == "/v1.0/drives/d/items/i3/permissions"
+
+    @pytest.mark.asyncio
+    async def test_missing_sub_response_is_a_server_error(self):
+        def server(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"responses": [{"id": "0", "status": 200, "body": {}}]})
+
+        http, _ = _client(server)
+        batch = BatchingHttpClient(http, GraphBatchCodec(GRAPH))
+
+        first, second = await asyncio.gather(
+            batch.get(f"{GRAPH}/users/a"), batch.get(f"{GRAPH}/users/b")
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 502
@@ -0,0 +1,65 @@
+"""Tests for the registry manifest — it must match the source and entity code."""
+
+import subprocess
+import sys
+import textwrap
+
+from airweave.platform.manifest import (
+    MANIFEST_PATH,
+    class_ref,
+    dumps,
+    generate_manifest,
+    import_ref,
+)
+
+
+def test_committed_manifest_is_up_to_date():
+    assert MANIFEST_PATH.read_text() == dumps(generate_manifest()), (
+        "registry_manifest.json is out of date; run `python -m airweave.platform.manifest`"
+    )
+
+
+def test_source_class_refs_resolve():
+    from airweave.platform.sources import ALL_SOURCES
+
+    for source_cls in ALL_SOURCES:
+        assert import_ref(class_ref(source_cls)) is source_cls
+
+
+def test_building_registries_imports_no_connector_code():
+    """Registries come up from the manifest; connectors load on first get()."""
+    script = textwrap.dedent(
+        """
+        import sys
+
+        from airweave.domains.auth_provider.registry import AuthProviderRegistry
+        from airweave.domains.entities.registry import EntityDefinitionRegistry
+        from airweave.domains.sources.registry import SourceRegistry
+
+        entities = EntityDefinitionRegistry()
+        entities.build()
+        auth_providers = AuthProviderRegistry()
+        auth_providers.build()
+        sources = SourceRegistry(auth_providers, entities)
+        sources.build()
+
+        def loaded():
+            return sorted(
+                m
+                for m in sys.modules
+                if m.startswith(("airweave.platform.sources.", "airweave.platform.entities."))
+                and m.rsplit(".", 1)[-1] not in ("_base", "retry_helpers", "worker_pool")
+            )
+
+        print(loaded())
+        sources.get("slack")
+        print(loaded())
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    after_build, after_get = result.stdout.strip().splitlines()[-2:]
+
+    assert after_build == "[]"
+    assert "'airweave.platform.sources.slack'" in after_get
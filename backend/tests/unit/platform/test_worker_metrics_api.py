@@ -558,3 +558,37 @@ async def test_zero_active_syncs_scenario(mock_registry, mock_settings, test_wor
             assert snap.active_sync_jobs_count == 0
             assert snap.worker_pool_active_and_pending_count == 0
             assert snap.connector_metrics == {}
+
+
+@pytest.mark.asyncio
+async def test_flight_recorder_endpoint(mock_registry, mock_settings, test_worker_config):
+    """Test /flight-recorder returns per-stage batch timings, filterable by job."""
+    import json
+
+    from airweave.domains.sync_pipeline.flight_recorder import SyncFlightRecorder
+
+    recorder = SyncFlightRecorder()
+    job_a, job_b = uuid4(), uuid4()
+    for job_id in (job_a, job_b):
+        with recorder.batch(job_id, "slack", entity_count=5):
+            pass
+
+    server = WorkerControlServer(
+        worker_state=WorkerState(running=True),
+        config=test_worker_config,
+        registry=mock_registry,
+        worker_metrics=FakeWorkerMetrics(),
+        renderer=FakeMetricsRenderer(),
+        flight_recorder=recorder,
+    )
+
+    request = MagicMock()
+    request.query = {}
+    data = json.loads((await server._handle_flight_recorder(request)).body)
+    assert len(data["active"]) == 2
+
+    request.query = {"sync_job_id": str(job_a)}
+    data = json.loads((await server._handle_flight_recorder(request)).body)
+    assert [job["sync_job_id"] for job in data["active"]] == [str(job_a)]
+    assert data["active"][0]["entities"] == 5
+    assert len(data["active"][0]["recent_batches"]) == 1
@@ -528,3 +528,37 @@ async def test_empty_registry_state(registry):
     assert summary["active_activities_count"] == 0
     assert summary["active_sync_jobs"] == []
     assert summary["active_activities"] == []
+
+
+@pytest.mark.asyncio
+async def test_per_connector_metrics_include_adaptive_concurrency():
+    """Live source limiters are exported per connector type, even without activities."""
+    from airweave.platform.http_client.concurrency import AdaptiveConcurrencyRegistry
+
+    limiters = AdaptiveConcurrencyRegistry()
+    gmail_a = limiters.for_source("gmail", uuid4(), initial_limit=8)
+    gmail_b = limiters.for_source("gmail", uuid4(), initial_limit=4)
+    gmail_b.record(429, None)
+
+    metrics = await WorkerMetricsRegistry(concurrency=limiters).get_per_connector_metrics()
+
+    assert metrics["gmail"]["concurrency_limit"] == 8 + 2
+    assert metrics["gmail"]["throttle_events"] == 1
+    assert metrics["gmail"]["active_syncs"] == 0
+    del gmail_a, gmail_b
+
+
+@pytest.mark.asyncio
+async def test_per_connector_metrics_include_source_stream_queues(registry):
+    """Source stream queue depth and bytes are summed per connector type."""
+    streams = [MagicMock(queue_depth=40, queued_bytes=2**20) for _ in range(2)]
+    registry.register_source_stream("sync_a_job_1", streams[0], "slack")
+    registry.register_source_stream("sync_b_job_2", streams[1], "slack")
+
+    metrics = await registry.get_per_connector_metrics()
+    assert metrics["slack"]["stream_queue_depth"] == 80
+    assert metrics["slack"]["stream_queued_bytes"] == 2 * 2**20
+
+    registry.unregister_source_stream("sync_a_job_1")
+    registry.unregister_source_stream("sync_b_job_2")
+    assert await registry.get_per_connector_metrics() == {}
@@ -1,5 +1,8 @@
 """Unit tests for SearchOrchestrator."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -259,3 +262,77 @@ class TestSearchOrchestrator:
         
         assert "results" in event_names
 
+
+
+def _timed_op(name, depends_on, log, delay=0.05, fail=False):
+    """Operation that records when it starts and finishes."""
+    op = MagicMock()
+    op.depends_on = MagicMock(return_value=depends_on)
+    op.__class__.__name__ = name
+
+    async def execute(context, state, ctx):
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        log.append(("end", name))
+
+    op.execute = execute
+    return op
+
+
+class TestDagScheduling:
+    """Operations run as soon as their dependencies complete."""
+
+    @pytest.mark.asyncio
+    async def test_independent_operations_overlap(self, orchestrator, mock_context, mock_api_context):
+        log = []
+        mock_context.access_control_filter = _timed_op("AccessControlFilter", [], log)
+        mock_context.query_expansion = _timed_op("QueryExpansion", [], log)
+        mock_context.query_interpretation = _timed_op(
+            "QueryInterpretation", ["QueryExpansion"], log
+        )
+        mock_context.embed_query = _timed_op("EmbedQuery", ["QueryExpansion"], log)
+        mock_context.retrieval = _timed_op(
+            "Retrieval",
+            ["QueryInterpretation", "EmbedQuery", "AccessControlFilter", "UserFilter"],
+            log,
+        )
+
+        start = time.monotonic()
+        _, state_dict = await orchestrator.run(mock_api_context, mock_context)
+        elapsed = time.monotonic() - start
+
+        # Critical path is QueryExpansion -> EmbedQuery -> Retrieval (3 x 50ms), not 5 x 50ms
+        assert elapsed < 0.22
+        order = [name for event, name in log if event == "start"]
+        assert set(order[:2]) == {"AccessControlFilter", "QueryExpansion"}
+        assert log.index(("end", "QueryExpansion")) < log.index(("start", "EmbedQuery"))
+        assert log.index(("start", "Retrieval")) > max(
+            log.index(("end", name))
+            for name in ("AccessControlFilter", "QueryInterpretation", "EmbedQuery")
+        )
+        assert state_dict["operation_metrics"]["Retrieval"]["duration_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_running_operations(
+        self, orchestrator, mock_context, mock_api_context
+    ):
+        log = []
+        mock_context.access_control_filter = _timed_op(
+            "AccessControlFilter", [], log, delay=0.01, fail=True
+        )
+        mock_context.query_expansion = _timed_op("QueryExpansion", [], log, delay=1.0)
+        mock_context.retrieval = _timed_op("Retrieval", ["AccessControlFilter"], log)
+
+        with pytest.raises(RuntimeError, match="AccessControlFilter failed"):
+            await orchestrator.run(mock_api_context, mock_context)
+
+        assert ("end", "QueryExpansion") not in log
+        assert ("start", "Retrieval") not in log
+        errors = [
+            call.args[1]["operation"]
+            for call in mock_context.emitter.emit.call_args_list
+            if call.args[0] == "error"
+        ]
+        assert errors == ["AccessControlFilter"]